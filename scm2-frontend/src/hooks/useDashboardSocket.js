@@ -0,0 +1,92 @@
+import { useEffect, useRef, useCallback, useState } from 'react'
+import { useQueryClient } from '@tanstack/react-query'
+
+/**
+ * WebSocket hook for live dashboard KPIs.
+ * Connects to ws://host/ws/dashboard/?token=<jwt>
+ * On kpi_snapshot: replaces the ['dashboard-summary'] cache
+ * On kpi_delta:    adds { module: { kpi: ±n } } to the cached values
+ * Returns true while connected so the page can stop polling.
+ */
+const MAX_RETRIES = 8
+const BASE_DELAY = 3000  // 3s, doubles each retry up to ~6.4min
+const QUERY_KEY = ['dashboard-summary']
+
+function applyDeltas(summary, deltas) {
+  if (!summary) return summary
+  const next = { ...summary }
+  for (const [module, changes] of Object.entries(deltas || {})) {
+    const section = { ...(next[module] || {}) }
+    for (const [key, value] of Object.entries(changes)) {
+      section[key] = (section[key] || 0) + value
+    }
+    next[module] = section
+  }
+  return next
+}
+
+export function useDashboardSocket() {
+  const qc = useQueryClient()
+  const wsRef = useRef(null)
+  const reconnectTimer = useRef(null)
+  const retryCount = useRef(0)
+  const [connected, setConnected] = useState(false)
+
+  const connect = useCallback(() => {
+    const token = localStorage.getItem('access_token')
+    if (!token) return
+    if (retryCount.current >= MAX_RETRIES) return  // 포기 — 폴링으로 대체
+
+    const protocol = window.location.protocol === 'https:' ? 'wss' : 'ws'
+    const url = `${protocol}://${window.location.host}/ws/dashboard/?token=${token}`
+
+    const ws = new WebSocket(url)
+    wsRef.current = ws
+
+    ws.onopen = () => {
+      retryCount.current = 0
+      setConnected(true)
+      if (reconnectTimer.current) {
+        clearTimeout(reconnectTimer.current)
+        reconnectTimer.current = null
+      }
+    }
+
+    ws.onmessage = (event) => {
+      try {
+        const msg = JSON.parse(event.data)
+        if (msg.type === 'kpi_snapshot') {
+          qc.setQueryData(QUERY_KEY, msg.data)
+        } else if (msg.type === 'kpi_delta') {
+          qc.setQueryData(QUERY_KEY, prev => applyDeltas(prev, msg.deltas))
+        }
+      } catch {}
+    }
+
+    ws.onclose = () => {
+      setConnected(false)
+      retryCount.current += 1
+      if (retryCount.current < MAX_RETRIES) {
+        const delay = Math.min(BASE_DELAY * 2 ** (retryCount.current - 1), 384000)
+        reconnectTimer.current = setTimeout(connect, delay)
+      }
+    }
+
+    ws.onerror = () => {
+      ws.close()
+    }
+  }, [qc])
+
+  useEffect(() => {
+    connect()
+    return () => {
+      if (reconnectTimer.current) clearTimeout(reconnectTimer.current)
+      if (wsRef.current) {
+        wsRef.current.onclose = null  // cleanup 시 재연결 방지
+        wsRef.current.close()
+      }
+    }
+  }, [connect])
+
+  return connected
+}
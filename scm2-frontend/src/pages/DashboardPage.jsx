@@ -11,6 +11,7 @@ import {
 } from 'lucide-react'
 import client from '../api/client'
 import useAuthStore from '../stores/authStore'
+import { useDashboardSocket } from '../hooks/useDashboardSocket'
 
 const fetchSummary = () => client.get('/dashboard/summary/').then(r => r.data)
 
@@ -64,10 +65,12 @@ const CHART_COLORS = {
 
 export default function DashboardPage() {
   const user = useAuthStore(s => s.user)
+  // WebSocket 연결 중에는 스냅샷 + 증감으로 갱신, 끊기면 60초 폴링으로 대체
+  const liveConnected = useDashboardSocket()
   const { data, isLoading, error } = useQuery({
     queryKey: ['dashboard-summary'],
     queryFn: fetchSummary,
-    refetchInterval: 60000,
+    refetchInterval: liveConnected ? false : 60000,
   })
 
   const { data: activeFeatures = [] } = useQuery({
@@ -0,0 +1,136 @@
+"""
+scm_core.analytics 성능 회귀 스위트 (pytest-benchmark)
+
+실행:
+    pip install -r requirements-dev.txt
+    pytest benchmarks/ --benchmark-only
+    pytest benchmarks/ --benchmark-autosave                # 기준 저장
+    pytest benchmarks/ --benchmark-compare --benchmark-compare-fail=mean:20%
+
+입력 크기 1k / 100k / 1M (Nelson 런 규칙은 10M 까지). 100k 이상은 pedantic(rounds=1) 로 1회만 측정합니다.
+런 규칙은 벡터화 이전 구현(_legacy_run_rule_ends, 고정본)도 같은 입력으로 측정하고 결과 일치를 확인합니다.
+Django 설정 없이 실행됩니다 (analytics 패키지는 ORM 에 의존하지 않음).
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scm_core.analytics import finance, inventory, spc  # noqa: E402
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def _run(benchmark, func, *args, size):
+    if size >= 100_000:
+        return benchmark.pedantic(func, args=args, rounds=1, iterations=1)
+    return benchmark(func, *args)
+
+
+# ── 벡터화 이전 런 규칙 1~4 (비교 기준, 수정 금지) ──────────────────
+
+def _legacy_run_lengths(mask):
+    idx = np.arange(mask.shape[0])
+    last_false = np.maximum.accumulate(np.where(mask, -1, idx))
+    return idx - last_false
+
+
+def _legacy_run_rule_ends(values, ucl, lcl, cl):
+    arr = np.asarray(values, dtype=np.float64)
+    n = arr.shape[0]
+    ends = {1: np.flatnonzero((arr > ucl) | (arr < lcl))}
+
+    above = _legacy_run_lengths(arr > cl)
+    below = _legacy_run_lengths(arr < cl)
+    ends[2] = np.flatnonzero((above >= 9) | (below >= 9))
+
+    if n >= 2:
+        diff = np.diff(arr)
+        up = _legacy_run_lengths(diff > 0)
+        down = _legacy_run_lengths(diff < 0)
+        ends[3] = np.flatnonzero((up >= 5) | (down >= 5)) + 1
+
+        sign = np.sign(diff)
+        alternating = np.zeros(n - 1, dtype=bool)
+        alternating[1:] = (sign[1:] * sign[:-1]) < 0
+        ends[4] = np.flatnonzero(_legacy_run_lengths(alternating) >= 12) + 1
+    else:
+        ends[3] = ends[4] = np.zeros(0, dtype=np.int64)
+    return ends
+
+
+def _assert_matches_legacy(ends, values):
+    legacy = _legacy_run_rule_ends(values, 13.0, 7.0, 10.0)
+    for rule in (1, 2, 3, 4):
+        np.testing.assert_array_equal(ends[rule], legacy[rule])
+
+
+@pytest.fixture(scope='module')
+def rng():
+    return np.random.default_rng(42)
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_policy_batch(benchmark, rng, size):
+    result = _run(
+        benchmark, inventory.policy_batch,
+        rng.uniform(0, 1e6, size), rng.uniform(0, 1e5, size), rng.uniform(0, 500, size),
+        rng.uniform(0, 50, size), rng.choice([0.5, 1, 2, 3], size), 50000.0,
+        rng.uniform(0.01, 100, size), 0.95, size,
+        size=size,
+    )
+    assert result['eoq'].shape == (size,)
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_abc_classify_batch(benchmark, rng, size):
+    pct, classes = _run(benchmark, inventory.abc_classify_batch, rng.uniform(0, 1e6, size), size=size)
+    assert classes.shape == (size,)
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_imr_limits(benchmark, rng, size):
+    limits = _run(benchmark, spc.imr_limits, rng.normal(10, 1, size), size=size)
+    assert limits['ucl'] > limits['lcl']
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_run_rule_ends(benchmark, rng, size):
+    values = rng.normal(10, 1, size)
+    ends = _run(benchmark, spc.run_rule_ends, values, 13.0, 7.0, 10.0, size=size)
+    assert set(ends) == {1, 2, 3, 4}
+    _assert_matches_legacy(ends, values)
+
+
+@pytest.mark.parametrize('size', SIZES + [10_000_000])
+def test_legacy_run_rule_ends(benchmark, rng, size):
+    values = rng.normal(10, 1, size)
+    ends = _run(benchmark, _legacy_run_rule_ends, values, 13.0, 7.0, 10.0, size=size)
+    assert set(ends) == {1, 2, 3, 4}
+
+
+@pytest.mark.parametrize('size', SIZES + [10_000_000])
+def test_nelson_rule_ends(benchmark, rng, size):
+    values = rng.normal(10, 1, size)
+    ends = _run(benchmark, spc.nelson_rule_ends, values, 13.0, 7.0, 10.0, size=size)
+    assert set(ends) == set(spc.NELSON_RULES)
+    _assert_matches_legacy(ends, values)   # 규칙 5~8 은 이전 구현이 없어 tests/ 의 무차별 대조로 검증
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_minmax_downsample(benchmark, rng, size):
+    idx = _run(benchmark, spc.minmax_downsample, rng.normal(10, 1, size), 1000, size=size)
+    assert idx.shape[0] <= 2002
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_aging_summary(benchmark, rng, size):
+    summary = _run(
+        benchmark, finance.aging_summary,
+        rng.integers(-60, 365, size), rng.uniform(0, 1e6, size),
+        size=size,
+    )
+    assert sum(b['count'] for b in summary.values()) == size
@@ -9,9 +9,10 @@ django_asgi_app = get_asgi_application()
 
 from scm_chat.routing import websocket_urlpatterns as chat_patterns
 from scm_notifications.routing import websocket_urlpatterns as notif_patterns
+from scm_dashboard.routing import websocket_urlpatterns as dashboard_patterns
 from scm_notifications.middleware import JwtAuthMiddleware
 
-all_websocket_patterns = chat_patterns + notif_patterns
+all_websocket_patterns = chat_patterns + notif_patterns + dashboard_patterns
 
 application = ProtocolTypeRouter({
     'http': django_asgi_app,
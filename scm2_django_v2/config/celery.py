@@ -0,0 +1,18 @@
+"""Celery 애플리케이션 — 장시간 작업(MRP 실행 등) 백그라운드 처리.
+
+REDIS_URL 미설정 시 settings 에서 CELERY_TASK_ALWAYS_EAGER 가 켜져
+브로커 없이 요청 프로세스 안에서 즉시 실행됩니다.
+
+워커 실행:
+    celery -A config worker -l info
+    celery -A config beat -l info      # 정기 작업 (settings.CELERY_BEAT_SCHEDULE)
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+app = Celery('scm2')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
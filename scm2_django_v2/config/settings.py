@@ -47,6 +47,7 @@ DEFAULT_FROM_EMAIL  = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@scm2.local')
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    'scm_core.middleware.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -93,6 +94,45 @@ else:
         'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}
     }
 
+# ── 캐시 (BOM 그래프 버전 등 프로세스 간 공유 값) ──────────────────
+if _redis_url:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('CACHE_URL', _redis_url),
+        }
+    }
+else:
+    CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    }
+
+# 대시보드 KPI 요약 캐시 TTL (초) — 하위 모델 저장 시 signal 이 재계산 필요 표시
+# 재계산은 잠금(LOCK_TTL 초 후 자동 해제)을 잡은 요청 하나만, 나머지는 이전 요약 응답
+# 캐시가 없을 때 잠금을 못 잡은 요청은 LOCK_WAIT 초까지 결과를 기다림
+DASHBOARD_CACHE_TTL = int(os.environ.get('DASHBOARD_CACHE_TTL', '60'))
+DASHBOARD_SUMMARY_LOCK_TTL = int(os.environ.get('DASHBOARD_SUMMARY_LOCK_TTL', '30'))
+DASHBOARD_SUMMARY_LOCK_WAIT = float(os.environ.get('DASHBOARD_SUMMARY_LOCK_WAIT', '2'))
+
+# ── Celery (백그라운드 작업) ──────────────────────────────────
+# REDIS_URL 설정 시 Redis 브로커 사용, 미설정 시 요청 프로세스 안에서 즉시 실행
+if _redis_url:
+    CELERY_BROKER_URL     = os.environ.get('CELERY_BROKER_URL', _redis_url)
+    CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', _redis_url)
+else:
+    CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_SERIALIZER   = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT    = ['json']
+CELERY_TIMEZONE          = 'Asia/Seoul'
+CELERY_BEAT_SCHEDULE     = {
+    # 감사 로그 미래 월 파티션 생성 + 보존 기간 지난 파티션 보관 (celery -A config beat)
+    'audit-log-partitions': {
+        'task': 'scm_core.maintain_audit_partitions',
+        'schedule': timedelta(days=1),
+    },
+}
+
 AUTH_USER_MODEL = 'scm_accounts.User'
 
 REST_FRAMEWORK = {
@@ -113,8 +153,47 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS':  True,
 }
 
+# ── 쿼리 예산 계측 (scm_core.middleware.QueryBudgetMiddleware) ────────
+# 뷰별 예산: 'ViewSet.action' 또는 'ViewSet' → 최대 쿼리 수
+QUERY_BUDGET_ENABLED = os.environ.get('QUERY_BUDGET_ENABLED', 'true').lower() != 'false'
+QUERY_BUDGET_DEFAULT = int(os.environ.get('QUERY_BUDGET_DEFAULT', '50'))
+QUERY_BUDGETS = {}
+
+# ── 감사 로그 기록 방식 (scm_core.audit) ────────────────────────
+# sync: 요청 안에서 즉시 INSERT / buffered: 커밋 후 버퍼 → 백그라운드 bulk_create
+AUDIT_LOG_MODE = os.environ.get('AUDIT_LOG_MODE', 'buffered')
+AUDIT_LOG_MODULE_MODES = {'fi': 'sync'}   # 회계 전표는 업무 데이터와 같은 트랜잭션으로 기록
+AUDIT_LOG_BATCH_SIZE = int(os.environ.get('AUDIT_LOG_BATCH_SIZE', '200'))
+AUDIT_LOG_FLUSH_INTERVAL = float(os.environ.get('AUDIT_LOG_FLUSH_INTERVAL', '2'))
+# DB 연결 오류 시 버퍼에 되돌려 재시도할 최대 건수 (초과분은 오래된 것부터 버리고 오류 로그)
+AUDIT_LOG_MAX_PENDING = int(os.environ.get('AUDIT_LOG_MAX_PENDING', '100000'))
+# 보존 기간(개월) — 이전 월 파티션은 manage_audit_partitions 가 보관 디렉터리로 내보낸 뒤 삭제
+# 기본 0 = 보관·삭제하지 않음 (운영에서 보존 정책을 정해 명시적으로 설정)
+AUDIT_LOG_RETAIN_MONTHS = int(os.environ.get('AUDIT_LOG_RETAIN_MONTHS', '0'))
+AUDIT_LOG_ARCHIVE_DIR = os.environ.get('AUDIT_LOG_ARCHIVE_DIR', str(BASE_DIR / 'archive' / 'audit'))
+# --archive table 보관 파티션의 컬럼 압축 방식 (PostgreSQL 14+, lz4 는 서버가 lz4 지원으로 빌드된 경우)
+AUDIT_LOG_ARCHIVE_COMPRESSION = os.environ.get('AUDIT_LOG_ARCHIVE_COMPRESSION', 'pglz')
+
+# ── WM 부족재고 알림·자동발주 (scm_wm.alerts) ─────────────────────
+# sync: 저장 트랜잭션 안에서 평가 / buffered: 커밋 후 모아서 WINDOW 초마다 회사별 1회 평가
+WM_LOW_STOCK_ALERT_MODE = os.environ.get('WM_LOW_STOCK_ALERT_MODE', 'buffered')
+WM_LOW_STOCK_ALERT_WINDOW = float(os.environ.get('WM_LOW_STOCK_ALERT_WINDOW', '5'))
+
+# ── WM 일괄 재고 이동 (POST /api/wm/movements/bulk/) ─────────────
+WM_BULK_MOVEMENT_LIMIT = int(os.environ.get('WM_BULK_MOVEMENT_LIMIT', '20000'))
+
+# ── QM 관리도 데이터 (GET /api/qm/spc-monitor/chart/) ──────────────
+# 구간의 측정값이 RAW_LIMIT 이하면 전체를 읽어 Nelson 규칙 판정 + 다운샘플,
+# 초과하면 DB 에서 구간 집계(최소·최대·평균) + 런 규칙은 pk 순 청크 판정(구간별 위반 수로 합침)
+# 런 규칙(2~8) 판정은 RULE_LIMIT 점까지만 허용 (초과 시 400 — 기간을 줄이거나 규칙 1 만 조회)
+QM_SPC_CHART_RAW_LIMIT = int(os.environ.get('QM_SPC_CHART_RAW_LIMIT', '500000'))
+QM_SPC_CHART_RULE_LIMIT = int(os.environ.get('QM_SPC_CHART_RULE_LIMIT', '10000000'))
+QM_SPC_CHART_MAX_POINTS = 10000       # max_points 상한
+QM_SPC_CHART_MAX_VIOLATIONS = 5000    # 응답에 담는 이상점 상한 (최근 순)
+
 CORS_ALLOWED_ORIGINS = ['http://localhost:3000', 'http://localhost:5173']
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ['Server-Timing']
 
 LANGUAGE_CODE = 'ko-kr'
 TIME_ZONE = 'Asia/Seoul'
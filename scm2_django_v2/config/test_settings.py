@@ -16,6 +16,13 @@ CHANNEL_LAYERS = {
     }
 }
 
+# 캐시: 테스트 시 로컬 메모리 캐시 강제 사용
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 # 테스트 속도 향상 — 해시 라운드 최소화
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
@@ -23,3 +30,10 @@ PASSWORD_HASHERS = [
 
 # Celery: 테스트에서 즉시 실행
 CELERY_TASK_ALWAYS_EAGER = True
+
+# 감사 로그·부족재고 알림: 테스트에서는 동기 처리 (인메모리 DB 는 백그라운드 스레드와 공유되지 않음)
+AUDIT_LOG_MODE = 'sync'
+WM_LOW_STOCK_ALERT_MODE = 'sync'
+
+# SQLite 는 인덱스 INCLUDE(비키 컬럼)를 무시 — PostgreSQL 용 커버링 인덱스 경고 제외
+SILENCED_SYSTEM_CHECKS = ['models.W040']
@@ -0,0 +1,12 @@
+"""테스트 설정 (PostgreSQL) — 파티션·동시성 등 PostgreSQL 전용 테스트를 CI 에서 실행할 때 사용.
+
+    DB_HOST=localhost DB_NAME=scm2_db DB_USER=scm2_user DB_PASSWORD=scm2pass \\
+        python manage.py test --settings=config.test_settings_pg tests
+
+테스트 DB(test_<DB_NAME>)는 Django 가 만들고 지우므로 DB_USER 에 CREATEDB 권한이 필요합니다.
+"""
+
+from .test_settings import *  # noqa: F401, F403
+from .settings import DATABASES as _PG_DATABASES
+
+DATABASES = _PG_DATABASES
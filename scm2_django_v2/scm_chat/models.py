@@ -41,6 +41,7 @@ class ChatMessage(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        indexes = [models.Index(fields=['room', 'created_at', 'id'])]   # 방별 키셋 페이지
 
     def __str__(self): return f"{self.sender_name}: {self.content[:30]}"
 
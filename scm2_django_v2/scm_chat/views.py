@@ -2,6 +2,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
+from scm_core.pagination import KeysetPagination
 from .models import ChatRoom, ChatMessage, ChatMember, ChatNotice
 from .serializers import (ChatRoomSerializer, ChatMessageSerializer,
                            ChatNoticeSerializer)
@@ -90,7 +91,11 @@ class ChatMessageViewSet(viewsets.ModelViewSet):
         qs = ChatMessage.objects.filter(is_deleted=False).select_related('sender')
         if room_id:
             qs = qs.filter(room_id=room_id)
-        return qs.order_by('-created_at')[:100]
+        qs = qs.order_by('-created_at')
+        # 커서 페이지네이션은 키셋 조건을 더해야 하므로 최근 100건 제한 없이 넘김
+        if KeysetPagination.requested(self.request):
+            return qs
+        return qs[:100]
 
     def perform_create(self, serializer):
         serializer.save(sender=self.request.user,
@@ -15,6 +15,8 @@ class AuditLogAdmin(admin.ModelAdmin):
     ]
     readonly_fields = [f.name for f in AuditLog._meta.get_fields()]
     ordering = ['-created_at']
+    list_select_related = ['user']
+    show_full_result_count = False   # 수억 건 테이블에서 전체 COUNT(*) 생략
 
     def has_add_permission(self, request):
         return False
@@ -0,0 +1,19 @@
+"""
+scm_core.analytics — 재고·품질·재무 공통 수치 알고리즘 (단일 구현)
+
+각 앱의 utils 는 이 패키지에 계산을 위임하고 자기 모듈의 반환 형태(dict 키,
+Decimal/float 타입, 반올림)만 맞춥니다. 알고리즘을 고칠 때는 이 패키지만
+수정하면 MM·PP·QM·FI 가 같은 결과를 냅니다.
+
+모듈:
+    inventory  EOQ / Z값 / 안전재고 / ROP / ABC (단건 + NumPy 일괄)
+    spc        이동범위 / I-MR·X-bar R 관리한계 / 공정능력 / Nelson 런 규칙 1~8 / 관리도 다운샘플링
+               (+ 1건씩 갱신하는 스트리밍 상태)
+    finance    채권·채무 나이분석 구간 / 감가상각 스케줄 (연·월)
+
+성능 회귀는 benchmarks/ 의 pytest-benchmark 스위트(1k / 100k / 1M)로 확인합니다.
+Django 에 의존하지 않으므로 ORM 없이 단독 import 할 수 있습니다.
+"""
+from . import finance, inventory, spc
+
+__all__ = ['finance', 'inventory', 'spc']
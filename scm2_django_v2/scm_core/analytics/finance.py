@@ -0,0 +1,201 @@
+"""
+재무 알고리즘 — 채권·채무 나이분석 구간 / 감가상각 스케줄
+
+나이분석 구간 경계는 한 곳(AGING_EDGES)에서만 정의하고, 감가상각은
+Decimal 로 계산해 단수 조정 후 장부가치가 잔존가치에 정확히 수렴합니다.
+"""
+from __future__ import annotations
+
+import calendar
+import math
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, List, Sequence
+
+# 나이분석 구간 키 (순서 = 구간 인덱스)
+AGING_KEYS = ('not_due', '0_30', '31_60', '61_90', 'over_90')
+
+# 연체 구간 상한 (일, 포함)
+AGING_EDGES = (30, 60, 90)
+
+
+# ─── 공통 ────────────────────────────────────────────────────────────────────
+
+def round2(value: Decimal) -> Decimal:
+    """소수점 2자리 반올림 (ROUND_HALF_UP)."""
+    return value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def add_months(d: date, months: int) -> date:
+    """주어진 날짜에 월 수를 더합니다. 월말 오버플로우를 처리합니다."""
+    month = d.month - 1 + months
+    year = d.year + month // 12
+    month = month % 12 + 1
+    day = min(d.day, calendar.monthrange(year, month)[1])
+    return date(year, month, day)
+
+
+# ─── 나이분석 ────────────────────────────────────────────────────────────────
+
+def aging_bucket_index(days_overdue: int, not_due_max: int = -1) -> int:
+    """연체일수 → 구간 인덱스 (AGING_KEYS 순서).
+
+    not_due_max 이하이면 미도래(0). 뷰는 만기 당일을 0~30 구간(-1),
+    financial.calculate_aging_buckets 는 미도래(0)로 봅니다.
+    """
+    if days_overdue <= not_due_max:
+        return 0
+    for idx, edge in enumerate(AGING_EDGES, start=1):
+        if days_overdue <= edge:
+            return idx
+    return len(AGING_EDGES) + 1
+
+
+def aging_bucket_indices(days_overdue: Sequence[int], not_due_max: int = -1):
+    """aging_bucket_index 의 벡터 버전 (np.searchsorted, O(n log 4))."""
+    import numpy as np
+
+    edges = np.array((not_due_max,) + AGING_EDGES)
+    return np.searchsorted(edges, np.asarray(days_overdue, dtype=np.int64), side='left')
+
+
+def aging_summary(
+    days_overdue: Sequence[int],
+    amounts: Sequence[float],
+    not_due_max: int = -1,
+) -> Dict[str, Dict[str, Any]]:
+    """구간별 {'count', 'amount'} 집계 (np.bincount, 금액은 소수 둘째 자리)."""
+    import numpy as np
+
+    idx = aging_bucket_indices(days_overdue, not_due_max)
+    size = len(AGING_KEYS)
+    counts = np.bincount(idx, minlength=size)
+    sums = np.bincount(idx, weights=np.asarray(amounts, dtype=np.float64), minlength=size)
+    return {
+        key: {'count': int(counts[i]), 'amount': round(float(sums[i]), 2)}
+        for i, key in enumerate(AGING_KEYS)
+    }
+
+
+# ─── 감가상각 (연 단위) ──────────────────────────────────────────────────────
+
+def annual_depreciation_schedule(
+    cost: Decimal,
+    salvage: Decimal,
+    useful_life: int,
+    method: str = 'SL',
+    start_date: date | None = None,
+) -> List[Dict[str, Any]]:
+    """연도별 감가상각 스케줄 — 'SL'(정액) / 'DB'(정률) / 'SYD'(연수합계).
+
+    정률은 rate = 1 - (잔존/취득)^(1/n), 잔존가치 0 이면 이중체감(2/n).
+    마지막 연도에서 단수 조정하여 장부가치 = 잔존가치.
+
+    Returns:
+        [{'year': 1..n, 'depreciation', 'book_value', 'date': 'YYYY-MM-DD'}, ...]
+    """
+    cost = Decimal(str(cost))
+    salvage = Decimal(str(salvage))
+    n = int(useful_life)
+    start = start_date or date.today()
+    if n < 1:
+        return []
+
+    depreciable = cost - salvage
+    if method == 'DB':
+        if cost > 0 and salvage > 0:
+            rate = Decimal(str(1 - (float(salvage) / float(cost)) ** (1.0 / n)))
+        else:
+            rate = Decimal('2') / Decimal(n)
+    syd = Decimal(n * (n + 1)) / 2
+
+    schedule = []
+    book_val = cost
+    for yr in range(1, n + 1):
+        if yr == n:
+            dep = book_val - salvage
+        elif method == 'DB':
+            dep = round2(book_val * rate)
+        elif method == 'SYD':
+            dep = round2(depreciable * Decimal(n - yr + 1) / syd)
+        else:
+            dep = round2(depreciable / n)
+        book_val -= dep
+        schedule.append({
+            'year':         yr,
+            'depreciation': round2(dep),
+            'book_value':   round2(book_val),
+            'date':         str(add_months(start, 12 * yr)),
+        })
+    return schedule
+
+
+# ─── 감가상각 (월 단위) ──────────────────────────────────────────────────────
+
+def _validate_depreciation(cost: Decimal, salvage: Decimal, useful_life_years: int) -> None:
+    if useful_life_years < 1:
+        raise ValueError("내용연수는 1년 이상이어야 합니다.")
+    if cost <= salvage:
+        raise ValueError("취득원가는 잔존가치보다 커야 합니다.")
+
+
+def _monthly_schedule(cost: Decimal, start_date: date, total_months: int, next_dep) -> List[Dict[str, Any]]:
+    """월별 스케줄 공통 루프. next_dep(i, accumulated, book) → 당월 상각비."""
+    schedule: List[Dict[str, Any]] = []
+    accumulated = Decimal("0")
+    book = cost
+    current = date(start_date.year, start_date.month, 1)
+    for i in range(total_months):
+        dep = next_dep(i, accumulated, book)
+        accumulated += dep
+        book = cost - accumulated
+        schedule.append({
+            "year": current.year,
+            "month": current.month,
+            "depreciation": round2(dep),
+            "accumulated": round2(accumulated),
+            "book_value": round2(book),
+        })
+        current = add_months(current, 1)
+    return schedule
+
+
+def monthly_straight_line(
+    cost: Decimal,
+    salvage: Decimal,
+    useful_life_years: int,
+    start_date: date,
+) -> List[Dict[str, Any]]:
+    """정액법 월별 스케줄 (마지막 월 단수 조정)."""
+    _validate_depreciation(cost, salvage, useful_life_years)
+    depreciable = cost - salvage
+    total_months = useful_life_years * 12
+    monthly_dep = round2(depreciable / Decimal(str(total_months)))
+
+    def next_dep(i, accumulated, book):
+        return depreciable - accumulated if i == total_months - 1 else monthly_dep
+
+    return _monthly_schedule(cost, start_date, total_months, next_dep)
+
+
+def monthly_declining_balance(
+    cost: Decimal,
+    salvage: Decimal,
+    useful_life_years: int,
+    start_date: date,
+) -> List[Dict[str, Any]]:
+    """정률법 월별 스케줄 (잔존가치 0 이면 취득원가 5% 로 상각률 산정, 마지막 월 단수 조정)."""
+    _validate_depreciation(cost, salvage, useful_life_years)
+    effective_salvage = salvage if salvage != Decimal("0") else cost * Decimal("0.05")
+    rate = Decimal(str(1.0 - math.pow(float(effective_salvage) / float(cost), 1.0 / useful_life_years)))
+    monthly_rate = rate.quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP) / Decimal("12")
+    depreciable = cost - salvage
+    total_months = useful_life_years * 12
+
+    def next_dep(i, accumulated, book):
+        if i == total_months - 1:
+            return depreciable - accumulated
+        # 장부가치가 잔존가치 아래로 내려가지 않도록 제한
+        return min(round2(book * monthly_rate), book - salvage)
+
+    return _monthly_schedule(cost, start_date, total_months, next_dep)
@@ -0,0 +1,223 @@
+"""
+재고정책 알고리즘 — EOQ / Z값 / 안전재고 / ROP / ABC
+
+단건 함수는 파이썬 float 연산, *_batch 함수는 같은 연산 순서의 NumPy 벡터
+연산이므로 두 경로의 결과는 비트 단위로 같습니다. 반올림이 필요하면
+round_like_python 으로 파이썬 round() 와 동일하게 맞춥니다.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Optional, Sequence
+
+# 서비스 수준 → Z-score (가장 가까운 키 사용, 동률이면 앞선 키)
+Z_SCORES = {
+    0.90: 1.282,
+    0.95: 1.645,
+    0.97: 1.881,
+    0.98: 2.054,
+    0.99: 2.326,
+}
+
+# ABC 누적 비율 경계 (%)
+ABC_A_LIMIT = 80.0
+ABC_B_LIMIT = 95.0
+
+
+# ─── 공통 ────────────────────────────────────────────────────────────────────
+
+def round_like_python(values, ndigits: int):
+    """np.round 결과를 파이썬 round() 와 동일하게 보정 (정확히 .5 인 경계값만 재계산)."""
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, ndigits)
+    scaled = values * (10 ** ndigits)
+    tolerance = 1e-6 + np.abs(scaled) * 1e-14
+    near_tie = np.isfinite(scaled) & (np.abs(scaled - np.floor(scaled) - 0.5) < tolerance)
+    for idx in np.flatnonzero(near_tie):
+        rounded[idx] = round(float(values[idx]), ndigits)
+    return rounded
+
+
+def z_score(service_level: float) -> float:
+    """서비스 수준에 가장 가까운 Z-score."""
+    z = Z_SCORES.get(service_level)
+    if z is None:
+        closest = min(Z_SCORES, key=lambda k: abs(k - service_level))
+        z = Z_SCORES[closest]
+    return z
+
+
+def z_score_batch(service_levels):
+    """z_score 의 벡터 버전."""
+    import numpy as np
+
+    levels = np.asarray(service_levels, dtype=np.float64)
+    keys = np.array(list(Z_SCORES.keys()))
+    vals = np.array(list(Z_SCORES.values()))
+    if levels.size == 0:
+        return np.zeros(0)
+    return vals[np.argmin(np.abs(keys[None, :] - levels[:, None]), axis=1)]
+
+
+# ─── EOQ ─────────────────────────────────────────────────────────────────────
+
+def eoq(annual_demand: float, order_cost: float, holding_cost: float) -> Optional[float]:
+    """Wilson EOQ = sqrt(2DS / H). 보관비용 0 이하이면 None."""
+    if holding_cost <= 0:
+        return None
+    return math.sqrt((2 * annual_demand * order_cost) / holding_cost)
+
+
+def order_cycle(annual_demand: float, eoq_qty: float) -> tuple[float, float]:
+    """EOQ 기준 (연간 발주횟수, 발주주기 일수)."""
+    annual_orders = annual_demand / eoq_qty if eoq_qty > 0 else 0
+    cycle_days = 365 / annual_orders if annual_orders > 0 else 0
+    return annual_orders, cycle_days
+
+
+def eoq_batch(annual_demand, order_cost, holding_cost):
+    """eoq + order_cycle 벡터 버전 → (eoq, annual_orders, cycle_days, valid)."""
+    import numpy as np
+
+    demand = np.asarray(annual_demand, dtype=np.float64)
+    s_cost = np.asarray(order_cost, dtype=np.float64)
+    h_cost = np.asarray(holding_cost, dtype=np.float64)
+    valid = h_cost > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        qty = np.sqrt((2 * demand * s_cost) / np.where(valid, h_cost, 1.0))
+        orders = np.where(qty > 0, demand / np.where(qty > 0, qty, 1.0), 0.0)
+        cycle = np.where(orders > 0, 365 / np.where(orders > 0, orders, 1.0), 0.0)
+    return qty, orders, cycle, valid
+
+
+# ─── 안전재고 / ROP ──────────────────────────────────────────────────────────
+
+def safety_stock(demand_std: float, lead_time: float, z: float) -> float:
+    """수요 변동 기반 안전재고 = Z × σ_d × sqrt(L)."""
+    return z * demand_std * math.sqrt(lead_time)
+
+
+def safety_stock_combined(
+    avg_demand: float,
+    demand_std: float,
+    avg_lead_time: float,
+    lead_time_std: float,
+    z: float,
+) -> float:
+    """수요·리드타임 복합 불확실성 안전재고 = Z × sqrt(L × σ_d² + d² × σ_L²)."""
+    variance = avg_lead_time * (demand_std ** 2) + (avg_demand ** 2) * (lead_time_std ** 2)
+    return z * math.sqrt(variance)
+
+
+def reorder_point(avg_demand: float, lead_time: float, safety_stock_qty: float = 0) -> tuple[float, float]:
+    """(재주문점, 리드타임 수요) — ROP = 평균수요 × 리드타임 + 안전재고."""
+    lead_time_demand = avg_demand * lead_time
+    return lead_time_demand + safety_stock_qty, lead_time_demand
+
+
+# ─── ABC ─────────────────────────────────────────────────────────────────────
+
+def abc_class(cumulative_pct: float) -> str:
+    return 'A' if cumulative_pct <= ABC_A_LIMIT else ('B' if cumulative_pct <= ABC_B_LIMIT else 'C')
+
+
+def abc_classify(values: Sequence[float]) -> tuple[list[int], list[float], list[str]]:
+    """금액 내림차순(안정 정렬) 파레토 분류.
+
+    Returns:
+        (정렬 순서 인덱스, 정렬 순서별 누적 비율 %, 정렬 순서별 등급)
+        합계가 0 이면 누적 비율 0, 전부 'C'.
+    """
+    floats = [float(v) for v in values]
+    order = sorted(range(len(floats)), key=lambda i: floats[i], reverse=True)
+    total = sum(floats[i] for i in order)
+    if total == 0:
+        return order, [0.0] * len(order), ['C'] * len(order)
+
+    cumulative = 0.0
+    pcts, classes = [], []
+    for i in order:
+        cumulative += floats[i]
+        pct = cumulative / total * 100
+        pcts.append(pct)
+        classes.append(abc_class(pct))
+    return order, pcts, classes
+
+
+def abc_classify_batch(values):
+    """abc_classify 벡터 버전 → 입력 순서 기준 (누적 비율 배열, 등급 배열)."""
+    import numpy as np
+
+    value = np.asarray(values, dtype=np.float64)
+    n = value.shape[0]
+    order = np.argsort(-value, kind='stable')
+    sorted_value = value[order]
+    total = sum(sorted_value.tolist())
+    classes = np.full(n, 'C', dtype='<U1')
+    pct = np.zeros(n)
+    if n and total != 0:
+        sorted_pct = np.cumsum(sorted_value) / total * 100
+        classes[order] = np.where(sorted_pct <= ABC_A_LIMIT, 'A',
+                                  np.where(sorted_pct <= ABC_B_LIMIT, 'B', 'C'))
+        pct[order] = sorted_pct
+    return pct, classes
+
+
+# ─── 일괄 재고정책 ───────────────────────────────────────────────────────────
+
+def policy_batch(
+    annual_value:  Any,
+    annual_demand: Any,
+    avg_demand:    Any,
+    demand_std:    Any,
+    lead_time:     Any,
+    order_cost:    Any,
+    holding_cost:  Any,
+    service_level: Any = 0.95,
+    size:          Optional[int] = None,
+) -> dict[str, Any]:
+    """자재 N개 ABC / EOQ / 안전재고 / ROP 일괄 계산 (반올림 전 원시 배열).
+
+    스칼라 인자는 N개 전체에 적용합니다. 안전재고는 소수 둘째 자리로 반올림한
+    값을 ROP 에 더합니다 (단건 계산의 안전재고 → ROP 연계와 동일).
+
+    Returns:
+        {'cumulative_pct', 'abc_class', 'eoq', 'annual_orders', 'cycle_days',
+         'eoq_valid', 'z', 'safety_stock', 'rop', 'lead_time_demand'} — 길이 N 의 ndarray
+    """
+    import numpy as np
+
+    if size is None:
+        size = np.asarray(annual_value).shape[0] if np.ndim(annual_value) else 1
+
+    def _col(values):
+        arr = np.asarray(values, dtype=np.float64)
+        if arr.ndim == 0:
+            return np.full(size, float(arr))
+        if arr.shape != (size,):
+            raise ValueError(f'열 길이가 자재 수({size})와 다릅니다: {arr.shape[0]}')
+        return arr
+
+    value, demand = _col(annual_value), _col(annual_demand)
+    avg, std, lt = _col(avg_demand), _col(demand_std), _col(lead_time)
+
+    pct, classes = abc_classify_batch(value)
+    qty, orders, cycle, valid = eoq_batch(demand, _col(order_cost), _col(holding_cost))
+    z = z_score_batch(_col(service_level))
+    with np.errstate(invalid='ignore'):
+        ss = round_like_python(z * std * np.sqrt(lt), 2)
+    ltd = avg * lt
+    return {
+        'cumulative_pct':   pct,
+        'abc_class':        classes,
+        'eoq':              qty,
+        'annual_orders':    orders,
+        'cycle_days':       cycle,
+        'eoq_valid':        valid,
+        'z':                z,
+        'safety_stock':     ss,
+        'rop':              ltd + ss,
+        'lead_time_demand': ltd,
+    }
@@ -0,0 +1,382 @@
+"""
+SPC (통계적 공정관리) 알고리즘 — 관리한계 / 공정능력 / 런 규칙
+
+모든 함수는 반올림하지 않은 float 를 돌려주며, 앱 모듈이 자기 응답 형태에
+맞게 반올림합니다. 평균·범위는 NumPy 로 O(n) 계산합니다.
+
+런 규칙은 nelson_rule_ends 가 Nelson 규칙 1~8 을 bool 배열 연산만으로 판정하고
+규칙별 창 끝 인덱스 배열을 돌려줍니다 (점별 dict 를 만들지 않음, 1천만 점 1초 미만).
+run_rule_ends 는 그중 Western Electric 규칙 1~4 입니다.
+
+stream_* 함수는 측정값을 1건씩 받아 누적 상태(dict)를 O(1) 로 갱신합니다
+(Welford 평균·분산, 이동범위 합, 런 규칙별 연속 길이). 전체 이력 재계산 없이
+관리한계·공정능력·현재 성립한 런 규칙을 알 수 있습니다.
+
+참고:
+    Montgomery, D.C. (2020). Introduction to Statistical Quality Control (8th ed.)
+    AIAG SPC Manual (2nd ed.)
+"""
+from __future__ import annotations
+
+import math
+from typing import Optional, Sequence
+
+# AIAG 관리도 계수 (부분군 크기 n = 2..10)
+D2 = {2: 1.128, 3: 1.693, 4: 2.059, 5: 2.326, 6: 2.534, 7: 2.704, 8: 2.847, 9: 2.970, 10: 3.078}
+D3 = {2: 0.000, 3: 0.000, 4: 0.000, 5: 0.000, 6: 0.000, 7: 0.076, 8: 0.136, 9: 0.184, 10: 0.223}
+D4 = {2: 3.267, 3: 2.574, 4: 2.282, 5: 2.114, 6: 2.004, 7: 1.924, 8: 1.864, 9: 1.816, 10: 1.777}
+A2 = {2: 1.880, 3: 1.023, 4: 0.729, 5: 0.577, 6: 0.483, 7: 0.419, 8: 0.373, 9: 0.337, 10: 0.308}
+
+# 런 규칙별 창 길이 (규칙 1 은 단일 점). 1~4 = Western Electric, 5~8 = Nelson 추가 규칙
+RULE_WINDOWS = {1: 1, 2: 9, 3: 6, 4: 14, 5: 3, 6: 5, 7: 15, 8: 8}
+NELSON_RULES = (1, 2, 3, 4, 5, 6, 7, 8)
+
+
+def _array(values):
+    import numpy as np
+    return np.asarray(values, dtype=np.float64)
+
+
+def moving_ranges(values: Sequence[float]):
+    """이동범위 MR_i = |X_i - X_{i-1}| (길이 n-1)."""
+    import numpy as np
+    return np.abs(np.diff(_array(values)))
+
+
+def imr_limits(values: Sequence[float]) -> dict:
+    """개별값-이동범위(I-MR) 관리한계. σ = MR̄ / d2(2), 한계 = X̄ ± 3σ."""
+    arr = _array(values)
+    mr = moving_ranges(arr)
+    limits = imr_limits_from(float(arr.mean()), float(mr.mean()) if mr.size else 0.0)
+    limits['moving_ranges'] = mr
+    return limits
+
+
+def imr_limits_from(center: float, mr_bar: float) -> dict:
+    """평균·MR̄ 만으로 I-MR 관리한계 (DB 집계·누적 상태처럼 값 배열이 없을 때)."""
+    sigma = mr_bar / D2[2] if mr_bar > 0 else 0.0
+    return {
+        'center': center,
+        'ucl':    center + 3.0 * sigma,
+        'lcl':    center - 3.0 * sigma,
+        'sigma':  sigma,
+        'r_bar':  mr_bar,
+        'ucl_r':  D4[2] * mr_bar,
+        'lcl_r':  D3[2] * mr_bar,
+    }
+
+
+def xbar_r_limits(values: Sequence[float], subgroup_size: int) -> Optional[dict]:
+    """X-bar R 관리한계 (완전한 부분군만 사용, 남는 값은 버림). 부분군이 없으면 None."""
+    n = subgroup_size
+    arr = _array(values)
+    count = arr.shape[0] // n
+    if count == 0:
+        return None
+    groups = arr[:count * n].reshape(count, n)
+    means = groups.mean(axis=1)
+    ranges = groups.max(axis=1) - groups.min(axis=1)
+    center = float(means.mean())
+    r_bar = float(ranges.mean())
+    return {
+        'center': center,
+        'ucl':    center + A2[n] * r_bar,
+        'lcl':    center - A2[n] * r_bar,
+        'sigma':  r_bar / D2[n] if r_bar > 0 else 0.0,
+        'r_bar':  r_bar,
+        'ucl_r':  D4[n] * r_bar,
+        'lcl_r':  D3[n] * r_bar,
+        'means':  means,
+        'ranges': ranges,
+    }
+
+
+def capability(
+    values: Sequence[float],
+    usl: Optional[float] = None,
+    lsl: Optional[float] = None,
+    target: Optional[float] = None,
+) -> dict:
+    """공정능력 지수 (표본 표준편차 기준).
+
+    Cp = (USL-LSL)/6σ, Cpu = (USL-μ)/3σ, Cpl = (μ-LSL)/3σ, Cpk = min(Cpu, Cpl),
+    Cpm = (USL-LSL) / 6·sqrt(σ² + (μ-T)²). 규격이 없는 지수와 σ = 0 일 때의 지수는 None.
+    """
+    arr = _array(values)
+    return _capability_indices(float(arr.mean()), float(arr.std(ddof=1)), int(arr.shape[0]), usl, lsl, target)
+
+
+def _capability_indices(mean, std, n, usl, lsl, target) -> dict:
+    result = {'mean': mean, 'std': std, 'n': n,
+              'cp': None, 'cpu': None, 'cpl': None, 'cpk': None, 'cpm': None, 'target': None}
+    if not std:
+        return result
+
+    if usl is not None and lsl is not None:
+        result['cp'] = (usl - lsl) / (6 * std)
+    if usl is not None:
+        result['cpu'] = (usl - mean) / (3 * std)
+    if lsl is not None:
+        result['cpl'] = (mean - lsl) / (3 * std)
+    sides = [v for v in (result['cpu'], result['cpl']) if v is not None]
+    if sides:
+        result['cpk'] = min(sides)
+    if usl is not None and lsl is not None:
+        t = target if target is not None else (usl + lsl) / 2
+        tau = math.sqrt(std ** 2 + (mean - t) ** 2)
+        result['target'] = t
+        if tau > 0:
+            result['cpm'] = (usl - lsl) / (6 * tau)
+    return result
+
+
+def _run_ends(mask, length):
+    """연속 True 길이가 length 이상이 되는 끝 인덱스 (오름차순).
+
+    "i 에서 끝나는 k 연속" 표시를 k 를 두 배씩 늘려 가며 AND 로 합칩니다
+    (O(n·log length) 의 bool 연산). 점마다 런 길이 배열을 만들지 않고, 마지막에
+    드문 표시만 인덱스로 바꾸므로 조밀한 마스크에서도 빠릅니다.
+    """
+    import numpy as np
+
+    ends = mask.copy()
+    covered = 1
+    while covered < length:
+        step = min(covered, length - covered)
+        joined = np.zeros_like(ends)
+        np.logical_and(ends[step:], ends[:-step], out=joined[step:])
+        ends = joined
+        covered += step
+    return np.flatnonzero(ends)
+
+
+def _window_count_ends(mask, hits, window):
+    """길이 window 창 안에 True 가 hits 개 이상인 창의 끝 인덱스 (창이 짧으므로 이동 합)."""
+    import numpy as np
+
+    n = mask.shape[0]
+    if n < window:
+        return np.zeros(0, dtype=np.int64)
+    counts = mask[window - 1:].astype(np.int8)
+    for shift in range(1, window):
+        counts += mask[window - 1 - shift:n - shift]
+    return np.flatnonzero(counts >= hits) + (window - 1)
+
+
+def nelson_rule_ends(
+    values: Sequence[float],
+    ucl: float,
+    lcl: float,
+    cl: float,
+    rules: Sequence[int] = NELSON_RULES,
+) -> dict:
+    """Nelson 규칙 1~8 을 만족하는 창의 끝 인덱스 (NumPy 벡터 연산, O(n)).
+
+    규칙 1: 관리한계(±3σ) 밖 점
+    규칙 2: 연속 9점이 중심선 한쪽
+    규칙 3: 연속 6점 단조 증가/감소
+    규칙 4: 연속 14점 교대 증감
+    규칙 5: 연속 3점 중 2점이 같은 쪽 2σ 밖
+    규칙 6: 연속 5점 중 4점이 같은 쪽 1σ 밖
+    규칙 7: 연속 15점이 1σ 안 (중심선 양쪽)
+    규칙 8: 연속 8점이 1σ 밖이고 중심선 양쪽에 모두 있음
+
+    1σ·2σ 구역은 중심선과 관리한계 사이를 3등분해 정합니다 (한계가 비대칭이면 쪽마다 따로).
+
+    Returns:
+        {rule: 끝 인덱스 ndarray (int64, 오름차순)} — 창 시작 = 끝 - RULE_WINDOWS[rule] + 1
+    """
+    import numpy as np
+
+    arr = _array(values)
+    upper = (ucl - cl) / 3.0
+    lower = (cl - lcl) / 3.0
+    ends = {}
+
+    if 1 in rules:
+        ends[1] = np.flatnonzero((arr > ucl) | (arr < lcl))
+    if 2 in rules:
+        ends[2] = np.union1d(_run_ends(arr > cl, 9), _run_ends(arr < cl, 9))
+    if 3 in rules or 4 in rules:
+        diff = np.diff(arr)
+        up, down = diff > 0, diff < 0
+        if 3 in rules:
+            ends[3] = np.union1d(_run_ends(up, 5), _run_ends(down, 5)) + 1
+        if 4 in rules:
+            alternating = (up[1:] & down[:-1]) | (down[1:] & up[:-1])
+            ends[4] = _run_ends(alternating, 12) + 2
+    if 5 in rules:
+        ends[5] = np.union1d(_window_count_ends(arr > cl + 2 * upper, 2, 3),
+                             _window_count_ends(arr < cl - 2 * lower, 2, 3))
+    if 6 in rules:
+        ends[6] = np.union1d(_window_count_ends(arr > cl + upper, 4, 5),
+                             _window_count_ends(arr < cl - lower, 4, 5))
+    if 7 in rules or 8 in rules:
+        outside = (arr > cl + upper) | (arr < cl - lower)
+        if 7 in rules:
+            ends[7] = _run_ends(~outside, 15)
+        if 8 in rules:
+            # 모두 1σ 밖이면서 한쪽에만 몰린 창은 제외 (양쪽에 모두 점이 있어야 함)
+            one_side = np.union1d(_run_ends(arr > cl + upper, 8), _run_ends(arr < cl - lower, 8))
+            ends[8] = np.setdiff1d(_run_ends(outside, 8), one_side, assume_unique=True)
+    return {rule: ends[rule].astype(np.int64, copy=False) for rule in sorted(ends)}
+
+
+def run_rule_ends(values: Sequence[float], ucl: float, lcl: float, cl: float) -> dict:
+    """Western Electric 런 규칙 1~4 (= nelson_rule_ends 의 규칙 1~4)."""
+    return nelson_rule_ends(values, ucl, lcl, cl, rules=(1, 2, 3, 4))
+
+
+def rule_point_mask(n: int, rule_ends: dict):
+    """규칙별 끝 인덱스 → 위반 창에 속한 점 표시 {rule: bool ndarray(n)} (차분 배열 누적, O(n))."""
+    import numpy as np
+
+    masks = {}
+    for rule, ends in rule_ends.items():
+        marks = np.zeros(n + 1, dtype=np.int32)
+        if ends.size:
+            np.add.at(marks, np.maximum(ends - (RULE_WINDOWS[rule] - 1), 0), 1)
+            np.add.at(marks, ends + 1, -1)
+        masks[rule] = np.cumsum(marks[:n]) > 0
+    return masks
+
+
+# ── 차트 다운샘플링 (관리도 표시용 인덱스 선택) ─────────────────────
+
+def _with_keep(selected, keep):
+    import numpy as np
+
+    if keep is None or len(keep) == 0:
+        return selected
+    return np.union1d(selected, np.asarray(keep, dtype=np.int64))
+
+
+def minmax_downsample(values: Sequence[float], buckets: int, keep=None):
+    """
+    같은 개수로 나눈 구간마다 최솟값·최댓값 점의 인덱스 (+ 처음·마지막 점, keep 인덱스).
+
+    봉우리·골짜기가 사라지지 않아 관리도 모양이 유지됩니다. 최대 2·buckets + 2 + len(keep) 개,
+    오름차순 int64 배열. 구간 argmin/argmax 는 reshape 1회로 O(n).
+    """
+    import numpy as np
+
+    arr = _array(values)
+    n = arr.shape[0]
+    if n <= 2 * buckets + 2:
+        return _with_keep(np.arange(n, dtype=np.int64), keep)
+    width = -(-n // buckets)
+    count = -(-n // width)
+    offsets = np.arange(count, dtype=np.int64) * width
+    padded = np.full(count * width, np.inf)       # 마지막 구간의 빈 칸은 선택되지 않도록
+    padded[:n] = arr
+    lows = padded.reshape(count, width).argmin(axis=1) + offsets
+    padded[n:] = -np.inf
+    highs = padded.reshape(count, width).argmax(axis=1) + offsets
+    selected = np.unique(np.concatenate(([0, n - 1], lows, highs)))
+    return _with_keep(selected, keep)
+
+
+def lttb_downsample(values: Sequence[float], threshold: int, keep=None):
+    """
+    Largest-Triangle-Three-Buckets — 시각적으로 가장 두드러진 점 threshold 개 (+ keep 인덱스).
+
+    x 는 인덱스(등간격)로 봅니다. 구간마다 앞서 고른 점·다음 구간 평균과 이루는 삼각형이
+    가장 큰 점을 고르므로 구간 수만큼 반복하고, 구간 안 계산은 NumPy 입니다.
+
+    참고: Steinarsson, S. (2013). Downsampling Time Series for Visual Representation.
+    """
+    import numpy as np
+
+    arr = _array(values)
+    n = arr.shape[0]
+    if threshold >= n or threshold < 3:
+        return _with_keep(np.arange(n, dtype=np.int64), keep)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)   # 처음·마지막 점 제외 구간 경계
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for k in range(threshold - 2):
+        lo, hi = edges[k], edges[k + 1]
+        if k + 2 < threshold - 1:
+            nxt_lo, nxt_hi = edges[k + 1], edges[k + 2]
+            next_x, next_y = (nxt_lo + nxt_hi - 1) / 2.0, arr[nxt_lo:nxt_hi].mean()
+        else:
+            next_x, next_y = float(n - 1), arr[n - 1]
+        xs = np.arange(lo, hi)
+        areas = np.abs((prev - next_x) * (arr[lo:hi] - arr[prev]) - (prev - xs) * (next_y - arr[prev]))
+        prev = lo + int(np.argmax(areas))
+        selected[k + 1] = prev
+    return _with_keep(selected, keep)
+
+
+# ── 스트리밍 (측정값 1건씩 O(1) 갱신) ──────────────────────────────
+
+# 누적 상태 키 — 앱이 상태를 테이블 컬럼으로 보관할 때 같은 이름을 사용
+STREAM_FIELDS = ('n', 'mean', 'm2', 'last_value', 'mr_sum',
+                 'above_run', 'below_run', 'up_run', 'down_run', 'alt_run', 'last_sign')
+
+
+def stream_init() -> dict:
+    return {'n': 0, 'mean': 0.0, 'm2': 0.0, 'last_value': None, 'mr_sum': 0.0,
+            'above_run': 0, 'below_run': 0, 'up_run': 0, 'down_run': 0, 'alt_run': 0, 'last_sign': 0}
+
+
+def stream_limits(state: dict) -> dict:
+    """누적 상태의 I-MR 관리한계 (imr_limits 와 같은 식, MR̄ = 이동범위 합 / (n-1))."""
+    n = state['n']
+    return imr_limits_from(state['mean'], state['mr_sum'] / (n - 1) if n >= 2 else 0.0)
+
+
+def stream_update(state: dict, x: float) -> list:
+    """
+    x 를 상태에 반영(제자리 갱신)하고 이 점에서 성립한 런 규칙 번호 목록을 돌려줌.
+
+    규칙 1·2 의 한계·중심선은 이 점 이전까지의 누적값 기준입니다. 전체 데이터의
+    평균을 쓰는 run_rule_ends 와는 초기 구간에서 다를 수 있고, 규칙 3·4 는 같습니다.
+    """
+    x = float(x)
+    rules = []
+    n = state['n']
+    if n >= 2:
+        limits = stream_limits(state)
+        if limits['sigma'] > 0 and (x > limits['ucl'] or x < limits['lcl']):
+            rules.append(1)
+    if n >= 1:
+        cl = state['mean']
+        state['above_run'] = state['above_run'] + 1 if x > cl else 0
+        state['below_run'] = state['below_run'] + 1 if x < cl else 0
+        if state['above_run'] >= RULE_WINDOWS[2] or state['below_run'] >= RULE_WINDOWS[2]:
+            rules.append(2)
+
+        diff = x - state['last_value']
+        sign = (diff > 0) - (diff < 0)
+        state['up_run'] = state['up_run'] + 1 if sign > 0 else 0
+        state['down_run'] = state['down_run'] + 1 if sign < 0 else 0
+        state['alt_run'] = state['alt_run'] + 1 if sign * state['last_sign'] < 0 else 0
+        state['last_sign'] = sign
+        state['mr_sum'] += abs(diff)
+        if state['up_run'] >= RULE_WINDOWS[3] - 1 or state['down_run'] >= RULE_WINDOWS[3] - 1:
+            rules.append(3)
+        if state['alt_run'] >= RULE_WINDOWS[4] - 2:
+            rules.append(4)
+
+    # Welford
+    n += 1
+    delta = x - state['mean']
+    state['mean'] += delta / n
+    state['m2'] += delta * (x - state['mean'])
+    state['n'] = n
+    state['last_value'] = x
+    return rules
+
+
+def stream_capability(
+    state: dict,
+    usl: Optional[float] = None,
+    lsl: Optional[float] = None,
+    target: Optional[float] = None,
+) -> dict:
+    """누적 상태의 공정능력 지수 (capability 와 같은 식, 표본 표준편차 = sqrt(M2 / (n-1)))."""
+    n = state['n']
+    std = math.sqrt(state['m2'] / (n - 1)) if n >= 2 and state['m2'] > 0 else 0.0
+    return _capability_indices(state['mean'], std, n, usl, lsl, target)
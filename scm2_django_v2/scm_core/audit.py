@@ -0,0 +1,158 @@
+"""
+감사 로그 일괄 기록기 (scm_core.utils.log_audit 에서 사용)
+
+모듈별 기록 방식 (settings):
+    AUDIT_LOG_MODE           기본 방식 'sync' | 'buffered'
+    AUDIT_LOG_MODULE_MODES   모듈별 재정의 — 예) {'fi': 'sync', 'chat': 'buffered'}
+    AUDIT_LOG_BATCH_SIZE     버퍼가 이 크기에 도달하면 즉시 기록
+    AUDIT_LOG_FLUSH_INTERVAL 버퍼 기록 주기(초)
+    AUDIT_LOG_MAX_PENDING    DB 연결 오류로 재대기 중인 로그 상한 (넘으면 오래된 것부터 버림)
+
+    sync      요청 트랜잭션 안에서 바로 INSERT — 업무 데이터와 같은 내구성
+    buffered  커밋 후 프로세스 내 버퍼에 넣고 백그라운드 스레드가 bulk_create
+              (롤백된 요청의 로그는 버퍼에 들어가지 않음, 프로세스 종료 시 남은 버퍼 기록)
+              비정상 종료(kill -9) 시 최대 FLUSH_INTERVAL 분량이 유실될 수 있음
+              일괄 기록이 실패하면 행 단위로 다시 기록 — 문제 행만 버리고, DB 연결 오류면
+              남은 행을 버퍼 앞에 되돌려 다음 주기에 재시도 (MAX_PENDING 까지)
+              작업 시각(created_at)은 로그 생성 시점이므로 늦게 기록돼도 바뀌지 않음
+"""
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import InterfaceError, OperationalError, close_old_connections
+
+logger = logging.getLogger('scm_core.audit')
+
+
+def audit_mode(module):
+    """모듈의 감사 로그 기록 방식 ('sync' | 'buffered')."""
+    modes = getattr(settings, 'AUDIT_LOG_MODULE_MODES', {})
+    return modes.get(module) or getattr(settings, 'AUDIT_LOG_MODE', 'sync')
+
+
+class AuditBuffer:
+    """
+    AuditLog 인스턴스(미저장) 버퍼.
+
+    flush_interval 이 None 이면 백그라운드 스레드 없이 batch_size 도달 시
+    호출한 스레드에서 바로 기록합니다 (테스트·관리 명령용).
+    """
+
+    def __init__(self, batch_size=200, flush_interval=2.0, max_pending=100000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._entries = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker = None
+        self._pid = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+            full = len(self._entries) >= self.batch_size
+        if self.flush_interval is None:
+            if full:
+                self.flush()
+            return
+        self._ensure_worker()
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """버퍼를 batch_size 단위로 모두 기록하고 기록한 건수를 돌려줌.
+
+        DB 연결 오류로 기록하지 못한 행은 버퍼 앞에 되돌리고 이번 flush 를 멈춥니다.
+        """
+        written = 0
+        while True:
+            with self._lock:
+                batch = [self._entries.popleft()
+                         for _ in range(min(self.batch_size, len(self._entries)))]
+            if not batch:
+                return written
+            try:
+                self._write(batch)
+                written += len(batch)
+                continue
+            except Exception as exc:
+                logger.warning('AuditBuffer: 감사 로그 일괄 기록 실패 — 행 단위로 재시도 (%d건): %s',
+                               len(batch), exc)
+            for index, entry in enumerate(batch):
+                try:
+                    self._write_one(entry)
+                    written += 1
+                except (OperationalError, InterfaceError) as exc:
+                    self._requeue(batch[index:], exc)
+                    return written
+                except Exception as exc:
+                    logger.error('AuditBuffer: 감사 로그 1건 기록 실패 (유실): %s', exc)
+
+    def _requeue(self, entries, exc):
+        with self._lock:
+            self._entries.extendleft(reversed(entries))
+            overflow = len(self._entries) - self.max_pending
+            for _ in range(max(overflow, 0)):
+                self._entries.popleft()
+        logger.error('AuditBuffer: DB 연결 오류로 %d건 재대기%s: %s', len(entries),
+                     f' (상한 초과 {overflow}건 유실)' if overflow > 0 else '', exc)
+
+    def _write(self, batch):
+        from .models import AuditLog
+        AuditLog.objects.bulk_create(batch)
+
+    def _write_one(self, entry):
+        entry.save(force_insert=True)
+
+    def _ensure_worker(self):
+        pid = os.getpid()
+        if self._pid == pid and self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._worker is not None and self._worker.is_alive():
+                return
+            self._pid = pid   # fork 된 워커 프로세스는 자기 스레드를 새로 시작
+            self._worker = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            close_old_connections()
+            self.flush()
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = AuditBuffer(
+                    batch_size=getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 200),
+                    flush_interval=getattr(settings, 'AUDIT_LOG_FLUSH_INTERVAL', 2.0),
+                    max_pending=getattr(settings, 'AUDIT_LOG_MAX_PENDING', 100000),
+                )
+    return _buffer
+
+
+def flush():
+    """남은 버퍼를 즉시 기록 (프로세스 종료 시 자동 호출)."""
+    if _buffer is None:
+        return 0
+    return _buffer.flush()
+
+
+atexit.register(flush)
@@ -0,0 +1,88 @@
+"""
+목록 내보내기 — CSV / XLSX 를 일정한 메모리로 생성
+
+행은 queryset.values_list(...).iterator(chunk_size) 로 읽습니다. PostgreSQL 에서는
+서버 측 커서로 chunk 단위만 메모리에 올라오므로 행 수와 무관하게 메모리가 일정합니다.
+
+    CSV   StreamingHttpResponse — 행을 읽는 즉시 응답으로 흘려보냄 (Excel 용 UTF-8 BOM)
+    XLSX  openpyxl write-only 워크북 → 임시 파일 → FileResponse 로 분할 전송
+          (XLSX 는 zip 이라 끝까지 쓴 뒤 전송, 메모리 대신 디스크 사용)
+
+ViewSet 에서는 scm_core.mixins.ExportMixin 의 export action 으로 사용합니다.
+"""
+import csv
+import datetime
+import tempfile
+
+from django.core.exceptions import FieldDoesNotExist
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+
+EXPORT_CHUNK_SIZE = 2000
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+def field_header(model, path):
+    """'warehouse__warehouse_name' 같은 values 경로의 마지막 필드 verbose_name."""
+    field = None
+    for part in path.split('__'):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return path
+        model = field.related_model or model
+    return str(getattr(field, 'verbose_name', path))
+
+
+def iter_rows(queryset, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    return queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+
+
+def _local(value):
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        return timezone.make_naive(value)
+    return value
+
+
+def _csv_cell(value):
+    if value is None:
+        return ''
+    value = _local(value)
+    if isinstance(value, datetime.datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return value
+
+
+class _Echo:
+    """csv.writer 가 쓴 한 줄을 그대로 돌려주는 파일 흉내."""
+    def write(self, value):
+        return value
+
+
+def stream_csv(headers, rows):
+    writer = csv.writer(_Echo())
+    yield '\ufeff'
+    yield writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow([_csv_cell(v) for v in row])
+
+
+def csv_response(filename, headers, rows):
+    response = StreamingHttpResponse(stream_csv(headers, rows), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
+    return response
+
+
+def xlsx_response(filename, headers, rows):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=filename[:31])
+    sheet.append(headers)
+    for row in rows:
+        sheet.append([_local(v) for v in row])
+    buffer = tempfile.TemporaryFile()
+    workbook.save(buffer)
+    buffer.seek(0)
+    return FileResponse(buffer, as_attachment=True, filename=f'{filename}.xlsx',
+                        content_type=XLSX_CONTENT_TYPE)
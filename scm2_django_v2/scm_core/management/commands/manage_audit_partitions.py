@@ -0,0 +1,59 @@
+"""
+감사 로그(AuditLog) 파티션 유지·보존 기간 관리
+
+    python manage.py manage_audit_partitions --convert                   # 최초 1회 파티션 테이블 전환
+    python manage.py manage_audit_partitions                             # 미래 월 파티션 생성
+    python manage.py manage_audit_partitions --retain-months 24 --archive file --export-dir /backup/audit
+
+PostgreSQL 에서는 월 파티션 단위로 분리·보관하고(scm_core.partitions), 그 외 DB 에서는
+보존 기간 이전 행을 gzip CSV 로 내보낸 뒤 삭제합니다. 보존 기간 기본값은 settings.AUDIT_LOG_RETAIN_MONTHS
+(기본 0 — 설정하지 않으면 아무것도 삭제하지 않음).
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from scm_core import partitions
+
+
+class Command(BaseCommand):
+    help = '감사 로그 월 파티션 생성 및 보존 기간이 지난 파티션 보관'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--convert', action='store_true',
+                            help='기존 테이블을 파티션 테이블로 전환 (PostgreSQL, 최초 1회)')
+        parser.add_argument('--months-ahead', type=int, default=3, help='미리 만들 미래 월 파티션 수')
+        parser.add_argument('--retain-months', type=int,
+                            default=getattr(settings, 'AUDIT_LOG_RETAIN_MONTHS', None),
+                            help='이 개월 수 이전 데이터를 보관 처리 (0/미지정: 보관 안 함)')
+        parser.add_argument('--archive', choices=['file', 'table'], default='file',
+                            help='file: gzip CSV 후 삭제 / table: 보관 테이블로 이동 (PostgreSQL)')
+        parser.add_argument('--export-dir', default=getattr(settings, 'AUDIT_LOG_ARCHIVE_DIR', None))
+
+    def handle(self, *args, **options):
+        retain = options['retain_months']
+        cutoff = None
+        if retain:
+            cutoff = partitions.add_months(partitions.month_start(timezone.now()), -retain)
+            if options['archive'] == 'file' and not options['export_dir']:
+                raise CommandError('--archive file 에는 --export-dir (또는 AUDIT_LOG_ARCHIVE_DIR) 이 필요합니다.')
+
+        if not partitions.supported():
+            if options['convert'] or (cutoff and options['archive'] == 'table'):
+                raise CommandError('파티션 전환·보관 테이블은 PostgreSQL 에서만 지원합니다.')
+            if cutoff:
+                path, count = partitions.retire_rows(cutoff, options['export_dir'])
+                self.stdout.write(self.style.SUCCESS(f'{cutoff:%Y-%m} 이전 {count}건 → {path}'))
+            return
+
+        if options['convert']:
+            if partitions.convert_to_partitioned(options['months_ahead']):
+                self.stdout.write(self.style.SUCCESS('감사 로그 테이블을 월 파티션 테이블로 전환했습니다.'))
+        if not partitions.is_partitioned():
+            raise CommandError('감사 로그 테이블이 파티션 테이블이 아닙니다. --convert 로 먼저 전환하세요.')
+
+        for name in partitions.ensure_partitions(options['months_ahead']):
+            self.stdout.write(f'파티션 생성: {name}')
+        if cutoff:
+            for name, target in partitions.retire_partitions(cutoff, options['archive'], options['export_dir']):
+                self.stdout.write(self.style.SUCCESS(f'파티션 보관: {name} → {target}'))
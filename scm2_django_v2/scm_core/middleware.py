@@ -0,0 +1,137 @@
+"""
+scm_core.middleware — 요청별 SQL 쿼리 수 / DB 시간 / 직렬화 시간 계측
+
+QueryBudgetMiddleware 는 모든 요청의 SQL 실행을 connection.execute_wrapper 로
+감싸 쿼리 수와 DB 시간을 집계하고, Server-Timing 헤더로 내보냅니다.
+(DEBUG=False 인 운영 환경에서도 동작하며 APM 없이 브라우저 개발자도구에서 확인 가능)
+
+    Server-Timing: db;dur=12.4;desc="18 queries", ser;dur=3.1, app;dur=41.0
+
+쿼리 수가 뷰별 예산을 넘으면 'scm_core.perf' 로거에 WARNING 을 남깁니다.
+예산 결정 순서 (먼저 찾은 값):
+    1. settings.QUERY_BUDGETS['<ViewSet>.<action>'] 또는 ['<ViewSet>']
+    2. 뷰 클래스의 query_budgets[action]  (QueryBudgetMixin)
+    3. 뷰 클래스의 query_budget
+    4. settings.QUERY_BUDGET_DEFAULT (None 이면 경고 없음)
+
+직렬화 시간(ser)은 QueryBudgetMixin 을 쓴 ViewSet 에서만 기록됩니다.
+"""
+import contextvars
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('scm_core.perf')
+
+_current = contextvars.ContextVar('scm_core_request_metrics', default=None)
+
+
+class RequestMetrics:
+    """한 요청의 계측값 (시간 단위: 초)."""
+
+    __slots__ = ('queries', 'db_time', 'serialize_time', 'view_class', 'action')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.view_class = None
+        self.action = None
+
+    @property
+    def view_name(self):
+        if self.view_class is None:
+            return ''
+        if self.action:
+            return f'{self.view_class.__name__}.{self.action}'
+        return self.view_class.__name__
+
+
+def current_metrics():
+    """진행 중인 요청의 RequestMetrics (미들웨어 밖이면 None)."""
+    return _current.get()
+
+
+def _count_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_time += time.perf_counter() - start
+        metrics.queries += 1
+
+
+def resolve_view_action(view_func, method):
+    """URL resolver 가 돌려준 view 함수 → (ViewSet/APIView 클래스, action 이름)."""
+    view_class = getattr(view_func, 'cls', None)
+    actions = getattr(view_func, 'actions', None) or {}
+    return view_class, actions.get(method.lower())
+
+
+def query_budget_for(view_class, action):
+    """쿼리 예산 (모듈 docstring 의 결정 순서). 예산이 없으면 None."""
+    overrides = getattr(settings, 'QUERY_BUDGETS', {})
+    if view_class is not None:
+        name = view_class.__name__
+        if action and f'{name}.{action}' in overrides:
+            return overrides[f'{name}.{action}']
+        if name in overrides:
+            return overrides[name]
+        per_action = getattr(view_class, 'query_budgets', None) or {}
+        if action in per_action:
+            return per_action[action]
+        if getattr(view_class, 'query_budget', None) is not None:
+            return view_class.query_budget
+    return getattr(settings, 'QUERY_BUDGET_DEFAULT', None)
+
+
+class QueryBudgetMiddleware:
+    """요청별 쿼리 수·DB 시간 계측, Server-Timing 헤더, 예산 초과 로깅."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, 'QUERY_BUDGET_ENABLED', True):
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(_count_query))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total = time.perf_counter() - start
+
+        timings = [
+            f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.queries} queries"',
+            f'app;dur={total * 1000:.1f}',
+        ]
+        if metrics.serialize_time:
+            timings.insert(1, f'ser;dur={metrics.serialize_time * 1000:.1f}')
+        response['Server-Timing'] = ', '.join(timings)
+
+        budget = query_budget_for(metrics.view_class, metrics.action)
+        if budget is not None and metrics.queries > budget:
+            logger.warning(
+                'query budget exceeded: %s %s view=%s queries=%d budget=%d db=%.1fms total=%.1fms',
+                request.method, request.path, metrics.view_name or '-',
+                metrics.queries, budget, metrics.db_time * 1000, total * 1000,
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.view_class, metrics.action = resolve_view_action(view_func, request.method)
+        return None
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:46
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scm_core', '0002_auditlog_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='기록일시'),
+        ),
+    ]
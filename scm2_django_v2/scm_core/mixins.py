@@ -1,4 +1,11 @@
+import time
+
+from django.utils import timezone
+from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+
+from .middleware import current_metrics
 from .utils import log_audit
 
 
@@ -96,3 +103,80 @@ class StateLockMixin:
     def destroy(self, request, *args, **kwargs):
         self._check_state_lock(self.get_object())
         return super().destroy(request, *args, **kwargs)
+
+
+class QueryBudgetMixin:
+    """
+    ViewSet 의 쿼리 예산 선언 + 직렬화 시간 계측 (QueryBudgetMiddleware 와 함께 사용).
+
+        query_budget  = 10                       # 모든 action 공통
+        query_budgets = {'dashboard': 6}         # action 별 (우선)
+
+    get_serializer() 가 돌려준 시리얼라이저의 to_representation 시간을
+    Server-Timing 의 ser 항목으로 기록합니다. 지연 로딩으로 직렬화 중 발생한
+    쿼리는 db 와 ser 양쪽에 포함됩니다.
+    """
+    query_budget = None
+    query_budgets: dict = {}
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        metrics = current_metrics()
+        if metrics is None:
+            return serializer
+        to_representation = serializer.to_representation
+
+        def timed(instance):
+            start = time.perf_counter()
+            try:
+                return to_representation(instance)
+            finally:
+                metrics.serialize_time += time.perf_counter() - start
+
+        serializer.to_representation = timed
+        return serializer
+
+
+class ExportMixin:
+    """
+    목록 내보내기 action — GET <목록 URL>/export/?export_format=csv|xlsx
+
+    목록과 같은 필터·검색·정렬(filter_queryset)을 적용한 전체 행을 페이지 없이 내보냅니다.
+    (DRF 가 format 파라미터를 렌더러 선택에 쓰므로 export_format 을 사용)
+
+        export_fields   = ['material_code', 'warehouse__warehouse_name', 'quantity']  # values 경로
+        export_headers  = {'warehouse__warehouse_name': '창고'}   # 생략 시 모델 verbose_name
+        export_filename = 'stock_movements'
+
+    다른 모델의 행을 내보내려면 get_export_queryset() 을 재정의합니다.
+    """
+    export_fields: list = []
+    export_headers: dict = {}
+    export_filename = None
+
+    def get_export_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        from .export import csv_response, field_header, iter_rows, xlsx_response
+
+        export_format = request.query_params.get('export_format', 'csv').lower()
+        if export_format not in ('csv', 'xlsx'):
+            return Response({'detail': "export_format 은 'csv' 또는 'xlsx' 여야 합니다."}, status=400)
+
+        queryset = self.get_export_queryset()
+        fields = self.export_fields or [
+            f.attname for f in queryset.model._meta.concrete_fields if f.name != 'company'
+        ]
+        headers = [self.export_headers.get(f) or field_header(queryset.model, f) for f in fields]
+        filename = (f'{self.export_filename or queryset.model._meta.model_name}'
+                    f'_{timezone.localdate():%Y%m%d}')
+        rows = iter_rows(queryset, fields)
+
+        if export_format == 'csv':
+            return csv_response(filename, headers, rows)
+        try:
+            return xlsx_response(filename, headers, rows)
+        except ImportError:
+            return Response({'detail': 'XLSX 내보내기에는 openpyxl 이 필요합니다.'}, status=501)
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from scm_accounts.models import Company
 
 
@@ -33,12 +34,17 @@ class AuditLog(models.Model):
     user_agent = models.CharField(
         max_length=500, blank=True, verbose_name='User-Agent'
     )
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name='기록일시')
+    # 작업 시각 — 인스턴스 생성 시점 (buffered 기록은 저장이 늦어도 작업 시각 유지)
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name='기록일시')
 
     class Meta:
         ordering = ['-created_at']
+        # 관리자 목록·API 필터(company, module, user) + 최신순 정렬에 맞춘 복합 인덱스
+        # 월 단위 파티셔닝은 scm_core.partitions / manage_audit_partitions 명령 참고
         indexes = [
-            models.Index(fields=['company', 'module']),
+            models.Index(fields=['company', 'module', '-created_at'], name='auditlog_co_mod_created_idx'),
+            models.Index(fields=['company', '-created_at'], name='auditlog_co_created_idx'),
+            models.Index(fields=['company', 'user', '-created_at'], name='auditlog_co_user_created_idx'),
             models.Index(fields=['company', 'model_name', 'object_id']),
             models.Index(fields=['user', 'created_at']),
             models.Index(fields=['action', 'created_at']),
@@ -0,0 +1,39 @@
+"""
+공통 마이그레이션 operation
+
+AddIndexConcurrentlyIfSupported
+    PostgreSQL 에서는 CREATE INDEX CONCURRENTLY 로 쓰기를 막지 않고 인덱스를 만들고,
+    그 외 DB(SQLite 테스트 등)에서는 일반 AddIndex 로 동작합니다.
+    사용하는 마이그레이션은 atomic = False 여야 합니다.
+
+RemoveIndexConcurrentlyIfSupported
+    같은 방식으로 PostgreSQL 에서는 DROP INDEX CONCURRENTLY, 그 외 DB 에서는 일반 RemoveIndex.
+"""
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db.migrations.operations import AddIndex, RemoveIndex
+
+
+class AddIndexConcurrentlyIfSupported(AddIndexConcurrently):
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        return AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        return AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class RemoveIndexConcurrentlyIfSupported(RemoveIndexConcurrently):
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        return RemoveIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        return RemoveIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
@@ -1,13 +1,183 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def estimate_count(queryset):
+    """PostgreSQL 플래너 통계 기반 추정 행 수 (EXPLAIN, 실행 없음). 그 외 DB 는 None."""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination(BasePagination):
+    """
+    키셋(커서) 페이지네이션 — OFFSET·COUNT(*) 없이 마지막 행의 정렬 키 다음부터 조회.
+
+        GET /api/wm/movements/?pagination=cursor            첫 페이지
+        GET /api/wm/movements/?pagination=cursor&cursor=…   next / previous 링크 그대로 사용
+
+    정렬은 (created_at, id) 내림차순 고정이며 (created_at 이 없는 모델은 id),
+    ViewSet 의 keyset_ordering = ('-created_at', '-id') 로 바꿀 수 있습니다. 모든 키는 같은 방향이어야 하고
+    ?ordering 파라미터는 무시됩니다. 정렬 키에 인덱스가 있으면 깊은 페이지도 첫 페이지와 같은 비용입니다.
+
+    응답은 StandardPagination 과 같은 형태에서 정확한 건수(count/total_pages/current_page) 대신
+    PostgreSQL 플래너 추정치 estimated_count 를 돌려줍니다.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+
+    @classmethod
+    def requested(cls, request):
+        params = request.query_params
+        return params.get(cls.mode_query_param) == 'cursor' or cls.cursor_query_param in params
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset, view):
+        ordering = getattr(view, 'keyset_ordering', None)
+        if ordering is None:
+            names = {f.name for f in queryset.model._meta.concrete_fields}
+            ordering = ('-created_at', '-id') if 'created_at' in names else ('-id',)
+        if len({o.startswith('-') for o in ordering}) != 1:
+            raise ValueError('keyset_ordering 의 모든 키는 같은 방향이어야 합니다.')
+        return tuple(ordering)
+
+    # ── 커서 인코딩 ──────────────────────────────────────────────
+    def decode_cursor(self, request, model, ordering):
+        raw = request.query_params.get(self.cursor_query_param)
+        if not raw:
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(raw.encode()).decode())
+            fields = [model._meta.get_field(o.lstrip('-')) for o in ordering]
+            keys = [f.to_python(v) for f, v in zip(fields, data['k'], strict=True)]
+            return keys, bool(data.get('r'))
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound('잘못된 cursor 입니다.')
+
+    def encode_cursor(self, instance, reverse):
+        keys = []
+        for o in self.ordering:
+            value = getattr(instance, o.lstrip('-'))
+            keys.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        raw = json.dumps({'k': keys, 'r': int(reverse)}, default=str)
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _after(ordering, keys):
+        """ordering 방향으로 keys 다음 행 조건: (a < ka) OR (a = ka AND b < kb) …"""
+        condition, equal = Q(), {}
+        for o, key in zip(ordering, keys):
+            name = o.lstrip('-')
+            lookup = 'lt' if o.startswith('-') else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': key})
+            equal[name] = key
+        return condition
+
+    # ── BasePagination ───────────────────────────────────────────
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = self.get_ordering(queryset, view)
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request, queryset.model, self.ordering)
+        reverse = bool(cursor and cursor[1])
+
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(o[1:] if o.startswith('-') else f'-{o}' for o in ordering)
+        qs = queryset.order_by(*ordering)
+        if cursor:
+            qs = qs.filter(self._after(ordering, cursor[0]))
+
+        rows = list(qs[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+        self.has_next = True if reverse else has_more
+        self.has_previous = has_more if reverse else cursor is not None
+        self.page = rows
+        self.estimated_count = estimate_count(queryset)
+        return rows
+
+    def _link(self, instance, reverse):
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.mode_query_param, 'cursor')
+        if instance is None:
+            return remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(instance, reverse))
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.page):
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'estimated_count': self.estimated_count,
+            'next':            self.get_next_link(),
+            'previous':        self.get_previous_link(),
+            'results':         data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'estimated_count': {'type': 'integer', 'nullable': True},
+                'next':            {'type': 'string', 'nullable': True},
+                'previous':        {'type': 'string', 'nullable': True},
+                'results':         schema,
+            },
+        }
 
 
 class StandardPagination(PageNumberPagination):
+    """
+    페이지 번호 페이지네이션. ?pagination=cursor (또는 cursor 파라미터)가 있으면
+    KeysetPagination 으로 처리합니다 — 대용량 목록(재고이동, 전표라인, 감사로그, 채팅, 알림)용.
+    """
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 200
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if KeysetPagination.requested(request):
+            self.keyset = KeysetPagination()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
         return Response({
             'count':        self.page.paginator.count,
             'next':         self.get_next_link(),
@@ -0,0 +1,270 @@
+"""
+AuditLog 월 단위 파티션 관리 (PostgreSQL 선언적 파티셔닝)
+
+    convert_to_partitioned()    기존 테이블을 RANGE(created_at) 파티션 테이블로 전환 (1회)
+                                기존 행은 가장 오래된 달부터 월 파티션으로 나눠 옮김
+    ensure_partitions(ahead)    이번 달 ~ ahead 개월 뒤 월 파티션 + default 파티션 생성
+    retire_partitions(cutoff)   cutoff 이전에 끝나는 파티션을 live 테이블에서 분리해
+                                  'table' → 압축 설정 테이블로 다시 써서 scm_core_auditlog_archive
+                                            파티션으로 붙임 (AUDIT_LOG_ARCHIVE_COMPRESSION)
+                                  'file'  → gzip CSV 로 내보낸 뒤 삭제
+    retire_rows(cutoff)         파티셔닝이 없는 DB(SQLite 등)용 — 행 단위 gzip CSV 내보내기 후 삭제
+
+최근 데이터 조회는 created_at 범위 조건으로 해당 월 파티션만 읽습니다(partition pruning).
+파티션 경계는 UTC 월 1일 00:00 이며, 실행은 manage_audit_partitions 명령을 사용합니다.
+"""
+import csv
+import datetime
+import gzip
+import json
+import os
+import re
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+TABLE = 'scm_core_auditlog'
+LEGACY_PARTITION = f'{TABLE}_legacy'   # 전환 중 기존 테이블 (행을 월 파티션으로 옮긴 뒤 삭제)
+DEFAULT_PARTITION = f'{TABLE}_default'
+ARCHIVE_TABLE = f'{TABLE}_archive'
+SEQUENCE = f'{TABLE}_id_seq'
+
+_BOUND = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def month_start(value):
+    value = timezone.localtime(value, datetime.timezone.utc) if timezone.is_aware(value) else value
+    return datetime.datetime(value.year, value.month, 1, tzinfo=datetime.timezone.utc)
+
+
+def add_months(value, months):
+    years, month = divmod(value.month - 1 + months, 12)
+    return value.replace(year=value.year + years, month=month + 1, day=1)
+
+
+def partition_name(start):
+    return f'{TABLE}_p{start:%Y_%m}'
+
+
+def supported():
+    return connection.vendor == 'postgresql'
+
+
+def is_partitioned():
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)', [TABLE])
+        row = cursor.fetchone()
+    return bool(row and row[0] == 'p')
+
+
+def _parse_bound(value):
+    if value == 'MINVALUE':
+        return None
+    return datetime.datetime.fromisoformat(value.strip("'"))
+
+
+def list_partitions(parent=TABLE):
+    """[(name, bound_sql, lower, upper)] — default 파티션은 lower/upper 모두 None, MINVALUE 는 lower None."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+              FROM pg_inherits
+              JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+              JOIN pg_class child  ON child.oid  = pg_inherits.inhrelid
+             WHERE parent.relname = %s
+             ORDER BY child.relname
+            """,
+            [parent],
+        )
+        rows = cursor.fetchall()
+    partitions = []
+    for name, bound in rows:
+        match = _BOUND.search(bound)
+        lower, upper = (_parse_bound(match.group(1)), _parse_bound(match.group(2))) if match else (None, None)
+        partitions.append((name, bound, lower, upper))
+    return partitions
+
+
+def convert_to_partitioned(months_ahead=3):
+    """
+    scm_core_auditlog → RANGE(created_at) 파티션 테이블 (PK (id, created_at)).
+
+    기존 테이블 이름을 바꾼 뒤 가장 오래된 행의 달부터 월 파티션을 만들고 행을 옮깁니다
+    (INSERT … SELECT 1회 — 월별 보관·삭제가 처음부터 파티션 단위로 동작). 행 수만큼 쓰기가
+    일어나므로 유지보수 시간에 실행합니다. 이미 전환됐으면 False.
+    """
+    from .models import AuditLog
+
+    if is_partitioned():
+        return False
+    boundary = month_start(timezone.now())
+    columns = ', '.join(connection.ops.quote_name(f.column) for f in AuditLog._meta.concrete_fields)
+    with connection.schema_editor() as editor:
+        q = editor.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT indexname FROM pg_indexes WHERE tablename = %s', [TABLE])
+            index_names = [row[0] for row in cursor.fetchall()]
+
+        # 1) 기존 테이블·인덱스 이름 변경 (새 부모 테이블이 원래 이름을 사용)
+        editor.execute(f'ALTER TABLE {q(TABLE)} RENAME TO {q(LEGACY_PARTITION)}')
+        for name in index_names:
+            editor.execute(f'ALTER INDEX {q(name)} RENAME TO {q(name[:55] + "_legacy")}')
+
+        # 2) id 는 identity 대신 부모 소유 시퀀스 사용 (파티션 간 공유)
+        editor.execute(f'ALTER TABLE {q(LEGACY_PARTITION)} ALTER COLUMN id DROP IDENTITY IF EXISTS')
+        editor.execute(f'ALTER TABLE {q(LEGACY_PARTITION)} ALTER COLUMN id DROP DEFAULT')
+        editor.execute(f'CREATE SEQUENCE IF NOT EXISTS {q(SEQUENCE)}')
+        editor.execute(
+            f"SELECT setval('{SEQUENCE}', COALESCE(MAX(id), 0) + 1, false) FROM {q(LEGACY_PARTITION)}"
+        )
+
+        # 3) 부모 테이블 + PK·FK·인덱스 (Django 모델 정의 그대로, 명시적 DDL / add_index)
+        editor.execute(
+            f'CREATE TABLE {q(TABLE)} (LIKE {q(LEGACY_PARTITION)} INCLUDING DEFAULTS INCLUDING STORAGE) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        editor.execute(f"ALTER TABLE {q(TABLE)} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')")
+        editor.execute(f'ALTER SEQUENCE {q(SEQUENCE)} OWNED BY {q(TABLE)}.id')
+        editor.execute(f'ALTER TABLE {q(TABLE)} ADD CONSTRAINT {q(TABLE + "_pkey")} PRIMARY KEY (id, created_at)')
+        for field in AuditLog._meta.concrete_fields:
+            if field.remote_field and field.db_constraint:
+                target = field.target_field
+                editor.execute(
+                    f'ALTER TABLE {q(TABLE)} ADD CONSTRAINT {q(f"{TABLE}_{field.column}_fk")} '
+                    f'FOREIGN KEY ({q(field.column)}) '
+                    f'REFERENCES {q(target.model._meta.db_table)} ({q(target.column)}) '
+                    f'DEFERRABLE INITIALLY DEFERRED'
+                )
+            if field.db_index and not field.primary_key:
+                editor.execute(
+                    f'CREATE INDEX {q(f"{TABLE}_{field.column}_idx")} ON {q(TABLE)} ({q(field.column)})'
+                )
+        for index in AuditLog._meta.indexes:
+            editor.add_index(AuditLog, index)
+
+        # 4) 기존 행의 달마다 월 파티션 생성 → 행 이동 (전환 시점 이후 행은 미래/default 파티션)
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT MIN(created_at) FROM {q(LEGACY_PARTITION)}')
+            oldest = cursor.fetchone()[0]
+            lower = month_start(oldest) if oldest is not None else boundary
+            while lower < boundary:
+                _create_month_partition(cursor, lower)
+                lower = add_months(lower, 1)
+        ensure_partitions(months_ahead)
+        editor.execute(
+            f'INSERT INTO {q(TABLE)} ({columns}) SELECT {columns} FROM {q(LEGACY_PARTITION)}'
+        )
+        editor.execute(f'DROP TABLE {q(LEGACY_PARTITION)}')
+    return True
+
+
+def _create_month_partition(cursor, lower):
+    name = partition_name(lower)
+    q = connection.ops.quote_name
+    cursor.execute(
+        f'CREATE TABLE {q(name)} PARTITION OF {q(TABLE)} FOR VALUES FROM (%s) TO (%s)',
+        [lower, add_months(lower, 1)],
+    )
+    return name
+
+
+def ensure_partitions(months_ahead=3, now=None):
+    """이번 달부터 months_ahead 개월 뒤까지 월 파티션을 만들고 새로 만든 이름 목록을 돌려줌."""
+    existing = {name for name, *_ in list_partitions()}
+    start = month_start(now or timezone.now())
+    created = []
+    with connection.cursor() as cursor:
+        q = connection.ops.quote_name
+        if DEFAULT_PARTITION not in existing:
+            cursor.execute(f'CREATE TABLE {q(DEFAULT_PARTITION)} PARTITION OF {q(TABLE)} DEFAULT')
+            created.append(DEFAULT_PARTITION)
+        for offset in range(months_ahead + 1):
+            lower = add_months(start, offset)
+            if partition_name(lower) in existing:
+                continue
+            created.append(_create_month_partition(cursor, lower))
+    return created
+
+
+def _ensure_archive_table():
+    q = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {q(ARCHIVE_TABLE)} (LIKE {q(TABLE)}) PARTITION BY RANGE (created_at)'
+        )
+
+
+def _compress_into(cursor, name, compressed):
+    """분리한 파티션을 압축 설정 테이블로 다시 씀 (인덱스 없음, 이름은 원래 파티션명으로).
+
+    toast_tuple_target 을 낮춰 짧은 변경 내역(JSON)도 인라인 압축 대상이 되게 하고,
+    가변 길이 컬럼의 압축 방식을 AUDIT_LOG_ARCHIVE_COMPRESSION(pglz|lz4)으로 지정합니다.
+    이미 저장된 값은 압축 설정이 바뀌어도 다시 압축되지 않으므로 행을 새 테이블로 옮깁니다.
+    """
+    from .models import AuditLog
+
+    q = connection.ops.quote_name
+    method = getattr(settings, 'AUDIT_LOG_ARCHIVE_COMPRESSION', 'pglz')
+    cursor.execute(
+        f'CREATE TABLE {q(compressed)} (LIKE {q(ARCHIVE_TABLE)} INCLUDING DEFAULTS) '
+        f'WITH (toast_tuple_target = 128)'
+    )
+    for field in AuditLog._meta.concrete_fields:
+        if field.get_internal_type() in ('CharField', 'TextField', 'JSONField'):
+            cursor.execute(
+                f'ALTER TABLE {q(compressed)} ALTER COLUMN {q(field.column)} SET COMPRESSION {method}'
+            )
+    cursor.execute(f'INSERT INTO {q(compressed)} SELECT * FROM {q(name)}')
+    cursor.execute(f'DROP TABLE {q(name)}')
+    cursor.execute(f'ALTER TABLE {q(compressed)} RENAME TO {q(name)}')
+
+
+def _export_path(export_dir, name):
+    os.makedirs(export_dir, exist_ok=True)
+    return os.path.join(export_dir, f'{name}.csv.gz')
+
+
+def retire_partitions(cutoff, mode='file', export_dir=None):
+    """cutoff 이전에 끝나는 파티션을 분리해 보관. [(파티션명, 보관 위치)] 반환."""
+    if mode not in ('table', 'file'):
+        raise ValueError(f'mode 는 table 또는 file: {mode}')
+    q = connection.ops.quote_name
+    retired = []
+    for name, bound, _lower, upper in list_partitions():
+        if upper is None or upper > cutoff:
+            continue   # default 파티션·보존 기간 내 파티션
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE {q(TABLE)} DETACH PARTITION {q(name)}')
+            if mode == 'table':
+                _ensure_archive_table()
+                _compress_into(cursor, name, f'{name}_z')
+                cursor.execute(f'ALTER TABLE {q(ARCHIVE_TABLE)} ATTACH PARTITION {q(name)} {bound}')
+                retired.append((name, ARCHIVE_TABLE))
+            else:
+                path = _export_path(export_dir, name)
+                with gzip.open(path, 'wt', encoding='utf-8', newline='') as fh:
+                    cursor.copy_expert(f'COPY {q(name)} TO STDOUT WITH (FORMAT csv, HEADER)', fh)
+                cursor.execute(f'DROP TABLE {q(name)}')
+                retired.append((name, path))
+    return retired
+
+
+def retire_rows(cutoff, export_dir):
+    """파티셔닝이 없는 DB 용: cutoff 이전 행을 gzip CSV 로 내보내고 삭제. (경로, 건수) 반환."""
+    from .models import AuditLog
+
+    queryset = AuditLog.objects.filter(created_at__lt=cutoff).order_by('created_at', 'id')
+    fields = [f.attname for f in AuditLog._meta.concrete_fields]
+    path = _export_path(export_dir, f'{TABLE}_before_{cutoff:%Y_%m}')
+    count = 0
+    with gzip.open(path, 'wt', encoding='utf-8', newline='') as fh:
+        writer = csv.writer(fh)
+        writer.writerow(fields)
+        for row in queryset.values_list(*fields).iterator(chunk_size=2000):
+            writer.writerow([json.dumps(v, ensure_ascii=False) if isinstance(v, (dict, list)) else v
+                             for v in row])
+            count += 1
+    queryset.delete()
+    return path, count
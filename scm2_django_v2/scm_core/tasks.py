@@ -0,0 +1,25 @@
+"""scm_core 정기 작업 (Celery beat).
+
+maintain_audit_partitions : 감사 로그 미래 월 파티션 생성 + 보존 기간 지난 파티션 보관
+                            (settings.CELERY_BEAT_SCHEDULE 에서 매일 실행)
+                            PostgreSQL 에서 테이블을 아직 전환(--convert)하지 않았으면 경고 후 건너뜀
+"""
+import logging
+
+from celery import shared_task
+from django.core.management import call_command
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='scm_core.maintain_audit_partitions')
+def maintain_audit_partitions():
+    from scm_core import partitions
+
+    if partitions.supported() and not partitions.is_partitioned():
+        logger.warning(
+            'maintain_audit_partitions: 감사 로그 테이블이 파티션 테이블이 아님 — '
+            'manage_audit_partitions --convert 실행 전까지 건너뜀'
+        )
+        return
+    call_command('manage_audit_partitions')
@@ -0,0 +1,54 @@
+"""
+scm_core.testing — 테스트 헬퍼
+
+QueryBudgetTestMixin 을 TestCase 에 섞으면 ViewSet action 별 쿼리 예산을
+검증할 수 있습니다. 예산을 생략하면 운영과 같은 규칙
+(settings.QUERY_BUDGETS → 뷰의 query_budgets/query_budget → QUERY_BUDGET_DEFAULT)
+으로 정합니다.
+
+    class InventoryQueryTests(QueryBudgetTestMixin, TestCase):
+        def test_dashboard(self):
+            self.assertWithinQueryBudget('get', '/api/wm/inventory/dashboard/')
+
+        def test_all_actions(self):
+            self.assertQueryBudgets([
+                ('get',  '/api/wm/inventory/', 5),
+                ('get',  '/api/wm/inventory/dashboard/'),
+            ])
+"""
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+from .middleware import query_budget_for, resolve_view_action
+
+
+class QueryBudgetTestMixin:
+    """self.client 로 요청하고 실행된 쿼리 수가 예산 이내인지 검증."""
+
+    def assertWithinQueryBudget(self, method, url, budget=None, data=None, using=DEFAULT_DB_ALIAS, **extra):
+        if budget is None:
+            view_class, action = resolve_view_action(resolve(url.split('?')[0]).func, method)
+            budget = query_budget_for(view_class, action)
+            if budget is None:
+                self.fail(f'{method.upper()} {url}: 쿼리 예산이 정의되지 않았습니다.')
+
+        with CaptureQueriesContext(connections[using]) as ctx:
+            if data is None:
+                response = getattr(self.client, method.lower())(url, **extra)
+            else:
+                response = getattr(self.client, method.lower())(url, data, **extra)
+
+        if len(ctx.captured_queries) > budget:
+            sqls = '\n'.join(f'  {i}. {q["sql"]}' for i, q in enumerate(ctx.captured_queries, 1))
+            self.fail(
+                f'{method.upper()} {url}: 쿼리 {len(ctx.captured_queries)}개가 예산 {budget}개를 초과했습니다.\n{sqls}'
+            )
+        return response
+
+    def assertQueryBudgets(self, cases):
+        """(method, url[, budget[, data]]) 튜플 목록을 subTest 로 검증."""
+        for case in cases:
+            method, url, *rest = case
+            with self.subTest(method=method, url=url):
+                self.assertWithinQueryBudget(method, url, *rest)
@@ -40,7 +40,8 @@ def log_audit(
     company=None,
 ):
     """
-    감사 로그를 비동기 없이 즉시 기록합니다.
+    감사 로그를 기록합니다. 모듈별 방식은 settings.AUDIT_LOG_MODULE_MODES (scm_core.audit 참고):
+    sync 는 즉시 INSERT, buffered 는 트랜잭션 커밋 후 버퍼에 넣어 일괄 기록합니다.
 
     :param request:     Django HttpRequest (user, IP 추출)
     :param action:      'CREATE' | 'UPDATE' | 'DELETE'
@@ -50,8 +51,12 @@ def log_audit(
     :param object_repr: str(instance) 결과 (선택)
     :param changes:     변경 내역 dict (선택)
     :param company:     Company 인스턴스 (없으면 request.user.company 사용)
+    :return:            AuditLog (buffered 면 아직 저장되지 않은 인스턴스) 또는 None
     """
     # 순환 임포트 방지를 위해 함수 내부에서 임포트
+    from django.db import transaction
+
+    from .audit import audit_mode, get_buffer
     from .models import AuditLog
 
     user = getattr(request, 'user', None)
@@ -69,19 +74,25 @@ def log_audit(
         )
         return None
 
+    # created_at 은 여기(작업 시점)에서 정해짐 — buffered 기록이 늦게 저장돼도 유지
+    log_entry = AuditLog(
+        company=resolved_company,
+        user=user,
+        action=action,
+        module=module,
+        model_name=model_name,
+        object_id=object_id,
+        object_repr=object_repr[:200] if object_repr else '',
+        changes=changes or {},
+        ip_address=get_client_ip(request),
+        user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
+    )
+    if audit_mode(module) == 'buffered':
+        transaction.on_commit(lambda: get_buffer().add(log_entry))
+        return log_entry
+
     try:
-        log_entry = AuditLog.objects.create(
-            company=resolved_company,
-            user=user,
-            action=action,
-            module=module,
-            model_name=model_name,
-            object_id=object_id,
-            object_repr=object_repr[:200] if object_repr else '',
-            changes=changes or {},
-            ip_address=get_client_ip(request),
-            user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
-        )
+        log_entry.save()
         return log_entry
     except Exception as exc:
         logger.error(
@@ -1,3 +1,6 @@
+import datetime
+
+from django.utils import timezone
 from rest_framework import viewsets, filters
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet, CharFilter, DateFromToRangeFilter
@@ -13,13 +16,24 @@ class AuditLogFilter(FilterSet):
     model_name = CharFilter(field_name='model_name', lookup_expr='icontains')
     object_repr = CharFilter(field_name='object_repr', lookup_expr='icontains')
     user = django_filters.NumberFilter(field_name='user__id')
-    date_from = django_filters.DateFilter(field_name='created_at', lookup_expr='date__gte')
-    date_to = django_filters.DateFilter(field_name='created_at', lookup_expr='date__lte')
+    # created_at__date 변환 대신 시각 범위로 비교 — 인덱스·월 파티션 범위 제외(pruning) 적용
+    date_from = django_filters.DateFilter(method='filter_date_from')
+    date_to = django_filters.DateFilter(method='filter_date_to')
 
     class Meta:
         model = AuditLog
         fields = ['company', 'action', 'module', 'model_name', 'user', 'date_from', 'date_to']
 
+    @staticmethod
+    def _day_start(day):
+        return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+    def filter_date_from(self, queryset, name, value):
+        return queryset.filter(created_at__gte=self._day_start(value))
+
+    def filter_date_to(self, queryset, name, value):
+        return queryset.filter(created_at__lt=self._day_start(value + datetime.timedelta(days=1)))
+
 
 class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ScmDashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'scm_dashboard'
+
+    def ready(self):
+        import scm_dashboard.signals  # noqa: F401 — 요약 캐시 무효화
@@ -0,0 +1,58 @@
+import json
+from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.db import database_sync_to_async
+
+from .push import dashboard_group
+
+
+class DashboardConsumer(AsyncWebsocketConsumer):
+    """
+    WebSocket consumer for live dashboard KPIs.
+    Each company gets its own group: dashboard_company_{company_id}
+
+    On connect the client receives a full snapshot
+        {"type": "kpi_snapshot", "data": {...same as /api/dashboard/summary/...}}
+    followed by small deltas emitted from model signals
+        {"type": "kpi_delta", "deltas": {"mm": {"pending_orders": -1, "in_delivery": 1}}}
+    Send {"type": "refresh"} to request a new snapshot.
+    """
+
+    async def connect(self):
+        user = self.scope.get('user')
+        if not user or not user.is_authenticated or not user.company_id:
+            await self.close()
+            return
+
+        self.company_id = user.company_id
+        self.group_name = dashboard_group(self.company_id)
+
+        # 스냅샷 계산 전에 그룹에 가입해 그 사이의 증감을 놓치지 않음
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+        await self.send_snapshot()
+
+    async def disconnect(self, close_code):
+        if hasattr(self, 'group_name'):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def receive(self, text_data):
+        try:
+            message = json.loads(text_data or '{}')
+        except ValueError:
+            return
+        if message.get('type') == 'refresh':
+            await self.send_snapshot()
+
+    async def kpi_message(self, event):
+        """Handler for messages sent to this company's group."""
+        await self.send(text_data=json.dumps(event['data']))
+
+    async def send_snapshot(self):
+        data = await self.get_summary()
+        await self.send(text_data=json.dumps({'type': 'kpi_snapshot', 'data': data}))
+
+    @database_sync_to_async
+    def get_summary(self):
+        from scm_accounts.models import Company
+        from .summary import get_summary
+        return get_summary(Company.objects.get(pk=self.company_id))
@@ -0,0 +1,101 @@
+"""
+대시보드 KPI 증감(delta) 계산
+
+모델별 contribution(instance) 는 그 행 하나가 요약 KPI 에 기여하는 값
+({module: {kpi: 0|1}})을 돌려줍니다. 저장 전 행(old)과 저장 후 행(new)의
+기여 차이가 곧 증감이므로, 상태 전환·생성·삭제 모두 같은 방식으로 계산됩니다.
+(생성: old=None, 삭제: new=None)
+
+여기 등록된 KPI 는 scm_dashboard.summary 의 같은 키와 정의가 일치해야 합니다.
+"""
+from django.utils import timezone
+
+
+def _is_today(value):
+    return value is not None and timezone.localdate(value) == timezone.localdate()
+
+
+def _this_month(value):
+    if value is None:
+        return False
+    today = timezone.localdate()
+    local = timezone.localdate(value)
+    return (local.year, local.month) == (today.year, today.month)
+
+
+def _stock_movement(m):
+    return {'wm': {'movements_today': int(_is_today(m.created_at))}}
+
+
+def _inventory(inv):
+    low = bool(inv.min_stock and inv.min_stock > 0 and (inv.stock_qty or 0) <= inv.min_stock)
+    return {'wm': {'total_items': 1, 'low_stock': int(low)}}
+
+
+def _purchase_order(po):
+    return {'mm': {
+        'pending_orders': int(po.status == '발주확정'),
+        'in_delivery':    int(po.status == '납품중'),
+    }}
+
+
+def _sales_order(so):
+    return {'sd': {
+        'monthly_orders':   int(_this_month(so.ordered_at)),
+        'pending_delivery': int(so.status == '출하준비'),
+        'in_transit':       int(so.status == '배송중'),
+        'new_orders':       int(so.status == '주문접수'),
+    }}
+
+
+def _approval_request(req):
+    return {'workflow': {'pending_approvals': int(req.status == 'pending')}}
+
+
+def _production_order(order):
+    return {'pp': {
+        'total':       1,
+        'in_progress': int(order.status == '생산중'),
+        'completed':   int(order.status == '완료'),
+        'planned':     int(order.status == '계획'),
+        'confirmed':   int(order.status == '확정'),
+    }}
+
+
+CONTRIBUTIONS = {
+    'scm_wm.StockMovement':        _stock_movement,
+    'scm_wm.Inventory':            _inventory,
+    'scm_mm.PurchaseOrder':        _purchase_order,
+    'scm_sd.SalesOrder':           _sales_order,
+    'scm_workflow.ApprovalRequest': _approval_request,
+    'scm_pp.ProductionOrder':      _production_order,
+}
+
+# contribution 이 읽는 필드 — 저장 전 값은 이 필드만 메모리에 보관해 계산 (scm_dashboard.signals)
+# StockMovement.created_at 은 생성 후 바뀌지 않으므로 수정 저장은 증감이 없음
+TRACKED_FIELDS = {
+    'scm_wm.StockMovement':        (),
+    'scm_wm.Inventory':            ('min_stock', 'stock_qty'),
+    'scm_mm.PurchaseOrder':        ('status',),
+    'scm_sd.SalesOrder':           ('ordered_at', 'status'),
+    'scm_workflow.ApprovalRequest': ('status',),
+    'scm_pp.ProductionOrder':      ('status',),
+}
+
+
+def kpi_delta(label, old, new):
+    """old → new 변경의 KPI 증감 ({module: {kpi: ±n}}, 0 인 항목 제외)."""
+    contribution = CONTRIBUTIONS[label]
+    before = contribution(old) if old is not None else {}
+    after = contribution(new) if new is not None else {}
+    delta = {}
+    for module in set(before) | set(after):
+        keys = set(before.get(module, {})) | set(after.get(module, {}))
+        changes = {
+            k: after.get(module, {}).get(k, 0) - before.get(module, {}).get(k, 0)
+            for k in keys
+        }
+        changes = {k: v for k, v in sorted(changes.items()) if v}
+        if changes:
+            delta[module] = changes
+    return delta
@@ -0,0 +1,27 @@
+"""Helper to push KPI deltas to connected dashboard WebSocket clients."""
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+
+def dashboard_group(company_id) -> str:
+    return f'dashboard_company_{company_id}'
+
+
+def push_kpi_delta(company_id: int, deltas: dict):
+    """
+    Push {module: {kpi: ±n}} to every dashboard connected for the company.
+    Clients add each value to the KPI they already display.
+    """
+    if not company_id or not deltas:
+        return
+    try:
+        channel_layer = get_channel_layer()
+        async_to_sync(channel_layer.group_send)(
+            dashboard_group(company_id),
+            {
+                'type': 'kpi_message',
+                'data': {'type': 'kpi_delta', 'deltas': deltas},
+            }
+        )
+    except Exception:
+        pass  # WebSocket push is best-effort; don't fail the main request
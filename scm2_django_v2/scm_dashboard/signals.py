@@ -0,0 +1,177 @@
+"""
+대시보드 요약 캐시 무효화 + 실시간 KPI 증감 push signal.
+
+invalidate_dashboard_summary : 요약 집계 모델 저장·삭제 → 해당 회사 요약에 재계산 필요 표시
+                               (캐시는 지우지 않음 — 연속 저장은 표시 1회, 재계산은 조회 시
+                                잠금을 잡은 요청 하나만. 커밋 전 재계산분을 위해 커밋 직후 한 번 더)
+remember_loaded_values       : 증감 대상 모델 적재·저장 후 → 기여 필드 값을 instance 에 보관
+capture_previous_row         : 증감 대상 모델 저장 전 → 보관한 값으로 이전 행 구성
+                               (기여 필드를 건드리지 않는 update_fields 저장은 건너뜀,
+                                보관 값이 없을 때만 해당 필드를 조회)
+push_dashboard_delta         : 증감 대상 모델 저장·삭제 → 커밋 후 회사 그룹에 kpi_delta 전송
+                               (scm_dashboard.deltas.CONTRIBUTIONS 의 모델: 재고이동, 재고,
+                                발주·수주·생산오더 상태, 결재 요청)
+push_bulk_movement_delta     : 재고이동 일괄 생성(scm_wm.stock) → 재계산 표시 + 합산 증감 1회 전송
+push_bulk_order_delta        : 부족재고 자동발주 일괄 생성(scm_wm.alerts) → 같은 방식
+"""
+import logging
+
+from django.db import transaction
+from types import SimpleNamespace
+
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# 요약에 반영되는 모델 (모두 company FK 보유)
+SUMMARY_MODELS = (
+    'scm_fi.AccountMove',
+    'scm_fi.Budget',
+    'scm_pp.ProductionOrder',
+    'scm_wm.Inventory',
+    'scm_wm.StockMovement',
+    'scm_hr.Employee',
+    'scm_hr.Leave',
+    'scm_hr.Attendance',
+    'scm_mm.PurchaseOrder',
+    'scm_mm.Material',
+    'scm_sd.SalesOrder',
+    'scm_workflow.ApprovalRequest',
+)
+
+
+def invalidate_dashboard_summary(sender, instance, **kwargs):
+    company_id = getattr(instance, 'company_id', None)
+    if not company_id:
+        return
+    try:
+        from .summary import invalidate_summary
+        invalidate_summary(company_id)
+        transaction.on_commit(lambda: invalidate_summary(company_id))
+    except Exception as e:
+        logger.warning('invalidate_dashboard_summary: 재계산 표시 실패 (company=%s): %s', company_id, e)
+
+
+for _label in SUMMARY_MODELS:
+    post_save.connect(invalidate_dashboard_summary, sender=_label,
+                      dispatch_uid=f'dashboard_summary_save_{_label}')
+    post_delete.connect(invalidate_dashboard_summary, sender=_label,
+                        dispatch_uid=f'dashboard_summary_delete_{_label}')
+
+
+# 저장 전후 기여가 같음 (기여 필드를 바꾸지 않는 저장)
+_UNCHANGED = object()
+
+
+def _tracked_values(sender, instance):
+    from .deltas import TRACKED_FIELDS
+    return {f: instance.__dict__[f] for f in TRACKED_FIELDS[sender._meta.label] if f in instance.__dict__}
+
+
+def remember_loaded_values(sender, instance, **kwargs):
+    # 적재(from_db)·저장 직후 값. refresh_from_db 는 다른 instance 로 적재해 값만 복사하므로 갱신되지 않음
+    instance._dashboard_loaded = _tracked_values(sender, instance)
+
+
+def capture_previous_row(sender, instance, update_fields=None, **kwargs):
+    from .deltas import TRACKED_FIELDS
+    if instance._state.adding or not instance.pk:
+        instance._dashboard_previous = None
+        return
+    fields = TRACKED_FIELDS[sender._meta.label]
+    loaded = getattr(instance, '_dashboard_loaded', {})
+    if not fields or (update_fields is not None and not set(update_fields) & set(fields)):
+        instance._dashboard_previous = _UNCHANGED
+    elif len(loaded) == len(fields):
+        instance._dashboard_previous = SimpleNamespace(**loaded)
+    else:   # 지연 로딩 필드 등 보관 값이 불완전할 때만 조회
+        instance._dashboard_previous = sender._base_manager.filter(pk=instance.pk).only(*fields).first()
+
+
+def push_dashboard_delta(sender, instance, **kwargs):
+    previous = getattr(instance, '_dashboard_previous', None)
+    if kwargs.get('signal') is post_save:
+        remember_loaded_values(sender, instance)   # 다음 저장의 이전 값
+    company_id = getattr(instance, 'company_id', None)
+    if not company_id or (previous is _UNCHANGED and kwargs.get('signal') is post_save):
+        return
+    try:
+        from .deltas import kpi_delta
+        from .push import push_kpi_delta
+        label = sender._meta.label
+        if kwargs.get('signal') is post_delete:
+            deltas = kpi_delta(label, instance, None)
+        else:
+            deltas = kpi_delta(label, previous, instance)
+        if deltas:
+            transaction.on_commit(lambda: push_kpi_delta(company_id, deltas))
+    except Exception as e:
+        logger.warning('push_dashboard_delta: KPI 증감 전송 실패 (company=%s): %s', company_id, e)
+
+
+def _connect_delta_signals():
+    from .deltas import CONTRIBUTIONS
+    for label in CONTRIBUTIONS:
+        post_init.connect(remember_loaded_values, sender=label,
+                          dispatch_uid=f'dashboard_delta_init_{label}')
+        pre_save.connect(capture_previous_row, sender=label,
+                         dispatch_uid=f'dashboard_delta_pre_{label}')
+        post_save.connect(push_dashboard_delta, sender=label,
+                          dispatch_uid=f'dashboard_delta_save_{label}')
+        post_delete.connect(push_dashboard_delta, sender=label,
+                            dispatch_uid=f'dashboard_delta_delete_{label}')
+
+
+_connect_delta_signals()
+
+
+def _push_bulk_delta(sender, company, samples, source):
+    """samples [(instance, 건수)] 의 증감을 합산해 커밋 후 1회 전송 (+ 요약 재계산 표시)."""
+    company_id = getattr(company, 'pk', company)
+    if not company_id or not samples:
+        return
+    try:
+        from .deltas import kpi_delta
+        from .push import push_kpi_delta
+        from .summary import invalidate_summary
+        invalidate_summary(company_id)
+        transaction.on_commit(lambda: invalidate_summary(company_id))
+
+        deltas = {}
+        for instance, count in samples:
+            for module, changes in kpi_delta(sender._meta.label, None, instance).items():
+                for key, value in changes.items():
+                    deltas.setdefault(module, {})
+                    deltas[module][key] = deltas[module].get(key, 0) + value * count
+        if deltas:
+            transaction.on_commit(lambda: push_kpi_delta(company_id, deltas))
+    except Exception as e:
+        logger.warning('%s: KPI 증감 전송 실패 (company=%s): %s', source, company_id, e)
+
+
+def push_bulk_movement_delta(sender, company, movements, **kwargs):
+    if not movements:
+        return
+    # 재고이동 기여는 created_at(오늘 여부)에만 의존 — 모두 같은 날짜면 1건 증감 × 건수
+    stamps = [m.created_at for m in movements if m.created_at is not None]
+    if (len(stamps) == len(movements)
+            and timezone.localdate(min(stamps)) == timezone.localdate(max(stamps))):
+        samples = [(movements[0], len(movements))]
+    else:
+        samples = [(movement, 1) for movement in movements]
+    _push_bulk_delta(sender, company, samples, 'push_bulk_movement_delta')
+
+
+def push_bulk_order_delta(sender, company, orders, **kwargs):
+    _push_bulk_delta(sender, company, [(order, 1) for order in orders], 'push_bulk_order_delta')
+
+
+def _connect_bulk_signals():
+    from scm_wm.alerts import auto_orders_bulk_created
+    from scm_wm.stock import movements_bulk_created
+    movements_bulk_created.connect(push_bulk_movement_delta, dispatch_uid='dashboard_bulk_movements')
+    auto_orders_bulk_created.connect(push_bulk_order_delta, dispatch_uid='dashboard_bulk_auto_orders')
+
+
+_connect_bulk_signals()
@@ -0,0 +1,201 @@
+"""
+대시보드 KPI 요약 — 조건부 집계 + 회사별 캐시
+
+build_summary(company, today) 는 모듈별 KPI 를 테이블당 aggregate() 한 번
+(Count/Sum(filter=Q(...)) 조건부 집계)으로 계산합니다. get_summary() 는 결과를
+회사별로 Django 캐시에 DASHBOARD_CACHE_TTL 초 동안 보관합니다.
+
+하위 모델 저장·삭제 signal(scm_dashboard.signals)은 invalidate_summary() 로 캐시를
+지우지 않고 "다시 계산 필요" 표시만 남깁니다 (cache.add — 연속 저장은 표시 1회로 합쳐짐).
+표시가 있거나 날짜가 바뀐 요약은 cache.add 잠금을 잡은 요청 하나만 다시 계산하고,
+그동안 다른 요청은 이전 요약을 그대로 받습니다 (stale-while-revalidate).
+캐시가 아예 없으면 잠금을 못 잡은 요청은 DASHBOARD_SUMMARY_LOCK_WAIT 초까지 결과를 기다립니다.
+"""
+import datetime
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = 'dashboard:summary:{company_id}'
+
+
+def _cache_key(company_id):
+    return CACHE_KEY.format(company_id=company_id or 'none')
+
+
+def _dirty_key(company_id):
+    return _cache_key(company_id) + ':dirty'
+
+
+def _lock_key(company_id):
+    return _cache_key(company_id) + ':lock'
+
+
+def _fi(company, today):
+    from scm_fi.models import AccountMove, Budget
+
+    month_start = today.replace(day=1)
+    year_start = datetime.date(today.year, 1, 1)
+    posted = Q(state='POSTED')
+    moves = AccountMove.objects.filter(company=company).aggregate(
+        posted_count=Count('id', filter=posted),
+        draft_count=Count('id', filter=Q(state='DRAFT')),
+        monthly_revenue=Sum('total_debit', filter=posted & Q(move_type='SALE', posting_date__gte=month_start)),
+        executed=Sum('total_debit', filter=posted & Q(posting_date__gte=year_start)),
+    )
+    total_budget = float(
+        Budget.objects.filter(company=company, budget_year=today.year)
+        .aggregate(s=Sum('budgeted_amount'))['s'] or 0
+    )
+    executed = float(moves['executed'] or 0)
+    return {
+        'posted_count': moves['posted_count'],
+        'draft_count': moves['draft_count'],
+        'monthly_revenue': float(moves['monthly_revenue'] or 0),
+        'budget_total': total_budget,
+        'budget_executed': executed,
+        'budget_execution_rate': round((executed / total_budget * 100), 1) if total_budget > 0 else 0,
+    }
+
+
+def _pp(company, today):
+    from scm_pp.models import ProductionOrder
+
+    return ProductionOrder.objects.filter(company=company).aggregate(
+        total=Count('id'),
+        in_progress=Count('id', filter=Q(status='생산중')),
+        completed=Count('id', filter=Q(status='완료')),
+        planned=Count('id', filter=Q(status='계획')),
+        confirmed=Count('id', filter=Q(status='확정')),
+    )
+
+
+def _wm(company, today):
+    from scm_wm.models import Inventory, StockMovement
+
+    # Low stock: min_stock > 0 and stock_qty at or below that threshold
+    inv = Inventory.objects.filter(company=company).aggregate(
+        total_items=Count('id'),
+        low_stock=Count('id', filter=Q(min_stock__gt=0, stock_qty__lte=F('min_stock'))),
+    )
+    # created_at__date 대신 시각 범위 — (company, created_at) 인덱스 사용
+    day_start = timezone.make_aware(datetime.datetime.combine(today, datetime.time.min))
+    inv['movements_today'] = StockMovement.objects.filter(
+        company=company, created_at__gte=day_start,
+        created_at__lt=day_start + datetime.timedelta(days=1),
+    ).count()
+    return inv
+
+
+def _hr(company, today):
+    from scm_hr.models import Attendance, Employee, Leave
+
+    return {
+        'employee_count': Employee.objects.filter(company=company, status='재직').count(),
+        'pending_leaves': Leave.objects.filter(company=company, status='pending').count(),
+        'attendance_today': Attendance.objects.filter(employee__company=company, work_date=today).count(),
+    }
+
+
+def _mm(company, today):
+    from scm_mm.models import Material, PurchaseOrder
+
+    po = PurchaseOrder.objects.filter(company=company).aggregate(
+        pending_orders=Count('id', filter=Q(status='발주확정')),
+        in_delivery=Count('id', filter=Q(status='납품중')),
+    )
+    po['material_count'] = Material.objects.filter(company=company).count()
+    return po
+
+
+def _sd(company, today):
+    from scm_sd.models import SalesOrder
+
+    return SalesOrder.objects.filter(company=company).aggregate(
+        monthly_orders=Count('id', filter=Q(ordered_at__date__gte=today.replace(day=1))),
+        pending_delivery=Count('id', filter=Q(status='출하준비')),
+        in_transit=Count('id', filter=Q(status='배송중')),
+        new_orders=Count('id', filter=Q(status='주문접수')),
+    )
+
+
+def _workflow(company, today):
+    from scm_workflow.models import ApprovalRequest
+
+    return {
+        'pending_approvals': ApprovalRequest.objects.filter(company=company, status='pending').count(),
+    }
+
+
+SECTIONS = (
+    ('fi', _fi),
+    ('pp', _pp),
+    ('wm', _wm),
+    ('hr', _hr),
+    ('mm', _mm),
+    ('sd', _sd),
+    ('workflow', _workflow),
+)
+
+
+def build_summary(company, today=None):
+    """모듈별 KPI 계산 (한 모듈 실패가 전체 응답을 깨지 않도록 모듈 단위로 {} 대체)."""
+    today = today or timezone.now().date()
+    data = {}
+    for key, section in SECTIONS:
+        try:
+            data[key] = section(company, today)
+        except Exception as e:
+            logger.warning('dashboard summary: %s 집계 실패: %s', key, e)
+            data[key] = {}
+    return data
+
+
+def _wait_for_summary(key, today):
+    deadline = time.monotonic() + getattr(settings, 'DASHBOARD_SUMMARY_LOCK_WAIT', 2.0)
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        cached = cache.get(key)
+        if cached and cached.get('date') == today.isoformat():
+            return cached
+    return None
+
+
+def get_summary(company):
+    """캐시된 요약 (재계산 표시·날짜 변경 시 잠금을 잡은 요청 하나만 계산 후 저장)."""
+    today = timezone.now().date()
+    company_id = getattr(company, 'pk', None)
+    key, dirty_key = _cache_key(company_id), _dirty_key(company_id)
+    entries = cache.get_many([key, dirty_key])
+    cached = entries.get(key)
+    if cached and cached.get('date') == today.isoformat() and dirty_key not in entries:
+        return cached['data']
+
+    lock_key = _lock_key(company_id)
+    if not cache.add(lock_key, 1, getattr(settings, 'DASHBOARD_SUMMARY_LOCK_TTL', 30)):
+        if cached:
+            return cached['data']   # 다른 요청이 재계산 중 — 이전 요약 응답
+        cached = _wait_for_summary(key, today)
+        if cached:
+            return cached['data']
+        return build_summary(company, today)   # 대기 시간 초과 — 캐시는 잠금 보유 요청이 저장
+    try:
+        # 계산 전에 표시를 지워, 계산 중 들어온 변경은 다음 요청에서 다시 반영
+        cache.delete(dirty_key)
+        data = build_summary(company, today)
+        cache.set(key, {'date': today.isoformat(), 'data': data},
+                  getattr(settings, 'DASHBOARD_CACHE_TTL', 60))
+    finally:
+        cache.delete(lock_key)
+    return data
+
+
+def invalidate_summary(company_id):
+    """회사 요약에 재계산 필요 표시 (이미 표시돼 있으면 그대로)."""
+    cache.add(_dirty_key(company_id), 1, getattr(settings, 'DASHBOARD_CACHE_TTL', 60))
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class FiConfig(AppConfig):
     name = 'scm_fi'
+
+    def ready(self):
+        import scm_fi.signals  # noqa: F401 — 계정별 월 잔액 유지
@@ -0,0 +1,159 @@
+"""
+계정별 월 잔액(AccountMonthlyBalance) 유지·조회·재검증
+
+확정 전표 라인을 매번 전수 집계하지 않도록 회사·계정·연월 합계를 보관합니다.
+
+    apply_move / apply_line   전표 확정·취소·라인 변경 시 증감 (scm_fi.signals)
+    rebuild                   전표 라인 전수 집계로 재작성 (기간 마감, reconcile --fix)
+    reconcile                 보관값 vs 전수 집계 차이 목록
+    statement_lines           재무제표용 계정별 합계 (월 잔액 합산, 계정당 최대 12행/연)
+
+증감은 F() 갱신이므로 여러 요청이 같은 행을 동시에 갱신해도 합계가 유지됩니다.
+"""
+import datetime
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
+
+ZERO = Decimal('0')
+
+
+def _apply(company_id, year, month, amounts, sign):
+    """amounts {account_id: (debit, credit)} 를 sign(±1) 방향으로 더함."""
+    from .models import AccountMonthlyBalance
+
+    amounts = {a: (d or ZERO, c or ZERO) for a, (d, c) in amounts.items() if (d or c)}
+    if not company_id or not amounts:
+        return
+    with transaction.atomic():
+        AccountMonthlyBalance.objects.bulk_create(
+            [AccountMonthlyBalance(company_id=company_id, account_id=account_id, year=year, month=month)
+             for account_id in amounts],
+            ignore_conflicts=True,
+        )
+        now = timezone.now()
+        for account_id, (debit, credit) in amounts.items():
+            AccountMonthlyBalance.objects.filter(
+                company_id=company_id, account_id=account_id, year=year, month=month,
+            ).update(debit=F('debit') + sign * debit, credit=F('credit') + sign * credit, updated_at=now)
+
+
+def apply_move(move, sign, posting_date=None):
+    """전표 전체 라인을 posting_date(기본: 전표 일자) 월에 ±반영."""
+    posting_date = posting_date or move.posting_date
+    amounts = {
+        row['account_id']: (row['d'], row['c'])
+        for row in move.lines.values('account_id').annotate(d=Sum('debit'), c=Sum('credit'))
+    }
+    _apply(move.company_id, posting_date.year, posting_date.month, amounts, sign)
+
+
+def apply_line(move, account_id, debit, credit, sign):
+    """확정 전표의 라인 1건을 ±반영."""
+    _apply(move.company_id, move.posting_date.year, move.posting_date.month,
+           {account_id: (debit, credit)}, sign)
+
+
+def _scope(prefix, year=None, month=None):
+    q = Q()
+    if year is not None:
+        q &= Q(**{f'{prefix}year': year})
+    if month is not None:
+        q &= Q(**{f'{prefix}month': month})
+    return q
+
+
+def rescan(company, year=None, month=None):
+    """확정 전표 라인 전수 집계 → {(account_id, year, month): (debit, credit)}."""
+    from .models import AccountMoveLine
+
+    qs = AccountMoveLine.objects.filter(move__company=company, move__state='POSTED')
+    if year is not None:
+        qs = qs.filter(move__posting_date__year=year)
+    if month is not None:
+        qs = qs.filter(move__posting_date__month=month)
+    rows = (
+        qs.annotate(y=ExtractYear('move__posting_date'), m=ExtractMonth('move__posting_date'))
+        .values('account_id', 'y', 'm')
+        .annotate(d=Sum('debit'), c=Sum('credit'))
+        .order_by()
+    )
+    return {(r['account_id'], r['y'], r['m']): (r['d'] or ZERO, r['c'] or ZERO) for r in rows}
+
+
+def materialized(company, year=None, month=None):
+    """보관된 월 잔액 → {(account_id, year, month): (debit, credit)} (0/0 행 제외)."""
+    from .models import AccountMonthlyBalance
+
+    rows = (
+        AccountMonthlyBalance.objects.filter(company=company)
+        .filter(_scope('', year, month))
+        .exclude(debit=0, credit=0)
+        .values_list('account_id', 'year', 'month', 'debit', 'credit')
+    )
+    return {(a, y, m): (d, c) for a, y, m, d, c in rows}
+
+
+def reconcile(company, year=None, month=None):
+    """보관값과 전수 집계가 다른 (계정, 연, 월) 목록."""
+    expected = rescan(company, year, month)
+    actual = materialized(company, year, month)
+    diffs = []
+    for key in sorted(set(expected) | set(actual)):
+        exp = expected.get(key, (ZERO, ZERO))
+        act = actual.get(key, (ZERO, ZERO))
+        if exp != act:
+            account_id, y, m = key
+            diffs.append({
+                'account_id': account_id, 'year': y, 'month': m,
+                'expected_debit': exp[0], 'expected_credit': exp[1],
+                'actual_debit': act[0], 'actual_credit': act[1],
+            })
+    return diffs
+
+
+def rebuild(company, year=None, month=None, close=None):
+    """범위의 월 잔액을 전수 집계로 재작성. close 가 bool 이면 is_closed 도 설정."""
+    from .models import AccountMonthlyBalance
+
+    expected = rescan(company, year, month)
+    with transaction.atomic():
+        scope = AccountMonthlyBalance.objects.filter(company=company).filter(_scope('', year, month))
+        scope.update(debit=ZERO, credit=ZERO, updated_at=timezone.now())
+        AccountMonthlyBalance.objects.bulk_create(
+            [AccountMonthlyBalance(company=company, account_id=a, year=y, month=m, debit=d, credit=c)
+             for (a, y, m), (d, c) in expected.items()],
+            update_conflicts=True,
+            unique_fields=['company', 'account', 'year', 'month'],
+            update_fields=['debit', 'credit', 'updated_at'],
+        )
+        if close is not None and month is not None:
+            scope.update(is_closed=close)
+    return len(expected)
+
+
+def _month_range(start, end):
+    """[start, end) 월 범위 Q (start/end 는 월 1일)."""
+    return (
+        (Q(year__gt=start.year) | Q(year=start.year, month__gte=start.month))
+        & (Q(year__lt=end.year) | Q(year=end.year, month__lt=end.month))
+    )
+
+
+def statement_lines(company, start: datetime.date, end: datetime.date, account_types=None):
+    """[start, end) 월 잔액 합계 — 계정별 account__code/name/type, total_debit, total_credit."""
+    from .models import AccountMonthlyBalance
+
+    qs = AccountMonthlyBalance.objects.filter(company=company).filter(_month_range(start, end))
+    if account_types is not None:
+        qs = qs.filter(account__account_type__in=account_types)
+    rows = (
+        qs.values('account__code', 'account__name', 'account__account_type')
+        .annotate(total_debit=Sum('debit'), total_credit=Sum('credit'))
+        .exclude(total_debit=0, total_credit=0)
+        .order_by('account__code')
+    )
+    return list(rows)
@@ -0,0 +1,50 @@
+"""
+계정별 월 잔액(AccountMonthlyBalance) 재검증
+
+    python manage.py reconcile_account_balances [--company CODE] [--year 2026] [--month 3] [--fix]
+
+확정 전표 라인 전수 집계와 보관된 월 잔액을 비교해 차이를 출력합니다.
+차이가 있으면 오류 코드로 종료하고, --fix 를 주면 해당 범위를 전수 집계로 재작성합니다.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from scm_accounts.models import Company
+from scm_fi.balances import rebuild, reconcile
+
+
+class Command(BaseCommand):
+    help = '계정별 월 잔액을 확정 전표 라인 전수 집계와 비교 (--fix 로 재작성)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--company', help='회사 코드 (기본: 전체)')
+        parser.add_argument('--year', type=int)
+        parser.add_argument('--month', type=int)
+        parser.add_argument('--fix', action='store_true', help='차이가 있는 범위를 재작성')
+
+    def handle(self, *args, **options):
+        if options['month'] and not options['year']:
+            raise CommandError('--month 는 --year 와 함께 지정해야 합니다.')
+        companies = Company.objects.all()
+        if options['company']:
+            companies = companies.filter(company_code=options['company'])
+            if not companies.exists():
+                raise CommandError(f'회사 코드 없음: {options["company"]}')
+
+        mismatched = 0
+        for company in companies:
+            diffs = reconcile(company, options['year'], options['month'])
+            for d in diffs:
+                self.stdout.write(
+                    f'{company.company_code} {d["year"]}-{d["month"]:02d} account={d["account_id"]} '
+                    f'expected={d["expected_debit"]}/{d["expected_credit"]} '
+                    f'actual={d["actual_debit"]}/{d["actual_credit"]}'
+                )
+            if diffs and options['fix']:
+                rebuild(company, options['year'], options['month'])
+                self.stdout.write(self.style.SUCCESS(f'{company.company_code}: {len(diffs)}건 재작성'))
+            mismatched += len(diffs)
+
+        if mismatched and not options['fix']:
+            raise CommandError(f'월 잔액 불일치 {mismatched}건 (--fix 로 재작성)')
+        if not mismatched:
+            self.stdout.write(self.style.SUCCESS('월 잔액 일치'))
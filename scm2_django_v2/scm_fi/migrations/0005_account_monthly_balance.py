@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def backfill_monthly_balances(apps, schema_editor):
+    """기존 확정 전표 라인으로 월 잔액 초기 적재."""
+    AccountMoveLine = apps.get_model('scm_fi', 'AccountMoveLine')
+    AccountMonthlyBalance = apps.get_model('scm_fi', 'AccountMonthlyBalance')
+    rows = (
+        AccountMoveLine.objects.filter(move__state='POSTED', move__company__isnull=False)
+        .annotate(y=ExtractYear('move__posting_date'), m=ExtractMonth('move__posting_date'))
+        .values('move__company_id', 'account_id', 'y', 'm')
+        .annotate(d=Sum('debit'), c=Sum('credit'))
+        .order_by()
+    )
+    AccountMonthlyBalance.objects.bulk_create(
+        [AccountMonthlyBalance(company_id=r['move__company_id'], account_id=r['account_id'],
+                               year=r['y'], month=r['m'], debit=r['d'] or 0, credit=r['c'] or 0)
+         for r in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scm_accounts', '0003_userpermission_can_delete'),
+        ('scm_fi', '0004_accounting_period'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountMonthlyBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField()),
+                ('month', models.IntegerField()),
+                ('debit', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('credit', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('is_closed', models.BooleanField(default=False, verbose_name='기간 마감')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_balances', to='scm_fi.account')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='scm_accounts.company')),
+            ],
+            options={
+                'ordering': ['year', 'month', 'account'],
+                'indexes': [models.Index(fields=['company', 'year', 'month'], name='scm_fi_acco_company_029cf6_idx')],
+                'unique_together': {('company', 'account', 'year', 'month')},
+            },
+        ),
+        migrations.RunPython(backfill_monthly_balances, migrations.RunPython.noop),
+    ]
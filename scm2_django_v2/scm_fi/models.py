@@ -154,3 +154,29 @@ class AccountingPeriod(models.Model):
 
     def __str__(self):
         return f"{self.year}-{self.month:02d} ({self.get_status_display()})"
+
+
+class AccountMonthlyBalance(models.Model):
+    """
+    계정별 월 잔액 (확정 전표 라인의 월 합계, 재무제표 조회용 집계 테이블)
+
+    확정(POSTED) 전표의 라인 차변·대변 합계를 회사·계정·연월 단위로 보관한다.
+    전표 확정/취소/삭제와 확정 전표의 라인 변경 시 signal 이 증감하고,
+    회계기간 마감 시 해당 월을 전표 라인에서 다시 계산해 is_closed 로 고정한다.
+    전체 재검증: python manage.py reconcile_account_balances
+    """
+    company    = models.ForeignKey(Company, on_delete=models.CASCADE)
+    account    = models.ForeignKey(Account, on_delete=models.CASCADE, related_name='monthly_balances')
+    year       = models.IntegerField()
+    month      = models.IntegerField()
+    debit      = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    credit     = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    is_closed  = models.BooleanField(default=False, verbose_name='기간 마감')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['company', 'account', 'year', 'month']
+        indexes = [models.Index(fields=['company', 'year', 'month'])]
+        ordering = ['year', 'month', 'account']
+
+    def __str__(self): return f"{self.account} {self.year}-{self.month:02d}"
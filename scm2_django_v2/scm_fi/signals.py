@@ -0,0 +1,98 @@
+"""
+FI 계정별 월 잔액(AccountMonthlyBalance) 유지 signal.
+
+Signal overview
+---------------
+track_move_state    : AccountMove 저장      → DRAFT→POSTED 시 라인 합계 +, POSTED→취소 시 −
+                                              (확정 상태에서 전기일 변경 시 이전 월 −, 새 월 +)
+track_line_change   : AccountMoveLine 저장  → 이미 확정된 전표의 라인 추가·수정분만 증감
+track_line_delete   : AccountMoveLine 삭제  → 확정 전표 라인 삭제(전표 삭제 cascade 포함) 시 −
+track_period_close  : AccountingPeriod 저장 → 마감 시 해당 월을 전표 라인에서 재계산 후 고정
+
+증감 실패는 경고만 남기고 저장 흐름을 막지 않는다. 누락분은
+`python manage.py reconcile_account_balances --fix` 로 복구한다.
+"""
+import logging
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(pre_save, sender='scm_fi.AccountMove')
+def capture_move_state(sender, instance, **kwargs):
+    instance._balance_previous = None
+    if instance.pk:
+        instance._balance_previous = (
+            sender.objects.filter(pk=instance.pk).values('state', 'posting_date').first()
+        )
+
+
+@receiver(post_save, sender='scm_fi.AccountMove')
+def track_move_state(sender, instance, created, **kwargs):
+    from .balances import apply_move
+    previous = getattr(instance, '_balance_previous', None) or {}
+    was_posted = previous.get('state') == 'POSTED'
+    is_posted = instance.state == 'POSTED'
+    try:
+        if is_posted and not was_posted:
+            apply_move(instance, +1)
+        elif was_posted and not is_posted:
+            apply_move(instance, -1, posting_date=previous['posting_date'])
+        elif is_posted and previous.get('posting_date') not in (None, instance.posting_date):
+            apply_move(instance, -1, posting_date=previous['posting_date'])
+            apply_move(instance, +1)
+    except Exception as e:
+        logger.warning('track_move_state: 월 잔액 반영 실패 (move=%s): %s', instance.move_number, e,
+                       exc_info=True)
+
+
+@receiver(pre_save, sender='scm_fi.AccountMoveLine')
+def capture_line(sender, instance, **kwargs):
+    instance._balance_previous = None
+    if instance.pk:
+        instance._balance_previous = (
+            sender.objects.filter(pk=instance.pk).values('account_id', 'debit', 'credit').first()
+        )
+
+
+@receiver(post_save, sender='scm_fi.AccountMoveLine')
+def track_line_change(sender, instance, **kwargs):
+    from .balances import apply_line
+    from .models import AccountMove
+    # instance.move 는 캐시된 객체일 수 있으므로 확정 여부는 DB 기준으로 판단
+    move = AccountMove.objects.filter(pk=instance.move_id, state='POSTED').first()
+    if move is None:
+        return
+    try:
+        previous = getattr(instance, '_balance_previous', None)
+        if previous:
+            apply_line(move, previous['account_id'], previous['debit'], previous['credit'], -1)
+        apply_line(move, instance.account_id, instance.debit, instance.credit, +1)
+    except Exception as e:
+        logger.warning('track_line_change: 월 잔액 반영 실패 (move=%s): %s', move.move_number, e,
+                       exc_info=True)
+
+
+@receiver(post_delete, sender='scm_fi.AccountMoveLine')
+def track_line_delete(sender, instance, **kwargs):
+    from .balances import apply_line
+    from .models import AccountMove
+    move = AccountMove.objects.filter(pk=instance.move_id, state='POSTED').first()
+    if move is None:
+        return
+    try:
+        apply_line(move, instance.account_id, instance.debit, instance.credit, -1)
+    except Exception as e:
+        logger.warning('track_line_delete: 월 잔액 반영 실패 (move=%s): %s', move.move_number, e,
+                       exc_info=True)
+
+
+@receiver(post_save, sender='scm_fi.AccountingPeriod')
+def track_period_close(sender, instance, **kwargs):
+    from .balances import rebuild
+    try:
+        rebuild(instance.company, instance.year, instance.month, close=instance.status == 'closed')
+    except Exception as e:
+        logger.warning('track_period_close: 월 잔액 재계산 실패 (%s): %s', instance, e, exc_info=True)
@@ -13,12 +13,21 @@ K-GAAP/IFRS 기준 재무 계산 모듈:
 
 from __future__ import annotations
 
-import calendar
-import math
-from datetime import date, timedelta
-from decimal import ROUND_HALF_UP, Decimal
+from datetime import date
+from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
+from scm_core.analytics.finance import (
+    add_months,
+    aging_bucket_index,
+    monthly_declining_balance,
+    monthly_straight_line,
+    round2,
+)
+
+# scm_core.analytics.finance.AGING_KEYS 순서의 이 모듈 버킷 키
+_BUCKET_KEYS = ("not_due", "days_0_30", "days_31_60", "days_61_90", "over_90")
+
 
 # ---------------------------------------------------------------------------
 # 내부 헬퍼
@@ -31,16 +40,12 @@ def _today() -> date:
 
 def _round2(value: Decimal) -> Decimal:
     """소수점 2자리로 반올림합니다."""
-    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return round2(value)
 
 
 def _add_months(d: date, months: int) -> date:
     """주어진 날짜에 월 수를 더합니다. 월말 오버플로우를 처리합니다."""
-    month = d.month - 1 + months
-    year = d.year + month // 12
-    month = month % 12 + 1
-    day = min(d.day, calendar.monthrange(year, month)[1])
-    return date(year, month, day)
+    return add_months(d, months)
 
 
 # ---------------------------------------------------------------------------
@@ -107,17 +112,7 @@ def calculate_aging_buckets(
         ref_no: str = inv.get("ref", "")
 
         days_overdue: int = (ref - due_date).days
-
-        if days_overdue <= 0:
-            bucket_key = "not_due"
-        elif days_overdue <= 30:
-            bucket_key = "days_0_30"
-        elif days_overdue <= 60:
-            bucket_key = "days_31_60"
-        elif days_overdue <= 90:
-            bucket_key = "days_61_90"
-        else:
-            bucket_key = "over_90"
+        bucket_key = _BUCKET_KEYS[aging_bucket_index(days_overdue, not_due_max=0)]
 
         buckets[bucket_key] += amount
         detail.append({
@@ -177,40 +172,7 @@ def calculate_straight_line_depreciation(
     Raises:
         ValueError: 취득원가 <= 잔존가치 또는 내용연수 < 1 인 경우.
     """
-    if useful_life_years < 1:
-        raise ValueError("내용연수는 1년 이상이어야 합니다.")
-    if acquisition_cost <= salvage_value:
-        raise ValueError("취득원가는 잔존가치보다 커야 합니다.")
-
-    depreciable_amount = acquisition_cost - salvage_value
-    total_months = useful_life_years * 12
-    monthly_dep = _round2(depreciable_amount / Decimal(str(total_months)))
-
-    schedule: List[Dict[str, Any]] = []
-    accumulated = Decimal("0")
-    current_date = date(start_date.year, start_date.month, 1)
-
-    for i in range(total_months):
-        is_last = i == total_months - 1
-        if is_last:
-            # 단수 조정: 목표 누적액 = depreciable_amount
-            dep = depreciable_amount - accumulated
-        else:
-            dep = monthly_dep
-
-        accumulated += dep
-        book_value = acquisition_cost - accumulated
-
-        schedule.append({
-            "year": current_date.year,
-            "month": current_date.month,
-            "depreciation": _round2(dep),
-            "accumulated": _round2(accumulated),
-            "book_value": _round2(book_value),
-        })
-        current_date = _add_months(current_date, 1)
-
-    return schedule
+    return monthly_straight_line(acquisition_cost, salvage_value, useful_life_years, start_date)
 
 
 # ---------------------------------------------------------------------------
@@ -243,55 +205,7 @@ def calculate_declining_balance_depreciation(
     Raises:
         ValueError: 취득원가 <= 잔존가치 또는 내용연수 < 1 인 경우.
     """
-    if useful_life_years < 1:
-        raise ValueError("내용연수는 1년 이상이어야 합니다.")
-    if acquisition_cost <= salvage_value:
-        raise ValueError("취득원가는 잔존가치보다 커야 합니다.")
-
-    # 잔존가치 0 처리: 수학적 계산을 위해 최소값 적용
-    effective_salvage = salvage_value
-    if effective_salvage == Decimal("0"):
-        effective_salvage = acquisition_cost * Decimal("0.05")
-
-    ratio_float = float(effective_salvage) / float(acquisition_cost)
-    declining_rate = Decimal(
-        str(1.0 - math.pow(ratio_float, 1.0 / useful_life_years))
-    )
-    declining_rate = declining_rate.quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
-
-    total_months = useful_life_years * 12
-    monthly_rate = declining_rate / Decimal("12")
-
-    schedule: List[Dict[str, Any]] = []
-    accumulated = Decimal("0")
-    remaining_book = acquisition_cost
-    current_date = date(start_date.year, start_date.month, 1)
-    depreciable_amount = acquisition_cost - salvage_value
-
-    for i in range(total_months):
-        is_last = i == total_months - 1
-        if is_last:
-            dep = depreciable_amount - accumulated
-        else:
-            dep = _round2(remaining_book * monthly_rate)
-            # 장부가치가 잔존가치 아래로 내려가지 않도록 제한
-            max_dep = remaining_book - salvage_value
-            if dep > max_dep:
-                dep = max_dep
-
-        accumulated += dep
-        remaining_book = acquisition_cost - accumulated
-
-        schedule.append({
-            "year": current_date.year,
-            "month": current_date.month,
-            "depreciation": _round2(dep),
-            "accumulated": _round2(accumulated),
-            "book_value": _round2(remaining_book),
-        })
-        current_date = _add_months(current_date, 1)
-
-    return schedule
+    return monthly_declining_balance(acquisition_cost, salvage_value, useful_life_years, start_date)
 
 
 # ---------------------------------------------------------------------------
@@ -384,3 +298,38 @@ def forecast_cash_flow(
         })
 
     return result
+
+
+# ---------------------------------------------------------------------------
+# 5. 예산 차이 분석 (Budget Variance)
+# ---------------------------------------------------------------------------
+
+def budget_variance(budget_amount: Any, actual_amount: Any) -> Dict[str, Any]:
+    """예산 vs 실적 차이 분석.
+
+    Returns:
+        Dict containing keys:
+            budget, actual (Decimal): 예산·실적 금액.
+            variance (Decimal): 실적 - 예산.
+            variance_pct (Decimal): 차이율 (%).
+            status (str): 'over' | 'under' | 'on_target' (±5% 이내).
+    """
+    b = Decimal(str(budget_amount))
+    a = Decimal(str(actual_amount))
+    v = a - b
+    pct = (v / b * 100) if b != 0 else Decimal("0")
+
+    if abs(pct) <= 5:
+        status = "on_target"
+    elif v > 0:
+        status = "over"
+    else:
+        status = "under"
+
+    return {
+        "budget": _round2(b),
+        "actual": _round2(a),
+        "variance": _round2(v),
+        "variance_pct": _round2(pct),
+        "status": status,
+    }
@@ -4,7 +4,6 @@ from decimal import Decimal
 from datetime import date
 
 from django.utils import timezone
-from django.db.models import Sum, Count, F, Q
 
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
@@ -19,8 +18,10 @@ from .serializers import (
     BudgetSerializer, FixedAssetSerializer, TaxInvoiceSerializer,
     AccountingPeriodSerializer,
 )
-from .utils import aging_buckets, calc_depreciation_schedule
-from scm_core.mixins import AuditLogMixin, StateLockMixin
+from .utils import calc_depreciation_schedule
+from .balances import statement_lines
+from scm_core.analytics.finance import aging_summary
+from scm_core.mixins import AuditLogMixin, ExportMixin, StateLockMixin
 
 
 class AccountViewSet(AuditLogMixin, viewsets.ModelViewSet):
@@ -39,10 +40,18 @@ class AccountViewSet(AuditLogMixin, viewsets.ModelViewSet):
         serializer.save(company=self.request.user.company)
 
 
-class AccountMoveViewSet(AuditLogMixin, StateLockMixin, viewsets.ModelViewSet):
+class AccountMoveViewSet(ExportMixin, AuditLogMixin, StateLockMixin, viewsets.ModelViewSet):
     audit_module = 'fi'
     locked_states = ['POSTED', 'CANCELLED']
     state_field = 'state'
+    # 내보내기는 전표 필터 결과의 라인 단위 (분개장)
+    export_filename = 'journal_lines'
+    export_fields = ['move__move_number', 'move__posting_date', 'move__move_type', 'move__state',
+                     'account__code', 'account__name', 'name', 'debit', 'credit', 'due_date']
+    export_headers = {'move__move_number': '전표번호', 'move__posting_date': '전기일',
+                      'move__move_type': '유형', 'move__state': '상태', 'account__code': '계정코드',
+                      'account__name': '계정명', 'name': '적요', 'debit': '차변', 'credit': '대변',
+                      'due_date': '만기일'}
     permission_classes = [IsAuthenticated]
     filter_backends = [filters.SearchFilter, DjangoFilterBackend, filters.OrderingFilter]
     search_fields = ['move_number', 'ref', 'created_by']
@@ -59,6 +68,11 @@ class AccountMoveViewSet(AuditLogMixin, StateLockMixin, viewsets.ModelViewSet):
             return AccountMoveWriteSerializer
         return AccountMoveSerializer
 
+    def get_export_queryset(self):
+        moves = self.filter_queryset(self.get_queryset())
+        return (AccountMoveLine.objects.filter(move__in=moves.order_by().values('pk'))
+                .order_by('move__posting_date', 'move__move_number', 'pk'))
+
     def perform_create(self, serializer):
         move_number = f'JE-{uuid.uuid4().hex[:8].upper()}'
         serializer.save(company=self.request.user.company, move_number=move_number)
@@ -136,34 +150,10 @@ class AccountMoveViewSet(AuditLogMixin, StateLockMixin, viewsets.ModelViewSet):
                 'days_overdue': (today - line.due_date).days,
             })
 
-        # 구간별 분류
-        buckets = {
-            'not_due': [],
-            '0_30':    [],
-            '31_60':   [],
-            '61_90':   [],
-            'over_90': [],
-        }
-        for rec in records:
-            d = rec['days_overdue']
-            if d < 0:
-                buckets['not_due'].append(rec)
-            elif d <= 30:
-                buckets['0_30'].append(rec)
-            elif d <= 60:
-                buckets['31_60'].append(rec)
-            elif d <= 90:
-                buckets['61_90'].append(rec)
-            else:
-                buckets['over_90'].append(rec)
-
-        summary = {
-            key: {
-                'count':  len(v),
-                'amount': round(sum(r['amount'] for r in v), 2),
-            }
-            for key, v in buckets.items()
-        }
+        summary = aging_summary(
+            [r['days_overdue'] for r in records],
+            [r['amount'] for r in records],
+        )
 
         return Response({
             'type':    aging_type,
@@ -382,6 +372,7 @@ class FinancialStatementView(APIView):
     """
     확정(POSTED) 전표 라인을 계정과목 유형별로 집계해
     손익계산서(Income Statement)와 대차대조표(Balance Sheet)를 반환합니다.
+    집계는 전표 라인 대신 계정별 월 잔액(scm_fi.balances)을 합산합니다.
 
     Query params:
         year  (int, 필수)
@@ -403,21 +394,8 @@ class FinancialStatementView(APIView):
         return start, end
 
     def _aggregate_lines(self, company, start, end, account_types):
-        """계정유형 목록에 해당하는 전표라인을 계정별로 집계."""
-        lines = (
-            AccountMoveLine.objects
-            .filter(
-                move__company=company,
-                move__state='POSTED',
-                move__posting_date__gte=start,
-                move__posting_date__lt=end,
-                account__account_type__in=account_types,
-            )
-            .values('account__code', 'account__name', 'account__account_type')
-            .annotate(total_debit=Sum('debit'), total_credit=Sum('credit'))
-            .order_by('account__code')
-        )
-        return list(lines)
+        """계정유형 목록에 해당하는 계정별 합계 — 월 잔액(AccountMonthlyBalance) 합산."""
+        return statement_lines(company, start, end, account_types)
 
     def get(self, request):
         company = request.user.company
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scm_accounts', '0003_userpermission_can_delete'),
+        ('scm_mm', '0005_supplier_lead_time_days_suppliermaterialconfig'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MaterialInventoryPolicy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('abc_class', models.CharField(choices=[('A', 'A'), ('B', 'B'), ('C', 'C')], default='C', max_length=1)),
+                ('annual_value', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('cumulative_pct', models.DecimalField(decimal_places=2, default=0, max_digits=6)),
+                ('eoq', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True)),
+                ('safety_stock', models.DecimalField(decimal_places=2, default=0, max_digits=15)),
+                ('reorder_point', models.DecimalField(decimal_places=2, default=0, max_digits=15)),
+                ('service_level', models.DecimalField(decimal_places=3, default=0.95, max_digits=4)),
+                ('calculated_at', models.DateTimeField(auto_now=True)),
+                ('company', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='scm_accounts.company')),
+                ('material', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='inventory_policy', to='scm_mm.material')),
+            ],
+        ),
+    ]
@@ -155,3 +155,21 @@ class SupplierMaterialConfig(models.Model):
 
     def __str__(self):
         return f"{self.supplier.name} × {self.material.material_name} ({self.lead_time_days}일)"
+
+
+class MaterialInventoryPolicy(models.Model):
+    """자재별 재고정책 (ABC / EOQ / 안전재고 / ROP 일괄 계산 결과)"""
+    ABC_CLASS = [('A', 'A'), ('B', 'B'), ('C', 'C')]
+    company        = models.ForeignKey('scm_accounts.Company', on_delete=models.CASCADE, null=True)
+    material       = models.OneToOneField(Material, on_delete=models.CASCADE, related_name='inventory_policy')
+    abc_class      = models.CharField(max_length=1, choices=ABC_CLASS, default='C')
+    annual_value   = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    cumulative_pct = models.DecimalField(max_digits=6, decimal_places=2, default=0)
+    eoq            = models.DecimalField(max_digits=15, decimal_places=2, null=True, blank=True)
+    safety_stock   = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    reorder_point  = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    service_level  = models.DecimalField(max_digits=4, decimal_places=3, default=0.95)
+    calculated_at  = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.material.material_code} [{self.abc_class}] ROP {self.reorder_point}"
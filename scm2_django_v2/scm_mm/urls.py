@@ -5,7 +5,7 @@ from .views import (
     PurchaseOrderLineViewSet, GoodsReceiptViewSet, MaterialPriceHistoryViewSet,
     RFQViewSet, SupplierEvaluationViewSet, SupplierMaterialConfigViewSet,
     CalculatorLeadTimeView, CalculatorSafetyStockView, CalculatorEOQView,
-    CalculatorDemandForecastView, CalculatorTransferListView,
+    CalculatorDemandForecastView, CalculatorTransferListView, CalculatorPolicyBatchView,
 )
 
 router = DefaultRouter()
@@ -25,4 +25,5 @@ urlpatterns = router.urls + [
     path('calculator/eoq/',           CalculatorEOQView.as_view(),             name='calc-eoq'),
     path('calculator/demand-forecast/', CalculatorDemandForecastView.as_view(), name='calc-demand'),
     path('calculator/transfer-list/', CalculatorTransferListView.as_view(),    name='calc-transfer'),
+    path('calculator/policy-batch/',  CalculatorPolicyBatchView.as_view(),     name='calc-policy-batch'),
 ]
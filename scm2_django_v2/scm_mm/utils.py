@@ -1,6 +1,9 @@
 """
 scm_mm.utils — MRP / 구매 계획 알고리즘 유틸리티
 
+EOQ / 안전재고 / ROP / ABC 계산은 scm_core.analytics.inventory 에 위임하고
+이 모듈은 MM 계산기 API 의 반환 형태(반올림된 dict)를 맞춥니다.
+
 주요 함수:
     calc_eoq(demand, order_cost, holding_cost)
         → Economic Order Quantity (경제적 주문량)
@@ -11,11 +14,14 @@ scm_mm.utils — MRP / 구매 계획 알고리즘 유틸리티
     calc_reorder_point(avg_demand, lead_time, safety_stock)
         → 재주문점
 
-    run_mrp(bom_tree, demand_schedule, inventory_map, lead_time_map)
+    run_mrp(gross_requirements, inventory_map, lead_time_map, scheduled_receipts)
         → 자재 소요량 계획 (MRP) — 기간별 순소요량 / 발주계획 산출
 
     classify_abc(items, value_field, qty_field)
         → ABC 분류 (파레토 원칙: A=상위80%, B=15%, C=5%)
+
+    calc_policy_batch(material_codes, annual_value, annual_demand, ...)
+        → 전체 자재 일괄 ABC / EOQ / 안전재고 / ROP (NumPy 벡터 연산, 단건 함수와 동일 결과)
 """
 from __future__ import annotations
 
@@ -24,6 +30,8 @@ from collections import defaultdict
 from decimal import Decimal
 from typing import Any
 
+from scm_core.analytics import inventory
+
 
 # ─── EOQ ─────────────────────────────────────────────────────────────────────
 
@@ -43,11 +51,10 @@ def calc_eoq(
     Returns:
         {'eoq': float, 'annual_orders': float, 'cycle_days': float}
     """
-    if holding_cost <= 0:
+    eoq = inventory.eoq(annual_demand, order_cost, holding_cost)
+    if eoq is None:
         return {'error': '보관비용은 0보다 커야 합니다'}
-    eoq = math.sqrt((2 * annual_demand * order_cost) / holding_cost)
-    annual_orders = annual_demand / eoq if eoq > 0 else 0
-    cycle_days    = 365 / annual_orders if annual_orders > 0 else 0
+    annual_orders, cycle_days = inventory.order_cycle(annual_demand, eoq)
     return {
         'eoq':           round(eoq, 2),
         'annual_orders': round(annual_orders, 2),
@@ -57,16 +64,6 @@ def calc_eoq(
 
 # ─── Safety Stock ─────────────────────────────────────────────────────────────
 
-# 서비스 수준 → Z-score 매핑
-_Z_SCORES = {
-    0.90: 1.282,
-    0.95: 1.645,
-    0.97: 1.881,
-    0.98: 2.054,
-    0.99: 2.326,
-}
-
-
 def calc_safety_stock(
     demand_std:    float,
     lead_time:     float,
@@ -83,13 +80,8 @@ def calc_safety_stock(
     Returns:
         {'z': float, 'safety_stock': float, 'service_level': float}
     """
-    z = _Z_SCORES.get(service_level)
-    if z is None:
-        # 가장 가까운 Z 사용
-        closest = min(_Z_SCORES, key=lambda k: abs(k - service_level))
-        z = _Z_SCORES[closest]
-
-    ss = z * demand_std * math.sqrt(lead_time)
+    z  = inventory.z_score(service_level)
+    ss = inventory.safety_stock(demand_std, lead_time, z)
     return {
         'z':             round(z,  3),
         'safety_stock':  round(ss, 2),
@@ -112,8 +104,7 @@ def calc_reorder_point(
     Returns:
         {'rop': float, 'lead_time_demand': float, 'safety_stock': float}
     """
-    ltd = avg_demand * lead_time
-    rop = ltd + safety_stock
+    rop, ltd = inventory.reorder_point(avg_demand, lead_time, safety_stock)
     return {
         'rop':               round(rop, 2),
         'lead_time_demand':  round(ltd, 2),
@@ -129,6 +120,7 @@ def run_mrp(
     lead_time_map:      dict[str, int],
     lot_size_map:       dict[str, float] | None = None,
     periods:            int = 8,
+    scheduled_receipts: dict[str, dict[int, float]] | None = None,
 ) -> dict[str, list[dict]]:
     """
     단순 MRP 계산 (독립품목 수준, BOM 확장 없이).
@@ -139,6 +131,7 @@ def run_mrp(
         lead_time_map:      {material_code: periods}        — 리드타임 (기간)
         lot_size_map:       {material_code: lot_size}       — 로트 크기 (없으면 1)
         periods:            계획 기간 수
+        scheduled_receipts: {material_code: {period: qty}} — 입고예정량 (발주잔량)
 
     Returns:
         {material_code: [
@@ -160,10 +153,13 @@ def run_mrp(
         lt       = lead_time_map.get(mat_code, 1)
         lot_size = (lot_size_map or {}).get(mat_code, 1)
         on_hand  = float(inventory_map.get(mat_code, 0))
+        receipts = (scheduled_receipts or {}).get(mat_code, {})
         schedule = []
 
         for p in range(1, periods + 1):
             gross   = float(reqs.get(p, 0))
+            receipt = float(receipts.get(p, 0))
+            on_hand += receipt
             net_req = max(gross - on_hand, 0)
 
             # 로트 크기 단위로 올림
@@ -180,6 +176,7 @@ def run_mrp(
             schedule.append({
                 'period':                 p,
                 'gross_req':              round(gross,           2),
+                'scheduled_receipt':      round(receipt,         2),
                 'projected_oh':           round(on_hand,         2),
                 'net_req':                round(net_req,         2),
                 'planned_order_receipt':  round(planned_receipt, 2),
@@ -213,22 +210,78 @@ def classify_abc(
     if not items:
         return []
 
-    sorted_items = sorted(items, key=lambda x: float(x.get(value_field, 0)), reverse=True)
-    total = sum(float(i.get(value_field, 0)) for i in sorted_items)
+    order, pcts, classes = inventory.abc_classify([i.get(value_field, 0) for i in items])
 
-    if total == 0:
+    if not any(pcts):
+        sorted_items = [items[i] for i in order]
         for item in sorted_items:
             item['abc_class'] = 'C'
             item['cumulative_pct'] = 0
         return sorted_items
 
-    cumulative = 0.0
-    result = []
-    for item in sorted_items:
-        val = float(item.get(value_field, 0))
-        cumulative += val
-        pct = cumulative / total * 100
-        cls = 'A' if pct <= 80 else ('B' if pct <= 95 else 'C')
-        result.append({**item, 'abc_class': cls, 'cumulative_pct': round(pct, 2)})
+    return [
+        {**items[i], 'abc_class': cls, 'cumulative_pct': round(pct, 2)}
+        for i, pct, cls in zip(order, pcts, classes)
+    ]
+
+
+# ─── 일괄 재고정책 (NumPy 벡터 연산) ─────────────────────────────────────────
+
+def calc_policy_batch(
+    material_codes: list[str],
+    annual_value:   Any,
+    annual_demand:  Any,
+    avg_demand:     Any,
+    demand_std:     Any,
+    lead_time:      Any,
+    order_cost:     Any,
+    holding_cost:   Any,
+    service_level:  Any = 0.95,
+) -> dict[str, Any]:
+    """
+    전체 자재 마스터 일괄 재고정책 계산 (ABC / EOQ / 안전재고 / ROP).
+
+    자재별 값을 열(column) 배열로 받아 한 번의 벡터 연산으로 계산합니다.
+    연산 순서·Z값 선택·반올림은 calc_eoq / calc_safety_stock / calc_reorder_point /
+    classify_abc 와 동일하므로 자재별 단건 계산과 소수 둘째 자리까지 일치합니다.
+    스칼라 인자는 전체 자재에 동일하게 적용됩니다.
 
-    return result
+    Args:
+        material_codes: 자재 코드 목록 (N)
+        annual_value:   연간 사용금액 (ABC 기준)
+        annual_demand:  연간 수요량 (EOQ 기준)
+        avg_demand:     기간당 평균 수요 (리드타임과 같은 기간 단위)
+        demand_std:     기간당 수요 표준편차
+        lead_time:      조달 리드타임 (기간 수)
+        order_cost:     1회 발주비용
+        holding_cost:   단위당 연간 보관비용 (0 이하이면 EOQ 는 None)
+        service_level:  서비스 수준 (0~1)
+
+    Returns:
+        {'material_code': [...], 'abc_class': [...], 'cumulative_pct': [...],
+         'eoq': [...], 'annual_orders': [...], 'cycle_days': [...],
+         'z': [...], 'safety_stock': [...], 'rop': [...], 'lead_time_demand': [...]}
+        — 모든 열은 입력 순서와 같은 길이 N 의 리스트
+    """
+    raw = inventory.policy_batch(
+        annual_value, annual_demand, avg_demand, demand_std, lead_time,
+        order_cost, holding_cost, service_level, size=len(material_codes),
+    )
+    rnd   = inventory.round_like_python
+    valid = raw['eoq_valid'].tolist()
+
+    def _eoq_col(values, ndigits):
+        return [float(v) if ok else None for v, ok in zip(rnd(values, ndigits).tolist(), valid)]
+
+    return {
+        'material_code':    list(material_codes),
+        'abc_class':        raw['abc_class'].tolist(),
+        'cumulative_pct':   rnd(raw['cumulative_pct'], 2).tolist(),
+        'eoq':              _eoq_col(raw['eoq'], 2),
+        'annual_orders':    _eoq_col(raw['annual_orders'], 2),
+        'cycle_days':       _eoq_col(raw['cycle_days'], 1),
+        'z':                rnd(raw['z'], 3).tolist(),
+        'safety_stock':     raw['safety_stock'].tolist(),
+        'rop':              rnd(raw['rop'], 2).tolist(),
+        'lead_time_demand': rnd(raw['lead_time_demand'], 2).tolist(),
+    }
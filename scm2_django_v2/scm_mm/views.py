@@ -10,12 +10,12 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
-from scm_core.mixins import AuditLogMixin
-from .utils import calc_safety_stock, calc_eoq, calc_reorder_point
+from scm_core.mixins import AuditLogMixin, QueryBudgetMixin
+from .utils import calc_safety_stock, calc_eoq, calc_reorder_point, calc_policy_batch
 from .models import (
     Supplier, Material, PurchaseOrder, PurchaseOrderLine,
     GoodsReceipt, MaterialPriceHistory, RFQ, SupplierEvaluation,
-    SupplierMaterialConfig,
+    SupplierMaterialConfig, MaterialInventoryPolicy,
 )
 from .serializers import (
     SupplierSerializer, MaterialSerializer,
@@ -40,8 +40,9 @@ class SupplierViewSet(AuditLogMixin, viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(company=self.request.user.company)
 
-class MaterialViewSet(AuditLogMixin, viewsets.ModelViewSet):
+class MaterialViewSet(QueryBudgetMixin, AuditLogMixin, viewsets.ModelViewSet):
     audit_module = 'mm'
+    query_budgets = {'list': 6, 'requirements_plan': 8}
     serializer_class = MaterialSerializer
     filter_backends  = [filters.SearchFilter]
     search_fields    = ['material_code', 'material_name']
@@ -682,3 +683,203 @@ class CalculatorTransferListView(APIView):
 
         transfer_list.sort(key=lambda x: (x['urgency'] == '권고', x['item_code']))
         return Response({'results': transfer_list, 'count': len(transfer_list)})
+
+
+class CalculatorPolicyBatchView(APIView):
+    """POST /mm/calculator/policy-batch/
+    전체 자재 일괄 ABC / EOQ / 안전재고 / ROP 계산 → MaterialInventoryPolicy 일괄 저장
+
+    columns 를 주면 열 배열(자재 코드별 annual_value, annual_demand, avg_demand,
+    demand_std, lead_time, order_cost, holding_cost, service_level — 스칼라는 전체 적용)로
+    계산하고, 생략하면 회사 자재 마스터 전체를 최근 history_months 개월 출고 실적
+    (월 단위 평균·표준편차, 리드타임 = lead_time_days / 30) 과 재고 평균단가로 계산한다.
+    """
+    permission_classes = [IsAuthenticated]
+
+    _COLUMNS = ('annual_value', 'annual_demand', 'avg_demand', 'demand_std', 'lead_time')
+
+    def post(self, request):
+        d       = request.data
+        company = request.user.company
+        persist = str(d.get('persist', True)).lower() not in ('false', '0')
+        columns = d.get('columns')
+
+        try:
+            if columns:
+                columns = dict(columns)
+                codes   = list(columns.get('material_code') or [])
+                missing = [c for c in self._COLUMNS if c not in columns]
+                if not codes or missing:
+                    return Response(
+                        {'error': f"columns 에 material_code 및 {', '.join(missing or self._COLUMNS)} 가 필요합니다."},
+                        status=400,
+                    )
+                for key in ('order_cost', 'holding_cost', 'service_level'):
+                    columns.setdefault(key, d.get(key))
+                if columns['order_cost'] is None or columns['holding_cost'] is None:
+                    return Response({'error': 'order_cost, holding_cost 가 필요합니다.'}, status=400)
+                if columns['service_level'] is None:
+                    columns['service_level'] = 0.95
+            else:
+                if d.get('order_cost') is None:
+                    return Response({'error': '1회 발주비용(order_cost)이 필요합니다.'}, status=400)
+                columns = self._columns_from_master(
+                    company,
+                    order_cost     = float(d['order_cost']),
+                    holding_cost   = d.get('holding_cost'),
+                    holding_rate   = float(d.get('holding_rate', 0.2)),
+                    service_level  = float(d.get('service_level', 0.95)),
+                    history_months = max(1, min(int(d.get('history_months', 12)), 60)),
+                )
+                codes = columns['material_code']
+
+            error = self._check_columns(codes, columns)
+            if error:
+                return Response({'error': error}, status=400)
+            result = calc_policy_batch(
+                codes,
+                columns['annual_value'], columns['annual_demand'],
+                columns['avg_demand'], columns['demand_std'], columns['lead_time'],
+                columns['order_cost'], columns['holding_cost'], columns['service_level'],
+            )
+        except (TypeError, ValueError) as e:
+            return Response({'error': f'입력값 오류: {e}'}, status=400)
+
+        keys = [k for k in result if k != 'material_code']
+        rows = [
+            {'material_code': code, **{k: result[k][i] for k in keys}}
+            for i, code in enumerate(result['material_code'])
+        ]
+
+        persisted = 0
+        if persist and rows:
+            persisted = self._persist(company, rows, columns)
+
+        summary = {'A': 0, 'B': 0, 'C': 0}
+        for cls in result['abc_class']:
+            summary[cls] += 1
+        return Response({
+            'count':     len(rows),
+            'persisted': persisted,
+            'summary':   summary,
+            'results':   rows,
+        })
+
+    def _check_columns(self, codes, columns):
+        """음수·비유한 값(→ nan 결과, Decimal('nan') 저장)과 중복 자재 코드(upsert 충돌) 검사"""
+        import numpy as np
+
+        counts = {}
+        for code in codes:
+            counts[code] = counts.get(code, 0) + 1
+        duplicated = sorted(str(code) for code, count in counts.items() if count > 1)
+        if duplicated:
+            return f"material_code 중복: {', '.join(duplicated[:10])}"
+
+        for key in self._COLUMNS + ('order_cost',):
+            values = np.asarray(columns[key], dtype=float)
+            if not np.isfinite(values).all() or (values < 0).any():
+                return f'{key} 는 0 이상의 유한한 값이어야 합니다.'
+        if not np.isfinite(np.asarray(columns['holding_cost'], dtype=float)).all():
+            return 'holding_cost 는 유한한 값이어야 합니다.'
+        levels = np.asarray(columns['service_level'], dtype=float)
+        if not np.isfinite(levels).all() or (levels < 0).any() or (levels > 1).any():
+            return 'service_level 은 0~1 사이여야 합니다.'
+        return None
+
+    def _columns_from_master(self, company, order_cost, holding_cost, holding_rate,
+                             service_level, history_months):
+        """자재 마스터 + 출고 실적(월별 합계 1회 집계) + 재고 평균단가 → 열 배열"""
+        import numpy as np
+        from datetime import timedelta
+        from django.db.models import Avg
+        from django.utils import timezone
+        from scm_wm.models import Inventory, StockMovement
+
+        materials = list(
+            Material.objects.filter(company=company)
+            .order_by('material_code')
+            .values_list('material_code', 'lead_time_days')
+        )
+        codes = [code for code, _ in materials]
+        index = {code: i for i, code in enumerate(codes)}
+
+        now     = timezone.now()
+        current = now.year * 12 + now.month - 1
+        usage   = np.zeros((len(codes), history_months))
+        since  = now - timedelta(days=31 * history_months)
+        for row in (
+            StockMovement.objects
+            .filter(company=company, movement_type='OUT', material_code__in=codes, created_at__gte=since)
+            .annotate(month=TruncMonth('created_at'))
+            .values('material_code', 'month')
+            .annotate(total_qty=Sum('quantity'))
+        ):
+            age = current - (row['month'].year * 12 + row['month'].month - 1)
+            if 0 <= age < history_months:
+                usage[index[row['material_code']], age] += float(row['total_qty'] or 0)
+
+        prices = dict(
+            Inventory.objects.filter(company=company, item_code__in=codes)
+            .values('item_code').annotate(price=Avg('unit_price'))
+            .values_list('item_code', 'price')
+        )
+        unit_price = np.array([float(prices.get(code) or 0) for code in codes])
+
+        avg_demand    = usage.mean(axis=1) if codes else np.zeros(0)
+        annual_demand = avg_demand * 12
+        if holding_cost is None:
+            holding = unit_price * holding_rate
+        else:
+            holding = float(holding_cost)
+        return {
+            'material_code': codes,
+            'annual_value':  annual_demand * unit_price,
+            'annual_demand': annual_demand,
+            'avg_demand':    avg_demand,
+            'demand_std':    usage.std(axis=1) if codes else np.zeros(0),
+            'lead_time':     [(lt or 0) / 30 for _, lt in materials],
+            'order_cost':    order_cost,
+            'holding_cost':  holding,
+            'service_level': service_level,
+        }
+
+    def _persist(self, company, rows, columns):
+        """자재별 재고정책 upsert (bulk_create 1회)"""
+        import numpy as np
+
+        material_ids = dict(
+            Material.objects.filter(company=company, material_code__in=[r['material_code'] for r in rows])
+            .values_list('material_code', 'id')
+        )
+        n = len(rows)
+        values = np.broadcast_to(np.asarray(columns['annual_value'], dtype=float), (n,))
+        levels = np.broadcast_to(np.asarray(columns['service_level'], dtype=float), (n,))
+
+        def _dec(v):
+            return None if v is None else Decimal(str(v))
+
+        policies = [
+            MaterialInventoryPolicy(
+                company        = company,
+                material_id    = material_ids[row['material_code']],
+                abc_class      = row['abc_class'],
+                annual_value   = Decimal(str(round(float(values[i]), 2))),
+                cumulative_pct = _dec(row['cumulative_pct']),
+                eoq            = _dec(row['eoq']),
+                safety_stock   = _dec(row['safety_stock']),
+                reorder_point  = _dec(row['rop']),
+                service_level  = Decimal(str(round(float(levels[i]), 3))),
+            )
+            for i, row in enumerate(rows)
+            if row['material_code'] in material_ids
+        ]
+        MaterialInventoryPolicy.objects.bulk_create(
+            policies,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['material'],
+            update_fields=['company', 'abc_class', 'annual_value', 'cumulative_pct', 'eoq',
+                           'safety_stock', 'reorder_point', 'service_level', 'calculated_at'],
+        )
+        return len(policies)
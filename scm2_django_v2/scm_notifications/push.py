@@ -41,3 +41,22 @@ def push_unread_count(user_id: int, count: int):
         )
     except Exception:
         pass
+
+
+def push_event(user_id: int, event_type: str, payload: dict):
+    """
+    Push an arbitrary event (e.g. background task progress) to a user's
+    notification channel. The client distinguishes events by 'type'.
+    """
+    try:
+        channel_layer = get_channel_layer()
+        group_name = f'notifications_user_{user_id}'
+        async_to_sync(channel_layer.group_send)(
+            group_name,
+            {
+                'type': 'notification_message',
+                'data': {'type': event_type, **payload},
+            }
+        )
+    except Exception:
+        pass
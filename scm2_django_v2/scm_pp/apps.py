@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class PpConfig(AppConfig):
     name = 'scm_pp'
+
+    def ready(self):
+        import scm_pp.signals  # noqa: F401 — 순변경 MRP 변경 추적
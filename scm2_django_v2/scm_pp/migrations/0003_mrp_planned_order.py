@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scm_pp', '0002_work_center_cost_production_cost_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MrpPlannedOrder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('material_code', models.CharField(max_length=50)),
+                ('material_name', models.CharField(blank=True, max_length=200)),
+                ('unit', models.CharField(default='EA', max_length=20)),
+                ('order_type', models.CharField(choices=[('구매', '구매'), ('생산', '생산')], default='구매', max_length=10)),
+                ('low_level_code', models.IntegerField(default=0)),
+                ('period', models.IntegerField(help_text='입고(필요) 기간 번호 (1부터)')),
+                ('release_date', models.DateField(help_text='권장 발주/착수일')),
+                ('due_date', models.DateField(help_text='필요일 (기간 시작일)')),
+                ('gross_qty', models.DecimalField(decimal_places=3, default=0, max_digits=15)),
+                ('net_qty', models.DecimalField(decimal_places=3, default=0, max_digits=15)),
+                ('planned_qty', models.DecimalField(decimal_places=3, default=0, max_digits=15)),
+                ('is_past_due', models.BooleanField(default=False, help_text='리드타임상 발주일이 계획 시작일 이전')),
+                ('mrp_run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='plan_lines', to='scm_pp.mrprun')),
+            ],
+            options={
+                'ordering': ['low_level_code', 'material_code', 'period'],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scm_accounts', '0003_userpermission_can_delete'),
+        ('scm_pp', '0003_mrp_planned_order'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mrprun',
+            name='run_mode',
+            field=models.CharField(choices=[('전체', '전체'), ('순변경', '순변경')], default='전체', help_text='전체 재생성 / 순변경(변경 자재만 재계획)', max_length=10),
+        ),
+        migrations.CreateModel(
+            name='MrpChangedMaterial',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('material_code', models.CharField(max_length=50)),
+                ('reason', models.CharField(blank=True, help_text='변경 원인 (WM/PP/MM/BOM)', max_length=20)),
+                ('changed_at', models.DateTimeField()),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='scm_accounts.company')),
+            ],
+            options={
+                'unique_together': {('company', 'material_code')},
+            },
+        ),
+    ]
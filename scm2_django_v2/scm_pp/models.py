@@ -104,13 +104,57 @@ class ProductionOrder(models.Model):
 class MrpRun(models.Model):
     """MRP 실행 이력"""
     STATUS = [('실행중', '실행중'), ('완료', '완료'), ('오류', '오류')]
+    RUN_MODES = [('전체', '전체'), ('순변경', '순변경')]
     company        = models.ForeignKey(Company, on_delete=models.CASCADE, null=True)
     run_number     = models.CharField(max_length=50, unique=True)
     run_date       = models.DateTimeField(auto_now_add=True)
     status         = models.CharField(max_length=20, choices=STATUS, default='실행중')
+    run_mode       = models.CharField(max_length=10, choices=RUN_MODES, default='전체',
+                                      help_text='전체 재생성 / 순변경(변경 자재만 재계획)')
     total_items    = models.IntegerField(default=0)
     planned_orders = models.IntegerField(default=0)
     note           = models.TextField(blank=True)
 
     def __str__(self):
         return self.run_number
+
+
+class MrpPlannedOrder(models.Model):
+    """MRP 계획오더 (기간별 순소요량 → 발주/생산 제안)"""
+    ORDER_TYPES = [('구매', '구매'), ('생산', '생산')]
+    mrp_run        = models.ForeignKey(MrpRun, on_delete=models.CASCADE,
+                                       related_name='plan_lines')
+    material_code  = models.CharField(max_length=50)
+    material_name  = models.CharField(max_length=200, blank=True)
+    unit           = models.CharField(max_length=20, default='EA')
+    order_type     = models.CharField(max_length=10, choices=ORDER_TYPES, default='구매')
+    low_level_code = models.IntegerField(default=0)
+    period         = models.IntegerField(help_text='입고(필요) 기간 번호 (1부터)')
+    release_date   = models.DateField(help_text='권장 발주/착수일')
+    due_date       = models.DateField(help_text='필요일 (기간 시작일)')
+    gross_qty      = models.DecimalField(max_digits=15, decimal_places=3, default=0)
+    net_qty        = models.DecimalField(max_digits=15, decimal_places=3, default=0)
+    planned_qty    = models.DecimalField(max_digits=15, decimal_places=3, default=0)
+    is_past_due    = models.BooleanField(default=False,
+                                         help_text='리드타임상 발주일이 계획 시작일 이전')
+
+    class Meta:
+        ordering = ['low_level_code', 'material_code', 'period']
+
+    def __str__(self):
+        return f"{self.mrp_run.run_number} {self.material_code} P{self.period}"
+
+
+class MrpChangedMaterial(models.Model):
+    """순변경(Net-change) MRP 대상 자재 — 마지막 MRP 실행 이후 변경된 자재 표시"""
+    company       = models.ForeignKey(Company, on_delete=models.CASCADE)
+    material_code = models.CharField(max_length=50)
+    reason        = models.CharField(max_length=20, blank=True,
+                                     help_text='변경 원인 (WM/PP/MM/BOM)')
+    changed_at    = models.DateTimeField()
+
+    class Meta:
+        unique_together = ['company', 'material_code']
+
+    def __str__(self):
+        return f"{self.material_code} ({self.reason})"
@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import BillOfMaterial, BomLine, ProductionOrder, MrpRun, WorkCenterCost
+from .models import (BillOfMaterial, BomLine, ProductionOrder, MrpRun, MrpPlannedOrder,
+                     WorkCenterCost)
 
 
 class BomLineSerializer(serializers.ModelSerializer):
@@ -36,6 +37,14 @@ class MrpRunSerializer(serializers.ModelSerializer):
         read_only_fields = ['company']
 
 
+class MrpPlannedOrderSerializer(serializers.ModelSerializer):
+    run_number = serializers.CharField(source='mrp_run.run_number', read_only=True)
+
+    class Meta:
+        model  = MrpPlannedOrder
+        fields = '__all__'
+
+
 class WorkCenterCostSerializer(serializers.ModelSerializer):
     total_rate = serializers.DecimalField(read_only=True, max_digits=12, decimal_places=2)
 
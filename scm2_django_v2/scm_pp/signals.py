@@ -0,0 +1,132 @@
+"""
+PP 순변경(Net-change) MRP 변경 추적 signal.
+
+Signal overview
+---------------
+마지막 MRP 실행 이후 소요량 계획에 영향을 주는 변경이 생기면 해당 자재를
+MrpChangedMaterial 에 표시한다. 순변경 MRP 는 표시된 자재와 그 BOM 하위
+자재만 재계획한다.
+
+track_stock_movement   : StockMovement 생성         → 이동 자재 (재고 변동)
+track_bulk_stock_movements : movements_bulk_created  → 이동 자재 (scm_wm.stock 일괄 기록,
+                         bulk_create 는 post_save 를 보내지 않음)
+track_production_order : ProductionOrder 저장/삭제  → 완제품 BOM 코드 (독립수요 변동)
+track_purchase_order   : PurchaseOrder(+Line) 저장  → 발주 자재 (입고예정 변동)
+track_bom              : BillOfMaterial/BomLine 변경 → 상위 BOM 코드 + 구성 자재 (구조 변동)
+
+BillOfMaterial/BomLine 변경은 회사별 BOM 그래프 캐시(scm_pp.utils.mrp.get_bom_graph)도
+무효화한다. 커밋 전 다른 프로세스가 이전 구조로 재적재하는 경우를 막기 위해
+커밋 직후 한 번 더 무효화한다.
+"""
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def mark_mrp_changed(company_id, material_codes, reason=''):
+    """자재를 순변경 MRP 대상으로 표시 (회사·자재별 1행 upsert, 실패해도 저장 흐름 유지)."""
+    codes = {str(code) for code in material_codes if code}
+    if not company_id or not codes:
+        return
+    try:
+        from .models import MrpChangedMaterial
+        now = timezone.now()
+        MrpChangedMaterial.objects.bulk_create(
+            [MrpChangedMaterial(company_id=company_id, material_code=code,
+                                reason=reason, changed_at=now)
+             for code in codes],
+            update_conflicts=True,
+            unique_fields=['company', 'material_code'],
+            update_fields=['reason', 'changed_at'],
+        )
+    except Exception as e:
+        logger.warning(
+            'mark_mrp_changed: 순변경 표시 실패 (codes=%s): %s', sorted(codes), e, exc_info=True,
+        )
+
+
+def _invalidate_bom_graph(company_id):
+    from .utils.mrp import invalidate_bom_graph
+    invalidate_bom_graph(company_id)
+    transaction.on_commit(lambda: invalidate_bom_graph(company_id))
+
+
+@receiver(post_save, sender='scm_wm.StockMovement')
+def track_stock_movement(sender, instance, created, **kwargs):
+    if created:
+        mark_mrp_changed(instance.company_id, [instance.material_code], 'WM')
+
+
+def track_bulk_stock_movements(sender, company, movements, **kwargs):
+    mark_mrp_changed(company.id, {m.material_code for m in movements}, 'WM')
+
+
+@receiver(post_save, sender='scm_pp.ProductionOrder')
+@receiver(post_delete, sender='scm_pp.ProductionOrder')
+def track_production_order(sender, instance, **kwargs):
+    from .models import BillOfMaterial
+    code = None
+    if instance.bom_id:
+        # 저장마다 회사 BOM 그래프를 적재하지 않도록 BOM 코드만 조회 (관계가 적재돼 있으면 0회)
+        if sender.bom.is_cached(instance):
+            code = instance.bom.bom_code
+        else:
+            code = (BillOfMaterial.objects.filter(pk=instance.bom_id)
+                    .values_list('bom_code', flat=True).first())
+    mark_mrp_changed(instance.company_id, [code or instance.product_name], 'PP')
+
+
+@receiver(post_save, sender='scm_mm.PurchaseOrder')
+def track_purchase_order(sender, instance, created, **kwargs):
+    if created:
+        return  # 신규 발주는 라인 저장 시 표시
+    codes = instance.lines.filter(material__isnull=False).values_list(
+        'material__material_code', flat=True,
+    )
+    mark_mrp_changed(instance.company_id, codes, 'MM')
+
+
+@receiver(post_save, sender='scm_mm.PurchaseOrderLine')
+@receiver(post_delete, sender='scm_mm.PurchaseOrderLine')
+def track_purchase_order_line(sender, instance, **kwargs):
+    from scm_mm.models import Material, PurchaseOrder
+    if not instance.material_id:
+        return
+    company_id = PurchaseOrder.objects.filter(pk=instance.po_id).values_list(
+        'company_id', flat=True,
+    ).first()
+    code = Material.objects.filter(pk=instance.material_id).values_list(
+        'material_code', flat=True,
+    ).first()
+    mark_mrp_changed(company_id, [code], 'MM')
+
+
+@receiver(post_save, sender='scm_pp.BillOfMaterial')
+@receiver(post_delete, sender='scm_pp.BillOfMaterial')
+def track_bom(sender, instance, **kwargs):
+    _invalidate_bom_graph(instance.company_id)
+    mark_mrp_changed(instance.company_id, [instance.bom_code], 'BOM')
+
+
+@receiver(post_save, sender='scm_pp.BomLine')
+@receiver(post_delete, sender='scm_pp.BomLine')
+def track_bom_line(sender, instance, **kwargs):
+    from .models import BillOfMaterial
+    bom = (BillOfMaterial.objects.filter(pk=instance.bom_id)
+           .values('company_id', 'bom_code').first())
+    if bom:
+        _invalidate_bom_graph(bom['company_id'])
+        mark_mrp_changed(bom['company_id'], [bom['bom_code'], instance.material_code], 'BOM')
+
+
+def _connect_bulk_signals():
+    from scm_wm.stock import movements_bulk_created
+    movements_bulk_created.connect(track_bulk_stock_movements, dispatch_uid='mrp_bulk_movements')
+
+
+_connect_bulk_signals()
@@ -0,0 +1,55 @@
+"""scm_pp 백그라운드 작업 (Celery).
+
+run_mrp_task : MrpRun 을 백그라운드에서 실행하고, 진행률을 요청 사용자의
+               notifications_user_{id} 채널 그룹으로 전송합니다.
+
+WebSocket 메시지 (NotificationConsumer 경유):
+    {'type': 'mrp_progress',  run_id, run_number, stage, percent, elapsed_sec, ...}
+    {'type': 'mrp_completed', run_id, run_number, total_items, planned_orders, ...}
+    {'type': 'mrp_failed',    run_id, run_number, error}
+"""
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='scm_pp.run_mrp')
+def run_mrp_task(mrp_run_id, user_id=None, periods=8, period_days=7, net_change=False):
+    """MrpRun 실행 (execute_mrp_run 래퍼) + 진행률 WebSocket 전송."""
+    from scm_notifications.push import push_event
+    from .models import MrpRun
+    from .utils.mrp import execute_mrp_run
+
+    mrp_run = MrpRun.objects.get(pk=mrp_run_id)
+
+    def _progress(payload):
+        if user_id:
+            push_event(user_id, 'mrp_progress', payload)
+
+    try:
+        result = execute_mrp_run(
+            mrp_run, periods=periods, period_days=period_days, progress=_progress,
+            net_change=net_change,
+        )
+    except Exception as exc:
+        if user_id:
+            push_event(user_id, 'mrp_failed', {
+                'run_id': mrp_run.pk,
+                'run_number': mrp_run.run_number,
+                'error': str(exc),
+            })
+        raise
+
+    summary = {
+        'run_id':         mrp_run.pk,
+        'run_number':     mrp_run.run_number,
+        'run_mode':       mrp_run.run_mode,
+        'total_items':    result['total_items'],
+        'planned_orders': result['planned_orders'],
+        'skipped_orders': result['skipped_orders'],
+    }
+    if user_id:
+        push_event(user_id, 'mrp_completed', summary)
+    return summary
@@ -5,8 +5,12 @@
 - 재주문점 계산 (ROP)
 - 경제적 주문량 (EOQ)
 - 안전재고 계산 (서비스 수준 기반)
+  → 1~4 의 계산식은 scm_core.analytics.inventory 공통 구현에 위임
 - 다단계 BOM 소요량 전개 (재귀적 폭발전개, Django ORM 연동)
-- 순소요량 계산 (가용재고/입고예정 반영)
+- 집합 기반 BOM 전개 (BOM 그래프 일괄 적재 + Low-Level Code 레벨별 전개)
+- BOM 그래프 캐시 (회사별 컴파일 그래프, BOM 변경 signal 로 무효화)
+- 순소요량 계산 (가용재고/입고예정 반영, 다건 일괄 계산)
+- 기간별 MRP 실행 (생산오더 일괄 전개 + 기간별 순소요량 + 계획오더 저장)
 
 참고:
     Vollmann, T.E. et al. (2005). Manufacturing Planning and Control for Supply Chain Management.
@@ -17,15 +21,21 @@ from __future__ import annotations
 
 import logging
 import math
+import threading
+import time
+import uuid
+from collections import deque
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from scm_core.analytics import inventory
 
 logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
-# 1. ABC 분류 (순수 파이썬, Django ORM 불필요)
+# 1. ABC 분류 (Django ORM 불필요)
 # ---------------------------------------------------------------------------
 
 def calculate_abc_classification(
@@ -60,43 +70,16 @@ def calculate_abc_classification(
     if not materials_data:
         return []
 
-    # Decimal 변환 및 내림차순 정렬
-    normalized: List[Dict[str, Any]] = []
-    for item in materials_data:
-        annual_value = Decimal(str(item.get("annual_usage_value", 0) or 0))
-        normalized.append({**item, "_annual_value": annual_value})
-
-    normalized.sort(key=lambda x: x["_annual_value"], reverse=True)
-
-    total_value: Decimal = sum(
-        (d["_annual_value"] for d in normalized), Decimal("0")
-    )
+    annual_values = [
+        Decimal(str(item.get("annual_usage_value", 0) or 0)) for item in materials_data
+    ]
+    order, pcts, classes = inventory.abc_classify(annual_values)
 
     result: List[Dict[str, Any]] = []
-    cumulative = Decimal("0")
-
-    for d in normalized:
-        annual_value = d["_annual_value"]
-        cumulative += annual_value
-
-        if total_value > Decimal("0"):
-            cum_pct = float(cumulative / total_value * 100)
-        else:
-            cum_pct = 0.0
-
-        if cum_pct <= 80.0:
-            abc_class = "A"
-        elif cum_pct <= 95.0:
-            abc_class = "B"
-        else:
-            abc_class = "C"
-
-        # 내부 임시 키 제외하고 결과 구성
-        entry: Dict[str, Any] = {
-            k: v for k, v in d.items() if k != "_annual_value"
-        }
+    for idx, cum_pct, abc_class in zip(order, pcts, classes):
+        entry: Dict[str, Any] = dict(materials_data[idx])
         entry["class"] = abc_class
-        entry["annual_value"] = annual_value
+        entry["annual_value"] = annual_values[idx]
         entry["cumulative_pct"] = round(cum_pct, 2)
         result.append(entry)
 
@@ -132,7 +115,7 @@ def calculate_reorder_point(
         raise ValueError("avg_daily_demand 는 0 이상이어야 합니다.")
     if lead_time_days < 0:
         raise ValueError("lead_time_days 는 0 이상이어야 합니다.")
-    return avg_daily_demand * lead_time_days + safety_stock
+    return inventory.reorder_point(avg_daily_demand, lead_time_days, safety_stock)[0]
 
 
 # ---------------------------------------------------------------------------
@@ -169,10 +152,8 @@ def calculate_eoq(
     if ordering_cost < 0:
         raise ValueError("ordering_cost 는 0 이상이어야 합니다.")
 
-    if holding_cost_per_unit <= 0:
-        return annual_demand
-
-    return math.sqrt(2.0 * annual_demand * ordering_cost / holding_cost_per_unit)
+    eoq = inventory.eoq(annual_demand, ordering_cost, holding_cost_per_unit)
+    return annual_demand if eoq is None else eoq
 
 
 # ---------------------------------------------------------------------------
@@ -197,11 +178,8 @@ def calculate_safety_stock(
         d_avg   : 평균 일간 수요량
         σ_L     : 리드타임의 표준편차
 
-    Z값 매핑:
-        service_level < 0.90  : Z = 1.282
-        service_level < 0.95  : Z = 1.645
-        service_level < 0.99  : Z = 2.054
-        service_level >= 0.99 : Z = 2.326
+    Z값: scm_core.analytics.inventory.Z_SCORES 에서 가장 가까운 서비스 수준
+        (0.90 → 1.282, 0.95 → 1.645, 0.97 → 1.881, 0.98 → 2.054, 0.99 → 2.326)
 
     Args:
         avg_daily_demand: 평균 일간 수요량.
@@ -219,17 +197,10 @@ def calculate_safety_stock(
     if not (0.0 <= service_level <= 1.0):
         raise ValueError("service_level 은 0.0 ~ 1.0 사이여야 합니다.")
 
-    if service_level < 0.90:
-        z = 1.282
-    elif service_level < 0.95:
-        z = 1.645
-    elif service_level < 0.99:
-        z = 2.054
-    else:
-        z = 2.326
-
-    variance = avg_lead_time * (std_daily_demand ** 2) + (avg_daily_demand ** 2) * (std_lead_time ** 2)
-    return z * math.sqrt(variance)
+    return inventory.safety_stock_combined(
+        avg_daily_demand, std_daily_demand, avg_lead_time, std_lead_time,
+        inventory.z_score(service_level),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -260,15 +231,16 @@ def _get_bom_with_lines(bom_id: int, company_id: int) -> Optional[Any]:
 
 
 def _get_inventory_available(material_code: str, company_id: int) -> Decimal:
-    """현재 가용재고(available stock)를 조회합니다."""
+    """현재 가용재고(available stock)를 조회합니다. (WM 재고의 창고 합계)"""
     try:
-        from scm_mm.models import Material
-        mat = Material.objects.filter(
-            material_code=material_code, company_id=company_id
-        ).first()
-        if mat and hasattr(mat, "stock_qty"):
-            return Decimal(str(mat.stock_qty))
-        return Decimal("0")
+        from django.db.models import Sum
+        from scm_wm.models import Inventory
+        total = (
+            Inventory.objects
+            .filter(item_code=material_code, company_id=company_id)
+            .aggregate(total=Sum("stock_qty"))
+        )
+        return Decimal(str(total["total"] or 0))
     except Exception:
         return Decimal("0")
 
@@ -278,19 +250,19 @@ def _get_incoming_quantity(
     company_id: int,
     required_date: date,
 ) -> Decimal:
-    """발주 잔량 또는 입고예정 수량을 조회합니다."""
+    """필요일까지 납기 도래하는 미입고 발주 라인 수량을 조회합니다."""
     try:
-        from scm_mm.models import PurchaseOrderLine
         from django.db.models import Sum
+        from scm_mm.models import PurchaseOrderLine
         total = (
             PurchaseOrderLine.objects
             .filter(
-                material_code=material_code,
-                purchase_order__company_id=company_id,
-                purchase_order__status__in=["확정", "발주"],
-                expected_date__lte=required_date,
+                material__material_code=material_code,
+                po__company_id=company_id,
+                po__status__in=_OPEN_PO_STATUSES,
+                po__delivery_date__lte=required_date,
             )
-            .aggregate(total=Sum("remaining_qty"))
+            .aggregate(total=Sum("quantity"))
         )
         return Decimal(str(total["total"] or 0))
     except Exception:
@@ -390,6 +362,364 @@ def explode_bom(
     return result
 
 
+# ---------------------------------------------------------------------------
+# 5-1. 집합 기반 BOM 전개 (Low-Level Code, 고정 쿼리 수)
+# ---------------------------------------------------------------------------
+
+def _line_requirement(
+    parent_qty: Decimal,
+    line: Dict[str, Any],
+    rounding: bool = True,
+) -> Decimal:
+    """BOM 라인 1건의 실소요량 (explode_bom 과 동일한 스크랩율·반올림 규칙)."""
+    scrap_rate = Decimal(str(line["scrap_rate"] or 0)) / Decimal("100")
+    if scrap_rate >= Decimal("1"):
+        scrap_rate = Decimal("0")
+
+    qty = parent_qty * Decimal(str(line["quantity"]))
+    if scrap_rate > Decimal("0"):
+        qty = qty / (Decimal("1") - scrap_rate)
+    return qty.quantize(Decimal("0.001")) if rounding else qty
+
+
+def load_bom_graph(company_id: int) -> Dict[str, Any]:
+    """회사의 BOM 전체(헤더 + 라인)를 2회 쿼리로 적재해 컴파일된 인접 인덱스를 만듭니다.
+
+    전개 간선·Low-Level Code·단위당 누적 소요 계수를 적재 시점에 한 번만 계산하므로
+    get_bom_graph 캐시에서는 버전당 1회만 계산됩니다.
+
+    Args:
+        company_id: 회사 PK.
+
+    Returns:
+        Dict containing keys:
+            boms (Dict[int, Dict]): 활성 bom_id → {id, bom_code, product_name}.
+            bom_by_code (Dict[str, int]): bom_code(=상위 자재코드) → 활성 bom_id.
+            bom_by_product (Dict[str, int]): product_name → 활성 bom_id (최초 등록 BOM).
+            lines (Dict[int, List[Dict]]): 활성 bom_id → 라인 dict 리스트 (PK 순).
+            inactive_lines (Dict[int, List[Dict]]): 비활성 bom_id → 라인 dict 리스트
+                (전개 대상은 아니지만 이미 발행된 생산오더의 자재 소비에 사용).
+            edges (Dict[int, List[int]]): 활성 bom_id → 하위 전개 bom_id (순환 간선 제외).
+            bom_level (Dict[int, int]): 활성 bom_id → 회사 전체 기준 BOM 깊이.
+            llc (Dict[str, int]): 자재 코드 → Low-Level Code.
+            material_names (Dict[str, str]): 자재 코드 → 자재명.
+            unit_requirements (Dict[int, Dict[str, Decimal]]): bom_id → 완제품 1단위당
+                다단계 누적 소요 계수 (반제품 포함, 반올림 없음).
+            unit_consumption (Dict[int, Dict[str, Decimal]]): bom_id → 완제품 1단위당
+                최하위 구성품 소비 계수 (반제품은 하위 구성품으로 전개, 반올림 없음).
+    """
+    from scm_pp.models import BillOfMaterial, BomLine
+
+    boms: Dict[int, Dict[str, Any]] = {}
+    bom_by_code: Dict[str, int] = {}
+    bom_by_product: Dict[str, int] = {}
+    inactive_ids = set()
+    for row in (
+        BillOfMaterial.objects
+        .filter(company_id=company_id)
+        .order_by("id")
+        .values("id", "bom_code", "product_name", "is_active")
+    ):
+        if not row.pop("is_active"):
+            inactive_ids.add(row["id"])
+            continue
+        boms[row["id"]] = row
+        bom_by_code[row["bom_code"]] = row["id"]
+        bom_by_product.setdefault(row["product_name"], row["id"])
+
+    lines: Dict[int, List[Dict[str, Any]]] = {bom_id: [] for bom_id in boms}
+    inactive_lines: Dict[int, List[Dict[str, Any]]] = {bom_id: [] for bom_id in inactive_ids}
+    for row in (
+        BomLine.objects
+        .filter(bom__company_id=company_id)
+        .order_by("bom_id", "id")
+        .values("bom_id", "material_code", "material_name",
+                "quantity", "unit", "scrap_rate")
+    ):
+        target = lines if row["bom_id"] in boms else inactive_lines
+        target[row["bom_id"]].append(row)
+
+    graph = {
+        "boms": boms,
+        "bom_by_code": bom_by_code,
+        "bom_by_product": bom_by_product,
+        "lines": lines,
+        "inactive_lines": inactive_lines,
+    }
+    _compile_bom_graph(graph)
+    return graph
+
+
+def _child_bom_id(graph: Dict[str, Any], material_code: str) -> Optional[int]:
+    return graph["bom_by_code"].get(material_code)
+
+
+def _acyclic_edges(
+    graph: Dict[str, Any],
+    roots: List[int],
+) -> Dict[int, List[int]]:
+    """루트에서 도달 가능한 BOM 간 전개 간선을 반환합니다 (역방향 간선 제외).
+
+    반복 DFS 로 현재 경로 위의 BOM 을 다시 가리키는 간선(순환 참조)을 찾아
+    전개 대상에서 제외합니다. 해당 라인은 explode_bom 과 마찬가지로
+    소요량에는 포함되지만 하위 전개만 생략됩니다.
+    """
+    edges: Dict[int, List[int]] = {}
+    state: Dict[int, int] = {}  # 1 = 경로 위(진행중), 2 = 완료
+
+    for root in roots:
+        if root in state:
+            continue
+        state[root] = 1
+        edges[root] = []
+        stack = [(root, iter(graph["lines"].get(root, [])))]
+        while stack:
+            bom_id, line_iter = stack[-1]
+            line = next(line_iter, None)
+            if line is None:
+                state[bom_id] = 2
+                stack.pop()
+                continue
+
+            child = _child_bom_id(graph, line["material_code"])
+            if child is None:
+                continue
+            if state.get(child) == 1:
+                logger.warning(
+                    "순환 BOM 참조 감지됨: bom_id=%s → bom_id=%s", bom_id, child
+                )
+                continue
+
+            edges[bom_id].append(child)
+            if child not in state:
+                state[child] = 1
+                edges[child] = []
+                stack.append((child, iter(graph["lines"].get(child, []))))
+
+    return edges
+
+
+def _compile_bom_graph(graph: Dict[str, Any]) -> None:
+    """BOM 그래프에 전개 간선·LLC·단위당 누적 계수를 미리 계산해 추가합니다.
+
+    1. 회사 전체 활성 BOM 의 비순환 전개 간선 (_acyclic_edges)
+    2. Kahn 위상 정렬 + 최장 경로로 BOM 깊이 → 자재별 Low-Level Code
+    3. 깊이 역순(최하위 BOM 부터)으로 단위당 누적 소요·최하위 구성품 소비 계수 합성
+       — 상위 BOM 은 하위 BOM 의 계수를 재사용하므로 BOM 마다 한 번만 계산됩니다.
+    """
+    edges = _acyclic_edges(graph, list(graph["boms"]))
+
+    indegree: Dict[int, int] = {bom_id: 0 for bom_id in edges}
+    for children in edges.values():
+        for child in children:
+            indegree[child] += 1
+
+    depth: Dict[int, int] = {bom_id: 0 for bom_id in edges}
+    order: List[int] = []
+    queue = deque(bom_id for bom_id in edges if indegree[bom_id] == 0)
+    while queue:
+        bom_id = queue.popleft()
+        order.append(bom_id)
+        for child in edges[bom_id]:
+            depth[child] = max(depth[child], depth[bom_id] + 1)
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                queue.append(child)
+
+    llc: Dict[str, int] = {}
+    names: Dict[str, str] = {}
+    for bom_lines, levels in (
+        (graph["lines"], depth),
+        (graph["inactive_lines"], {}),
+    ):
+        for bom_id, lines in bom_lines.items():
+            for line in lines:
+                code = line["material_code"]
+                names.setdefault(code, line["material_name"])
+                if bom_id in levels:
+                    llc[code] = max(llc.get(code, 0), levels[bom_id])
+
+    unit_requirements: Dict[int, Dict[str, Decimal]] = {}
+    unit_consumption: Dict[int, Dict[str, Decimal]] = {}
+
+    def _accumulate(bom_id: int, lines: List[Dict[str, Any]], expandable: List[int]) -> None:
+        total: Dict[str, Decimal] = {}
+        leaf: Dict[str, Decimal] = {}
+        for line in lines:
+            qty = _line_requirement(Decimal("1"), line, rounding=False)
+            code = line["material_code"]
+            total[code] = total.get(code, Decimal("0")) + qty
+            child = _child_bom_id(graph, code)
+            if child is not None and child in expandable:
+                expandable.remove(child)
+                for sub_code, sub_qty in unit_requirements[child].items():
+                    total[sub_code] = total.get(sub_code, Decimal("0")) + qty * sub_qty
+                for sub_code, sub_qty in unit_consumption[child].items():
+                    leaf[sub_code] = leaf.get(sub_code, Decimal("0")) + qty * sub_qty
+            else:
+                leaf[code] = leaf.get(code, Decimal("0")) + qty
+        unit_requirements[bom_id] = total
+        unit_consumption[bom_id] = leaf
+
+    for bom_id in reversed(order):
+        _accumulate(bom_id, graph["lines"][bom_id], list(edges[bom_id]))
+    for bom_id, lines in graph["inactive_lines"].items():
+        children = [_child_bom_id(graph, line["material_code"]) for line in lines]
+        _accumulate(bom_id, lines, [child for child in children if child is not None])
+
+    graph["edges"] = edges
+    graph["bom_level"] = depth
+    graph["llc"] = llc
+    graph["material_names"] = names
+    graph["unit_requirements"] = unit_requirements
+    graph["unit_consumption"] = unit_consumption
+
+
+def explode_bom_by_level(
+    bom_quantities: Dict[int, Decimal],
+    company_id: int,
+    graph: Optional[Dict[str, Any]] = None,
+    rounding: bool = True,
+) -> List[Dict[str, Any]]:
+    """집합 기반 다단계 BOM 전개 (Low-Level Code 순 레벨별 전개).
+
+    explode_bom 과 달리 BOM 을 한 건씩 재귀 조회하지 않고, load_bom_graph 가
+    미리 계산한 전개 간선·BOM 깊이(=Low-Level Code) 순서로 인메모리 그래프를 한 번만
+    순회합니다. 동일 자재가 여러 경로에서 쓰이면 상위 소요량을 모두 합산한 뒤
+    한 번만 하위로 전개하므로, BOM 깊이·구성품 수와 무관하게 쿼리 수가 고정됩니다.
+
+    스크랩율·반올림 규칙은 explode_bom 과 동일합니다 (라인별 0.001 반올림).
+
+    Args:
+        bom_quantities: {bom_id: 완제품 생산 수량} — 여러 완제품을 한 번에 전개.
+        company_id: 회사 PK.
+        graph: load_bom_graph 결과 (없으면 get_bom_graph 캐시 사용).
+        rounding: False 면 라인별 0.001 반올림 없이 전개.
+
+    Returns:
+        자재별 합산 소요량 리스트 (level, 최초 등장 순). 각 항목은 Dict:
+            material_code (str): 자재 코드.
+            material_name (str): 자재명.
+            required_qty (Decimal): 합산 실소요량 (스크랩율 반영).
+            unit (str): 단위.
+            level (int): Low-Level Code (해당 자재가 등장하는 가장 깊은 레벨).
+            bom_id (int): 최초로 소요를 발생시킨 상위 BOM ID.
+            has_bom (bool): 하위 BOM 보유 여부 (반제품이면 True).
+    """
+    if graph is None:
+        graph = get_bom_graph(company_id)
+
+    edges = graph["edges"]
+    depth = graph["bom_level"]
+    roots = [bom_id for bom_id in bom_quantities if bom_id in graph["boms"]]
+    if not roots:
+        return []
+
+    # 루트에서 도달 가능한 BOM 만 레벨 순(동일 레벨은 ID 순)으로 전개
+    reachable = set(roots)
+    stack = list(roots)
+    while stack:
+        for child in edges[stack.pop()]:
+            if child not in reachable:
+                reachable.add(child)
+                stack.append(child)
+    order = sorted(reachable, key=lambda bom_id: (depth[bom_id], bom_id))
+
+    gross: Dict[int, Decimal] = {
+        bom_id: Decimal(str(qty)) for bom_id, qty in bom_quantities.items()
+        if bom_id in reachable
+    }
+    result: Dict[str, Dict[str, Any]] = {}
+
+    for bom_id in order:
+        parent_qty = gross.get(bom_id, Decimal("0"))
+        if parent_qty <= Decimal("0"):
+            continue
+        expandable = list(edges[bom_id])
+
+        for line in graph["lines"].get(bom_id, []):
+            line_req = _line_requirement(parent_qty, line, rounding)
+            code = line["material_code"]
+            entry = result.get(code)
+            if entry is None:
+                entry = result[code] = {
+                    "material_code": code,
+                    "material_name": line["material_name"],
+                    "required_qty": Decimal("0.000") if rounding else Decimal("0"),
+                    "unit": line["unit"],
+                    "level": depth[bom_id],
+                    "bom_id": bom_id,
+                    "has_bom": False,
+                }
+            entry["required_qty"] += line_req
+            entry["level"] = max(entry["level"], depth[bom_id])
+
+            child = _child_bom_id(graph, code)
+            if child is not None and child in expandable:
+                expandable.remove(child)
+                entry["has_bom"] = True
+                gross[child] = gross.get(child, Decimal("0")) + line_req
+
+    return sorted(result.values(), key=lambda e: e["level"])
+
+
+# ---------------------------------------------------------------------------
+# 5-2. BOM 그래프 캐시 (회사별 컴파일 그래프, signal 기반 무효화)
+# ---------------------------------------------------------------------------
+
+# company_id → (버전 토큰, 컴파일 그래프). 버전 토큰은 Django 캐시에 두어
+# 다른 프로세스(웹/Celery 워커)의 무효화도 다음 조회 시 반영됩니다.
+_BOM_GRAPH_CACHE: Dict[Any, tuple] = {}
+_BOM_GRAPH_LOCK = threading.Lock()
+
+
+def _bom_graph_version_key(company_id: Optional[int]) -> str:
+    return f"scm_pp:bom_graph_version:{company_id}"
+
+
+def invalidate_bom_graph(company_id: Optional[int]) -> None:
+    """회사의 BOM 그래프 캐시를 무효화합니다 (BillOfMaterial/BomLine 변경 signal)."""
+    from django.core.cache import cache
+
+    with _BOM_GRAPH_LOCK:
+        _BOM_GRAPH_CACHE.pop(company_id, None)
+    try:
+        cache.set(_bom_graph_version_key(company_id), uuid.uuid4().hex, None)
+    except Exception as exc:
+        logger.warning("BOM 그래프 캐시 버전 갱신 실패 (company=%s): %s", company_id, exc)
+
+
+def get_bom_graph(company_id: Optional[int]) -> Dict[str, Any]:
+    """캐시된 회사 BOM 그래프를 반환합니다 (없거나 무효화됐으면 2회 쿼리로 재적재).
+
+    전개 간선·Low-Level Code·단위당 누적 계수(load_bom_graph 참조)는 적재 시 한 번만
+    계산되어 캐시 버전 동안 MRP 전개와 생산 완료 자재 소비가 함께 재사용합니다.
+
+    반환값은 여러 호출자가 공유하므로 수정하면 안 됩니다.
+    """
+    from django.core.cache import cache
+
+    key = _bom_graph_version_key(company_id)
+    try:
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, uuid.uuid4().hex, None)
+            version = cache.get(key)
+    except Exception as exc:
+        logger.warning("BOM 그래프 캐시 버전 조회 실패 (company=%s): %s", company_id, exc)
+        version = None
+
+    entry = _BOM_GRAPH_CACHE.get(company_id)
+    if version is not None and entry is not None and entry[0] == version:
+        return entry[1]
+
+    graph = load_bom_graph(company_id)
+    if version is not None:
+        with _BOM_GRAPH_LOCK:
+            _BOM_GRAPH_CACHE[company_id] = (version, graph)
+    return graph
+
+
 # ---------------------------------------------------------------------------
 # 6. 순소요량 계산
 # ---------------------------------------------------------------------------
@@ -464,3 +794,482 @@ def calculate_net_requirements(
         "lead_time_days": lead_time_days,
         "is_urgent": is_urgent,
     }
+
+
+def calculate_net_requirements_bulk(
+    requirements: List[tuple],
+    company_id: int,
+) -> List[Dict[str, Any]]:
+    """순소요량 일괄 계산 — :func:`calculate_net_requirements` 의 배치 버전.
+
+    자재 수와 무관하게 3회 쿼리(자재 마스터, 재고 합계, 발주 라인 납기별 합계)로
+    처리합니다. 입고예정량은 자재·납기일별로 집계한 뒤 요청마다 필요일까지의
+    누적 합계를 사용하므로, 동일 자재가 여러 필요일로 요청되어도 추가 쿼리가 없습니다.
+
+    Args:
+        requirements: ``(material_id, gross_requirement, required_date)`` 튜플 목록.
+        company_id: 회사 PK.
+
+    Returns:
+        입력 순서대로 :func:`calculate_net_requirements` 와 동일한 형태의 dict 목록.
+    """
+    from bisect import bisect_right
+
+    from django.db.models import Sum
+    from scm_mm.models import Material, PurchaseOrderLine
+    from scm_wm.models import Inventory
+
+    if not requirements:
+        return []
+
+    material_ids = {int(material_id) for material_id, _, _ in requirements}
+    materials = {
+        row["id"]: row
+        for row in Material.objects
+        .filter(company_id=company_id, id__in=material_ids)
+        .values("id", "material_code", "lead_time_days")
+    }
+    codes = {row["material_code"] for row in materials.values()}
+
+    stock: Dict[str, Decimal] = {
+        row["item_code"]: Decimal(str(row["total"] or 0))
+        for row in Inventory.objects
+        .filter(company_id=company_id, item_code__in=codes)
+        .values("item_code")
+        .annotate(total=Sum("stock_qty"))
+    }
+
+    # 자재별 (납기일, 누적수량) — 필요일 기준 누적 합계를 이분 탐색으로 조회
+    latest = max(required_date for _, _, required_date in requirements)
+    receipts: Dict[int, List[tuple]] = {}
+    for row in (
+        PurchaseOrderLine.objects
+        .filter(
+            material_id__in=materials.keys(),
+            po__company_id=company_id,
+            po__status__in=_OPEN_PO_STATUSES,
+            po__delivery_date__lte=latest,
+        )
+        .values("material_id", "po__delivery_date")
+        .annotate(total=Sum("quantity"))
+        .order_by("material_id", "po__delivery_date")
+    ):
+        receipts.setdefault(row["material_id"], []).append(
+            (row["po__delivery_date"], Decimal(str(row["total"] or 0)))
+        )
+    cumulative: Dict[int, tuple] = {}
+    for material_id, rows in receipts.items():
+        days, totals, running = [], [], Decimal("0")
+        for day, qty in rows:
+            running += qty
+            days.append(day)
+            totals.append(running)
+        cumulative[material_id] = (days, totals)
+
+    today = date.today()
+    results: List[Dict[str, Any]] = []
+    for material_id, gross_requirement, required_date in requirements:
+        gross_requirement = Decimal(str(gross_requirement))
+        mat = materials.get(int(material_id))
+        material_code = mat["material_code"] if mat else str(material_id)
+        lead_time_days = int(mat["lead_time_days"]) if mat and mat["lead_time_days"] else 7
+
+        available = stock.get(material_code, Decimal("0")) if mat else Decimal("0")
+        incoming = Decimal("0")
+        if int(material_id) in cumulative:
+            days, totals = cumulative[int(material_id)]
+            idx = bisect_right(days, required_date)
+            if idx:
+                incoming = totals[idx - 1]
+
+        net = max(gross_requirement - available - incoming, Decimal("0"))
+
+        order_date = required_date - timedelta(days=lead_time_days)
+        is_urgent = order_date < today
+        if is_urgent:
+            order_date = today
+
+        results.append({
+            "material_id": material_id,
+            "material_code": material_code,
+            "gross": gross_requirement.quantize(Decimal("0.001")),
+            "available": available.quantize(Decimal("0.001")),
+            "incoming": incoming.quantize(Decimal("0.001")),
+            "net": net.quantize(Decimal("0.001")),
+            "order_date": order_date,
+            "lead_time_days": lead_time_days,
+            "is_urgent": is_urgent,
+        })
+    return results
+
+
+# ---------------------------------------------------------------------------
+# 7. 기간별 MRP 실행 (Time-phased, 생산오더 일괄 처리)
+# ---------------------------------------------------------------------------
+
+_PENDING_ORDER_STATUSES = ("계획", "확정")
+_OPEN_PO_STATUSES = ("발주확정", "납품중")
+
+
+def _period_of(day: Optional[date], start_date: date, period_days: int) -> int:
+    """날짜 → 계획 기간 번호 (1부터). 미정·과거 일자는 1기간으로 간주합니다."""
+    if day is None or day <= start_date:
+        return 1
+    return (day - start_date).days // period_days + 1
+
+
+def bom_descendants(graph: Dict[str, Any], material_codes: set) -> set:
+    """자재 코드 집합 + BOM 상 모든 하위 구성 자재 코드를 반환합니다."""
+    result = set(material_codes)
+    stack = list(material_codes)
+    while stack:
+        bom_id = graph["bom_by_code"].get(stack.pop())
+        if bom_id is None:
+            continue
+        for line in graph["lines"].get(bom_id, []):
+            if line["material_code"] not in result:
+                result.add(line["material_code"])
+                stack.append(line["material_code"])
+    return result
+
+
+def plan_time_phased_requirements(
+    orders: List[tuple],
+    graph: Dict[str, Any],
+    inventory_map: Dict[str, float],
+    lead_time_map: Dict[str, int],
+    scheduled_receipts: Optional[Dict[str, Dict[int, float]]] = None,
+    periods: int = 8,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    only: Optional[set] = None,
+    retained_releases: Optional[Dict[str, List[tuple]]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """생산오더 전체를 한 번에 받아 레벨별(LLC 순) 기간 MRP 를 수행합니다.
+
+    1. 각 오더의 BOM 1단계 구성품을 오더 착수 기간의 총소요량으로 집계
+    2. Low-Level Code 가 낮은 자재부터 scm_mm.utils.run_mrp 로 기간별 순소요량 계산
+    3. 반제품의 계획오더 발주(착수) 기간에 하위 구성품 총소요량을 추가
+    4. 다음 레벨 반복 — 모든 상위 소요가 확정된 뒤 하위 자재를 계산
+
+    순변경(net-change) 모드에서는 only 에 속한 자재만 재계산하고, 나머지 반제품은
+    직전 계획의 발주(착수) 수량(retained_releases)을 그대로 하위로 전개합니다.
+
+    DB 를 조회하지 않는 순수 함수이며, 입력은 execute_mrp_run 이 일괄 적재합니다.
+
+    Args:
+        orders: [(bom_id, period, qty), ...] 완제품 생산오더.
+        graph: load_bom_graph 결과.
+        inventory_map: {material_code: 현재고}.
+        lead_time_map: {material_code: 리드타임(기간 수)}.
+        scheduled_receipts: {material_code: {period: 입고예정량}}.
+        periods: 계획 기간 수.
+        progress: 진행 콜백. {'stage': 'explode', 'orders_processed', 'orders_total'}
+            또는 {'stage': 'netting', 'level', 'max_level'} dict 를 받습니다.
+        only: 재계산할 자재 코드 집합 (None 이면 전체).
+        retained_releases: {material_code: [(period, qty), ...]} — only 밖 반제품의
+            직전 계획오더 착수 기간·수량.
+
+    Returns:
+        {material_code: {material_code, material_name, unit, level, order_type, schedule}}
+        schedule 은 run_mrp 의 기간별 결과 리스트입니다.
+    """
+    from scm_mm.utils import run_mrp
+
+    root_qty: Dict[int, Decimal] = {}
+    for bom_id, _period, qty in orders:
+        root_qty[bom_id] = root_qty.get(bom_id, Decimal("0")) + qty
+    materials = {
+        row["material_code"]: row
+        for row in explode_bom_by_level(root_qty, None, graph)
+    }
+
+    gross: Dict[str, Dict[int, Decimal]] = {}
+
+    def _explode_single_level(bom_id: int, period: int, qty: Decimal) -> None:
+        for line in graph["lines"].get(bom_id, []):
+            by_period = gross.setdefault(line["material_code"], {})
+            by_period[period] = by_period.get(period, Decimal("0")) + _line_requirement(qty, line)
+
+    total = len(orders)
+    step = max(1, total // 20)
+    for index, (bom_id, period, qty) in enumerate(orders, start=1):
+        _explode_single_level(bom_id, period, qty)
+        if progress and (index % step == 0 or index == total):
+            progress({"stage": "explode", "orders_processed": index, "orders_total": total})
+
+    for code, releases in (retained_releases or {}).items():
+        if code in materials and materials[code]["has_bom"] and (only is None or code not in only):
+            for period, qty in releases:
+                _explode_single_level(graph["bom_by_code"][code], period, qty)
+
+    result: Dict[str, Dict[str, Any]] = {}
+    levels = sorted({row["level"] for row in materials.values()})
+    for level in levels:
+        if progress:
+            progress({"stage": "netting", "level": level, "max_level": levels[-1]})
+        level_gross = {
+            code: {p: float(q) for p, q in gross[code].items()}
+            for code, row in materials.items()
+            if row["level"] == level and code in gross and (only is None or code in only)
+        }
+        schedules = run_mrp(
+            level_gross, inventory_map, lead_time_map,
+            periods=periods, scheduled_receipts=scheduled_receipts,
+        )
+
+        for code, schedule in schedules.items():
+            row = materials[code]
+            result[code] = {
+                "material_code": code,
+                "material_name": row["material_name"],
+                "unit": row["unit"],
+                "level": level,
+                "order_type": "생산" if row["has_bom"] else "구매",
+                "schedule": schedule,
+            }
+            if not row["has_bom"]:
+                continue
+            child_bom = graph["bom_by_code"][code]
+            for entry in schedule:
+                if entry["planned_order_receipt"] > 0:
+                    _explode_single_level(
+                        child_bom,
+                        max(entry["planned_order_release_period"], 1),
+                        Decimal(str(entry["planned_order_receipt"])),
+                    )
+
+    return result
+
+
+def execute_mrp_run(
+    mrp_run: Any,
+    start_date: Optional[date] = None,
+    periods: int = 8,
+    period_days: int = 7,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    net_change: bool = False,
+) -> Dict[str, Any]:
+    """MrpRun 레코드 기준으로 기간별 MRP 를 실행하고 계획오더를 저장합니다.
+
+    대기 중인 생산오더, BOM 그래프(캐시), 재고, 자재 리드타임, 미입고 발주라인을
+    각각 한 번의 쿼리로 적재하므로 쿼리 수는 오더 수와 무관합니다.
+
+    순변경(net_change) 모드:
+        직전 완료 실행 이후 MrpChangedMaterial 에 표시된 자재와 그 BOM 하위 자재만
+        재계획합니다. 재고·리드타임·입고예정도 해당 자재만 조회하며, 나머지 자재의
+        계획오더는 직전 실행에서 이번 실행으로 이관(UPDATE 1회)됩니다. 즉 현재 유효한
+        전체 계획은 항상 가장 최근 완료 실행에 연결됩니다. 직전 완료 실행이 없으면
+        전체 재생성으로 동작합니다.
+
+    Args:
+        mrp_run: 실행할 MrpRun 인스턴스 (company 필수).
+        start_date: 1기간 시작일 (기본값: 오늘).
+        periods: 계획 기간 수.
+        period_days: 1기간 일수.
+        progress: 진행 콜백. run_id, run_number, stage, percent(0~100),
+            elapsed_sec 와 단계별 필드(orders_processed/orders_total,
+            level/max_level)를 담은 dict 를 받습니다.
+        net_change: True 면 순변경 모드로 실행.
+
+    Returns:
+        Dict containing keys:
+            total_items (int): 이번 실행에서 (재)계획한 자재 수.
+            planned_orders (int): 실행 완료 후 계획오더 수 (이관분 포함).
+            skipped_orders (int): BOM 없음·계획기간 초과로 제외된 생산오더 수.
+            requirements (List[Dict]): plan_time_phased_requirements 결과 (레벨 순).
+    """
+    from django.db import transaction
+    from django.db.models import Sum
+    from scm_mm.models import Material, PurchaseOrderLine
+    from django.utils import timezone
+    from scm_pp.models import MrpChangedMaterial, MrpPlannedOrder, MrpRun, ProductionOrder
+    from scm_wm.models import Inventory
+
+    company_id = mrp_run.company_id
+    start_date = start_date or date.today()
+    started = time.monotonic()
+    snapshot = timezone.now()
+
+    def _report(event: Dict[str, Any]) -> None:
+        if progress is None:
+            return
+        # 진행률: 데이터 적재 0~10%, 오더 전개 10~50%, 레벨별 계산 50~95%, 저장 100%
+        if event["stage"] == "explode":
+            percent = 10 + 40 * event["orders_processed"] / max(event["orders_total"], 1)
+        elif event["stage"] == "netting":
+            percent = 50 + 45 * event["level"] / max(event["max_level"] + 1, 1)
+        elif event["stage"] == "done":
+            percent = 100
+        else:
+            percent = 0
+        progress({
+            "run_id": mrp_run.pk,
+            "run_number": mrp_run.run_number,
+            "percent": round(percent, 1),
+            "elapsed_sec": round(time.monotonic() - started, 2),
+            **event,
+        })
+
+    try:
+        _report({"stage": "load"})
+        graph = get_bom_graph(company_id)
+
+        orders: List[tuple] = []
+        skipped = 0
+        for po in (
+            ProductionOrder.objects
+            .filter(company_id=company_id, status__in=_PENDING_ORDER_STATUSES)
+            .values_list("bom_id", "product_name", "planned_qty", "planned_start")
+        ):
+            bom_id, product_name, planned_qty, planned_start = po
+            if bom_id not in graph["boms"]:
+                bom_id = graph["bom_by_product"].get(product_name)
+            period = _period_of(planned_start, start_date, period_days)
+            if bom_id is None or period > periods:
+                skipped += 1
+                continue
+            orders.append((bom_id, period, Decimal(planned_qty or 1)))
+
+        base_run = None
+        if net_change:
+            base_run = (
+                MrpRun.objects
+                .filter(company_id=company_id, status="완료")
+                .exclude(pk=mrp_run.pk)
+                .order_by("-run_date", "-pk")
+                .first()
+            )
+
+        # 순변경: 변경 자재 + BOM 하위 자재만 재계획, 조회도 해당 자재로 한정
+        only = None
+        retained_releases: Dict[str, List[tuple]] = {}
+        inventory_qs = Inventory.objects.filter(company_id=company_id)
+        material_qs = Material.objects.filter(company_id=company_id)
+        po_line_qs = PurchaseOrderLine.objects.filter(
+            po__company_id=company_id, po__status__in=_OPEN_PO_STATUSES,
+            material__isnull=False,
+        )
+        if base_run is not None:
+            changed = set(
+                MrpChangedMaterial.objects
+                .filter(company_id=company_id, changed_at__lte=snapshot)
+                .values_list("material_code", flat=True)
+            )
+            only = bom_descendants(graph, changed)
+            inventory_qs = inventory_qs.filter(item_code__in=only)
+            material_qs = material_qs.filter(material_code__in=only)
+            po_line_qs = po_line_qs.filter(material__material_code__in=only)
+            for code, release_date, qty in (
+                MrpPlannedOrder.objects
+                .filter(mrp_run=base_run, order_type="생산")
+                .exclude(material_code__in=only)
+                .values_list("material_code", "release_date", "planned_qty")
+            ):
+                retained_releases.setdefault(code, []).append(
+                    (_period_of(release_date, start_date, period_days), qty)
+                )
+
+        inventory_map = {
+            code: float(qty or 0)
+            for code, qty in (
+                inventory_qs
+                .values("item_code")
+                .annotate(qty=Sum("stock_qty"))
+                .values_list("item_code", "qty")
+            )
+        }
+
+        lead_days = dict(material_qs.values_list("material_code", "lead_time_days"))
+        codes = only if only is not None else {
+            line["material_code"]
+            for lines in graph["lines"].values() for line in lines
+        }
+        lead_time_map = {
+            code: math.ceil((lead_days.get(code) or 7) / period_days)
+            for code in codes
+        }
+
+        scheduled_receipts: Dict[str, Dict[int, float]] = {}
+        for code, delivery_date, qty in po_line_qs.values_list(
+            "material__material_code", "po__delivery_date", "quantity",
+        ):
+            period = _period_of(delivery_date, start_date, period_days)
+            if period <= periods:
+                by_period = scheduled_receipts.setdefault(code, {})
+                by_period[period] = by_period.get(period, 0.0) + float(qty)
+
+        requirements = plan_time_phased_requirements(
+            orders, graph, inventory_map, lead_time_map,
+            scheduled_receipts=scheduled_receipts, periods=periods, progress=_report,
+            only=only, retained_releases=retained_releases,
+        )
+
+        plan_lines = []
+        for req in requirements.values():
+            for entry in req["schedule"]:
+                if entry["planned_order_receipt"] <= 0:
+                    continue
+                release_period = entry["planned_order_release_period"]
+                plan_lines.append(MrpPlannedOrder(
+                    mrp_run=mrp_run,
+                    material_code=req["material_code"],
+                    material_name=req["material_name"],
+                    unit=req["unit"],
+                    order_type=req["order_type"],
+                    low_level_code=req["level"],
+                    period=entry["period"],
+                    release_date=start_date + timedelta(
+                        days=(max(release_period, 1) - 1) * period_days),
+                    due_date=start_date + timedelta(days=(entry["period"] - 1) * period_days),
+                    gross_qty=Decimal(str(entry["gross_req"])),
+                    net_qty=Decimal(str(entry["net_req"])),
+                    planned_qty=Decimal(str(entry["planned_order_receipt"])),
+                    is_past_due=release_period < 1,
+                ))
+
+        with transaction.atomic():
+            MrpPlannedOrder.objects.filter(mrp_run=mrp_run).delete()
+            carried = 0
+            if base_run is not None:
+                carried = (
+                    MrpPlannedOrder.objects
+                    .filter(mrp_run=base_run)
+                    .exclude(material_code__in=only)
+                    .update(mrp_run=mrp_run)
+                )
+            MrpPlannedOrder.objects.bulk_create(plan_lines, batch_size=1000)
+            MrpChangedMaterial.objects.filter(
+                company_id=company_id, changed_at__lte=snapshot,
+            ).delete()
+
+            mrp_run.status = "완료"
+            mrp_run.run_mode = "순변경" if base_run is not None else "전체"
+            mrp_run.total_items = len(requirements)
+            mrp_run.planned_orders = carried + len(plan_lines)
+            if base_run is not None:
+                mrp_run.note = (
+                    f"Net-change: 기준 {base_run.run_number}, 재계획 자재 {len(only)}개, "
+                    f"계획오더 {len(plan_lines)}건 (이관 {carried}건)"
+                )
+            else:
+                mrp_run.note = (
+                    f"Auto-run: 생산오더 {len(orders)}건, 계획오더 {len(plan_lines)}건"
+                    + (f" (제외 {skipped}건)" if skipped else "")
+                )
+            mrp_run.save(update_fields=[
+                "status", "run_mode", "total_items", "planned_orders", "note",
+            ])
+        _report({"stage": "done"})
+    except Exception as exc:
+        logger.exception("MRP 실행 실패 (run=%s)", mrp_run.run_number)
+        mrp_run.status = "오류"
+        mrp_run.note = f"MRP 실행 실패: {exc}"[:1000]
+        mrp_run.save(update_fields=["status", "note"])
+        raise
+
+    return {
+        "total_items": len(requirements),
+        "planned_orders": mrp_run.planned_orders,
+        "skipped_orders": skipped,
+        "requirements": sorted(requirements.values(), key=lambda r: r["level"]),
+    }
@@ -3,10 +3,11 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.db.models import Sum, Count, Q
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import BillOfMaterial, BomLine, ProductionOrder, MrpRun, WorkCenterCost
+from .models import (BillOfMaterial, BomLine, ProductionOrder, MrpRun, MrpPlannedOrder,
+                     WorkCenterCost)
 from .serializers import (BillOfMaterialSerializer, BomLineSerializer,
                            ProductionOrderSerializer, MrpRunSerializer,
-                           WorkCenterCostSerializer)
+                           MrpPlannedOrderSerializer, WorkCenterCostSerializer)
 from scm_core.mixins import AuditLogMixin, StateLockMixin
 
 
@@ -100,50 +101,56 @@ class MrpRunViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['post'], url_path='run_mrp')
     def run_mrp(self, request):
-        """BOM 기반 자재 소요량 계획 실행."""
+        """BOM 기반 기간별 자재 소요량 계획 실행 (백그라운드).
+
+        MrpRun 을 '실행중' 상태로 만들고 Celery 작업으로 넘긴 뒤 즉시 반환합니다.
+        진행률은 WebSocket(/ws/notifications/)의 mrp_progress 메시지로 전송되며,
+        결과 계획오더는 /api/pp/mrp-planned-orders/?mrp_run={id} 로 조회합니다.
+
+        Body (선택): periods (기본 8), period_days (기본 7),
+                     net_change (true 면 마지막 실행 이후 변경된 자재만 재계획)
+        """
         import uuid as _uuid
-        company = request.user.company
-        run_number = f'MRP-{_uuid.uuid4().hex[:8].upper()}'
+        from .tasks import run_mrp_task
 
-        pending_orders = ProductionOrder.objects.filter(
-            company=company, status__in=['계획', '확정'],
-        )
+        try:
+            periods     = int(request.data.get('periods', 8))
+            period_days = int(request.data.get('period_days', 7))
+        except (TypeError, ValueError):
+            return Response({'error': 'periods, period_days 는 정수여야 합니다.'}, status=400)
+        if not (1 <= periods <= 104) or not (1 <= period_days <= 31):
+            return Response({'error': 'periods 는 1~104, period_days 는 1~31 이어야 합니다.'},
+                            status=400)
 
-        total_items = planned_orders = 0
-        summary = []
-
-        for po in pending_orders:
-            po_qty = float(getattr(po, 'planned_qty', getattr(po, 'quantity', 1)) or 1)
-            # BOM 매핑: finished_item 또는 product_name
-            boms = BillOfMaterial.objects.filter(
-                company=company,
-                finished_item=getattr(po, 'item_name', getattr(po, 'product_name', '')),
-                is_active=True,
-            )
-            for bom in boms:
-                for line in BomLine.objects.filter(bom=bom):
-                    req_qty = float(line.quantity) * po_qty
-                    total_items    += 1
-                    planned_orders += 1
-                    summary.append({
-                        'production_order': str(po),
-                        'component':        getattr(line, 'component_name', str(line)),
-                        'required_qty':     round(req_qty, 4),
-                        'unit':             getattr(line, 'unit', ''),
-                    })
+        net_change = str(request.data.get('net_change', '')).lower() in ('1', 'true', 'yes')
 
         mrp = MrpRun.objects.create(
-            company=company,
-            run_number=run_number,
-            status='완료',
-            total_items=total_items,
-            planned_orders=planned_orders,
-            note=f'Auto-run: {planned_orders}건 소요량 계획',
+            company=request.user.company,
+            run_number=f'MRP-{_uuid.uuid4().hex[:8].upper()}',
+            status='실행중',
+            run_mode='순변경' if net_change else '전체',
         )
+        run_mrp_task.delay(mrp.pk, request.user.pk, periods, period_days, net_change)
+
+        mrp.refresh_from_db()
         return Response({
-            'run_number':     mrp.run_number,
-            'status':         '완료',
-            'total_items':    total_items,
-            'planned_orders': planned_orders,
-            'requirements':   summary,
-        })
+            'id':          mrp.pk,
+            'run_number':  mrp.run_number,
+            'status':      mrp.status,
+            'run_mode':    mrp.run_mode,
+            'periods':     periods,
+            'period_days': period_days,
+        }, status=202)
+
+
+class MrpPlannedOrderViewSet(viewsets.ReadOnlyModelViewSet):
+    """MRP 실행 결과 계획오더 조회."""
+    serializer_class = MrpPlannedOrderSerializer
+    filter_backends  = [DjangoFilterBackend, filters.SearchFilter]
+    filterset_fields = ['mrp_run', 'order_type', 'period', 'is_past_due']
+    search_fields    = ['material_code', 'material_name']
+
+    def get_queryset(self):
+        return MrpPlannedOrder.objects.filter(
+            mrp_run__company=self.request.user.company
+        ).select_related('mrp_run')
@@ -0,0 +1,39 @@
+"""
+SPC 누적 상태(SPCStreamState) 재계산
+
+    python manage.py rebuild_spc_state [--company CODE] [--measurement NAME]
+
+SPCData 전체 이력을 측정 순서대로 재생해 측정 항목별 상태를 다시 씁니다.
+SPCData 를 signal 없이 수정·삭제했거나 bulk_create 후 ingest() 를 빠뜨린 경우에 사용합니다.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from scm_accounts.models import Company
+from scm_qm.models import SPCData
+from scm_qm.spc_stream import rebuild
+
+
+class Command(BaseCommand):
+    help = '측정 항목별 SPC 누적 상태를 SPCData 전체 이력으로 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--company', help='회사 코드 (기본: 전체)')
+        parser.add_argument('--measurement', help='측정 항목 (기본: 전체)')
+
+    def handle(self, *args, **options):
+        companies = Company.objects.all()
+        if options['company']:
+            companies = companies.filter(company_code=options['company'])
+            if not companies.exists():
+                raise CommandError(f'회사 코드 없음: {options["company"]}')
+
+        total = 0
+        for company in companies:
+            names = SPCData.objects.filter(company=company)
+            if options['measurement']:
+                names = names.filter(measurement_name=options['measurement'])
+            for name in names.values_list('measurement_name', flat=True).distinct().order_by('measurement_name'):
+                n = rebuild(company, name)
+                self.stdout.write(f'{company.company_code} {name}: {n}건')
+                total += 1
+        self.stdout.write(self.style.SUCCESS(f'SPC 상태 {total}개 항목 재계산'))
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_spc_stream_state(apps, schema_editor):
+    """기존 SPCData 이력을 측정 항목별로 재생해 초기 상태 생성 (scm_qm.spc_stream.rebuild 와 동일)."""
+    from scm_qm.spc_stream import _replay
+
+    SPCData = apps.get_model('scm_qm', 'SPCData')
+    SPCStreamState = apps.get_model('scm_qm', 'SPCStreamState')
+    keys = (SPCData.objects.values_list('company_id', 'measurement_name')
+            .distinct().order_by('company_id', 'measurement_name'))
+    states = []
+    for company_id, name in keys:
+        rows = (SPCData.objects.filter(company_id=company_id, measurement_name=name).order_by('pk')
+                .only('pk', 'measured_value', 'usl', 'lsl', 'target', 'measured_at'))
+        obj = SPCStreamState(company_id=company_id, measurement_name=name)
+        states.append(_replay(obj, rows.iterator(chunk_size=2000)))
+    SPCStreamState.objects.bulk_create(states, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scm_accounts', '0003_userpermission_can_delete'),
+        ('scm_qm', '0002_ncr_spcdata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SPCStreamState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('measurement_name', models.CharField(max_length=100)),
+                ('n', models.BigIntegerField(default=0)),
+                ('mean', models.FloatField(default=0)),
+                ('m2', models.FloatField(default=0)),
+                ('last_value', models.FloatField(null=True)),
+                ('mr_sum', models.FloatField(default=0)),
+                ('above_run', models.IntegerField(default=0)),
+                ('below_run', models.IntegerField(default=0)),
+                ('up_run', models.IntegerField(default=0)),
+                ('down_run', models.IntegerField(default=0)),
+                ('alt_run', models.IntegerField(default=0)),
+                ('last_sign', models.SmallIntegerField(default=0)),
+                ('usl', models.FloatField(null=True)),
+                ('lsl', models.FloatField(null=True)),
+                ('target', models.FloatField(null=True)),
+                ('open_violations', models.JSONField(default=list, verbose_name='진행 중인 규칙 위반')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='scm_accounts.company')),
+                ('last_data', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='scm_qm.spcdata')),
+            ],
+            options={
+                'ordering': ['measurement_name'],
+                'unique_together': {('company', 'measurement_name')},
+            },
+        ),
+        migrations.RunPython(backfill_spc_stream_state, migrations.RunPython.noop),
+    ]
@@ -102,6 +102,43 @@ class SPCData(models.Model):
     def __str__(self): return f"{self.inspection_result} - {self.measurement_name}"
 
 
+class SPCStreamState(models.Model):
+    """
+    측정 항목별 SPC 누적 상태 (회사 × measurement_name)
+
+    SPCData 저장 시 signal 이 O(1) 로 갱신한다 (scm_qm.spc_stream, 계산식은
+    scm_core.analytics.spc.stream_*). 전체 이력 재계산: python manage.py rebuild_spc_state
+    """
+    company          = models.ForeignKey(Company, on_delete=models.CASCADE)
+    measurement_name = models.CharField(max_length=100)
+    # Welford 누적 평균·편차제곱합, 이동범위 합
+    n                = models.BigIntegerField(default=0)
+    mean             = models.FloatField(default=0)
+    m2               = models.FloatField(default=0)
+    last_value       = models.FloatField(null=True)
+    mr_sum           = models.FloatField(default=0)
+    # 런 규칙 연속 길이 (중심선 위/아래, 증가/감소, 교대) + 직전 증감 부호
+    above_run        = models.IntegerField(default=0)
+    below_run        = models.IntegerField(default=0)
+    up_run           = models.IntegerField(default=0)
+    down_run         = models.IntegerField(default=0)
+    alt_run          = models.IntegerField(default=0)
+    last_sign        = models.SmallIntegerField(default=0)
+    # 최근 측정값의 규격
+    usl              = models.FloatField(null=True)
+    lsl              = models.FloatField(null=True)
+    target           = models.FloatField(null=True)
+    open_violations  = models.JSONField(default=list, verbose_name='진행 중인 규칙 위반')
+    last_data        = models.ForeignKey(SPCData, on_delete=models.SET_NULL, null=True, related_name='+')
+    updated_at       = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['company', 'measurement_name']
+        ordering = ['measurement_name']
+
+    def __str__(self): return f"{self.company_id} {self.measurement_name} (n={self.n})"
+
+
 class NCR(models.Model):
     """부적합 보고서 (Non-Conformance Report)"""
     company            = models.ForeignKey(Company, on_delete=models.CASCADE)
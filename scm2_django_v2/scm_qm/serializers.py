@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import InspectionPlan, InspectionResult, DefectRecord, CorrectiveAction
+from .models import InspectionPlan, InspectionResult, DefectRecord, CorrectiveAction, SPCStreamState
 
 
 class InspectionPlanSerializer(serializers.ModelSerializer):
@@ -41,3 +41,33 @@ class CorrectiveActionSerializer(serializers.ModelSerializer):
         model  = CorrectiveAction
         fields = '__all__'
         read_only_fields = ['company']
+
+
+class SPCStreamStateSerializer(serializers.ModelSerializer):
+    """측정 항목별 SPC 누적 상태 — 응답은 scm_qm.spc_stream.snapshot 형식."""
+
+    class Meta:
+        model  = SPCStreamState
+        fields = ['id', 'measurement_name']
+
+    def to_representation(self, instance):
+        from .spc_stream import snapshot
+        return {'id': instance.pk, **snapshot(instance)}
+
+
+class SPCMeasurementSerializer(serializers.Serializer):
+    """SPC 측정값 일괄 기록 (POST /api/qm/spc-monitor/record/)."""
+    inspection_result = serializers.PrimaryKeyRelatedField(queryset=InspectionResult.objects.none())
+    measurement_name  = serializers.CharField(max_length=100)
+    values            = serializers.ListField(
+        child=serializers.DecimalField(max_digits=15, decimal_places=4), allow_empty=False, max_length=10000,
+    )
+    usl    = serializers.DecimalField(max_digits=15, decimal_places=4, required=False, allow_null=True)
+    lsl    = serializers.DecimalField(max_digits=15, decimal_places=4, required=False, allow_null=True)
+    target = serializers.DecimalField(max_digits=15, decimal_places=4, required=False, allow_null=True)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is not None:
+            self.fields['inspection_result'].queryset = InspectionResult.objects.filter(company=request.user.company)
@@ -6,11 +6,12 @@ Signal overview
 qm_fail_to_pp_rework : InspectionResult '불합격' 전환 시
                          → PP ProductionOrder 재작업 오더 자동생성
                          → 회사 사용자 전체에 인앱 알림 + WebSocket push
+spc_stream_update    : SPCData 생성 시 측정 항목 SPC 누적 상태 O(1) 갱신 (scm_qm.spc_stream)
 """
 import logging
 
 from django.db import transaction
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
@@ -176,3 +177,22 @@ def _notify_company_users(inspection_result, order_number):
         inspection_result.result_number,
         len(created),
     )
+
+
+# ---------------------------------------------------------------------------
+# SPC 스트리밍 상태
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender='scm_qm.SPCData')
+def spc_stream_update(sender, instance, created, **kwargs):
+    """신규 측정값만 반영 (수정은 rebuild_spc_state 로 재계산)."""
+    if not created:
+        return
+    try:
+        from .spc_stream import ingest
+        ingest([instance])
+    except Exception as exc:
+        logger.warning(
+            'spc_stream_update: SPC 상태 갱신 실패 | measurement=%s | error=%s',
+            instance.measurement_name, exc, exc_info=True,
+        )
@@ -0,0 +1,248 @@
+"""
+SPC 관리도 데이터 — 긴 측정 이력을 차트용으로 줄여서 응답 (GET /api/qm/spc-monitor/chart/)
+
+    chart_data(queryset, max_points, method, rules)
+
+queryset 은 한 측정 항목의 SPCData (회사·기간 필터 적용). 점 수에 따라 두 방식:
+
+    raw     점 수 ≤ QM_SPC_CHART_RAW_LIMIT
+            (pk, 측정값) 만 읽어 I-MR 한계·Nelson 규칙(scm_core.analytics.spc)을 계산하고
+            max_points 로 다운샘플 (minmax: 구간별 최소·최대 / lttb). 이상점은 항상 포함.
+    bucket  그보다 많으면 집계는 DB 에서 계산
+            평균·MR̄(Lag 윈도 함수) → 관리한계, pk 구간별 최소·최대·평균·개수.
+            규칙 1 만 요청하면 관리한계 밖 점만 조회하고, 런 규칙 2~8 이 있으면
+            (pk, 측정값) 을 pk 순으로 _RULE_CHUNK 개씩 읽어 직전 청크 끝
+            (가장 긴 규칙 창 - 1)점을 겹쳐 nelson_rule_ends 로 판정합니다 (전체 판정과 동일).
+            위반점은 모두 구간별 위반 수·규칙으로 합치고, 개별 목록만 상한(최근 순)을 둡니다.
+            점 수가 QM_SPC_CHART_RULE_LIMIT 를 넘으면 런 규칙 요청은 거절 (ValueError).
+
+측정 시각은 응답에 담는 점만 따로 조회합니다. 1 Hz 1년(약 3천만 점)도
+구간 max_points/2 개 + 이상점 상한(QM_SPC_CHART_MAX_VIOLATIONS)으로 수백 KB 이내입니다.
+"""
+from django.conf import settings
+from django.db.models import Avg, BigIntegerField, Count, ExpressionWrapper, F, Max, Min, Q, Window
+from django.db.models.functions import Abs, Lag
+
+from scm_core.analytics import spc
+
+METHODS = ('minmax', 'lttb')
+_RULE_CHUNK = 200000   # bucket 방식 런 규칙 판정 시 한 번에 읽는 점 수
+
+
+def _float(value):
+    return float(value) if value is not None else None
+
+
+def _limits_payload(limits):
+    return {
+        'chart_type': 'I-MR',
+        'x_bar':      round(limits['center'], 6),
+        'ucl_x':      round(limits['ucl'], 6),
+        'lcl_x':      round(limits['lcl'], 6),
+        'sigma':      round(limits['sigma'], 6),
+        'mr_bar':     round(limits['r_bar'], 6),
+        'ucl_r':      round(limits['ucl_r'], 6),
+    }
+
+
+def _times(ids):
+    from .models import SPCData
+
+    times = {}
+    for start in range(0, len(ids), 5000):   # IN 절 변수 수 제한
+        times.update(SPCData.objects.filter(pk__in=ids[start:start + 5000]).values_list('pk', 'measured_at'))
+    return times
+
+
+def _columns(ids, values, times):
+    return {
+        'id':          ids,
+        'measured_at': [times.get(pk) for pk in ids],
+        'value':       values,
+    }
+
+
+def _from_values(queryset, n, max_points, method, rules):
+    import numpy as np
+
+    # count() 이후 추가된 행은 제외 (다음 조회에서)
+    rows = queryset.order_by('pk').values_list('pk', 'measured_value')[:n]
+    ids = np.empty(n, dtype=np.int64)
+    values = np.empty(n, dtype=np.float64)
+    count = 0
+    for count, (pk, value) in enumerate(rows.iterator(chunk_size=5000), start=1):
+        ids[count - 1] = pk
+        values[count - 1] = value
+    ids, values = ids[:count], values[:count]
+
+    limits = spc.imr_limits(values)
+    ends = {}
+    if limits['sigma'] > 0:
+        ends = spc.nelson_rule_ends(values, limits['ucl'], limits['lcl'], limits['center'], rules=rules)
+    flagged = np.unique(np.concatenate(list(ends.values()) or [np.zeros(0, dtype=np.int64)]))
+    cap = getattr(settings, 'QM_SPC_CHART_MAX_VIOLATIONS', 5000)
+    truncated = flagged.shape[0] > cap
+    flagged = flagged[-cap:] if truncated else flagged
+
+    if count <= max_points:
+        selected = np.arange(count, dtype=np.int64)
+    elif method == 'lttb':
+        selected = spc.lttb_downsample(values, max_points, keep=flagged)
+    else:
+        selected = spc.minmax_downsample(values, max(max_points // 2, 1), keep=flagged)
+
+    point_ids = ids[selected].tolist()
+    flagged_ids = ids[flagged].tolist()
+    times = _times(sorted(set(point_ids) | set(flagged_ids)))
+    order = sorted(ends)
+    member = np.vstack([np.isin(flagged, ends[rule]) for rule in order]) if order else np.zeros((0, 0), dtype=bool)
+    violation_rules = [[order[k] for k in np.flatnonzero(column).tolist()] for column in member.T]
+    violations = _columns(flagged_ids, values[flagged].tolist(), times)
+    violations['rules'] = violation_rules
+    return {
+        'mode':           method if count > max_points else 'raw',
+        'n':              count,
+        'control_limits': _limits_payload(limits),
+        'rules':          order,
+        'points':         _columns(point_ids, values[selected].tolist(), times),
+        'violations':     violations,
+        'violations_truncated': bool(truncated),
+    }
+
+
+def _chunked_rule_points(queryset, limits, rules):
+    """pk 순 청크별 Nelson 판정 → [(pk, 측정값, [규칙...]), ...] (pk 오름차순).
+
+    청크마다 직전 청크의 마지막 (최장 규칙 창 - 1)점을 앞에 붙여 판정하고, 새 청크에서
+    끝나는 창만 취하므로 전체 배열을 한 번에 판정한 결과와 같습니다.
+    """
+    import numpy as np
+
+    overlap = max(spc.RULE_WINDOWS[rule] for rule in rules) - 1
+    tail_ids = np.zeros(0, dtype=np.int64)
+    tail_values = np.zeros(0, dtype=np.float64)
+    found = {}
+
+    def _evaluate(chunk_ids, chunk_values):
+        nonlocal tail_ids, tail_values
+        ids = np.concatenate([tail_ids, np.asarray(chunk_ids, dtype=np.int64)])
+        values = np.concatenate([tail_values, np.asarray(chunk_values, dtype=np.float64)])
+        ends = spc.nelson_rule_ends(values, limits['ucl'], limits['lcl'], limits['center'], rules=rules)
+        for rule, rule_ends in ends.items():
+            for index in rule_ends[rule_ends >= tail_ids.shape[0]].tolist():
+                found.setdefault(int(ids[index]), (float(values[index]), []))[1].append(rule)
+        tail_ids, tail_values = ids[ids.shape[0] - overlap:], values[values.shape[0] - overlap:]
+
+    chunk_ids, chunk_values = [], []
+    rows = queryset.order_by('pk').values_list('pk', 'measured_value')
+    for pk, value in rows.iterator(chunk_size=5000):
+        chunk_ids.append(pk)
+        chunk_values.append(value)
+        if len(chunk_ids) >= _RULE_CHUNK:
+            _evaluate(chunk_ids, chunk_values)
+            chunk_ids, chunk_values = [], []
+    if chunk_ids:
+        _evaluate(chunk_ids, chunk_values)
+    return [(pk, value, sorted(point_rules)) for pk, (value, point_rules) in sorted(found.items())]
+
+
+def _from_buckets(queryset, max_points, rules):
+    stats = (
+        queryset.annotate(prev=Window(Lag('measured_value'), order_by=F('pk').asc()))
+        .aggregate(
+            n=Count('pk'), mean=Avg('measured_value'),
+            mr_bar=Avg(Abs(F('measured_value') - F('prev'))),
+            first_pk=Min('pk'), last_pk=Max('pk'),
+        )
+    )
+    limits = spc.imr_limits_from(_float(stats['mean']), _float(stats['mr_bar']) or 0.0)
+
+    buckets = max(max_points // 2, 1)
+    width = -(-(stats['last_pk'] - stats['first_pk'] + 1) // buckets)
+    rows = (
+        queryset.annotate(bucket=ExpressionWrapper((F('pk') - stats['first_pk']) / width,
+                                                   output_field=BigIntegerField()))
+        .values('bucket')
+        .annotate(start=Min('measured_at'), end=Max('measured_at'), low=Min('measured_value'),
+                  high=Max('measured_value'), mean=Avg('measured_value'), count=Count('pk'))
+        .order_by('bucket')
+    )
+    series = {'start': [], 'end': [], 'min': [], 'max': [], 'mean': [], 'count': []}
+    bucket_ids = []
+    for row in rows:
+        bucket_ids.append(row['bucket'])
+        series['start'].append(row['start'])
+        series['end'].append(row['end'])
+        series['min'].append(_float(row['low']))
+        series['max'].append(_float(row['high']))
+        series['mean'].append(round(_float(row['mean']), 6))
+        series['count'].append(row['count'])
+
+    evaluated = sorted(set(rules)) if limits['sigma'] > 0 else []
+    violations = {'id': [], 'measured_at': [], 'value': [], 'rules': []}
+    series['violations'] = [0] * len(series['count'])
+    series['rules'] = [[] for _ in series['count']]
+    truncated = False
+    if evaluated:
+        cap = getattr(settings, 'QM_SPC_CHART_MAX_VIOLATIONS', 5000)
+        if evaluated == [1]:
+            flagged = [
+                (pk, float(value), [1]) for pk, value in
+                queryset.filter(Q(measured_value__gt=limits['ucl']) | Q(measured_value__lt=limits['lcl']),
+                                pk__lte=stats['last_pk'])
+                .order_by('pk').values_list('pk', 'measured_value')
+            ]
+        else:
+            flagged = _chunked_rule_points(queryset.filter(pk__lte=stats['last_pk']), limits, evaluated)
+
+        # 위반점은 모두 소속 구간에 합치고, 개별 목록은 최근 cap 개만
+        position = {row: k for k, row in enumerate(bucket_ids)}
+        for pk, _value, point_rules in flagged:
+            k = position[(pk - stats['first_pk']) // width]
+            series['violations'][k] += 1
+            series['rules'][k] = sorted(set(series['rules'][k]).union(point_rules))
+        truncated = len(flagged) > cap
+        listed = flagged[-cap:] if truncated else flagged
+        times = _times([pk for pk, _value, _rules in listed])
+        for pk, value, point_rules in listed:
+            violations['id'].append(pk)
+            violations['measured_at'].append(times.get(pk))
+            violations['value'].append(value)
+            violations['rules'].append(point_rules)
+    return {
+        'mode':           'bucket',
+        'n':              stats['n'],
+        'control_limits': _limits_payload(limits),
+        'rules':          evaluated,
+        'buckets':        series,
+        'violations':     violations,
+        'violations_truncated': truncated,
+    }
+
+
+def chart_data(queryset, max_points=2000, method='minmax', rules=(1, 2, 3, 4)):
+    """측정 항목 1개의 관리도 데이터 (모듈 docstring 의 raw / bucket 방식).
+
+    Raises:
+        ValueError: bucket 방식에서 점 수가 QM_SPC_CHART_RULE_LIMIT 를 넘는데 런 규칙 2~8 요청.
+    """
+    n = queryset.count()
+    spec = queryset.exclude(usl=None, lsl=None).order_by('-pk').values('usl', 'lsl', 'target').first() or {}
+    result = {'spec': {key: _float(spec.get(key)) for key in ('usl', 'lsl', 'target')}}
+    if n == 0:
+        result.update({'mode': 'raw', 'n': 0, 'control_limits': None, 'rules': [],
+                       'points': _columns([], [], {}),
+                       'violations': {'id': [], 'measured_at': [], 'value': [], 'rules': []},
+                       'violations_truncated': False})
+        return result
+    if n <= getattr(settings, 'QM_SPC_CHART_RAW_LIMIT', 500000):
+        result.update(_from_values(queryset, n, max_points, method, rules))
+    else:
+        limit = getattr(settings, 'QM_SPC_CHART_RULE_LIMIT', 10000000)
+        if n > limit and any(rule != 1 for rule in rules):
+            raise ValueError(
+                f'측정값 {n}건은 런 규칙 판정 상한({limit}건)을 넘습니다. '
+                '기간을 줄이거나 rules=1 로 조회하세요.'
+            )
+        result.update(_from_buckets(queryset, max_points, rules))
+    return result
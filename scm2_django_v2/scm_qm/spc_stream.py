@@ -0,0 +1,122 @@
+"""
+SPC 스트리밍 모니터링 — SPCData 저장마다 측정 항목별 누적 상태(SPCStreamState)를 O(1) 갱신
+
+    ingest(rows)             SPCData 목록 반영 (post_save signal 은 1건씩,
+                             bulk_create 로 넣은 뒤에는 직접 호출)
+    rebuild(company, name)   전체 이력으로 상태 재작성 (rebuild_spc_state 명령)
+    snapshot(state)          현재 관리한계·Cp/Cpk·진행 중인 규칙 위반 (SPC 모니터 API 응답)
+
+계산식은 scm_core.analytics.spc.stream_* 를 사용합니다. 상태 행은 select_for_update 로
+잠그므로 같은 측정 항목의 동시 저장도 순서대로 반영됩니다.
+
+진행 중인 위반(open_violations): 런 규칙이 성립한 점에서 열리고, 이후 점마다 계속
+성립하면 points 가 늘어나며, 성립하지 않는 점이 오면 닫힙니다 (목록에서 제외).
+"""
+from django.db import transaction
+
+from scm_core.analytics import spc
+
+RULE_DESCRIPTIONS = {
+    1: 'Rule 1: 관리한계 외부 점',
+    2: 'Rule 2: 연속 9점 중심선 한쪽',
+    3: 'Rule 3: 연속 6점 단조 증가/감소',
+    4: 'Rule 4: 연속 14점 교대 증감',
+}
+
+
+def _replay(obj, rows):
+    """obj(SPCStreamState) 에 rows(SPCData, 저장 순서) 를 반영. 저장은 호출한 쪽에서."""
+    state = {field: getattr(obj, field) for field in spc.STREAM_FIELDS}
+    opened = {v['rule']: v for v in obj.open_violations or []}
+    for row in rows:
+        value = float(row.measured_value)
+        rules = spc.stream_update(state, value)
+        current = {}
+        for rule in rules:
+            violation = opened.get(rule) or {
+                'rule': rule,
+                'description': RULE_DESCRIPTIONS[rule],
+                'opened_at': row.measured_at.isoformat() if row.measured_at else None,
+                'first_data_id': row.pk,
+                'points': 0,
+            }
+            violation['points'] += 1
+            violation['last_data_id'] = row.pk
+            violation['last_value'] = value
+            current[rule] = violation
+        opened = current
+        for spec in ('usl', 'lsl', 'target'):
+            if getattr(row, spec) is not None:
+                setattr(obj, spec, float(getattr(row, spec)))
+        obj.last_data_id = row.pk
+    for field, value in state.items():
+        setattr(obj, field, value)
+    obj.open_violations = [opened[rule] for rule in sorted(opened)]
+    return obj
+
+
+def ingest(rows):
+    """SPCData 목록을 측정 항목별 상태에 반영하고 갱신한 상태 목록을 돌려줌."""
+    from .models import SPCStreamState
+
+    groups = {}
+    for row in rows:
+        groups.setdefault((row.company_id, row.measurement_name), []).append(row)
+
+    updated = []
+    with transaction.atomic():
+        for company_id, name in sorted(groups):   # 잠금 순서 고정 (교착 방지)
+            SPCStreamState.objects.get_or_create(company_id=company_id, measurement_name=name)
+            obj = SPCStreamState.objects.select_for_update().get(company_id=company_id, measurement_name=name)
+            _replay(obj, sorted(groups[(company_id, name)], key=lambda r: r.pk))
+            obj.save()
+            updated.append(obj)
+    return updated
+
+
+def rebuild(company, measurement_name):
+    """측정 항목의 상태를 SPCData 전체 이력으로 다시 계산. 반영한 측정값 수를 돌려줌."""
+    from .models import SPCData, SPCStreamState
+
+    rows = (
+        SPCData.objects.filter(company=company, measurement_name=measurement_name)
+        .order_by('pk')
+        .only('pk', 'measured_value', 'usl', 'lsl', 'target', 'measured_at')
+    )
+    with transaction.atomic():
+        SPCStreamState.objects.filter(company=company, measurement_name=measurement_name).delete()
+        obj = SPCStreamState(company=company, measurement_name=measurement_name)
+        _replay(obj, rows.iterator(chunk_size=2000))
+        obj.save()
+    return obj.n
+
+
+def _round(value, ndigits):
+    return round(value, ndigits) if value is not None else None
+
+
+def snapshot(obj):
+    """상태 1건의 현재 관리한계·공정능력·진행 중인 위반."""
+    state = {field: getattr(obj, field) for field in spc.STREAM_FIELDS}
+    limits = spc.stream_limits(state)
+    capability = spc.stream_capability(state, usl=obj.usl, lsl=obj.lsl, target=obj.target)
+    return {
+        'measurement_name': obj.measurement_name,
+        'n':                obj.n,
+        'mean':             _round(obj.mean, 6),
+        'std':              _round(capability['std'], 6),
+        'last_value':       obj.last_value,
+        'control_limits': {
+            'chart_type': 'I-MR',
+            'x_bar':      _round(limits['center'], 6),
+            'ucl_x':      _round(limits['ucl'], 6),
+            'lcl_x':      _round(limits['lcl'], 6),
+            'sigma':      _round(limits['sigma'], 6),
+            'mr_bar':     _round(limits['r_bar'], 6),
+            'ucl_r':      _round(limits['ucl_r'], 6),
+        },
+        'spec':       {'usl': obj.usl, 'lsl': obj.lsl, 'target': obj.target},
+        'capability': {key: _round(capability[key], 4) for key in ('cp', 'cpu', 'cpl', 'cpk', 'cpm')},
+        'open_violations': obj.open_violations,
+        'updated_at': obj.updated_at,
+    }
@@ -1,4 +1,10 @@
-"""scm_qm utils package - SPC and quality management utilities."""
+"""scm_qm utils package - SPC and quality management utilities.
+
+calc_* / classify_spc_points 는 SpcAnalyzeView 응답 형태(x_bar, ucl_x, lcl_x ...)를
+반환하는 래퍼이며, 계산은 spc.py 와 같은 scm_core.analytics.spc 공통 구현을 사용합니다.
+"""
+from scm_core.analytics import spc as core_spc
+
 from .spc import (
     calculate_cpk,
     calculate_control_limits,
@@ -9,28 +15,94 @@ from .spc import (
 
 
 def calc_process_capability(values, usl=None, lsl=None, target=None):
-    """views.py 호환 래퍼 — calculate_cpk 호출."""
-    try:
-        if usl is not None and lsl is not None:
-            return calculate_cpk([float(v) for v in values], usl=float(usl), lsl=float(lsl))
-        # USL/LSL 없으면 기본 통계만 반환
-        import statistics as _s
-        vals = [float(v) for v in values]
-        return {'mean': round(_s.mean(vals), 6), 'std': round(_s.stdev(vals), 6), 'n': len(vals)}
-    except Exception as e:
-        return {'error': str(e)}
+    """공정능력 지수 (한쪽 규격만 있어도 계산, 양쪽 규격이면 Cp·Cpm 포함).
+
+    Returns:
+        {mean, std, n, cp, cpu, cpl, cpk, cpm, target} — 해당 없는 지수는 생략
+    """
+    if not values or len(values) < 2:
+        return {'error': '데이터가 충분하지 않습니다 (최소 2개)'}
+
+    stats = core_spc.capability(
+        [float(v) for v in values],
+        usl=float(usl) if usl is not None else None,
+        lsl=float(lsl) if lsl is not None else None,
+        target=float(target) if target is not None else None,
+    )
+    result = {'mean': round(stats['mean'], 6), 'std': round(stats['std'], 6), 'n': stats['n']}
+    if stats['std'] == 0:
+        result['error'] = '표준편차가 0입니다'
+        return result
+
+    for key in ('cp', 'cpu', 'cpl'):
+        if stats[key] is not None:
+            result[key] = round(stats[key], 4)
+    if stats['cpk'] is not None:
+        result['cpk'] = round(stats['cpk'], 4)
+    if stats['cpm'] is not None:
+        result['cpm'] = round(stats['cpm'], 4)
+        result['target'] = stats['target']
+    return result
 
 
 def calc_control_limits(values, subgroup_size=1):
-    """views.py 호환 래퍼 — calculate_control_limits 호출."""
-    return calculate_control_limits([float(v) for v in values], subgroup_size=subgroup_size)
+    """I-MR (subgroup_size=1) 또는 X-bar R 관리도 한계선."""
+    if not values or len(values) < 2:
+        return {'error': '데이터 부족 (최소 2개)'}
+    if subgroup_size not in range(1, 11):
+        return {'error': '부분군 크기는 1~10 사이여야 합니다'}
 
+    floats = [float(v) for v in values]
+    if subgroup_size == 1:
+        limits = core_spc.imr_limits(floats)
+        return {
+            'chart_type':    'I-MR',
+            'x_bar':         round(limits['center'], 6),
+            'ucl_x':         round(limits['ucl'], 6),
+            'lcl_x':         round(limits['lcl'], 6),
+            'mr_bar':        round(limits['r_bar'], 6),
+            'ucl_r':         round(limits['ucl_r'], 6),
+            'lcl_r':         0,
+            'individuals':   floats,
+            'moving_ranges': limits['moving_ranges'].tolist(),
+        }
 
-def classify_spc_points(values, ucl, lcl, center):
-    """views.py 호환 래퍼 — detect_out_of_control 호출."""
-    return detect_out_of_control(
-        [float(v) for v in values], ucl=float(ucl), lcl=float(lcl), cl=float(center)
-    )
+    limits = core_spc.xbar_r_limits(floats, subgroup_size)
+    if limits is None:
+        return {'error': '유효한 부분군 없음'}
+    return {
+        'chart_type':     'X-bar R',
+        'x_bar':          round(limits['center'], 6),
+        'ucl_x':          round(limits['ucl'], 6),
+        'lcl_x':          round(limits['lcl'], 6),
+        'r_bar':          round(limits['r_bar'], 6),
+        'ucl_r':          round(limits['ucl_r'], 6),
+        'lcl_r':          round(limits['lcl_r'], 6),
+        'subgroup_size':  subgroup_size,
+        'subgroup_count': int(limits['means'].shape[0]),
+        'xbars':          [round(x, 6) for x in limits['means'].tolist()],
+        'ranges':         [round(r, 6) for r in limits['ranges'].tolist()],
+    }
+
+
+def classify_spc_points(values, ucl, lcl, center, rules=(1, 2, 3, 4)):
+    """런 규칙 위반 창에 속한 모든 점 표시 (기본 Western Electric 1~4, Nelson 1~8 선택 가능).
+
+    Returns:
+        list of {'index': int, 'value': float, 'rules': [int, ...]} — 위반 점만
+    """
+    import numpy as np
+
+    floats = [float(v) for v in values]
+    ends = core_spc.nelson_rule_ends(floats, ucl=float(ucl), lcl=float(lcl), cl=float(center), rules=rules)
+    masks = core_spc.rule_point_mask(len(floats), ends)
+    order = sorted(masks)
+    flags = np.vstack([masks[rule] for rule in order]) if order else np.zeros((0, len(floats)), dtype=bool)
+    flagged = np.flatnonzero(flags.any(axis=0))
+    return [
+        {'index': i, 'value': floats[i], 'rules': [order[k] for k in np.flatnonzero(column).tolist()]}
+        for i, column in zip(flagged.tolist(), flags[:, flagged].T)
+    ]
 
 
 __all__ = [
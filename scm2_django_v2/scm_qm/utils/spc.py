@@ -4,9 +4,12 @@
 - Cpk (공정능력지수) 계산
 - X-bar/R 관리도 데이터 계산
 - 관리한계선(UCL/LCL) 계산
-- Western Electric 이상 규칙 탐지
+- Western Electric / Nelson 이상 규칙 탐지
 - 이동범위(Moving Range) 계산
 
+관리도 계수(AIAG d2/D3/D4/A2)와 계산식은 scm_core.analytics.spc 공통 구현을
+사용하고, 이 모듈은 입력 검증과 반환 형태만 담당합니다.
+
 참고:
     Montgomery, D.C. (2020). Introduction to Statistical Quality Control (8th ed.)
     AIAG SPC Manual (2nd ed.)
@@ -14,39 +17,20 @@
 
 from __future__ import annotations
 
-import math
-import statistics
-from typing import Any, Dict, List, Optional
-
-
-# ---------------------------------------------------------------------------
-# AIAG SPC Manual Table: d2, D3, D4, A2 상수 (서브그룹 크기 n=2..10)
-# ---------------------------------------------------------------------------
-_D2: Dict[int, float] = {
-    2: 1.128, 3: 1.693, 4: 2.059, 5: 2.326,
-    6: 2.534, 7: 2.704, 8: 2.847, 9: 2.970, 10: 3.078,
-}
-
-_D3: Dict[int, float] = {
-    2: 0.000, 3: 0.000, 4: 0.000, 5: 0.000,
-    6: 0.000, 7: 0.076, 8: 0.136, 9: 0.184, 10: 0.223,
-}
+from typing import Any, Dict, List, Optional, Sequence
 
-_D4: Dict[int, float] = {
-    2: 3.267, 3: 2.574, 4: 2.282, 5: 2.114,
-    6: 2.004, 7: 1.924, 8: 1.864, 9: 1.816, 10: 1.777,
-}
+from scm_core.analytics import spc as core_spc
 
-_A2: Dict[int, float] = {
-    2: 1.880, 3: 1.023, 4: 0.729, 5: 0.577,
-    6: 0.483, 7: 0.419, 8: 0.373, 9: 0.337, 10: 0.308,
+# 방향·쪽이 붙는 Rule 2·3 은 detect_out_of_control 에서 점마다 만듦
+RULE_DESCRIPTIONS: Dict[int, str] = {
+    1: "Rule 1: 관리한계 외부 점",
+    4: "Rule 4: 연속 14점 교대 증감",
+    5: "Rule 5: 연속 3점 중 2점 2σ 밖 (같은 쪽)",
+    6: "Rule 6: 연속 5점 중 4점 1σ 밖 (같은 쪽)",
+    7: "Rule 7: 연속 15점 1σ 안",
+    8: "Rule 8: 연속 8점 1σ 밖 (양쪽)",
 }
 
-# 개별값 관리도(n=1)용 상수
-_D2_INDIVIDUAL: float = 1.128
-_D4_INDIVIDUAL: float = 3.267
-_D3_INDIVIDUAL: float = 0.000
-
 
 def calculate_cpk(
     values: List[float],
@@ -91,16 +75,14 @@ def calculate_cpk(
     if usl <= lsl:
         raise ValueError(f"USL({usl}) 은 LSL({lsl}) 보다 커야 합니다.")
 
-    mean_val: float = statistics.mean(values)
-    std_val: float = statistics.stdev(values)  # 표본 표준편차 (n-1)
+    stats = core_spc.capability(values, usl=usl, lsl=lsl)
+    mean_val: float = stats["mean"]
+    std_val: float = stats["std"]  # 표본 표준편차 (n-1)
 
     if std_val == 0.0:
         cp = cpu = cpl = cpk = float("inf")
     else:
-        cp = (usl - lsl) / (6.0 * std_val)
-        cpu = (usl - mean_val) / (3.0 * std_val)
-        cpl = (mean_val - lsl) / (3.0 * std_val)
-        cpk = min(cpu, cpl)
+        cp, cpu, cpl, cpk = stats["cp"], stats["cpu"], stats["cpl"], stats["cpk"]
 
     if cpk == float("inf"):
         judgment = "탁월"
@@ -174,57 +156,24 @@ def calculate_control_limits(
         raise ValueError("values 는 최소 2개 이상이어야 합니다.")
 
     if n == 1:
-        # I-MR 관리도
-        moving_ranges = calculate_moving_range(values)
-        x_bar = statistics.mean(values)
-        mr_bar = statistics.mean(moving_ranges) if moving_ranges else 0.0
-        sigma = mr_bar / _D2_INDIVIDUAL if mr_bar > 0 else 0.0
-        ucl = x_bar + 3.0 * sigma
-        lcl = x_bar - 3.0 * sigma
-        ucl_r = _D4_INDIVIDUAL * mr_bar
-        lcl_r = _D3_INDIVIDUAL * mr_bar
-        return {
-            "cl": round(x_bar, 6),
-            "ucl": round(ucl, 6),
-            "lcl": round(lcl, 6),
-            "sigma": round(sigma, 6),
-            "r_bar": round(mr_bar, 6),
-            "ucl_r": round(ucl_r, 6),
-            "lcl_r": round(lcl_r, 6),
-            "chart_type": "I-MR",
-        }
+        limits = core_spc.imr_limits(values)
+        chart_type = "I-MR"
     else:
-        # X-bar R 관리도: values 를 서브그룹으로 분할
-        subgroups: List[List[float]] = []
-        for i in range(0, len(values) - n + 1, n):
-            subgroups.append(values[i: i + n])
-
-        if not subgroups:
+        limits = core_spc.xbar_r_limits(values, n)
+        if limits is None:
             raise ValueError("서브그룹을 구성하기에 데이터가 부족합니다.")
+        chart_type = "Xbar-R"
 
-        subgroup_means = [statistics.mean(sg) for sg in subgroups]
-        subgroup_ranges = [max(sg) - min(sg) for sg in subgroups]
-
-        x_double_bar = statistics.mean(subgroup_means)
-        r_bar = statistics.mean(subgroup_ranges)
-        sigma = r_bar / _D2[n] if r_bar > 0 else 0.0
-
-        a2 = _A2[n]
-        ucl = x_double_bar + a2 * r_bar
-        lcl = x_double_bar - a2 * r_bar
-        ucl_r = _D4[n] * r_bar
-        lcl_r = _D3[n] * r_bar
-
-        return {
-            "cl": round(x_double_bar, 6),
-            "ucl": round(ucl, 6),
-            "lcl": round(lcl, 6),
-            "sigma": round(sigma, 6),
-            "r_bar": round(r_bar, 6),
-            "ucl_r": round(ucl_r, 6),
-            "lcl_r": round(lcl_r, 6),
-            "chart_type": "Xbar-R",
-        }
+    return {
+        "cl": round(limits["center"], 6),
+        "ucl": round(limits["ucl"], 6),
+        "lcl": round(limits["lcl"], 6),
+        "sigma": round(limits["sigma"], 6),
+        "r_bar": round(limits["r_bar"], 6),
+        "ucl_r": round(limits["ucl_r"], 6),
+        "lcl_r": round(limits["lcl_r"], 6),
+        "chart_type": chart_type,
+    }
 
 
 def detect_out_of_control(
@@ -232,20 +181,28 @@ def detect_out_of_control(
     ucl: float,
     lcl: float,
     cl: float,
+    rules: Sequence[int] = (1, 2, 3, 4),
 ) -> List[Dict[str, Any]]:
-    """Western Electric 이상 규칙(Rule 1~4) 탐지.
+    """Western Electric 이상 규칙(Rule 1~4, 선택 시 Nelson Rule 5~8) 탐지.
 
     탐지 규칙:
         Rule 1: 관리한계(UCL/LCL) 외부 점 1개 이상.
         Rule 2: 연속 9점이 모두 중심선(CL)의 같은 쪽에 위치.
         Rule 3: 연속 6점이 단조 증가 또는 단조 감소.
         Rule 4: 연속 14점이 교대로 증감 (지그재그).
+        Rule 5: 연속 3점 중 2점이 같은 쪽 2σ 밖.
+        Rule 6: 연속 5점 중 4점이 같은 쪽 1σ 밖.
+        Rule 7: 연속 15점이 1σ 안.
+        Rule 8: 연속 8점이 1σ 밖 (양쪽).
+
+    σ 구역은 CL 과 UCL/LCL 사이를 3등분해 정합니다.
 
     Args:
         values: 측정값 리스트 (시계열 순서).
         ucl: 상한 관리한계.
         lcl: 하한 관리한계.
         cl: 중심선 (평균).
+        rules: 탐지할 규칙 번호 (기본 1~4).
 
     Returns:
         위반 점들의 리스트. 각 항목은 Dict:
@@ -255,84 +212,27 @@ def detect_out_of_control(
             rule_description (str): 규칙 설명.
     """
     violations: List[Dict[str, Any]] = []
-    n = len(values)
-
-    # Rule 1: 관리한계 외부 점
-    for i, v in enumerate(values):
-        if v > ucl or v < lcl:
+    ends = core_spc.nelson_rule_ends(values, ucl=ucl, lcl=lcl, cl=cl, rules=rules)
+
+    for rule, rule_ends in ends.items():
+        for i in rule_ends.tolist():
+            if rule == 2:
+                side = "위" if values[i] > cl else "아래"
+                description = f"Rule 2: 연속 9점 중심선 {side}"
+            elif rule == 3:
+                direction = "증가" if values[i] > values[i - 1] else "감소"
+                description = f"Rule 3: 연속 6점 단조 {direction}"
+            else:
+                description = RULE_DESCRIPTIONS[rule]
             violations.append({
                 "index": i,
-                "value": v,
-                "rule": 1,
-                "rule_description": "Rule 1: 관리한계 외부 점",
+                "value": values[i],
+                "rule": rule,
+                "rule_description": description,
             })
 
-    # Rule 2: 연속 9점이 중심선 한쪽
-    run_len = 9
-    if n >= run_len:
-        for i in range(n - run_len + 1):
-            window = values[i: i + run_len]
-            above = all(v > cl for v in window)
-            below = all(v < cl for v in window)
-            if above or below:
-                side = "위" if above else "아래"
-                violations.append({
-                    "index": i + run_len - 1,
-                    "value": values[i + run_len - 1],
-                    "rule": 2,
-                    "rule_description": f"Rule 2: 연속 9점 중심선 {side}",
-                })
-
-    # Rule 3: 연속 6점 단조 증가/감소
-    run_len = 6
-    if n >= run_len:
-        for i in range(n - run_len + 1):
-            window = values[i: i + run_len]
-            increasing = all(window[j] < window[j + 1] for j in range(run_len - 1))
-            decreasing = all(window[j] > window[j + 1] for j in range(run_len - 1))
-            if increasing or decreasing:
-                direction = "증가" if increasing else "감소"
-                violations.append({
-                    "index": i + run_len - 1,
-                    "value": values[i + run_len - 1],
-                    "rule": 3,
-                    "rule_description": f"Rule 3: 연속 6점 단조 {direction}",
-                })
-
-    # Rule 4: 연속 14점 교대 증감 (지그재그)
-    run_len = 14
-    if n >= run_len:
-        for i in range(n - run_len + 1):
-            window = values[i: i + run_len]
-            # 방향 1: 올라갔다 내려갔다 (짝수 인덱스에서 상승)
-            alt1 = all(
-                (window[j] < window[j + 1]) if j % 2 == 0 else (window[j] > window[j + 1])
-                for j in range(run_len - 1)
-            )
-            # 방향 2: 내려갔다 올라갔다 (짝수 인덱스에서 하강)
-            alt2 = all(
-                (window[j] > window[j + 1]) if j % 2 == 0 else (window[j] < window[j + 1])
-                for j in range(run_len - 1)
-            )
-            if alt1 or alt2:
-                violations.append({
-                    "index": i + run_len - 1,
-                    "value": values[i + run_len - 1],
-                    "rule": 4,
-                    "rule_description": "Rule 4: 연속 14점 교대 증감",
-                })
-
-    # 중복 제거: 동일 (index, rule) 쌍
-    seen: set = set()
-    unique_violations: List[Dict[str, Any]] = []
-    for v in violations:
-        key = (v["index"], v["rule"])
-        if key not in seen:
-            seen.add(key)
-            unique_violations.append(v)
-
-    unique_violations.sort(key=lambda x: (x["index"], x["rule"]))
-    return unique_violations
+    violations.sort(key=lambda x: (x["index"], x["rule"]))
+    return violations
 
 
 def calculate_moving_range(values: List[float]) -> List[float]:
@@ -353,7 +253,7 @@ def calculate_moving_range(values: List[float]) -> List[float]:
     """
     if len(values) < 2:
         raise ValueError("이동범위 계산을 위해 값이 최소 2개 이상 필요합니다.")
-    return [abs(values[i] - values[i - 1]) for i in range(1, len(values))]
+    return core_spc.moving_ranges(values).tolist()
 
 
 def get_control_chart_data(
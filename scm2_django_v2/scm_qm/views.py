@@ -1,11 +1,13 @@
-from rest_framework import viewsets, filters
+from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.db import transaction
 from django.db.models import Sum, Count, Q
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import InspectionPlan, InspectionResult, DefectRecord, CorrectiveAction
+from .models import InspectionPlan, InspectionResult, DefectRecord, CorrectiveAction, SPCData, SPCStreamState
 from .serializers import (InspectionPlanSerializer, InspectionResultSerializer,
-                           DefectRecordSerializer, CorrectiveActionSerializer)
+                           DefectRecordSerializer, CorrectiveActionSerializer,
+                           SPCStreamStateSerializer, SPCMeasurementSerializer)
 from .utils import calc_process_capability, calc_control_limits, classify_spc_points
 
 
@@ -58,6 +60,7 @@ class InspectionResultViewSet(viewsets.ModelViewSet):
             lsl            (float|null)  : 규격 하한
             target         (float|null)  : 목표값
             subgroup_size  (int, 기본 1): 부분군 크기
+            rules          (list[int], 기본 [1,2,3,4]) : 경보 런 규칙 (Nelson 1~8)
         """
         data          = request.data
         values        = data.get('values', [])
@@ -65,9 +68,12 @@ class InspectionResultViewSet(viewsets.ModelViewSet):
         lsl           = data.get('lsl')
         target        = data.get('target')
         subgroup_size = int(data.get('subgroup_size', 1))
+        rules         = data.get('rules') or [1, 2, 3, 4]
 
         if not values:
             return Response({'error': '측정값(values)이 필요합니다.'}, status=400)
+        if not isinstance(rules, list) or not all(r in range(1, 9) for r in rules):
+            return Response({'error': '런 규칙(rules)은 1~8 사이 번호 목록이어야 합니다.'}, status=400)
 
         capability = calc_process_capability(values, usl, lsl, target)
         control    = calc_control_limits(values, subgroup_size)
@@ -79,6 +85,7 @@ class InspectionResultViewSet(viewsets.ModelViewSet):
                 ucl=control['ucl_x'],
                 lcl=control['lcl_x'],
                 center=control.get('x_bar', 0),
+                rules=rules,
             )
 
         return Response({
@@ -116,3 +123,114 @@ class CorrectiveActionViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         serializer.save(company=self.request.user.company)
+
+
+class SPCMonitorViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    SPC 실시간 모니터 — 측정 항목별 현재 관리한계·Cp/Cpk·진행 중인 규칙 위반.
+
+    SPCData 가 저장될 때마다 갱신되는 SPCStreamState 를 읽기만 하므로
+    측정 이력 길이와 무관하게 응답합니다 (scm_qm.spc_stream).
+    """
+    serializer_class = SPCStreamStateSerializer
+    filter_backends  = [filters.SearchFilter, DjangoFilterBackend]
+    search_fields    = ['measurement_name']
+    filterset_fields = ['measurement_name']
+
+    def get_queryset(self):
+        return SPCStreamState.objects.filter(company=self.request.user.company)
+
+    @action(detail=False, methods=['post'])
+    def record(self, request):
+        """
+        측정값 일괄 기록 — SPCData bulk_create 후 상태를 한 번에 갱신.
+
+        Body:
+            inspection_result (int)         : 검사 결과 id
+            measurement_name  (str)         : 측정 항목
+            values            (list[float]) : 측정값 (측정 순서)
+            usl / lsl / target (float|null) : 규격
+        """
+        from .spc_stream import ingest, snapshot
+
+        serializer = SPCMeasurementSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        with transaction.atomic():   # 측정값과 상태는 함께 저장되거나 함께 취소
+            rows = SPCData.objects.bulk_create([
+                SPCData(
+                    company=request.user.company,
+                    inspection_result=data['inspection_result'],
+                    measurement_name=data['measurement_name'],
+                    measured_value=value,
+                    usl=data.get('usl'),
+                    lsl=data.get('lsl'),
+                    target=data.get('target'),
+                )
+                for value in data['values']
+            ])
+            state, = ingest(rows)   # bulk_create 는 post_save 를 보내지 않으므로 직접 반영
+        return Response(snapshot(state), status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['get'])
+    def chart(self, request):
+        """
+        관리도 데이터 — SPCData 를 기간으로 조회해 차트용으로 다운샘플 (scm_qm.spc_chart).
+
+        Query:
+            measurement_name (str, 필수)     : 측정 항목
+            start / end      (ISO 일시|날짜) : 측정 시각 범위 (end 가 날짜면 그날 끝까지)
+            max_points       (int, 기본 2000): 응답 점 수 목표 (이상점은 별도로 항상 포함)
+            method           (minmax|lttb)   : 다운샘플 방식
+            rules            (예: 1,2,3,4)   : 판정할 Nelson 규칙
+        """
+        from django.conf import settings
+        from .spc_chart import METHODS, chart_data
+
+        params = request.query_params
+        name = params.get('measurement_name')
+        if not name:
+            return Response({'error': '측정 항목(measurement_name)이 필요합니다.'}, status=400)
+        try:
+            start = _parse_bound(params.get('start'))
+            end = _parse_bound(params.get('end'), end=True)
+            max_points = int(params.get('max_points', 2000))
+            rules = [int(r) for r in params.get('rules', '1,2,3,4').split(',') if r.strip()]
+        except ValueError:
+            return Response({'error': 'start·end·max_points·rules 형식이 올바르지 않습니다.'}, status=400)
+        method = params.get('method', 'minmax')
+        if method not in METHODS:
+            return Response({'error': f'method 는 {", ".join(METHODS)} 중 하나여야 합니다.'}, status=400)
+        if not all(r in range(1, 9) for r in rules):
+            return Response({'error': '런 규칙(rules)은 1~8 사이 번호 목록이어야 합니다.'}, status=400)
+        max_points = min(max(max_points, 10), getattr(settings, 'QM_SPC_CHART_MAX_POINTS', 10000))
+
+        queryset = SPCData.objects.filter(company=request.user.company, measurement_name=name)
+        if start is not None:
+            queryset = queryset.filter(measured_at__gte=start)
+        if end is not None:
+            queryset = queryset.filter(measured_at__lt=end)
+        try:
+            data = chart_data(queryset, max_points=max_points, method=method, rules=rules)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=400)
+        return Response({'measurement_name': name, 'start': start, 'end': end, **data})
+
+
+def _parse_bound(value, end=False):
+    """ISO 일시 또는 날짜 → aware datetime. end=True 면 배타적 상한 (날짜는 다음 날 0시)."""
+    from datetime import datetime, time, timedelta
+    from django.utils import timezone
+    from django.utils.dateparse import parse_date, parse_datetime
+
+    if not value:
+        return None
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(value)
+        moment = datetime.combine(day + timedelta(days=1) if end else day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
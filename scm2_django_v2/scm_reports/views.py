@@ -235,9 +235,8 @@ class FinancialStatementPDF(APIView):
 
 
 def _build_statement_data(company, stmt_type, year, month):
-    """FI AccountMoveLine 집계 (FinancialStatementView 와 동일 로직)."""
-    from scm_fi.models import AccountMoveLine
-    from django.db.models import Sum
+    """FI 계정별 월 잔액 집계 (FinancialStatementView 와 동일 로직)."""
+    from scm_fi.balances import statement_lines
 
     date_from = datetime.date(year, month, 1)
     if month == 12:
@@ -245,24 +244,14 @@ def _build_statement_data(company, stmt_type, year, month):
     else:
         date_to = datetime.date(year, month + 1, 1)
 
-    qs = (AccountMoveLine.objects
-          .filter(
-              move__company=company,
-              move__state='POSTED',
-              move__posting_date__gte=date_from,
-              move__posting_date__lt=date_to,
-          )
-          .select_related('account'))
-
     result = {}
-    for line in qs:
-        code  = line.account.code
-        name  = line.account.name
-        atype = line.account.account_type
-        if code not in result:
-            result[code] = {'name': name, 'type': atype, 'debit': Decimal('0'), 'credit': Decimal('0')}
-        result[code]['debit']  += line.debit  or Decimal('0')
-        result[code]['credit'] += line.credit or Decimal('0')
+    for line in statement_lines(company, date_from, date_to):
+        result[line['account__code']] = {
+            'name':   line['account__name'],
+            'type':   line['account__account_type'],
+            'debit':  line['total_debit']  or Decimal('0'),
+            'credit': line['total_credit'] or Decimal('0'),
+        }
 
     revenues  = [{'code': k, **v} for k, v in result.items() if v['type'] == 'REVENUE']
     expenses  = [{'code': k, **v} for k, v in result.items() if v['type'] == 'EXPENSE']
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scm_tm', '0002_shipmenttracking'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='freightrate',
+            name='min_weight_kg',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='중량 구간 시작(kg)'),
+        ),
+        migrations.AddField(
+            model_name='freightrate',
+            name='transit_days',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='운송 소요일'),
+        ),
+    ]
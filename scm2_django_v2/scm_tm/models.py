@@ -57,6 +57,9 @@ class FreightRate(models.Model):
     rate_per_kg    = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     rate_per_cbm   = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     min_charge     = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    # 중량 구간: 화물 중량이 이 값 이상인 행 중 valid_from 이 가장 늦고 구간이 가장 높은 행 적용 (scm_tm.rating)
+    min_weight_kg  = models.DecimalField('중량 구간 시작(kg)', max_digits=12, decimal_places=2, default=0)
+    transit_days   = models.PositiveIntegerField('운송 소요일', null=True, blank=True)
     currency       = models.CharField(max_length=10, default='KRW')
     valid_from     = models.DateField()
     valid_to       = models.DateField(null=True, blank=True)
@@ -0,0 +1,247 @@
+"""
+TM 운임 산정 엔진 — FreightRate 를 한 번 읽어 메모리 요율표로 만들고 여러 화물을 일괄 산정
+
+    table = RateTable.load(company, start, end)      # FreightRate·Carrier 조회 1회
+    result = table.rate(origins, destinations, weights, volumes, dates, carrier_ids)
+    rate_orders(company, orders)                     # TransportOrder 재산정 (감사용)
+
+요율 선택 (운송사·구간·화물마다):
+    1. 회사·운송사·출발지·도착지(대소문자·앞뒤 공백 무시)가 같고 산정일에 유효한 활성 요율
+    2. 중량 구간 시작(min_weight_kg) ≤ 화물 중량인 행 중 valid_from 이 가장 늦은 것,
+       같으면 가장 높은 중량 구간
+    운임 = max(min_charge, 중량 × rate_per_kg + 부피 × rate_per_cbm)
+
+요율 행은 (구간, 운송사) 묶음·중량 구간 순으로 정렬해 두고, 산정일마다 유효 행의
+"이 구간까지 중 우선 행" 누적 인덱스를 만든 뒤 (화물 × 운송사) 쌍 전체를 searchsorted
+1회로 찾습니다. 반복은 서로 다른 산정일 수만큼이고 화물·운송사 수만큼이 아닙니다.
+
+가장 싼 운송사 / 가장 빠른 운송사(transit_days 최소, 같으면 싼 쪽)는 활성 운송사만 추천합니다.
+"""
+from datetime import date as date_type
+
+from django.db.models import Q
+from django.utils import timezone
+
+_FAR_FUTURE = date_type.max.toordinal()
+
+
+def lane_key(origin, destination):
+    return ((origin or '').strip().casefold(), (destination or '').strip().casefold())
+
+
+class RateTable:
+    """메모리 요율표 (RateTable.load 로 생성)."""
+
+    def __init__(self, rows, on=None):
+        import numpy as np
+
+        self.on = on or timezone.localdate()
+        self.carrier_ids = sorted({r['carrier_id'] for r in rows})
+        self.carrier_names = {}
+        active = {}
+        for r in rows:
+            self.carrier_names[r['carrier_id']] = r['carrier__carrier_name']
+            active[r['carrier_id']] = r['carrier__is_active']
+        column = {cid: k for k, cid in enumerate(self.carrier_ids)}
+        self.carrier_active = np.array([bool(active[cid]) for cid in self.carrier_ids], dtype=bool)
+
+        self.lanes = {}
+        lane = np.array([self.lanes.setdefault(lane_key(r['origin'], r['destination']), len(self.lanes))
+                         for r in rows], dtype=np.int64)
+        col = np.array([column[r['carrier_id']] for r in rows], dtype=np.int64)
+        self.rate_kg = np.array([float(r['rate_per_kg']) for r in rows], dtype=np.float64)
+        self.rate_cbm = np.array([float(r['rate_per_cbm']) for r in rows], dtype=np.float64)
+        self.min_charge = np.array([float(r['min_charge']) for r in rows], dtype=np.float64)
+        self.transit = np.array([r['transit_days'] if r['transit_days'] is not None else np.nan for r in rows],
+                                dtype=np.float64)
+        breaks = np.array([float(r['min_weight_kg']) for r in rows], dtype=np.float64)
+        valid_from = np.array([r['valid_from'].toordinal() for r in rows], dtype=np.int64)
+        valid_to = np.array([r['valid_to'].toordinal() if r['valid_to'] else _FAR_FUTURE for r in rows],
+                            dtype=np.int64)
+
+        # 묶음 = (구간, 운송사). 행은 묶음·중량 구간 오름차순으로 정렬해 둠
+        self._group = lane * max(len(self.carrier_ids), 1) + col
+        self._order = np.lexsort((breaks, self._group))
+        self._breaks, self._valid_from, self._valid_to = breaks, valid_from, valid_to
+
+    def __len__(self):
+        return self.rate_kg.shape[0]
+
+    @classmethod
+    def load(cls, company, start=None, end=None, carrier_ids=None, lanes=None):
+        """
+        start~end 사이 하루라도 유효한 활성 요율을 1회 조회 (기본: 오늘).
+        carrier_ids / lanes([(출발지, 도착지)]) 로 범위를 좁힐 수 있습니다.
+        lanes 는 조회 후 lane_key(앞뒤 공백 제거 + casefold)로 걸러 quote·rate 의 구간 비교와 같게 맞춥니다.
+        """
+        from .models import FreightRate
+
+        end = end or start or timezone.localdate()
+        start = start or end
+        qs = (FreightRate.objects
+              .filter(company=company, is_active=True, valid_from__lte=end)
+              .filter(Q(valid_to__isnull=True) | Q(valid_to__gte=start)))
+        if carrier_ids is not None:
+            qs = qs.filter(carrier_id__in=list(carrier_ids))
+        rows = list(qs.values(
+            'carrier_id', 'carrier__carrier_name', 'carrier__is_active', 'origin', 'destination',
+            'rate_per_kg', 'rate_per_cbm', 'min_charge', 'min_weight_kg', 'transit_days',
+            'valid_from', 'valid_to',
+        ))
+        if lanes is not None:
+            wanted = {lane_key(origin, destination) for origin, destination in lanes}
+            rows = [r for r in rows if lane_key(r['origin'], r['destination']) in wanted]
+        return cls(rows, on=end)
+
+    def _applicable(self, day, groups, weights):
+        """day 에 유효한 행 중 (묶음, 화물 중량) 쌍마다 적용 행 번호 (없으면 -1)."""
+        import numpy as np
+
+        order = self._order
+        rows = order[(self._valid_from[order] <= day) & (self._valid_to[order] >= day)]
+        if rows.size == 0:
+            return np.full(groups.shape[0], -1, dtype=np.int64)
+        size = rows.size
+        group = self._group[rows]
+        # 묶음 안에서 구간 오름차순 누적 우선 행: valid_from 이 늦은 행, 같으면 뒤(높은 구간) 행
+        segment = np.concatenate(([0], np.cumsum(group[1:] != group[:-1])))
+        since = np.unique(self._valid_from[rows], return_inverse=True)[1]
+        key = (segment * size + since) * size + np.arange(size)
+        best = np.maximum.accumulate(key) % size
+        # (묶음, 중량) 정수 복합 키로 searchsorted 1회 — 중량·구간은 함께 순위화
+        ranks = np.unique(np.concatenate((self._breaks[rows], weights)), return_inverse=True)[1]
+        width = int(ranks.max()) + 1
+        pos = np.searchsorted(group * width + ranks[:size], groups * width + ranks[size:], side='right') - 1
+        pos = np.maximum(pos, 0)
+        found = (group[pos] == groups) & (self._breaks[rows[pos]] <= weights)
+        return np.where(found, rows[best[pos]], -1)
+
+    def rate(self, origins, destinations, weights, volumes, dates=None, carrier_ids=None):
+        """
+        화물 n 건 × 운송사 C 곳 운임 일괄 산정.
+
+        Returns:
+            carriers       [{'id', 'name', 'is_active'}] — 열 순서
+            cost           ndarray (n, C), 요율 없으면 nan
+            transit_days   ndarray (n, C), 요율 없거나 미등록이면 nan
+            cheapest / fastest             운송사 id 목록 (없으면 None)
+            cheapest_cost / fastest_cost   ndarray (n,), 없으면 nan
+            fastest_days                   ndarray (n,)
+            assigned_cost  carrier_ids 를 주면 지정 운송사 운임 ndarray (n,)
+        """
+        import numpy as np
+
+        n = len(origins)
+        ncol = len(self.carrier_ids)
+        w = np.asarray(weights, dtype=np.float64)
+        v = np.asarray(volumes, dtype=np.float64)
+        days = np.array([(d or self.on).toordinal() for d in dates] if dates is not None
+                        else [self.on.toordinal()] * n, dtype=np.int64)
+        cost = np.full((n, ncol), np.nan)
+        transit = np.full((n, ncol), np.nan)
+
+        lane = np.array([self.lanes.get(lane_key(o, d), -1) for o, d in zip(origins, destinations)],
+                        dtype=np.int64)
+        for day in np.unique(days[lane >= 0]).tolist():
+            members = np.flatnonzero((days == day) & (lane >= 0))
+            ship = np.repeat(members, ncol)
+            col = np.tile(np.arange(ncol), members.size)
+            rows = self._applicable(day, lane[ship] * ncol + col, w[ship])
+            hit = rows >= 0
+            ship, col, r = ship[hit], col[hit], rows[hit]
+            cost[ship, col] = np.maximum(self.min_charge[r], w[ship] * self.rate_kg[r] + v[ship] * self.rate_cbm[r])
+            transit[ship, col] = self.transit[r]
+
+        # 운송사가 없어도 열 연산이 되도록 최소 1열 (빈 열은 요율 없음과 같음)
+        if ncol == 0:
+            cost, transit = np.full((n, 1), np.nan), np.full((n, 1), np.nan)
+        active = np.zeros(cost.shape[1], dtype=bool)
+        active[:ncol] = self.carrier_active
+        eligible = np.where(active[None, :], cost, np.nan)
+        priced = np.where(np.isnan(eligible), np.inf, eligible)
+        cheapest = np.where(np.isfinite(priced).any(axis=1), priced.argmin(axis=1), -1)
+        days = np.where(np.isnan(eligible) | np.isnan(transit), np.inf, transit)
+        min_days = days.min(axis=1)
+        fastest = np.where(np.isfinite(min_days),
+                           np.where(days == min_days[:, None], priced, np.inf).argmin(axis=1), -1)
+
+        rows = np.arange(n)
+
+        def pick(columns, matrix):
+            return np.where(columns >= 0, matrix[rows, np.maximum(columns, 0)], np.nan)
+
+        result = {
+            'carriers': [{'id': cid, 'name': self.carrier_names[cid], 'is_active': bool(self.carrier_active[k])}
+                         for k, cid in enumerate(self.carrier_ids)],
+            'cost': cost[:, :ncol],
+            'transit_days': transit[:, :ncol],
+            'cheapest': [self.carrier_ids[k] if k >= 0 else None for k in cheapest.tolist()],
+            'cheapest_cost': pick(cheapest, eligible),
+            'fastest': [self.carrier_ids[k] if k >= 0 else None for k in fastest.tolist()],
+            'fastest_cost': pick(fastest, eligible),
+            'fastest_days': np.where(np.isfinite(min_days), min_days, np.nan),
+        }
+        if carrier_ids is not None:
+            column = {cid: k for k, cid in enumerate(self.carrier_ids)}
+            result['assigned_cost'] = pick(np.array([column.get(cid, -1) for cid in carrier_ids], dtype=np.int64),
+                                           cost)
+        return result
+
+    def quote(self, carrier_id, origin, destination, weight, volume, on=None):
+        """화물 1건의 지정 운송사 운임 (요율 없으면 None)."""
+        import math
+
+        cost = self.rate([origin], [destination], [weight], [volume],
+                         dates=[on] if on else None, carrier_ids=[carrier_id])['assigned_cost'][0]
+        return None if math.isnan(cost) else float(cost)
+
+
+def _rating_date(order):
+    if order.planned_date:
+        return order.planned_date
+    return timezone.localdate(order.created_at) if order.created_at else None
+
+
+def rate_orders(company, orders, table=None):
+    """
+    운송 오더 재산정 — 산정일(planned_date, 없으면 생성일)의 요율로 지정 운송사 운임과
+    가장 싼·빠른 운송사를 계산. 요율표는 전체 오더 기간으로 1회 조회합니다.
+
+    반환: 오더별 dict 목록 (입력 순서)
+    """
+    import math
+
+    orders = list(orders)
+    if not orders:
+        return []
+    dates = [_rating_date(o) or timezone.localdate() for o in orders]
+    if table is None:
+        table = RateTable.load(company, start=min(dates), end=max(dates))
+    result = table.rate(
+        [o.origin for o in orders], [o.destination for o in orders],
+        [float(o.weight_kg or 0) for o in orders], [float(o.volume_cbm or 0) for o in orders],
+        dates=dates, carrier_ids=[o.carrier_id for o in orders],
+    )
+
+    def money(value):
+        return None if math.isnan(value) else round(float(value), 2)
+
+    rows = []
+    for i, order in enumerate(orders):
+        assigned = money(result['assigned_cost'][i])
+        cheapest = money(result['cheapest_cost'][i])
+        rows.append({
+            'id':               order.pk,
+            'transport_number': order.transport_number,
+            'rating_date':      dates[i],
+            'carrier':          order.carrier_id,
+            'freight_cost':     float(order.freight_cost or 0),
+            'rated_cost':       assigned,
+            'cheapest_carrier': result['cheapest'][i],
+            'cheapest_cost':    cheapest,
+            'fastest_carrier':  result['fastest'][i],
+            'fastest_cost':     money(result['fastest_cost'][i]),
+            'fastest_days':     None if math.isnan(result['fastest_days'][i]) else int(result['fastest_days'][i]),
+            'saving':           round(assigned - cheapest, 2) if assigned is not None and cheapest is not None else None,
+        })
+    return rows
@@ -33,3 +33,37 @@ class ShipmentTrackingSerializer(serializers.ModelSerializer):
         model  = ShipmentTracking
         fields = '__all__'
         read_only_fields = ['company', 'transport_number', 'created_at']
+
+
+class RouteStopSerializer(serializers.Serializer):
+    """배송지 1건 — transport_order 를 주면 중량·이름은 운송 오더에서 가져옴."""
+    transport_order = serializers.IntegerField(required=False)
+    id        = serializers.CharField(required=False, allow_blank=True)
+    name      = serializers.CharField(required=False, allow_blank=True, default='')
+    lat       = serializers.FloatField(min_value=-90, max_value=90)
+    lon       = serializers.FloatField(min_value=-180, max_value=180)
+    weight_kg = serializers.FloatField(required=False, min_value=0, default=0)
+
+
+class RouteOptimizeSerializer(serializers.Serializer):
+    """배송 경로 최적화 요청 (POST /api/tm/orders/optimize_route/)."""
+    depot_lat   = serializers.FloatField(min_value=-90, max_value=90)
+    depot_lon   = serializers.FloatField(min_value=-180, max_value=180)
+    stops       = RouteStopSerializer(many=True, allow_empty=False, max_length=1000)
+    vehicles    = serializers.IntegerField(required=False, min_value=1, max_value=100, default=1)
+    capacity_kg = serializers.FloatField(required=False, allow_null=True, min_value=0, default=None)
+    time_budget = serializers.FloatField(required=False, min_value=0, max_value=5, default=0.5)
+
+
+class RerateSerializer(serializers.Serializer):
+    """운송 오더 운임 재산정 요청 (POST /api/tm/orders/rerate/)."""
+    date_from = serializers.DateField()
+    date_to   = serializers.DateField()
+    carrier   = serializers.IntegerField(required=False, allow_null=True, default=None)
+
+    def validate(self, attrs):
+        if attrs['date_from'] > attrs['date_to']:
+            raise serializers.ValidationError('date_from 은 date_to 이전이어야 합니다.')
+        if (attrs['date_to'] - attrs['date_from']).days > 366:
+            raise serializers.ValidationError('재산정 기간은 1년 이내여야 합니다.')
+        return attrs
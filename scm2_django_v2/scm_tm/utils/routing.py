@@ -4,17 +4,23 @@
 - Haversine 공식 기반 거리 계산
 - 부피중량 고려 운임 견적
 - 점수 기반 운송사 추천 (urgency 가중치 반영)
-- 최근접 이웃 알고리즘(Nearest Neighbor Heuristic) TSP 근사
+- 벡터화 Haversine 거리 행렬 (좌표 집합별 캐시)
+- 배송 경로 최적화: 최근접 이웃 구성 + 2-opt / Or-opt 지역 탐색 (다중 차량·적재량)
 
 참고:
     Haversine formula: R. W. Sinnott, "Virtues of the Haversine", Sky and Telescope (1984)
+    2-opt / Or-opt: Laporte, G. (1992). The Vehicle Routing Problem: An overview of exact
+        and approximate algorithms. EJOR 59(3)
     운임 산정: IATA 국제항공운송협회 부피중량 기준 (1 CBM = 333 kg)
 """
 
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -242,20 +248,266 @@ def suggest_carriers(
 
 
 # ---------------------------------------------------------------------------
-# 4. 최근접 이웃 TSP 근사 (다중 배송지 경로 최적화)
+# 4. 거리 행렬 (벡터화 Haversine, 좌표 집합별 캐시)
 # ---------------------------------------------------------------------------
 
+def _validate_coords(coords: Sequence[Tuple[float, float]]) -> None:
+    for lat, lon in coords:
+        if not -90.0 <= lat <= 90.0:
+            raise ValueError(f"위도는 -90 ~ 90 사이여야 합니다. (lat={lat})")
+        if not -180.0 <= lon <= 180.0:
+            raise ValueError(f"경도는 -180 ~ 180 사이여야 합니다. (lon={lon})")
+
+
+# 행렬 하나가 n²×8 바이트(1000개 지점 ≈ 8 MB)이므로 개수가 아니라 총 바이트로 제한
+_MATRIX_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_MATRIX_CACHE_MAX_ENTRIES = 16
+_matrix_cache: "OrderedDict[Tuple[Tuple[float, float], ...], Any]" = OrderedDict()
+_matrix_cache_bytes = 0
+_matrix_cache_lock = threading.Lock()
+
+
+def _compute_matrix(coords: Tuple[Tuple[float, float], ...]):
+    import numpy as np
+
+    arr = np.radians(np.asarray(coords, dtype=np.float64).reshape(-1, 2))
+    lat, lon = arr[:, 0], arr[:, 1]
+    d_phi = lat[:, None] - lat[None, :]
+    d_lambda = lon[:, None] - lon[None, :]
+    a = np.sin(d_phi / 2.0) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(d_lambda / 2.0) ** 2
+    matrix = 2.0 * _EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(np.clip(1.0 - a, 0.0, None)))
+    matrix.setflags(write=False)   # 캐시 공유 배열
+    return matrix
+
+
+def _cached_matrix(coords: Tuple[Tuple[float, float], ...]):
+    """LRU 캐시 — 총 바이트 _MATRIX_CACHE_MAX_BYTES, 개수 _MATRIX_CACHE_MAX_ENTRIES 이내.
+
+    한도보다 큰 행렬은 계산만 하고 캐시하지 않습니다.
+    """
+    global _matrix_cache_bytes
+    with _matrix_cache_lock:
+        matrix = _matrix_cache.get(coords)
+        if matrix is not None:
+            _matrix_cache.move_to_end(coords)
+            return matrix
+    matrix = _compute_matrix(coords)
+    if matrix.nbytes > _MATRIX_CACHE_MAX_BYTES:
+        return matrix
+    with _matrix_cache_lock:
+        if coords in _matrix_cache:   # 다른 스레드가 먼저 채움
+            _matrix_cache.move_to_end(coords)
+            return _matrix_cache[coords]
+        _matrix_cache[coords] = matrix
+        _matrix_cache_bytes += matrix.nbytes
+        while (_matrix_cache_bytes > _MATRIX_CACHE_MAX_BYTES
+               or len(_matrix_cache) > _MATRIX_CACHE_MAX_ENTRIES):
+            _, evicted = _matrix_cache.popitem(last=False)
+            _matrix_cache_bytes -= evicted.nbytes
+    return matrix
+
+
+def distance_matrix(coords: Sequence[Tuple[float, float]]):
+    """좌표 목록의 n×n Haversine 거리 행렬 (km, 반올림 없음, 읽기 전용).
+
+    calculate_distance_km 과 같은 식을 NumPy 브로드캐스트로 한 번에 계산하고,
+    같은 좌표 집합(순서 포함)은 프로세스 내 LRU 캐시(총 32 MB·16개 이내)에서
+    재사용합니다.
+
+    Raises:
+        ValueError: 위도/경도 범위를 벗어난 경우.
+    """
+    key = tuple((float(lat), float(lon)) for lat, lon in coords)
+    _validate_coords(key)
+    return _cached_matrix(key)
+
+
+# ---------------------------------------------------------------------------
+# 5. 배송 경로 최적화 (최근접 이웃 구성 + 2-opt / Or-opt 개선, 다중 차량·적재량)
+# ---------------------------------------------------------------------------
+
+_EPS = 1e-9
+
+
+def _tour_length(matrix, tour) -> float:
+    return float(matrix[tour[:-1], tour[1:]].sum())
+
+
+def _nearest_neighbor(matrix, weights, vehicles: int, capacity: Optional[float]):
+    """차량마다 depot(0)에서 적재 가능한 가장 가까운 배송지를 차례로 방문. (투어 목록, 미배정 인덱스)"""
+    import numpy as np
+
+    n = matrix.shape[0] - 1
+    remaining = np.ones(n + 1, dtype=bool)
+    remaining[0] = False
+    if capacity is not None:
+        remaining[1:] &= weights[1:] <= capacity   # 차량 1대에도 실리지 않는 배송지는 제외
+    tours = []
+    for _ in range(vehicles):
+        if not remaining.any():
+            break
+        tour, load, current = [0], 0.0, 0
+        while True:
+            candidates = remaining.copy()
+            if capacity is not None:
+                candidates &= weights <= capacity - load + _EPS
+            if not candidates.any():
+                break
+            row = np.where(candidates, matrix[current], np.inf)
+            current = int(row.argmin())
+            tour.append(current)
+            load += weights[current]
+            remaining[current] = False
+        tour.append(0)
+        tours.append(np.asarray(tour, dtype=np.int64))
+    tours, unassigned = _insert_unassigned(matrix, tours, weights, capacity,
+                                           [int(i) for i in np.flatnonzero(remaining)])
+    unassigned += [i for i in range(1, n + 1)
+                   if capacity is not None and weights[i] > capacity]
+    return tours, sorted(unassigned)
+
+
+def _insert_unassigned(matrix, tours, weights, capacity, unassigned):
+    """남은 배송지를 적재 여유가 있는 경로의 가장 싼 위치에 삽입 (최근접 이웃의 적재 단편화 보완)."""
+    import numpy as np
+
+    left = []
+    for stop in unassigned:
+        best = None
+        for r, tour in enumerate(tours):
+            if capacity is not None and weights[tour].sum() + weights[stop] > capacity + _EPS:
+                continue
+            a, b = tour[:-1], tour[1:]
+            cost = matrix[a, stop] + matrix[stop, b] - matrix[a, b]
+            q = int(cost.argmin())
+            if best is None or cost[q] < best[0]:
+                best = (float(cost[q]), r, q)
+        if best is None:
+            left.append(stop)
+            continue
+        _cost, r, q = best
+        tours[r] = np.concatenate((tours[r][:q + 1], [stop], tours[r][q + 1:]))
+    return tours, left
+
+
+def _two_opt(matrix, tour):
+    """가장 많이 줄이는 2-opt 교환 1회 적용. 개선 없으면 None."""
+    import numpy as np
+
+    m = tour.shape[0] - 1   # 간선 수
+    if m < 4:
+        return None
+    a, b = tour[:-1], tour[1:]
+    edges = matrix[a, b]
+    delta = matrix[np.ix_(a, a)] + matrix[np.ix_(b, b)] - edges[:, None] - edges[None, :]
+    delta[np.tril_indices(m, 1)] = np.inf   # j >= i + 2 만
+    i, j = np.unravel_index(int(delta.argmin()), delta.shape)
+    if delta[i, j] >= -_EPS:
+        return None
+    new = tour.copy()
+    new[i + 1:j + 1] = tour[i + 1:j + 1][::-1]
+    return new
+
+
+def _segment_moves(matrix, source, target, same: bool, max_len: int = 3,
+                   weights=None, room: Optional[float] = None):
+    """
+    source 의 연속 구간(1~max_len)을 target 의 간선 사이로 옮기는 최선의 이동 (Or-opt).
+
+    room 을 주면 중량 합이 room 을 넘는 구간은 후보에서 제외합니다 (차량 간 이동의 적재량).
+
+    Returns: (변화량, 구간 시작, 구간 길이, 삽입 간선, 뒤집기) 또는 None
+    """
+    import numpy as np
+
+    best = None
+    k = source.shape[0] - 2   # source 배송지 수
+    ta, tb = target[:-1], target[1:]
+    t_edges = matrix[ta, tb]
+    for length in range(1, min(max_len, k) + 1):
+        starts = np.arange(1, k - length + 2)
+        first, last = source[starts], source[starts + length - 1]
+        before, after = source[starts - 1], source[starts + length]
+        gain = matrix[before, first] + matrix[last, after] - matrix[before, after]
+        forward = matrix[np.ix_(first, ta)] + matrix[np.ix_(last, tb)] - t_edges[None, :]
+        backward = matrix[np.ix_(last, ta)] + matrix[np.ix_(first, tb)] - t_edges[None, :]
+        insert = np.minimum(forward, backward)
+        if same:   # 구간에 닿는 간선(s-1 … s+length-1)에는 넣지 않음
+            q = np.arange(ta.shape[0])
+            touching = (q[None, :] >= starts[:, None] - 1) & (q[None, :] <= starts[:, None] + length - 1)
+            insert = np.where(touching, np.inf, insert)
+        delta = insert - gain[:, None]
+        if room is not None:
+            load = sum(weights[source[starts + i]] for i in range(length))
+            delta = np.where((load > room + _EPS)[:, None], np.inf, delta)
+        s_idx, q = np.unravel_index(int(delta.argmin()), delta.shape)
+        value = float(delta[s_idx, q])
+        if value < -_EPS and (best is None or value < best[0]):
+            best = (value, int(starts[s_idx]), length, int(q), bool(backward[s_idx, q] < forward[s_idx, q]))
+    return best
+
+
+def _apply_segment(source, target, start, length, edge, reverse, same):
+    import numpy as np
+
+    segment = source[start:start + length]
+    if reverse:
+        segment = segment[::-1]
+    if same:
+        rest = np.concatenate((source[:start], source[start + length:]))
+        pos = edge + 1 if edge < start else edge + 1 - length
+        return np.concatenate((rest[:pos], segment, rest[pos:])), None
+    new_source = np.concatenate((source[:start], source[start + length:]))
+    new_target = np.concatenate((target[:edge + 1], segment, target[edge + 1:]))
+    return new_source, new_target
+
+
+def _local_search(matrix, tours, weights, capacity, deadline):
+    """2-opt·Or-opt(경로 내)·구간 재배치(차량 간, 적재량 확인)를 개선이 없거나 시간이 다할 때까지."""
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for r in range(len(tours)):
+            while time.perf_counter() < deadline:
+                new = _two_opt(matrix, tours[r])
+                if new is None:
+                    move = _segment_moves(matrix, tours[r], tours[r], same=True) if tours[r].shape[0] > 3 else None
+                    if move is None:
+                        break
+                    new, _ = _apply_segment(tours[r], tours[r], *move[1:], same=True)
+                tours[r] = new
+                improved = True
+        for r in range(len(tours)):
+            for t in range(len(tours)):
+                if r == t or tours[r].shape[0] <= 2 or time.perf_counter() >= deadline:
+                    continue
+                room = None if capacity is None else capacity - float(weights[tours[t]].sum())
+                move = _segment_moves(matrix, tours[r], tours[t], same=False, weights=weights, room=room)
+                if move is None:
+                    continue   # 적재량 안에서 개선되는 이동이 없음
+                _value, start, length, edge, reverse = move
+                tours[r], tours[t] = _apply_segment(tours[r], tours[t], start, length, edge, reverse, same=False)
+                improved = True
+    return tours
+
+
 def optimize_delivery_route(
     depot: Tuple[float, float],
     stops: List[Dict[str, Any]],
+    vehicles: int = 1,
+    capacity_kg: Optional[float] = None,
+    time_budget: float = 0.5,
 ) -> Dict[str, Any]:
-    """최근접 이웃 알고리즘(Nearest Neighbor Heuristic)으로 배송 경로를 최적화합니다.
+    """배송 경로 최적화 — 최근접 이웃으로 경로를 만든 뒤 지역 탐색으로 개선합니다.
 
     알고리즘:
-        1. 출발지(depot)에서 시작
-        2. 미방문 배송지 중 현재 위치에서 가장 가까운 곳으로 이동
-        3. 모든 배송지 방문 후 출발지로 복귀
-        4. 총 이동 거리 계산
+        1. depot + 배송지 거리 행렬을 한 번 계산 (distance_matrix, 좌표 집합별 캐시)
+        2. 차량마다 depot 에서 출발해 적재 가능한 가장 가까운 배송지를 방문 (최근접 이웃)
+        3. time_budget(초) 안에서 개선이 없을 때까지 반복
+           - 2-opt: 경로 안 두 간선을 교차 제거
+           - Or-opt: 연속 1~3개 배송지를 같은 경로의 다른 위치로 이동(뒤집기 포함)
+           - 차량 간 재배치: 구간을 다른 차량 경로로 이동 (적재량 이내일 때)
+        4. 각 차량은 depot 으로 복귀
 
     Args:
         depot: 출발/복귀 기지 좌표 (위도, 경도).
@@ -264,59 +516,72 @@ def optimize_delivery_route(
             name (str): 배송지명.
             lat (float): 위도.
             lon (float): 경도.
+            weight_kg (float, optional): 화물 중량 (capacity_kg 지정 시 사용).
+        vehicles: 차량 수 (기본 1).
+        capacity_kg: 차량당 최대 적재 중량 (None 이면 제한 없음).
+        time_budget: 지역 탐색 시간 한도 (초).
 
     Returns:
         Dict containing keys:
-            route (List[Dict]): 최적화된 방문 순서 리스트.
-            total_distance_km (float): 총 이동 거리 (depot 복귀 포함).
-            return_distance_km (float): 마지막 배송지에서 depot 복귀 거리.
+            route (List[Dict]): 첫 번째 차량의 방문 순서 리스트 (차량 1대일 때 전체 경로).
+            total_distance_km (float): 총 이동 거리 (모든 차량, depot 복귀 포함).
+            return_distance_km (float): 첫 번째 차량의 마지막 배송지 → depot 거리.
             depot (Dict): 출발지 정보.
+            routes (List[Dict]): 차량별 {vehicle, route, load_kg, distance_km, return_distance_km}.
+            unassigned (List): 차량 수·적재량이 모자라 배정하지 못한 배송지 id.
+            initial_distance_km (float): 최근접 이웃 구성 직후 총 거리 (개선 전).
 
     Raises:
-        ValueError: stops 가 비어있는 경우.
+        ValueError: stops 가 비어있거나 vehicles 가 1 미만인 경우, 좌표 범위 오류.
     """
+    import numpy as np
+
     if not stops:
         raise ValueError("배송지 목록이 비어있습니다.")
-
-    unvisited = [dict(s) for s in stops]
-    current_lat, current_lon = depot
-    route: List[Dict[str, Any]] = []
-    total_distance = 0.0
-    order = 1
-
-    while unvisited:
-        min_dist = float("inf")
-        nearest_idx = 0
-
-        for i, stop in enumerate(unvisited):
-            dist = calculate_distance_km(
-                current_lat, current_lon,
-                float(stop["lat"]), float(stop["lon"]),
-            )
-            if dist < min_dist:
-                min_dist = dist
-                nearest_idx = i
-
-        nearest = unvisited.pop(nearest_idx)
-        total_distance += min_dist
-        route.append({
-            "order": order,
-            "id": nearest.get("id"),
-            "name": nearest.get("name", ""),
-            "lat": nearest["lat"],
-            "lon": nearest["lon"],
-            "distance_from_prev_km": round(min_dist, 3),
+    if vehicles < 1:
+        raise ValueError(f"차량 수는 1 이상이어야 합니다. (vehicles={vehicles})")
+
+    started = time.perf_counter()
+    coords = [(float(depot[0]), float(depot[1]))] + [(float(s["lat"]), float(s["lon"])) for s in stops]
+    matrix = distance_matrix(coords)
+    weights = np.zeros(len(coords), dtype=np.float64)
+    weights[1:] = [float(s.get("weight_kg") or 0) for s in stops]
+    capacity = float(capacity_kg) if capacity_kg is not None else None
+
+    tours, unassigned = _nearest_neighbor(matrix, weights, vehicles, capacity)
+    initial = sum(_tour_length(matrix, t) for t in tours)
+    tours = _local_search(matrix, tours, weights, capacity, started + time_budget)
+
+    routes: List[Dict[str, Any]] = []
+    for tour in tours:
+        if tour.shape[0] <= 2:
+            continue   # 재배치로 빈 차량
+        route = []
+        for order, (prev, idx) in enumerate(zip(tour[:-2].tolist(), tour[1:-1].tolist()), start=1):
+            stop = stops[idx - 1]
+            route.append({
+                "order": order,
+                "id": stop.get("id"),
+                "name": stop.get("name", ""),
+                "lat": stop["lat"],
+                "lon": stop["lon"],
+                "distance_from_prev_km": round(float(matrix[prev, idx]), 3),
+            })
+        routes.append({
+            "vehicle": len(routes) + 1,
+            "route": route,
+            "load_kg": round(float(weights[tour].sum()), 3),
+            "distance_km": round(_tour_length(matrix, tour), 3),
+            "return_distance_km": round(float(matrix[tour[-2], 0]), 3),
         })
-        current_lat = float(nearest["lat"])
-        current_lon = float(nearest["lon"])
-        order += 1
-
-    return_dist = calculate_distance_km(current_lat, current_lon, depot[0], depot[1])
-    total_distance += return_dist
 
+    total = sum(_tour_length(matrix, t) for t in tours)
     return {
-        "route": route,
-        "total_distance_km": round(total_distance, 3),
-        "return_distance_km": round(return_dist, 3),
+        "route": routes[0]["route"] if routes else [],
+        "total_distance_km": round(total, 3),
+        "return_distance_km": routes[0]["return_distance_km"] if routes else 0.0,
         "depot": {"lat": depot[0], "lon": depot[1]},
+        "routes": routes,
+        "unassigned": [stops[i - 1].get("id") for i in unassigned],
+        "initial_distance_km": round(initial, 3),
     }
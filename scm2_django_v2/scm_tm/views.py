@@ -4,7 +4,8 @@ from rest_framework.response import Response
 from django.db.models import Sum, Avg
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Carrier, TransportOrder, FreightRate, ShipmentTracking
-from .serializers import CarrierSerializer, TransportOrderSerializer, FreightRateSerializer, ShipmentTrackingSerializer
+from .serializers import (CarrierSerializer, TransportOrderSerializer, FreightRateSerializer,
+                          ShipmentTrackingSerializer, RouteOptimizeSerializer, RerateSerializer)
 
 
 class CarrierViewSet(viewsets.ModelViewSet):
@@ -49,6 +50,104 @@ class TransportOrderViewSet(viewsets.ModelViewSet):
             'avg_freight':   float(avg_freight),
         })
 
+    @action(detail=False, methods=['post'])
+    def optimize_route(self, request):
+        """
+        배송 경로 최적화 (다중 차량·적재량) — scm_tm.utils.routing.optimize_delivery_route.
+
+        Body:
+            depot_lat / depot_lon (float)  : 출발·복귀 기지 좌표
+            stops       (list)             : [{transport_order?, id?, name?, lat, lon, weight_kg?}]
+                                             transport_order 를 주면 중량·이름은 운송 오더 값
+            vehicles    (int, 기본 1)      : 차량 수
+            capacity_kg (float|null)       : 차량당 최대 적재 중량
+            time_budget (float, 기본 0.5)  : 개선 탐색 시간 한도(초, 최대 5)
+        """
+        from .utils.routing import optimize_delivery_route
+
+        serializer = RouteOptimizeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        order_ids = {s['transport_order'] for s in data['stops'] if s.get('transport_order') is not None}
+        orders = {
+            pk: (number, weight)
+            for pk, number, weight in self.get_queryset().filter(pk__in=order_ids)
+            .values_list('pk', 'transport_number', 'weight_kg')
+        }
+        missing = sorted(order_ids - set(orders))
+        if missing:
+            return Response({'error': f'운송 오더를 찾을 수 없습니다: {missing}'}, status=400)
+
+        stops = []
+        for i, stop in enumerate(data['stops'], start=1):
+            stop = dict(stop)
+            if stop.get('transport_order') is not None:
+                number, weight = orders[stop['transport_order']]
+                stop.setdefault('id', stop['transport_order'])
+                stop['name'] = stop['name'] or number
+                stop['weight_kg'] = float(weight)
+            stop.setdefault('id', i)
+            stops.append(stop)
+
+        try:
+            result = optimize_delivery_route(
+                (data['depot_lat'], data['depot_lon']), stops,
+                vehicles=data['vehicles'], capacity_kg=data['capacity_kg'], time_budget=data['time_budget'],
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=400)
+        return Response(result)
+
+    @action(detail=False, methods=['post'])
+    def rerate(self, request):
+        """
+        운임 재산정 (감사용, 저장하지 않음) — scm_tm.rating.rate_orders.
+
+        Body:
+            date_from / date_to (date) : 산정일 범위 (planned_date, 없으면 생성일)
+            carrier     (int|null)     : 지정 운송사 오더만
+
+        오더별 현재 운임·요율표 운임·가장 싼/빠른 운송사와 합계를 반환합니다.
+        요율표·오더 조회는 기간 전체에 각 1회입니다.
+        """
+        from django.db.models import Q
+        from .rating import rate_orders
+
+        serializer = RerateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        period = (data['date_from'], data['date_to'])
+        orders = (TransportOrder.objects
+                  .filter(company=request.user.company)
+                  .exclude(status='취소')
+                  .filter(Q(planned_date__range=period)
+                          | Q(planned_date__isnull=True, created_at__date__range=period))
+                  .only('pk', 'transport_number', 'carrier_id', 'origin', 'destination',
+                        'weight_kg', 'volume_cbm', 'freight_cost', 'planned_date', 'created_at')
+                  .order_by('pk'))
+        if data['carrier'] is not None:
+            orders = orders.filter(carrier_id=data['carrier'])
+        rows = rate_orders(request.user.company, orders)
+
+        def total(key):
+            return round(sum(r[key] for r in rows if r[key] is not None), 2)
+
+        return Response({
+            'count':   len(rows),
+            'summary': {
+                'freight_cost':  total('freight_cost'),
+                'rated_cost':    total('rated_cost'),
+                'cheapest_cost': total('cheapest_cost'),
+                'saving':        total('saving'),
+                'unrated':       sum(1 for r in rows if r['rated_cost'] is None),
+                'mismatched':    sum(1 for r in rows
+                                     if r['rated_cost'] is not None and abs(r['rated_cost'] - r['freight_cost']) > 0.005),
+            },
+            'orders':  rows,
+        })
+
 
 class FreightRateViewSet(viewsets.ModelViewSet):
     serializer_class = FreightRateSerializer
@@ -0,0 +1,265 @@
+"""
+부족재고 알림·자동발주 — 모아서 한 번에 평가 (check_min_stock_alert 에서 사용)
+
+재고 저장마다 회사 전체 사용자 알림 + 발주 중복 조회를 하던 방식을 대체합니다.
+부족해진 재고 행 id 를 모았다가 회사별로 evaluate() 한 번에 처리합니다.
+
+settings:
+    WM_LOW_STOCK_ALERT_MODE    'sync' | 'buffered'
+    WM_LOW_STOCK_ALERT_WINDOW  buffered 모드에서 모으는 시간(초)
+
+    sync      저장한 트랜잭션 안에서 바로 평가 (deferred() 블록 안이면 블록 끝에서 1회)
+    buffered  커밋 후 프로세스 내 버퍼에 넣고 백그라운드 스레드가 WINDOW 초마다 회사별로 평가
+              — 실사로 2,000 품목이 연달아 저장돼도 회사당 평가 1회 (롤백된 변경은 버퍼에 들어가지 않음)
+
+evaluate(company_id, inventory_ids):
+    1. 지금도 최소재고 미만인 품목만 다시 조회
+    2. 오늘 자동발주(AUTO-PO-{item_code}-{date})가 이미 있는 품목은 발주에서 제외 (품목·일 단위 중복 제거)
+    3. 나머지 품목 자동발주 bulk_create → auto_orders_bulk_created signal (대시보드 증감)
+    4. 발주 생성 여부와 관계없이 최소재고 미만 품목 전체를 WM·MM 조회 권한 사용자(또는 관리자)에게
+       품목 목록을 담은 알림 1건씩 bulk_create (발주 실패·기존 발주 품목도 알림)
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import F, Q
+from django.dispatch import Signal
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# sender=PurchaseOrder, company, orders=[PurchaseOrder, ...]
+auto_orders_bulk_created = Signal()
+
+# 알림 수신 대상 모듈 (UserPermission.module, can_read)
+ALERT_MODULES = ('wm', 'mm')
+MESSAGE_ITEMS = 20   # 알림 본문에 나열할 최대 품목 수
+
+_local = threading.local()
+
+
+def alert_mode():
+    return getattr(settings, 'WM_LOW_STOCK_ALERT_MODE', 'sync')
+
+
+def auto_po_number(item_code, day):
+    return f'AUTO-PO-{item_code}-{day}'
+
+
+def _recipients(company_id):
+    from scm_accounts.models import User
+    return list(
+        User.objects.filter(company_id=company_id, is_active=True)
+        .filter(Q(is_admin=True)
+                | Q(module_permissions__module__in=ALERT_MODULES, module_permissions__can_read=True))
+        .distinct().values_list('pk', flat=True)
+    )
+
+
+def _create_orders(orders):
+    """자동발주 bulk_create. 다른 프로세스가 먼저 만든 번호가 있으면 빼고 한 번 더 시도."""
+    from scm_mm.models import PurchaseOrder
+
+    for _attempt in range(2):
+        if not orders:
+            return []
+        try:
+            with transaction.atomic():
+                return PurchaseOrder.objects.bulk_create(orders)
+        except IntegrityError:
+            taken = set(PurchaseOrder.objects.filter(
+                po_number__in=[o.po_number for o in orders],
+            ).values_list('po_number', flat=True))
+            orders = [o for o in orders if o.po_number not in taken]
+    return []
+
+
+def _message(items):
+    lines = [f'{inv.item_name or inv.item_code}: 현재 {inv.stock_qty or 0} / 최소 {inv.min_stock}'
+             for inv in items[:MESSAGE_ITEMS]]
+    if len(items) > MESSAGE_ITEMS:
+        lines.append(f'외 {len(items) - MESSAGE_ITEMS}개 품목')
+    return '\n'.join(lines)
+
+
+def evaluate(company_id, inventory_ids):
+    """부족재고 품목 자동발주 + 부족 품목 전체 통합 알림. 새로 발주한 품목의 재고 행 목록을 돌려줌."""
+    from scm_mm.models import PurchaseOrder
+    from scm_notifications.models import Notification
+    from scm_wm.models import Inventory
+
+    items = sorted(
+        Inventory.objects.filter(company_id=company_id, pk__in=inventory_ids,
+                                 min_stock__gt=0, stock_qty__lt=F('min_stock'))
+        .only('pk', 'company_id', 'item_code', 'item_name', 'stock_qty', 'min_stock'),
+        key=lambda inv: (inv.item_code, inv.pk),
+    )
+    if not items:
+        return []
+
+    today = timezone.localdate()
+    by_number = {}
+    for inv in items:   # 창고별 같은 품목은 발주 1건 (번호가 같음)
+        by_number.setdefault(auto_po_number(inv.item_code, today), inv)
+    existing = set(PurchaseOrder.objects.filter(po_number__in=list(by_number))
+                   .values_list('po_number', flat=True))
+
+    orders = []
+    for po_number, inv in by_number.items():
+        if po_number in existing:
+            continue
+        stock_qty = inv.stock_qty or 0
+        orders.append(PurchaseOrder(
+            company_id=company_id,
+            po_number=po_number,
+            supplier=None,
+            item_name=inv.item_name,
+            quantity=max(inv.min_stock * 2 - stock_qty, 1),   # 최소재고의 2배까지 채우는 양
+            unit_price=Decimal('0'),
+            status='발주확정',
+            note=f'재고 부족 자동생성: {inv.item_name} (현재 {stock_qty} / 최소 {inv.min_stock})',
+        ))
+
+    created = []
+    try:
+        created = _create_orders(orders)
+    except Exception as e:
+        logger.warning('alerts.evaluate: 자동발주 생성 실패 (company=%s): %s', company_id, e, exc_info=True)
+    if created:
+        auto_orders_bulk_created.send(sender=PurchaseOrder, company=company_id, orders=created)
+    fresh = [by_number[order.po_number] for order in created]
+
+    try:
+        title = f'재고 부족 경고 ({len(items)}개 품목)' if len(items) > 1 else '재고 부족 경고'
+        message = _message(items)
+        ref_id = items[0].pk if len(items) == 1 else None
+        Notification.objects.bulk_create([
+            Notification(company_id=company_id, recipient_id=user_id, notification_type='low_stock',
+                         title=title, message=message, ref_module='wm', ref_id=ref_id)
+            for user_id in _recipients(company_id)
+        ])
+    except Exception as e:
+        logger.warning('alerts.evaluate: 재고 부족 알림 발송 실패 (company=%s): %s', company_id, e, exc_info=True)
+
+    logger.info('alerts.evaluate: 부족 %d개 품목 알림, 자동발주 %d개 품목 (company=%s)',
+                len(items), len(fresh), company_id)
+    return fresh
+
+
+def _evaluate_safely(company_id, inventory_ids):
+    try:
+        evaluate(company_id, inventory_ids)
+    except Exception as e:
+        logger.warning('alerts.evaluate: 평가 실패 (company=%s, %d개 품목): %s',
+                       company_id, len(inventory_ids), e, exc_info=True)
+
+
+class LowStockCollector:
+    """
+    회사별 부족재고 행 id 버퍼 (buffered 모드).
+
+    window 가 None 이면 백그라운드 스레드 없이 flush() 를 직접 호출할 때만 평가합니다 (테스트용).
+    """
+
+    def __init__(self, window=5.0):
+        self.window = window
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._worker = None
+        self._pid = None
+
+    def __len__(self):
+        return sum(len(ids) for ids in self._pending.values())
+
+    def add(self, company_id, inventory_ids):
+        with self._lock:
+            self._pending.setdefault(company_id, set()).update(inventory_ids)
+        if self.window is not None:
+            self._ensure_worker()
+
+    def flush(self):
+        """모인 품목을 회사별로 평가하고 평가한 회사 수를 돌려줌."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for company_id, ids in pending.items():
+            _evaluate_safely(company_id, ids)
+        return len(pending)
+
+    def _ensure_worker(self):
+        pid = os.getpid()
+        if self._pid == pid and self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._worker is not None and self._worker.is_alive():
+                return
+            self._pid = pid   # fork 된 워커 프로세스는 자기 스레드를 새로 시작
+            self._worker = threading.Thread(target=self._run, name='wm-low-stock-alerts', daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.window)
+            close_old_connections()
+            self.flush()
+
+
+_collector = None
+_collector_lock = threading.Lock()
+
+
+def get_collector():
+    global _collector
+    if _collector is None:
+        with _collector_lock:
+            if _collector is None:
+                _collector = LowStockCollector(window=getattr(settings, 'WM_LOW_STOCK_ALERT_WINDOW', 5.0))
+    return _collector
+
+
+def flush():
+    """남은 버퍼를 즉시 평가 (프로세스 종료 시 자동 호출)."""
+    if _collector is None:
+        return 0
+    return _collector.flush()
+
+
+atexit.register(flush)
+
+
+def _dispatch(company_id, inventory_ids):
+    if alert_mode() == 'buffered':
+        transaction.on_commit(lambda: get_collector().add(company_id, inventory_ids))
+    else:
+        _evaluate_safely(company_id, inventory_ids)
+
+
+def schedule(company_id, inventory_id):
+    """부족해진 재고 행 1건 등록 — deferred() 블록 안이면 블록 끝에서 모아 처리."""
+    pending = getattr(_local, 'pending', None)
+    if pending is not None:
+        pending.setdefault(company_id, set()).add(inventory_id)
+        return
+    _dispatch(company_id, {inventory_id})
+
+
+@contextmanager
+def deferred():
+    """블록 안의 부족재고 등록을 모아 블록이 정상 종료되면 회사별로 한 번에 처리 (중첩 시 가장 바깥 블록)."""
+    if getattr(_local, 'pending', None) is not None:
+        yield
+        return
+    _local.pending = {}
+    try:
+        yield
+        pending = _local.pending
+    finally:
+        _local.pending = None
+    for company_id, ids in pending.items():
+        _dispatch(company_id, ids)
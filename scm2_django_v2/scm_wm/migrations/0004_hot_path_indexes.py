@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:36
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+from scm_core.operations import AddIndexConcurrentlyIfSupported
+
+
+class Migration(migrations.Migration):
+    # 운영 테이블 잠금 없이 생성 (PostgreSQL CREATE INDEX CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('scm_accounts', '0003_userpermission_can_delete'),
+        ('scm_wm', '0003_stockmovement'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfSupported(
+            model_name='inventory',
+            index=models.Index(fields=['company', 'item_code'], include=('stock_qty', 'min_stock'), name='inv_co_item_idx'),
+        ),
+        AddIndexConcurrentlyIfSupported(
+            model_name='inventory',
+            index=models.Index(models.F('company'), django.db.models.functions.text.Upper('item_name'), name='inv_co_upper_name_idx'),
+        ),
+        AddIndexConcurrentlyIfSupported(
+            model_name='inventory',
+            index=models.Index(condition=models.Q(('min_stock__gt', 0)), fields=['company', 'item_code'], include=('stock_qty', 'min_stock'), name='inv_co_min_stock_idx'),
+        ),
+        AddIndexConcurrentlyIfSupported(
+            model_name='stockmovement',
+            index=models.Index(fields=['company', 'created_at', 'id'], name='sm_co_created_idx'),
+        ),
+        AddIndexConcurrentlyIfSupported(
+            model_name='stockmovement',
+            index=models.Index(fields=['company', 'movement_type', 'material_code', 'created_at'], name='sm_co_type_mat_created_idx'),
+        ),
+        AddIndexConcurrentlyIfSupported(
+            model_name='stockmovement',
+            index=models.Index(condition=models.Q(('movement_type', 'OUT')), fields=['company', 'material_code', 'created_at'], include=('quantity', 'material_name'), name='sm_out_demand_idx'),
+        ),
+        AddIndexConcurrentlyIfSupported(
+            model_name='stockmovement',
+            index=models.Index(fields=['company', 'reference_document'], name='sm_co_ref_doc_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:10
+
+from django.db import migrations
+
+from scm_core.operations import RemoveIndexConcurrentlyIfSupported
+
+
+class Migration(migrations.Migration):
+    # inv_co_min_stock_idx 는 inv_co_item_idx 와 키·INCLUDE 가 같은 부분 인덱스 — 쓰기 비용만 추가
+    atomic = False
+
+    dependencies = [
+        ('scm_wm', '0004_hot_path_indexes'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrentlyIfSupported(
+            model_name='inventory',
+            name='inv_co_min_stock_idx',
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Upper
 from scm_accounts.models import Company
 
 class Warehouse(models.Model):
@@ -29,6 +31,13 @@ class Inventory(models.Model):
 
     class Meta:
         unique_together = ('item_code', 'warehouse', 'lot_number')
+        indexes = [
+            # WM/SD/MM signal·조회의 회사 + 품목코드 조회 (부족재고 알림·대시보드도 같은 인덱스)
+            models.Index(fields=['company', 'item_code'], name='inv_co_item_idx',
+                         include=['stock_qty', 'min_stock']),
+            # SD 출하 재고 매칭 — item_name iexact (UPPER(item_name) 비교)
+            models.Index(F('company'), Upper('item_name'), name='inv_co_upper_name_idx'),
+        ]
 
     @property
     def is_low_stock(self):
@@ -94,4 +103,18 @@ class StockMovement(models.Model):
     reference_document = models.CharField(max_length=100, blank=True)
     created_at         = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 목록 최신순·키셋 페이지, 대시보드 오늘 이동 건수
+            models.Index(fields=['company', 'created_at', 'id'], name='sm_co_created_idx'),
+            # 유형·자재별 기간 조회 (보고서, 목록 필터)
+            models.Index(fields=['company', 'movement_type', 'material_code', 'created_at'],
+                         name='sm_co_type_mat_created_idx'),
+            # 수요예측·배치 계산기의 출고 이력 — 출고만, 수량까지 인덱스에서 읽음
+            models.Index(fields=['company', 'material_code', 'created_at'], name='sm_out_demand_idx',
+                         include=['quantity', 'material_name'], condition=Q(movement_type='OUT')),
+            # 참조 문서(PO/SO/생산오더) 역추적
+            models.Index(fields=['company', 'reference_document'], name='sm_co_ref_doc_idx'),
+        ]
+
     def __str__(self): return f"{self.movement_type} {self.material_code} {self.quantity}"
@@ -1,3 +1,6 @@
+from decimal import Decimal
+
+from django.conf import settings
 from rest_framework import serializers
 from .models import Warehouse, Inventory, BinLocation, CycleCount, CycleCountLine, StockMovement
 
@@ -47,3 +50,46 @@ class StockMovementSerializer(serializers.ModelSerializer):
         model = StockMovement
         fields = '__all__'
         read_only_fields = ['created_at']
+
+
+class StockMovementBulkLineSerializer(serializers.Serializer):
+    """일괄 재고 이동 1건 입력 — amount 가 있으면 FI 자동전표 대상 (IN 매입 / OUT 매출)"""
+    item_code          = serializers.CharField(max_length=100)
+    item_name          = serializers.CharField(max_length=200, required=False, allow_blank=True, default='')
+    quantity           = serializers.DecimalField(max_digits=15, decimal_places=3, min_value=Decimal('1'))
+    movement_type      = serializers.ChoiceField(choices=StockMovement.MOVEMENT_TYPES)
+    reference_type     = serializers.CharField(max_length=50, required=False, allow_blank=True, default='')
+    reference_document = serializers.CharField(max_length=100, required=False, allow_blank=True, default='')
+    amount             = serializers.DecimalField(max_digits=18, decimal_places=2, min_value=Decimal('0'),
+                                                  required=False, allow_null=True, default=None)
+    cost_amount        = serializers.DecimalField(max_digits=18, decimal_places=2, min_value=Decimal('0'),
+                                                  required=False, allow_null=True, default=None)
+
+    def validate_quantity(self, value):
+        # Inventory.stock_qty 는 정수 — 소수 수량은 이동 이력과 재고가 어긋나므로 거부
+        if value != value.to_integral_value():
+            raise serializers.ValidationError('수량은 정수여야 합니다.')
+        return value
+
+
+class StockMovementBulkSerializer(serializers.Serializer):
+    """일괄 재고 이동 입력 (POST /api/wm/movements/bulk/)"""
+    movements = StockMovementBulkLineSerializer(many=True, allow_empty=False)
+
+    def validate_movements(self, movements):
+        limit = getattr(settings, 'WM_BULK_MOVEMENT_LIMIT', 20000)
+        if len(movements) > limit:
+            raise serializers.ValidationError(f'한 번에 최대 {limit}건까지 처리할 수 있습니다.')
+
+        # 참조 문서당 자동전표 1건 — 같은 문서에 입고·출고 금액을 섞으면 전표 유형을 정할 수 없음
+        directions = {}
+        for m in movements:
+            if m['amount'] and m['movement_type'] in ('IN', 'OUT'):
+                key = (m['reference_type'], m['reference_document'])
+                directions.setdefault(key, set()).add(m['movement_type'])
+        mixed = sorted(f'{t}-{d}' for (t, d), types in directions.items() if len(types) > 1)
+        if mixed:
+            raise serializers.ValidationError(
+                f'한 참조 문서에 입고·출고 금액을 함께 보낼 수 없습니다: {", ".join(mixed[:10])}'
+            )
+        return movements
@@ -182,28 +182,33 @@ def pp_completion_consume_bom(sender, instance, **kwargs):
     qty_multiplier = instance.planned_qty or 1
     material_cost = Decimal('0')
 
-    # BOM 구성자재 소비
+    # BOM 구성자재 소비 — 회사별 BOM 그래프 캐시의 단위당 최하위 구성품 계수
+    # (반제품은 캐시에서 하위 구성품으로 전개, 비활성 BOM 포함 BOM 테이블 조회 없음)
     if instance.bom_id:
         try:
-            for line in instance.bom.lines.all():
-                scrap_factor = float(line.scrap_rate or 0) / 100
-                if scrap_factor >= 1:
-                    scrap_factor = 0
-                gross_qty = float(line.quantity) * qty_multiplier
-                if scrap_factor:
-                    gross_qty /= (1 - scrap_factor)
+            from scm_pp.utils.mrp import get_bom_graph
+            graph = get_bom_graph(instance.company_id)
+            per_unit = graph['unit_consumption'].get(instance.bom_id)
+            if per_unit is None:
+                logger.warning(
+                    'pp_completion_consume_bom: BOM 그래프에 없는 BOM (order=%s, bom_id=%s)',
+                    instance.order_number, instance.bom_id,
+                )
+                per_unit = {}
+            for material_code, unit_qty in per_unit.items():
+                gross_qty = float(unit_qty) * qty_multiplier
 
                 _adjust_inventory(
                     company=instance.company,
-                    item_code=line.material_code,
-                    item_name=line.material_name,
+                    item_code=material_code,
+                    item_name=graph['material_names'].get(material_code, material_code),
                     quantity=gross_qty,
                     movement_type='OUT',
                     reference_type='PP',
                     reference_document=instance.order_number,
                 )
 
-                unit_cost = _get_material_unit_cost(instance.company, line.material_code)
+                unit_cost = _get_material_unit_cost(instance.company, material_code)
                 material_cost += unit_cost * Decimal(str(gross_qty))
         except Exception as e:
             logger.warning(
@@ -321,34 +326,22 @@ def tm_freight_settlement(sender, instance, **kwargs):
 
 
 def _calculate_freight_cost(transport_order):
-    """FreightRate 테이블에서 운임 자동계산."""
+    """FreightRate 테이블에서 운임 자동계산 (scm_tm.rating — 중량 구간 포함)."""
     try:
-        from scm_tm.models import FreightRate
-        today = timezone.localdate()
+        from scm_tm.rating import RateTable
 
-        rate = (FreightRate.objects
-                .filter(
-                    company=transport_order.company,
-                    carrier=transport_order.carrier,
-                    origin__iexact=transport_order.origin,
-                    destination__iexact=transport_order.destination,
-                    is_active=True,
-                    valid_from__lte=today,
-                )
-                .filter(
-                    models.Q(valid_to__isnull=True) | models.Q(valid_to__gte=today)
-                )
-                .order_by('-valid_from')
-                .first())
-
-        if not rate:
+        if not transport_order.carrier_id:
             return 0
-
-        weight = float(transport_order.weight_kg or 0)
-        volume = float(transport_order.volume_cbm or 0)
-        calculated = (weight * float(rate.rate_per_kg)
-                      + volume * float(rate.rate_per_cbm))
-        return max(float(rate.min_charge), calculated)
+        table = RateTable.load(
+            transport_order.company,
+            carrier_ids=[transport_order.carrier_id],
+            lanes=[(transport_order.origin, transport_order.destination)],
+        )
+        cost = table.quote(
+            transport_order.carrier_id, transport_order.origin, transport_order.destination,
+            float(transport_order.weight_kg or 0), float(transport_order.volume_cbm or 0),
+        )
+        return cost or 0
 
     except Exception as e:
         logger.warning('_calculate_freight_cost: 운임 계산 실패: %s', e, exc_info=True)
@@ -397,38 +390,18 @@ def _adjust_inventory(company, item_code, item_name, quantity, movement_type,
     if not item_code or not quantity:
         return
 
-    from scm_wm.models import Inventory, StockMovement
+    from scm_wm.stock import apply_movements
 
     with transaction.atomic():
-        inv, _ = Inventory.objects.get_or_create(
-            company=company,
-            item_code=str(item_code),
-            warehouse=None,
-            lot_number='',
-            defaults={
-                'item_name': item_name or str(item_code),
-                'stock_qty': 0,
-                'system_qty': 0,
-                'min_stock': 0,
-            },
-        )
-
-        if movement_type == 'IN':
-            inv.stock_qty = (inv.stock_qty or 0) + int(quantity)
-        elif movement_type == 'OUT':
-            inv.stock_qty = max(0, (inv.stock_qty or 0) - int(quantity))
-        inv.save(update_fields=['stock_qty'])
-
-        StockMovement.objects.create(
-            company=company,
-            warehouse=None,
-            movement_type=movement_type,
-            material_code=str(item_code),
-            material_name=item_name or str(item_code),
-            quantity=quantity,
-            reference_type=reference_type,
-            reference_document=reference_document,
-        )
+        # 재고 행 잠금 후 반영 + StockMovement 기록 (scm_wm.stock)
+        apply_movements(company, [{
+            'item_code':          item_code,
+            'item_name':          item_name,
+            'quantity':           quantity,
+            'movement_type':      movement_type,
+            'reference_type':     reference_type,
+            'reference_document': reference_document,
+        }])
 
         # FI 자동전기 (금액이 있을 때만)
         if monetary_amount and monetary_amount > 0:
@@ -476,6 +449,8 @@ def _auto_post_fi(company, movement_type, reference_type, reference_document,
         CR 매출       monetary_amount
         DR 매출원가   cost_amount      (원가 ← 추정값이면 괜찮음)
         CR 재고자산   cost_amount
+
+    생성한 AccountMove 반환 (같은 참조의 전표가 이미 있으면 None).
     """
     from scm_fi.models import AccountMove, AccountMoveLine
 
@@ -483,7 +458,7 @@ def _auto_post_fi(company, movement_type, reference_type, reference_document,
 
     move_number = f'AUTO-{reference_type}-{reference_document or uuid.uuid4().hex[:8]}'
     if AccountMove.objects.filter(company=company, move_number=move_number).exists():
-        return  # 중복 방지
+        return None  # 중복 방지
 
     if movement_type == 'IN':
         # 매입전표
@@ -535,6 +510,7 @@ def _auto_post_fi(company, movement_type, reference_type, reference_document,
         AccountMoveLine.objects.create(move=move, account=acc_inv,
                                         name=f'자동전기-재고감소: {item_name}',
                                         debit=0, credit=ca)
+    return move
 
 
 # ---------------------------------------------------------------------------
@@ -580,89 +556,20 @@ def _auto_post_production(company, reference_document, item_name, production_cos
 @receiver(post_save, sender='scm_wm.Inventory')
 def check_min_stock_alert(sender, instance, **kwargs):
     """
-    Inventory 저장 시 stock_qty < min_stock 이면:
-      1. 해당 회사의 모든 유저에게 재고 부족 알림 발송
-      2. MM PurchaseOrder 자동 발주 초안 생성 (중복 방지)
+    Inventory 저장 시 stock_qty < min_stock 이면 부족재고 평가 대상으로 등록.
+    알림(WM·MM 권한 사용자에게 통합 1건)·자동발주는 scm_wm.alerts 가 모아서 처리한다.
     """
     # min_stock 이 0 이하이면 모니터링 대상 아님
     if not instance.min_stock or instance.min_stock <= 0:
         return
-
-    stock_qty = instance.stock_qty or 0
-    if stock_qty >= instance.min_stock:
+    if (instance.stock_qty or 0) >= instance.min_stock:
         return
-
-    company = instance.company
-
-    # --- 1. 알림 발송 ---
     try:
-        from scm_notifications.models import Notification
-        from scm_accounts.models import User
-
-        title = '재고 부족 경고'
-        message = (
-            f'{instance.item_name} 재고 부족: '
-            f'현재 {stock_qty} / 최소 {instance.min_stock}'
-        )
-
-        users = User.objects.filter(company=company, is_active=True)
-        notifications = [
-            Notification(
-                company=company,
-                recipient=user,
-                notification_type='system',
-                title=title,
-                message=message,
-                ref_module='wm',
-                ref_id=instance.pk,
-            )
-            for user in users
-        ]
-        if notifications:
-            Notification.objects.bulk_create(notifications, ignore_conflicts=True)
-            logger.info(
-                'check_min_stock_alert: 재고 부족 알림 %d건 발송 (item=%s, stock=%s, min=%s)',
-                len(notifications), instance.item_code, stock_qty, instance.min_stock,
-            )
-    except Exception as e:
-        logger.warning(
-            'check_min_stock_alert: 재고 부족 알림 발송 실패 (item=%s): %s',
-            instance.item_code, e, exc_info=True,
-        )
-
-    # --- 2. MM 자동 발주 생성 ---
-    try:
-        from scm_mm.models import PurchaseOrder as MMPurchaseOrder
-
-        today = timezone.localdate()
-        po_number = f'AUTO-PO-{instance.item_code}-{today}'
-
-        if MMPurchaseOrder.objects.filter(po_number=po_number).exists():
-            logger.info(
-                'check_min_stock_alert: 자동발주 이미 존재함, 건너뜀 (po_number=%s)', po_number,
-            )
-            return
-
-        # 발주 수량: 최소재고의 2배까지 채우는 양, 최소 1
-        order_qty = max(instance.min_stock * 2 - stock_qty, 1)
-
-        MMPurchaseOrder.objects.create(
-            company=company,
-            po_number=po_number,
-            supplier=None,
-            item_name=instance.item_name,
-            quantity=order_qty,
-            unit_price=Decimal('0'),
-            status='발주확정',
-            note=f'재고 부족 자동생성: {instance.item_name} (현재 {stock_qty} / 최소 {instance.min_stock})',
-        )
-        logger.info(
-            'check_min_stock_alert: 자동발주 생성 완료 (po_number=%s, qty=%s)',
-            po_number, order_qty,
-        )
+        from scm_wm.alerts import schedule
+        schedule(instance.company_id, instance.pk)
     except Exception as e:
         logger.warning(
-            'check_min_stock_alert: 자동발주 생성 실패 (item=%s): %s',
+            'check_min_stock_alert: 부족재고 평가 등록 실패 (item=%s): %s',
             instance.item_code, e, exc_info=True,
         )
 
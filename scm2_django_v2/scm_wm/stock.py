@@ -0,0 +1,152 @@
+"""
+WM 재고 수량 반영 — 행 잠금 + 일괄 기록
+
+apply_movements(company, movements) 는 여러 재고 이동을 한 트랜잭션으로 반영합니다.
+
+    1. 없는 품목 재고 행(창고 미지정·LOT 없음) 생성
+    2. 대상 재고 행을 item_code 순서로 SELECT ... FOR UPDATE
+       — 여러 품목을 다루는 요청끼리도 같은 순서로 잠그므로 교착이 생기지 않음
+    3. 잠근 값 기준으로 이동을 순서대로 적용 (IN +, OUT −, 0 미만은 0) 후 품목당 1회 save()
+       — save() 이므로 재고 post_save signal(부족재고 알림, 대시보드)은 그대로 동작
+         (부족재고 평가는 scm_wm.alerts.deferred() 로 모아 한 번에)
+    4. StockMovement 는 bulk_create 1회 → movements_bulk_created signal 전송
+       (bulk_create 는 post_save 를 보내지 않으므로 대시보드 등은 이 signal 로 한 번에 처리)
+
+잠금 없이 읽고-쓰던 기존 방식은 같은 품목의 동시 입·출고에서 갱신이 유실됐습니다.
+
+post_movements(company, movements) 는 일괄 이동 API(/api/wm/movements/bulk/)용입니다.
+apply_movements 로 재고를 반영한 뒤 금액(amount)이 있는 이동을 참조 문서별로 묶어
+FI 자동전표를 문서당 1건 만듭니다. 부족재고 평가는 요청당 1회입니다.
+"""
+import logging
+
+from django.db import transaction
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+# sender=StockMovement, company, movements=[StockMovement, ...]
+movements_bulk_created = Signal()
+
+
+def _quantity_after(current, movement_type, quantity):
+    if movement_type == 'IN':
+        return current + int(quantity)
+    if movement_type == 'OUT':
+        return max(0, current - int(quantity))
+    return current
+
+
+def apply_movements(company, movements):
+    """
+    movements: [{'item_code', 'quantity', 'movement_type', 'item_name'?,
+                 'reference_type'?, 'reference_document'?}, ...]
+    반환: 생성된 StockMovement 목록 (item_code·quantity 가 비어 있는 항목은 건너뜀)
+    """
+    from scm_wm.alerts import deferred
+    from scm_wm.models import Inventory, StockMovement
+
+    movements = [m for m in movements if m.get('item_code') and m.get('quantity')]
+    if not movements:
+        return []
+
+    names = {}
+    for m in movements:
+        code = str(m['item_code'])
+        names.setdefault(code, m.get('item_name') or code)
+    codes = sorted(names)
+    scope = dict(company=company, warehouse=None, lot_number='')
+
+    with transaction.atomic():
+        existing = set(
+            Inventory.objects.filter(item_code__in=codes, **scope).values_list('item_code', flat=True)
+        )
+        for code in codes:
+            if code not in existing:
+                Inventory.objects.get_or_create(
+                    item_code=code, **scope,
+                    defaults={'item_name': names[code], 'stock_qty': 0, 'system_qty': 0, 'min_stock': 0},
+                )
+
+        locked = {}
+        for inv in (Inventory.objects.select_for_update()
+                    .filter(item_code__in=codes, **scope).order_by('item_code', 'pk')):
+            locked.setdefault(inv.item_code, inv)
+
+        for m in movements:
+            inv = locked[str(m['item_code'])]
+            inv.stock_qty = _quantity_after(inv.stock_qty or 0, m['movement_type'], m['quantity'])
+        with deferred():   # 부족재고 평가는 저장한 품목을 모아 1회 (scm_wm.alerts)
+            for code in codes:
+                locked[code].save(update_fields=['stock_qty'])
+
+        created = StockMovement.objects.bulk_create([
+            StockMovement(
+                company_id=company.pk,   # FK 디스크립터 대신 id 직접 지정 (수천 건 생성 비용)
+                warehouse_id=None,
+                movement_type=m['movement_type'],
+                material_code=str(m['item_code']),
+                material_name=m.get('item_name') or names[str(m['item_code'])],
+                quantity=m['quantity'],
+                reference_type=m.get('reference_type', ''),
+                reference_document=m.get('reference_document', ''),
+            )
+            for m in movements
+        ])
+        movements_bulk_created.send(sender=StockMovement, company=company, movements=created)
+    return created
+
+
+def _journal_label(names):
+    return names[0] if len(names) == 1 else f'{names[0]} 외 {len(names) - 1}건'
+
+
+def post_movements(company, movements):
+    """
+    movements: apply_movements 형식 + 'amount'?(FI 금액), 'cost_amount'?(OUT 매출원가)
+    반환: (생성된 StockMovement 목록, 생성된 자동전표 번호 목록)
+
+    자동전표 실패는 해당 문서만 savepoint 로 되돌리고 재고 반영은 유지합니다 (_adjust_inventory 와 동일).
+    """
+    from scm_wm.signals import _auto_post_fi
+
+    groups = {}
+    for m in movements:
+        if m.get('amount') and m['movement_type'] in ('IN', 'OUT'):
+            key = (m.get('reference_type', ''), m.get('reference_document', ''), m['movement_type'])
+            group = groups.setdefault(key, {'amount': 0.0, 'cost': 0.0, 'has_cost': False, 'names': []})
+            amount = float(m['amount'])
+            group['amount'] += amount
+            if m.get('cost_amount') is not None:
+                group['has_cost'] = True
+                group['cost'] += float(m['cost_amount'])
+            else:
+                group['cost'] += amount * 0.7   # _auto_post_fi 의 원가 추정과 동일
+            name = m.get('item_name') or str(m['item_code'])
+            if name not in group['names']:
+                group['names'].append(name)
+
+    journal_entries = []
+    with transaction.atomic():
+        created = apply_movements(company, movements)
+        for (reference_type, reference_document, movement_type), group in groups.items():
+            try:
+                with transaction.atomic():
+                    move = _auto_post_fi(
+                        company=company,
+                        movement_type=movement_type,
+                        reference_type=reference_type,
+                        reference_document=reference_document,
+                        item_name=_journal_label(group['names']),
+                        monetary_amount=group['amount'],
+                        cost_amount=group['cost'] if group['has_cost'] else None,
+                    )
+            except Exception as e:
+                logger.warning(
+                    'post_movements: FI 자동전기 실패 (ref=%s %s): %s',
+                    reference_type, reference_document, e, exc_info=True,
+                )
+                continue
+            if move is not None:
+                journal_entries.append(move.move_number)
+    return created, journal_entries
@@ -2,13 +2,13 @@ import uuid
 from decimal import Decimal
 
 from django.db.models import Sum, F
-from rest_framework import viewsets, filters
+from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
-from scm_core.mixins import AuditLogMixin, StateLockMixin
+from scm_core.mixins import AuditLogMixin, ExportMixin, QueryBudgetMixin, StateLockMixin
 from .models import Warehouse, Inventory, BinLocation, CycleCount, StockMovement
 from .serializers import (
     WarehouseSerializer,
@@ -18,6 +18,7 @@ from .serializers import (
     CycleCountWriteSerializer,
     CycleCountLineSerializer,
     StockMovementSerializer,
+    StockMovementBulkSerializer,
 )
 
 
@@ -37,8 +38,17 @@ class WarehouseViewSet(AuditLogMixin, viewsets.ModelViewSet):
         serializer.save(company=self.request.user.company)
 
 
-class InventoryViewSet(AuditLogMixin, viewsets.ModelViewSet):
+class InventoryViewSet(QueryBudgetMixin, ExportMixin, AuditLogMixin, viewsets.ModelViewSet):
     audit_module = 'wm'
+    query_budgets = {'list': 6, 'dashboard': 5}
+    export_filename = 'inventory'
+    export_fields = ['item_code', 'item_name', 'category', 'warehouse__warehouse_name', 'bin_code',
+                     'lot_number', 'stock_qty', 'system_qty', 'min_stock', 'unit_price',
+                     'expiry_date', 'updated_at']
+    export_headers = {'item_code': '품목코드', 'item_name': '품목명', 'category': '분류',
+                      'warehouse__warehouse_name': '창고', 'bin_code': '빈', 'lot_number': 'LOT',
+                      'stock_qty': '재고수량', 'system_qty': '전산수량', 'min_stock': '최소재고',
+                      'unit_price': '단가', 'expiry_date': '유효기한', 'updated_at': '수정일시'}
     serializer_class = InventorySerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -126,19 +136,45 @@ class InventoryViewSet(AuditLogMixin, viewsets.ModelViewSet):
         })
 
 
-class StockMovementViewSet(viewsets.ReadOnlyModelViewSet):
+class StockMovementViewSet(ExportMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = StockMovementSerializer
+    export_filename = 'stock_movements'
+    export_fields = ['created_at', 'movement_type', 'material_code', 'material_name', 'quantity',
+                     'warehouse__warehouse_name', 'reference_type', 'reference_document']
+    export_headers = {'created_at': '일시', 'movement_type': '유형', 'material_code': '자재코드',
+                      'material_name': '자재명', 'quantity': '수량', 'warehouse__warehouse_name': '창고',
+                      'reference_type': '참조유형', 'reference_document': '참조문서'}
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['material_code', 'material_name', 'reference_document']
     filterset_fields = ['movement_type', 'reference_type', 'warehouse']
     ordering_fields = ['created_at', 'material_code', 'movement_type']
+    query_budgets = {'bulk': None}   # 품목 수에 비례 — 고정 예산 대상 아님
 
     def get_queryset(self):
         return StockMovement.objects.filter(
             company=self.request.user.company
         ).select_related('warehouse').order_by('-created_at')
 
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        재고 이동 일괄 기록 — {"movements": [{item_code, quantity, movement_type, ...}, ...]}
+        전체 검증 후 한 트랜잭션으로 반영 (scm_wm.stock.post_movements). 오류가 있으면 아무것도 기록하지 않음.
+        """
+        from scm_wm.stock import post_movements
+
+        input_ser = StockMovementBulkSerializer(data=request.data)
+        input_ser.is_valid(raise_exception=True)
+        movements = input_ser.validated_data['movements']
+
+        created, journal_entries = post_movements(request.user.company, movements)
+        return Response({
+            'created': len(created),
+            'items': len({m['item_code'] for m in movements}),
+            'journal_entries': journal_entries,
+        }, status=status.HTTP_201_CREATED)
+
 
 class BinLocationViewSet(AuditLogMixin, viewsets.ModelViewSet):
     audit_module = 'wm'
@@ -66,7 +66,8 @@ class ApprovalRequestSerializer(serializers.ModelSerializer):
 
     def get_total_steps(self, obj):
         if obj.template:
-            return obj.template.steps.count()
+            # 뷰가 template__steps 를 prefetch 하므로 추가 쿼리 없음
+            return len(obj.template.steps.all())
         return None
 
 
@@ -5,6 +5,8 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 
+from scm_core.mixins import QueryBudgetMixin
+
 from .models import ApprovalTemplate, ApprovalRequest, ApprovalAction
 from .serializers import (
     ApprovalTemplateSerializer,
@@ -39,7 +41,7 @@ class ApprovalTemplateViewSet(viewsets.ModelViewSet):
         return ApprovalTemplate.objects.none()
 
 
-class ApprovalRequestViewSet(viewsets.ModelViewSet):
+class ApprovalRequestViewSet(QueryBudgetMixin, viewsets.ModelViewSet):
     """
     결재 요청 관리
 
@@ -54,12 +56,13 @@ class ApprovalRequestViewSet(viewsets.ModelViewSet):
     """
     queryset = ApprovalRequest.objects.select_related(
         'company', 'template', 'requester', 'content_type'
-    ).prefetch_related('actions__approver', 'actions__step').all()
+    ).prefetch_related('actions__approver', 'actions__step', 'template__steps').all()
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['company', 'status', 'template']
     ordering_fields = ['created_at', 'completed_at', 'current_step']
     ordering = ['-created_at']
+    query_budgets = {'list': 8, 'my_requests': 8, 'pending_for_me': 8}
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -70,7 +73,7 @@ class ApprovalRequestViewSet(viewsets.ModelViewSet):
         user = self.request.user
         qs = ApprovalRequest.objects.select_related(
             'company', 'template', 'requester', 'content_type'
-        ).prefetch_related('actions__approver', 'actions__step')
+        ).prefetch_related('actions__approver', 'actions__step', 'template__steps')
 
         if user.is_admin or user.is_superuser:
             return qs.all()
@@ -89,9 +92,7 @@ class ApprovalRequestViewSet(viewsets.ModelViewSet):
         status_filter = request.query_params.get('status')
         if status_filter:
             qs = qs.filter(status=status_filter)
-        serializer = ApprovalRequestSerializer(
-            qs, many=True, context={'request': request}
-        )
+        serializer = self.get_serializer(qs, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'], url_path='pending')
@@ -103,14 +104,15 @@ class ApprovalRequestViewSet(viewsets.ModelViewSet):
         result = []
         for req in qs:
             if req.template:
-                step = req.template.steps.filter(step_no=req.current_step).first()
+                step = next(
+                    (st for st in req.template.steps.all() if st.step_no == req.current_step),
+                    None,
+                )
                 if step and (
                     step.approver_role == my_dept or step.approver_role == ''
                 ):
                     result.append(req)
-        serializer = ApprovalRequestSerializer(
-            result, many=True, context={'request': request}
-        )
+        serializer = self.get_serializer(result, many=True)
         return Response(serializer.data)
 
     @action(detail=True, methods=['post'], url_path='approve')
@@ -0,0 +1,209 @@
+"""
+scm_core.analytics 공통 알고리즘 테스트 — MM·PP·QM·FI 가 같은 구현을 쓰는지 확인
+
+커버리지:
+  CORE (6)  MM/PP EOQ·Z값 일치, 런 규칙 = 단순 반복 기준 구현, 나이분석 구간 벡터 = 단건,
+            연 단위 감가상각 단수 조정, Nelson 규칙 5~8 = 기준 구현 (비대칭 한계 포함),
+            위반 점 표시(classify_spc_points) = 창별 표시
+  API  (3)  QM SPC 분석 관리한계·경보(Nelson 규칙 선택), FI 감가상각 스케줄 생성, FI 나이분석 집계
+"""
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_core.analytics import finance, spc
+from scm_fi.models import Account, AccountMove, AccountMoveLine, DepreciationSchedule, FixedAsset
+from scm_mm.utils import calc_eoq, calc_safety_stock
+from scm_pp.utils.mrp import calculate_eoq, calculate_safety_stock
+from scm_qm.utils import classify_spc_points
+
+
+def _brute_force_rule_ends(values, ucl, lcl, cl):
+    """run_rule_ends 기준 구현 — 창마다 직접 검사."""
+    n = len(values)
+    ends = {1: [i for i, v in enumerate(values) if v > ucl or v < lcl], 2: [], 3: [], 4: []}
+    for end in range(n):
+        win = values[max(0, end - 8):end + 1]
+        if len(win) == 9 and (all(v > cl for v in win) or all(v < cl for v in win)):
+            ends[2].append(end)
+        win = values[max(0, end - 5):end + 1]
+        diffs = [b - a for a, b in zip(win, win[1:])]
+        if len(win) == 6 and (all(d > 0 for d in diffs) or all(d < 0 for d in diffs)):
+            ends[3].append(end)
+        win = values[max(0, end - 13):end + 1]
+        diffs = [b - a for a, b in zip(win, win[1:])]
+        if len(win) == 14 and all(d1 * d2 < 0 for d1, d2 in zip(diffs, diffs[1:])):
+            ends[4].append(end)
+    return ends
+
+
+def _brute_force_nelson_ends(values, ucl, lcl, cl):
+    """Nelson 규칙 5~8 기준 구현 — 창마다 직접 검사."""
+    up1, up2 = cl + (ucl - cl) / 3, cl + 2 * (ucl - cl) / 3
+    lo1, lo2 = cl - (cl - lcl) / 3, cl - 2 * (cl - lcl) / 3
+    ends = {5: [], 6: [], 7: [], 8: []}
+    for end in range(len(values)):
+        win = values[max(0, end - 2):end + 1]
+        if len(win) == 3 and (sum(v > up2 for v in win) >= 2 or sum(v < lo2 for v in win) >= 2):
+            ends[5].append(end)
+        win = values[max(0, end - 4):end + 1]
+        if len(win) == 5 and (sum(v > up1 for v in win) >= 4 or sum(v < lo1 for v in win) >= 4):
+            ends[6].append(end)
+        win = values[max(0, end - 14):end + 1]
+        if len(win) == 15 and all(lo1 <= v <= up1 for v in win):
+            ends[7].append(end)
+        win = values[max(0, end - 7):end + 1]
+        if (len(win) == 8 and all(v > up1 or v < lo1 for v in win)
+                and any(v > up1 for v in win) and any(v < lo1 for v in win)):
+            ends[8].append(end)
+    return ends
+
+
+class AnalyticsCoreTests(SimpleTestCase):
+    def test_core_01_mm_and_pp_share_eoq_and_z(self):
+        """MM 계산기와 PP MRP 유틸이 같은 EOQ·Z값을 낸다."""
+        rng = random.Random(3)
+        for _ in range(200):
+            d, s, h = rng.uniform(1, 1e5), rng.uniform(1, 1e3), rng.uniform(0.1, 100)
+            self.assertEqual(calc_eoq(d, s, h)['eoq'], round(calculate_eoq(d, s, h), 2))
+        for level in (0.9, 0.95, 0.97, 0.98, 0.99):
+            mm = calc_safety_stock(10, 4, level)
+            pp = calculate_safety_stock(0, 10, 4, 0, level)
+            self.assertAlmostEqual(mm['safety_stock'], round(pp, 2), places=2)
+
+    def test_core_02_run_rules_match_brute_force(self):
+        """벡터 런 규칙 끝 인덱스 = 창별 직접 검사 결과."""
+        rng = random.Random(11)
+        for trial in range(50):
+            values = [round(rng.gauss(10, 1), 1) for _ in range(rng.randint(1, 120))]
+            if trial % 5 == 0:
+                values += [12 + i * 0.1 for i in range(10)]         # 연속 상승 + 중심선 위
+            if trial % 7 == 0:
+                values += [10 + (-1) ** i for i in range(16)]       # 교대 증감
+            ends = spc.run_rule_ends(values, ucl=13.0, lcl=7.0, cl=10.0)
+            expected = _brute_force_rule_ends(values, 13.0, 7.0, 10.0)
+            for rule in (1, 2, 3, 4):
+                self.assertEqual(ends[rule].tolist(), expected[rule], (trial, rule))
+
+    def test_core_05_nelson_rules_match_brute_force(self):
+        """Nelson 규칙 5~8 끝 인덱스 = 창별 직접 검사 결과 (한계가 비대칭이어도)."""
+        rng = random.Random(5)
+        for trial in range(50):
+            values = [round(rng.gauss(10, 1.2), 1) for _ in range(rng.randint(1, 150))]
+            if trial % 4 == 0:
+                values += [10 + rng.uniform(-0.3, 0.3) for _ in range(18)]      # 1σ 안 장기 유지
+            if trial % 6 == 0:
+                values += [8.5 if i % 2 else 11.5 for i in range(10)]            # 1σ 밖 양쪽 교대
+            if trial % 5 == 0:
+                values += [11.8] * 9 + [8.2]                                    # 1σ 밖 한쪽 → 양쪽
+            ucl, lcl = (13.0, 7.0) if trial % 2 else (13.6, 7.3)
+            ends = spc.nelson_rule_ends(values, ucl=ucl, lcl=lcl, cl=10.0)
+            self.assertEqual(sorted(ends), list(range(1, 9)))
+            expected = _brute_force_nelson_ends(values, ucl, lcl, 10.0)
+            for rule in (5, 6, 7, 8):
+                self.assertEqual(ends[rule].tolist(), expected[rule], (trial, rule))
+            self.assertEqual(ends[2].tolist(), spc.run_rule_ends(values, ucl, lcl, 10.0)[2].tolist())
+
+    def test_core_06_classify_points_matches_window_marking(self):
+        """위반 점 표시(차분 배열) = 끝 인덱스마다 창을 직접 표시한 결과."""
+        rng = random.Random(9)
+        values = [round(rng.gauss(10, 1), 2) for _ in range(400)] + [9 + 0.2 * i for i in range(12)]
+        rules = (1, 2, 3, 4, 5, 6, 7, 8)
+        ends = spc.nelson_rule_ends(values, ucl=13.0, lcl=7.0, cl=10.0, rules=rules)
+        flags = [set() for _ in values]
+        for rule, rule_ends in ends.items():
+            for end in rule_ends.tolist():
+                for j in range(end - spc.RULE_WINDOWS[rule] + 1, end + 1):
+                    flags[j].add(rule)
+        expected = [{'index': i, 'value': values[i], 'rules': sorted(f)} for i, f in enumerate(flags) if f]
+        self.assertEqual(classify_spc_points(values, 13.0, 7.0, 10.0, rules=rules), expected)
+        self.assertEqual(classify_spc_points([], 13.0, 7.0, 10.0), [])
+
+    def test_core_03_aging_vector_matches_scalar(self):
+        """나이분석 구간: 벡터 결과가 단건 결과와 같고 경계값(0/30/31/90/91)이 정확하다."""
+        days = list(range(-40, 200))
+        for not_due_max in (-1, 0):
+            vector = finance.aging_bucket_indices(days, not_due_max).tolist()
+            self.assertEqual(vector, [finance.aging_bucket_index(d, not_due_max) for d in days])
+        self.assertEqual([finance.aging_bucket_index(d) for d in (-1, 0, 30, 31, 90, 91)],
+                         [0, 1, 1, 2, 3, 4])
+        self.assertEqual(finance.aging_bucket_index(0, not_due_max=0), 0)
+
+    def test_core_04_annual_schedule_converges_to_salvage(self):
+        """연 단위 SL/DB/SYD: 상각 합계 = 취득원가 - 잔존가치, 마지막 장부가치 = 잔존가치."""
+        for method in ('SL', 'DB', 'SYD'):
+            rows = finance.annual_depreciation_schedule(
+                Decimal('1000000'), Decimal('100000'), 7, method, date(2024, 2, 29))
+            self.assertEqual([r['year'] for r in rows], list(range(1, 8)))
+            self.assertEqual(sum(r['depreciation'] for r in rows), Decimal('900000.00'), method)
+            self.assertEqual(rows[-1]['book_value'], Decimal('100000.00'), method)
+            self.assertEqual(rows[0]['date'], '2025-02-28')
+
+
+class AnalyticsApiTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='ANLY', company_name='분석')
+        self.user = User.objects.create_user(
+            username='anlyuser', email='anly@test.com', password='testpass123',
+            name='분석', company=self.company,
+        )
+        self.client = APIClient()
+        resp = self.client.post('/api/auth/login/', {'email': 'anly@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {resp.data["access"]}')
+
+    def test_api_01_qm_spc_analysis_returns_limits_and_alerts(self):
+        """SPC 분석: I-MR 한계(x_bar/ucl_x/lcl_x)와 규칙 위반 경보가 채워진다."""
+        values = [10.0, 10.2, 9.9, 10.1, 9.8, 10.0, 10.1, 9.9, 10.0, 15.0]
+        resp = self.client.post('/api/qm/inspection-results/spc_analysis/',
+                                {'values': values, 'usl': 11, 'lsl': 9}, format='json')
+        self.assertEqual(resp.status_code, 200, resp.data)
+        control = resp.data['control_limits']
+        self.assertEqual(control['chart_type'], 'I-MR')
+        self.assertLess(control['ucl_x'], 15.0)
+        self.assertIn({'index': 9, 'value': 15.0, 'rules': [1]}, resp.data['alerts'])
+        self.assertIn('cpk', resp.data['capability'])
+
+        resp = self.client.post('/api/qm/inspection-results/spc_analysis/',
+                                {'values': values, 'rules': [5, 9]}, format='json')
+        self.assertEqual(resp.status_code, 400)
+        resp = self.client.post('/api/qm/inspection-results/spc_analysis/',
+                                {'values': [10.0, 10.1] * 8, 'rules': [7]}, format='json')
+        self.assertEqual(resp.status_code, 200, resp.data)   # 모든 점이 1σ 안 (층화)
+        self.assertEqual({a['index'] for a in resp.data['alerts']}, set(range(16)))
+        self.assertEqual({tuple(a['rules']) for a in resp.data['alerts']}, {(7,)})
+
+    def test_api_02_fi_depreciate_creates_yearly_schedule(self):
+        """감가상각: 내용연수만큼 연도별 스케줄, 마지막 장부가치 = 잔존가치."""
+        asset = FixedAsset.objects.create(
+            company=self.company, asset_code='FA-1', asset_name='설비', category='equipment',
+            acquisition_date=date(2024, 3, 15), acquisition_cost=Decimal('5000000'),
+            useful_life_years=5, salvage_value=Decimal('500000'), depreciation_method='declining',
+        )
+        resp = self.client.post(f'/api/fi/fixed-assets/{asset.pk}/depreciate/')
+        self.assertEqual(resp.status_code, 200, resp.data)
+        rows = DepreciationSchedule.objects.filter(asset=asset).order_by('period_year')
+        self.assertEqual([r.period_year for r in rows], [2024, 2025, 2026, 2027, 2028])
+        self.assertEqual(rows.last().book_value_after, Decimal('500000.00'))
+
+    def test_api_03_fi_aging_summary_buckets(self):
+        """나이분석: 만기 당일은 0~30, 미도래/91일 이상이 각 구간에 집계된다."""
+        account = Account.objects.create(company=self.company, code='1100', name='매출채권',
+                                         account_type='asset')
+        move = AccountMove.objects.create(company=self.company, move_number='MV-ANLY-1',
+                                          move_type='SALE', posting_date=date.today(), state='POSTED')
+        today = date.today()
+        for offset, amount in ((-5, 100), (0, 200), (45, 300), (120, 400)):
+            AccountMoveLine.objects.create(move=move, account=account, debit=Decimal(amount),
+                                           due_date=today - timedelta(days=offset))
+        resp = self.client.get('/api/fi/moves/aging/?type=receivable')
+        self.assertEqual(resp.status_code, 200, resp.data)
+        summary = resp.data['summary']
+        self.assertEqual(summary['not_due'], {'count': 1, 'amount': 100.0})
+        self.assertEqual(summary['0_30'], {'count': 1, 'amount': 200.0})
+        self.assertEqual(summary['31_60'], {'count': 1, 'amount': 300.0})
+        self.assertEqual(summary['61_90'], {'count': 0, 'amount': 0.0})
+        self.assertEqual(summary['over_90'], {'count': 1, 'amount': 400.0})
@@ -0,0 +1,131 @@
+"""
+감사 로그 일괄 기록 테스트 — scm_core.audit.AuditBuffer / log_audit 모듈별 방식
+
+커버리지:
+  MODE   (1)  모듈별 재정의 (fi=sync, 그 외 buffered), sync 는 즉시 저장
+  BUF    (4)  커밋 후에만 버퍼 적재(롤백 시 제외), batch_size 도달 시 bulk_create, flush 로 잔여 기록,
+              백그라운드 스레드가 주기적으로 기록, created_at 은 로그 생성 시점 유지,
+              일괄 기록 실패 시 행 단위 재기록(문제 행만 제외)·DB 연결 오류 시 상한 내 재대기
+"""
+import datetime
+import threading
+from unittest import mock
+
+from django.db import OperationalError, transaction
+from django.test import RequestFactory, TestCase, override_settings
+
+from scm_accounts.models import Company, User
+from scm_core import audit
+from scm_core.audit import AuditBuffer, audit_mode
+from scm_core.models import AuditLog
+from scm_core.utils import log_audit
+
+
+class AuditBufferTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='AUD', company_name='감사')
+        self.user = User.objects.create_user(
+            username='auduser', email='aud@test.com', password='testpass123',
+            name='감사', company=self.company,
+        )
+        self.request = RequestFactory().post('/api/wm/inventory/')
+        self.request.user = self.user
+
+    def _log(self, module, object_id):
+        return log_audit(request=self.request, action='CREATE', module=module,
+                         model_name='Inventory', object_id=object_id)
+
+    @override_settings(AUDIT_LOG_MODE='buffered', AUDIT_LOG_MODULE_MODES={'fi': 'sync'})
+    def test_mode_01_module_override(self):
+        """fi 는 동기 기록, 그 외 모듈은 버퍼 기록."""
+        self.assertEqual(audit_mode('fi'), 'sync')
+        self.assertEqual(audit_mode('wm'), 'buffered')
+
+        buffer = AuditBuffer(batch_size=10, flush_interval=None)
+        with mock.patch.object(audit, '_buffer', buffer), self.captureOnCommitCallbacks(execute=True):
+            self.assertIsNotNone(self._log('fi', 1).pk)
+            self.assertIsNone(self._log('wm', 2).pk)
+        self.assertEqual(list(AuditLog.objects.values_list('module', flat=True)), ['fi'])
+        self.assertEqual(len(buffer), 1)
+
+    @override_settings(AUDIT_LOG_MODE='buffered')
+    def test_buf_01_batches_after_commit(self):
+        """커밋된 로그만 버퍼에 쌓이고 batch_size 마다 bulk_create, flush 로 잔여 기록."""
+        buffer = AuditBuffer(batch_size=3, flush_interval=None)
+        with mock.patch.object(audit, '_buffer', buffer):
+            with self.captureOnCommitCallbacks(execute=True):
+                for i in range(4):
+                    self._log('wm', i)
+                try:
+                    with transaction.atomic():
+                        self._log('wm', 99)
+                        raise ValueError('rollback')
+                except ValueError:
+                    pass
+                self.assertEqual(AuditLog.objects.count(), 0)   # 커밋 전
+            self.assertEqual(AuditLog.objects.count(), 3)
+            self.assertEqual(audit.flush(), 1)
+        self.assertEqual(sorted(AuditLog.objects.values_list('object_id', flat=True)), [0, 1, 2, 3])
+
+    def test_buf_02_worker_thread_flushes_on_interval(self):
+        """백그라운드 스레드가 주기마다 버퍼를 기록한다."""
+        written = []
+        done = threading.Event()
+
+        class RecordingBuffer(AuditBuffer):
+            def _write(self, batch):
+                written.extend(batch)
+                done.set()
+
+        buffer = RecordingBuffer(batch_size=100, flush_interval=0.05)
+        buffer.add('a')
+        buffer.add('b')
+        self.assertTrue(done.wait(2))
+        self.assertEqual(written, ['a', 'b'])
+        self.assertEqual(len(buffer), 0)
+
+    @override_settings(AUDIT_LOG_MODE='buffered')
+    def test_buf_03_created_at_stamped_when_built(self):
+        """buffered 로그는 늦게 저장돼도 log_audit 호출 시각을 created_at 으로 기록한다."""
+        buffer = AuditBuffer(batch_size=10, flush_interval=None)
+        with mock.patch.object(audit, '_buffer', buffer), self.captureOnCommitCallbacks(execute=True):
+            entry = self._log('wm', 1)
+        built_at = entry.created_at
+        later = built_at + datetime.timedelta(minutes=5)
+        with mock.patch('django.utils.timezone.now', return_value=later):
+            self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(AuditLog.objects.get().created_at, built_at)
+
+    def test_buf_04_failed_batch_falls_back_and_requeues(self):
+        """일괄 기록 실패 시 행 단위로 기록하고, 연결 오류 행부터는 상한 안에서 버퍼에 되돌린다."""
+        written = []
+        state = {'down': False}
+
+        class FlakyBuffer(AuditBuffer):
+            def _write(self, batch):
+                raise OperationalError('batch failed')
+
+            def _write_one(self, entry):
+                if state['down']:
+                    raise OperationalError('connection lost')
+                if entry == 'bad':
+                    raise ValueError('bad row')
+                written.append(entry)
+
+        buffer = FlakyBuffer(batch_size=10, flush_interval=None, max_pending=3)
+        for entry in ('a', 'bad', 'b'):
+            buffer.add(entry)
+        with self.assertLogs('scm_core.audit', 'WARNING'):
+            self.assertEqual(buffer.flush(), 2)
+        self.assertEqual((written, len(buffer)), (['a', 'b'], 0))
+
+        state['down'] = True
+        for entry in ('c', 'd', 'e', 'f'):
+            buffer.add(entry)
+        with self.assertLogs('scm_core.audit', 'ERROR'):
+            self.assertEqual(buffer.flush(), 0)
+        self.assertEqual(list(buffer._entries), ['d', 'e', 'f'])   # 상한 3 — 가장 오래된 c 제외
+
+        state['down'] = False
+        self.assertEqual(buffer.flush(), 3)
+        self.assertEqual(written, ['a', 'b', 'd', 'e', 'f'])
@@ -0,0 +1,154 @@
+"""
+감사 로그 보존 기간 테스트 — manage_audit_partitions / scm_core.partitions / API 날짜 필터
+
+커버리지:
+  RET (5)  월 경계 계산, 보존 기간 이전 행을 gzip CSV 로 내보내고 삭제(비 PostgreSQL 경로),
+           date_from/date_to 필터가 created_at 범위 조건으로 동작,
+           보존 기간 미설정이면 삭제 없음, 정기 작업은 미전환 테이블을 경고 후 건너뜀
+  PG  (1)  (PostgreSQL 전용, config.test_settings_pg) 파티션 전환 시 기존 행 월 분할,
+           미래 월 파티션 생성, table(압축)·file 보관
+"""
+import csv
+import datetime
+import gzip
+import tempfile
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_core import partitions
+from scm_core.models import AuditLog
+from scm_core.tasks import maintain_audit_partitions
+
+
+class PartitionBoundsTests(SimpleTestCase):
+    def test_ret_01_month_bounds(self):
+        """파티션 경계는 UTC 월 1일, 이름은 _pYYYY_MM."""
+        utc = datetime.timezone.utc
+        start = partitions.month_start(datetime.datetime(2026, 3, 31, 23, 30, tzinfo=utc))
+        self.assertEqual(start, datetime.datetime(2026, 3, 1, tzinfo=utc))
+        self.assertEqual(partitions.add_months(start, 10), datetime.datetime(2027, 1, 1, tzinfo=utc))
+        self.assertEqual(partitions.add_months(start, -3), datetime.datetime(2025, 12, 1, tzinfo=utc))
+        self.assertEqual(partitions.partition_name(start), 'scm_core_auditlog_p2026_03')
+
+
+class AuditRetentionTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='RET', company_name='보존')
+        self.user = User.objects.create_user(
+            username='retuser', email='ret@test.com', password='testpass123',
+            name='보존', company=self.company, is_admin=True,
+        )
+        now = timezone.now()
+        for i, age in enumerate([0, 40, 400, 800]):   # 일 단위 경과
+            log = AuditLog.objects.create(company=self.company, user=self.user, action='CREATE',
+                                          module='wm', model_name='Inventory', object_id=i,
+                                          changes={'qty': i})
+            AuditLog.objects.filter(pk=log.pk).update(created_at=now - datetime.timedelta(days=age))
+
+    def test_ret_02_export_and_delete_old_rows(self):
+        """보존 기간(12개월) 이전 행은 gzip CSV 로 내보낸 뒤 삭제된다."""
+        with tempfile.TemporaryDirectory() as export_dir:
+            out = StringIO()
+            call_command('manage_audit_partitions', retain_months=12, export_dir=export_dir, stdout=out)
+            self.assertIn('2건', out.getvalue())
+            path = out.getvalue().split('→')[-1].strip()
+            with gzip.open(path, 'rt', encoding='utf-8') as fh:
+                rows = list(csv.DictReader(fh))
+        self.assertEqual(sorted(int(r['object_id']) for r in rows), [2, 3])
+        self.assertEqual(rows[0]['changes'], '{"qty": %s}' % rows[0]['object_id'])
+        self.assertEqual(sorted(AuditLog.objects.values_list('object_id', flat=True)), [0, 1])
+
+        with self.assertRaises(CommandError):   # 보관 테이블 방식은 PostgreSQL 전용
+            call_command('manage_audit_partitions', retain_months=12, archive='table', stdout=StringIO())
+
+    def test_ret_03_date_filter_uses_range(self):
+        """date_from/date_to 는 created_at 범위 비교(날짜 변환 없음)로 필터링한다."""
+        client = APIClient()
+        resp = client.post('/api/auth/login/', {'email': 'ret@test.com', 'password': 'testpass123'})
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {resp.data["access"]}')
+
+        today = timezone.localdate()
+        resp = client.get('/api/core/audit-logs/', {
+            'date_from': (today - datetime.timedelta(days=60)).isoformat(),
+            'date_to': today.isoformat(),
+        })
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(sorted(r['object_id'] for r in resp.data['results']), [0, 1])
+
+    @override_settings(AUDIT_LOG_RETAIN_MONTHS=0)
+    def test_ret_04_no_retention_by_default(self):
+        """보존 기간을 설정하지 않으면 정기 실행이 감사 로그를 삭제하지 않는다."""
+        maintain_audit_partitions()
+        self.assertEqual(AuditLog.objects.count(), 4)
+
+    def test_ret_05_beat_task_skips_unconverted_table(self):
+        """PostgreSQL 에서 파티션 전환 전이면 명령을 실행하지 않고 경고만 남긴다."""
+        with mock.patch.object(partitions, 'supported', return_value=True), \
+                mock.patch.object(partitions, 'is_partitioned', return_value=False), \
+                mock.patch('scm_core.tasks.call_command') as command, \
+                self.assertLogs('scm_core.tasks', 'WARNING'):
+            maintain_audit_partitions()
+        command.assert_not_called()
+
+
+@skipUnless(connection.vendor == 'postgresql', 'PostgreSQL 선언적 파티셔닝 전용 (config.test_settings_pg)')
+class AuditPartitionPostgresTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='PRT', company_name='파티션')
+        self.month = partitions.month_start(timezone.now())
+        for i, months in enumerate([0, -1, -14, -26]):
+            log = AuditLog.objects.create(company=self.company, action='CREATE', module='wm',
+                                          model_name='Inventory', object_id=i, changes={'qty': i})
+            created = partitions.add_months(self.month, months) + datetime.timedelta(days=3)
+            AuditLog.objects.filter(pk=log.pk).update(created_at=created)
+
+    def _partition_of(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT object_id, tableoid::regclass::text FROM {partitions.TABLE}')
+            return dict(cursor.fetchall())
+
+    def test_pg_01_convert_create_and_retire(self):
+        """전환 시 기존 행은 월 파티션으로 나뉘고, 미래 파티션 생성·table/file 보관이 동작한다."""
+        self.assertTrue(partitions.convert_to_partitioned(months_ahead=2))
+        self.assertTrue(partitions.is_partitioned())
+        self.assertFalse(partitions.convert_to_partitioned())
+        names = {name for name, *_ in partitions.list_partitions()}
+        self.assertNotIn(partitions.LEGACY_PARTITION, names)
+        self.assertEqual(self._partition_of(), {
+            i: partitions.partition_name(partitions.add_months(self.month, months))
+            for i, months in enumerate([0, -1, -14, -26])
+        })
+        self.assertIn(partitions.partition_name(partitions.add_months(self.month, 2)), names)
+        AuditLog.objects.create(company=self.company, action='CREATE', module='wm',
+                                model_name='Inventory', object_id=9)   # 공유 시퀀스로 id 발급
+        self.assertEqual(AuditLog.objects.count(), 5)
+
+        created = partitions.ensure_partitions(months_ahead=4)
+        self.assertEqual(created, [partitions.partition_name(partitions.add_months(self.month, m))
+                                   for m in (3, 4)])
+
+        oldest = partitions.partition_name(partitions.add_months(self.month, -26))
+        retired = dict(partitions.retire_partitions(partitions.add_months(self.month, -20), mode='table'))
+        self.assertEqual(len(retired), 6)   # -26 ~ -21 개월 (빈 월 파티션 포함)
+        self.assertEqual(retired[oldest], partitions.ARCHIVE_TABLE)
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT object_id FROM {partitions.ARCHIVE_TABLE}')
+            self.assertEqual(cursor.fetchall(), [(3,)])
+            cursor.execute('SELECT reloptions FROM pg_class WHERE relname = %s', [oldest])
+            self.assertIn('toast_tuple_target=128', cursor.fetchone()[0])
+
+        with tempfile.TemporaryDirectory() as export_dir:
+            retired = dict(partitions.retire_partitions(partitions.add_months(self.month, -12),
+                                                        export_dir=export_dir))
+            self.assertEqual(len(retired), 8)   # -20 ~ -13 개월
+            path = retired[partitions.partition_name(partitions.add_months(self.month, -14))]
+            with gzip.open(path, 'rt', encoding='utf-8') as fh:
+                self.assertEqual([r['object_id'] for r in csv.DictReader(fh)], ['2'])
+        self.assertEqual(sorted(AuditLog.objects.values_list('object_id', flat=True)), [0, 1, 9])
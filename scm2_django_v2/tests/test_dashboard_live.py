@@ -0,0 +1,157 @@
+"""
+대시보드 실시간 KPI 테스트 — DashboardConsumer / signal 증감 push
+
+커버리지:
+  DELTA (3)  발주 상태 전환·결재 완료·재고이동 생성 시 회사 그룹으로 kpi_delta 전송 (커밋 후),
+             증감 누적 = 요약 재계산 값, 이전 값은 메모리에서 (저장 전 SELECT 없음)
+  WS    (1)  JWT 로 접속 → kpi_snapshot 수신 → 이후 kpi_delta 수신, 회사 없는 사용자는 거부
+"""
+import asyncio
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken
+
+from scm_accounts.models import Company, User
+from scm_dashboard.push import dashboard_group, push_kpi_delta
+from scm_dashboard.routing import websocket_urlpatterns
+from scm_dashboard.summary import build_summary
+from scm_mm.models import Material, PurchaseOrder
+from scm_notifications.middleware import JwtAuthMiddleware
+from scm_wm.models import StockMovement
+from scm_workflow.models import ApprovalRequest
+
+
+class DashboardDeltaTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='LIVE', company_name='실시간')
+        self.user = User.objects.create_user(
+            username='liveuser', email='live@test.com', password='testpass123',
+            name='실시간', company=self.company,
+        )
+        self.layer = get_channel_layer()
+        self.channel = async_to_sync(self.layer.new_channel)()
+        async_to_sync(self.layer.group_add)(dashboard_group(self.company.pk), self.channel)
+
+    def _receive(self):
+        return async_to_sync(self.layer.receive)(self.channel)['data']
+
+    def _drain(self):
+        """대기 중인 메시지를 모두 수신 (0.2초 동안 새 메시지가 없으면 종료)."""
+        async def drain():
+            messages = []
+            while True:
+                try:
+                    message = await asyncio.wait_for(self.layer.receive(self.channel), 0.2)
+                except asyncio.TimeoutError:
+                    return messages
+                messages.append(message['data'])
+        return async_to_sync(drain)()
+
+    def test_delta_01_status_transition_pushed_after_commit(self):
+        """발주 발주확정 → 납품중: 커밋 후 pending -1 / in_delivery +1 이 전송된다."""
+        with self.captureOnCommitCallbacks(execute=True):
+            po = PurchaseOrder.objects.create(company=self.company, po_number='PO-LIVE-1',
+                                              item_name='자재', quantity=1,
+                                              unit_price=Decimal('10'), status='발주확정')
+        self.assertEqual(self._receive(), {'type': 'kpi_delta', 'deltas': {'mm': {'pending_orders': 1}}})
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            po.status = '납품중'
+            po.save()
+        self.assertEqual(self._drain(), [])   # 커밋 전에는 전송하지 않음
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self._receive()['deltas'], {'mm': {'in_delivery': 1, 'pending_orders': -1}})
+
+    def test_delta_02_accumulated_deltas_match_summary(self):
+        """결재·재고이동 증감을 스냅샷에 더한 값 = 요약 재계산 값."""
+        snapshot = build_summary(self.company)
+        material = Material.objects.create(company=self.company, material_code='LV-1', material_name='LV-1')
+        with self.captureOnCommitCallbacks(execute=True):
+            req = ApprovalRequest.objects.create(
+                company=self.company, requester=self.user, title='결재',
+                content_type=ContentType.objects.get_for_model(Material), object_id=material.pk,
+            )
+            StockMovement.objects.create(company=self.company, movement_type='IN',
+                                         material_code='LV-1', quantity=Decimal('5'))
+            req.status = 'approved'
+            req.save()
+
+        totals = {}
+        for message in self._drain():
+            for module, changes in message['deltas'].items():
+                for key, value in changes.items():
+                    totals[(module, key)] = totals.get((module, key), 0) + value
+
+        fresh = build_summary(self.company)
+        for (module, key), value in totals.items():
+            self.assertEqual(snapshot[module][key] + value, fresh[module][key], (module, key))
+        self.assertEqual(totals.get(('wm', 'movements_today')), 1)
+        self.assertEqual(totals.get(('workflow', 'pending_approvals'), 0), 0)
+
+
+    def test_delta_03_previous_values_without_reselect(self):
+        """조회한 발주의 상태 전환은 저장 전 재조회 없이 증감을 계산하고, 기여 필드 밖 저장은 건너뛴다."""
+        PurchaseOrder.objects.create(company=self.company, po_number='PO-LIVE-2', item_name='자재',
+                                     quantity=1, unit_price=Decimal('10'), status='발주확정')
+        po = PurchaseOrder.objects.get(po_number='PO-LIVE-2')
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as ctx:
+                po.status = '납품중'
+                po.save()
+                po.item_name = '자재2'
+                po.save(update_fields=['item_name'])
+        # 이전 행 재조회(.first() → LIMIT 1) 없음 — 다른 모듈 signal 의 .get() 은 제외
+        reselects = [q['sql'] for q in ctx.captured_queries
+                     if 'FROM "scm_mm_purchaseorder"' in q['sql'] and q['sql'].endswith('LIMIT 1')]
+        self.assertEqual(reselects, [])
+        self.assertEqual([m['deltas'] for m in self._drain()],
+                         [{'mm': {'in_delivery': 1, 'pending_orders': -1}}])
+
+
+class DashboardConsumerTests(TransactionTestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='LIVEWS', company_name='실시간WS')
+        self.user = User.objects.create_user(
+            username='wsuser', email='ws@test.com', password='testpass123',
+            name='WS', company=self.company,
+        )
+        self.loner = User.objects.create_user(
+            username='loner', email='loner@test.com', password='testpass123', name='무소속',
+        )
+        self.app = JwtAuthMiddleware(URLRouter(websocket_urlpatterns))
+
+    def _communicator(self, user):
+        return WebsocketCommunicator(self.app, f'/ws/dashboard/?token={AccessToken.for_user(user)}')
+
+    def test_ws_01_snapshot_then_delta(self):
+        async def scenario():
+            communicator = self._communicator(self.user)
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+            snapshot = await communicator.receive_json_from(timeout=5)
+            self.assertEqual(snapshot['type'], 'kpi_snapshot')
+            self.assertIn('mm', snapshot['data'])
+
+            await get_channel_layer().group_send(dashboard_group(self.company.pk), {
+                'type': 'kpi_message',
+                'data': {'type': 'kpi_delta', 'deltas': {'mm': {'pending_orders': 1}}},
+            })
+            delta = await communicator.receive_json_from(timeout=5)
+            self.assertEqual(delta['deltas'], {'mm': {'pending_orders': 1}})
+            await communicator.disconnect()
+
+            communicator = self._communicator(self.loner)
+            connected, _ = await communicator.connect()
+            self.assertFalse(connected)
+
+        async_to_sync(scenario)()
+        push_kpi_delta(self.company.pk, {})   # 빈 증감은 전송하지 않음 (예외 없음)
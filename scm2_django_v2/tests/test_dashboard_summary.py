@@ -0,0 +1,111 @@
+"""
+대시보드 요약 테스트 — 조건부 집계 / 회사별 캐시 / signal 무효화
+
+커버리지:
+  SUM   (1)  조건부 집계 KPI 값 + 쿼리 수 (테이블당 1회)
+  CACHE (4)  두 번째 요청은 집계 쿼리 없이 캐시 응답, 모델 저장·삭제 시 해당 회사 캐시 무효화,
+             연속 저장은 재계산 1회, 재계산 잠금 중에는 이전 요약 응답 (stale-while-revalidate)
+"""
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_dashboard.summary import _lock_key, build_summary, get_summary
+from scm_pp.models import ProductionOrder
+from scm_sd.models import SalesOrder
+from scm_wm.models import Inventory
+
+
+class DashboardSummaryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.company = Company.objects.create(company_code='DASH', company_name='대시')
+        self.other = Company.objects.create(company_code='DASH2', company_name='대시2')
+        self.user = User.objects.create_user(
+            username='dashuser', email='dash@test.com', password='testpass123',
+            name='대시', company=self.company,
+        )
+        self.client = APIClient()
+        resp = self.client.post('/api/auth/login/', {'email': 'dash@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {resp.data["access"]}')
+
+        for i, status in enumerate(['계획', '확정', '생산중', '생산중', '완료']):
+            ProductionOrder.objects.create(company=self.company, order_number=f'PO-D-{i}',
+                                           product_name='제품', planned_qty=10, status=status)
+        ProductionOrder.objects.create(company=self.other, order_number='PO-D-X',
+                                       product_name='타사', planned_qty=10, status='생산중')
+        Inventory.objects.create(company=self.company, item_code='D-1', item_name='D-1',
+                                 stock_qty=3, min_stock=5)
+        Inventory.objects.create(company=self.company, item_code='D-2', item_name='D-2',
+                                 stock_qty=30, min_stock=5)
+        SalesOrder.objects.create(company=self.company, order_number='SO-D-1', customer_name='고객',
+                                  item_name='제품', quantity=1, unit_price=Decimal('10'))
+
+    def test_sum_01_conditional_aggregation(self):
+        """모듈 KPI 가 회사 범위로 정확하고, 테이블당 한 번만 조회한다."""
+        with CaptureQueriesContext(connection) as ctx:
+            data = build_summary(self.company)
+        self.assertLessEqual(len(ctx.captured_queries), 12)
+        # 수주 저장 시 SD signal 이 재고 부족분 생산오더(계획)를 1건 자동 생성
+        self.assertEqual(data['pp'], {'total': 6, 'in_progress': 2, 'completed': 1,
+                                      'planned': 2, 'confirmed': 1})
+        self.assertEqual(data['wm']['total_items'], 2)
+        self.assertEqual(data['wm']['low_stock'], 1)
+        self.assertEqual(data['sd']['monthly_orders'], 1)
+        self.assertEqual(data['sd']['new_orders'], 1)
+        self.assertEqual(data['fi']['budget_execution_rate'], 0)
+
+    def test_cache_01_second_request_served_from_cache(self):
+        """두 번째 요청은 집계 쿼리를 실행하지 않는다."""
+        first = self.client.get('/api/dashboard/summary/')
+        self.assertEqual(first.status_code, 200)
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get('/api/dashboard/summary/')
+        self.assertEqual(second.data, first.data)
+        self.assertFalse([q for q in ctx.captured_queries if 'production' in q['sql'].lower()])
+
+    def test_cache_02_signal_invalidates_company_summary(self):
+        """생산오더 저장·삭제 시 해당 회사 캐시가 무효화되어 새 값이 반영된다."""
+        self.assertEqual(self.client.get('/api/dashboard/summary/').data['pp']['completed'], 1)
+
+        order = ProductionOrder.objects.get(order_number='PO-D-2')
+        order.status = '완료'
+        order.save()
+        self.assertEqual(self.client.get('/api/dashboard/summary/').data['pp']['completed'], 2)
+
+        order.delete()
+        self.assertEqual(self.client.get('/api/dashboard/summary/').data['pp']['total'], 5)
+
+    def test_cache_03_burst_of_saves_recomputes_once(self):
+        """재고 저장이 여러 번 이어져도 캐시는 남고, 다음 조회에서 한 번만 다시 계산한다."""
+        self.assertEqual(get_summary(self.company)['wm']['low_stock'], 1)
+        inventory = Inventory.objects.get(item_code='D-2')
+        for qty in (4, 3, 2):
+            inventory.stock_qty = qty
+            inventory.save()
+        self.assertIsNotNone(cache.get('dashboard:summary:%s' % self.company.pk))
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(get_summary(self.company)['wm']['low_stock'], 2)
+        inventory_queries = [q for q in ctx.captured_queries if 'scm_wm_inventory' in q['sql']]
+        self.assertEqual(len(inventory_queries), 1)
+        with self.assertNumQueries(0):
+            get_summary(self.company)
+
+    def test_cache_04_stale_summary_served_while_locked(self):
+        """다른 요청이 재계산 잠금을 잡고 있으면 집계하지 않고 이전 요약을 돌려준다."""
+        get_summary(self.company)
+        order = ProductionOrder.objects.get(order_number='PO-D-2')
+        order.status = '완료'
+        order.save()
+
+        cache.add(_lock_key(self.company.pk), 1, 30)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_summary(self.company)['pp']['completed'], 1)
+        cache.delete(_lock_key(self.company.pk))
+        self.assertEqual(get_summary(self.company)['pp']['completed'], 2)
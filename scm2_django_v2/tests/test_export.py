@@ -0,0 +1,90 @@
+"""
+목록 내보내기 테스트 — scm_core.mixins.ExportMixin (CSV 스트리밍 / XLSX)
+
+커버리지:
+  EXP (3)  CSV 스트리밍 + 목록 필터·검색 적용 + 회사 범위, XLSX 헤더·행,
+           FI 전표 필터 → 라인 단위 분개장 / 잘못된 형식 400
+"""
+import csv
+import datetime
+import io
+from decimal import Decimal
+
+from django.test import TestCase
+from django.http import StreamingHttpResponse
+from openpyxl import load_workbook
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_fi.models import Account, AccountMove, AccountMoveLine
+from scm_wm.models import StockMovement, Warehouse
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='EXP', company_name='내보내기')
+        other = Company.objects.create(company_code='EXP2', company_name='타사')
+        self.user = User.objects.create_user(
+            username='expuser', email='exp@test.com', password='testpass123',
+            name='내보내기', company=self.company,
+        )
+        self.client = APIClient()
+        resp = self.client.post('/api/auth/login/', {'email': 'exp@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {resp.data["access"]}')
+
+        wh = Warehouse.objects.create(company=self.company, warehouse_code='EXP-WH', warehouse_name='본창고')
+        for i in range(250):   # max_page_size(200) 초과
+            StockMovement.objects.create(company=self.company, warehouse=wh,
+                                         movement_type='IN' if i % 2 else 'OUT',
+                                         material_code=f'MAT-{i:03d}', quantity=Decimal(i))
+        StockMovement.objects.create(company=other, movement_type='IN', material_code='MAT-X',
+                                     quantity=Decimal('1'))
+
+    def _csv(self, resp):
+        self.assertIsInstance(resp, StreamingHttpResponse)
+        body = b''.join(resp.streaming_content).decode('utf-8-sig')
+        return list(csv.reader(io.StringIO(body)))
+
+    def test_exp_01_csv_streams_filtered_rows(self):
+        """CSV 는 스트리밍 응답이며 페이지 제한 없이 필터·검색 결과 전체를 내보낸다."""
+        resp = self.client.get('/api/wm/movements/export/')
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn('stock_movements_', resp['Content-Disposition'])
+        rows = self._csv(resp)
+        self.assertEqual(rows[0][:3], ['일시', '유형', '자재코드'])
+        self.assertEqual(len(rows) - 1, 250)   # 타사 제외
+
+        rows = self._csv(self.client.get('/api/wm/movements/export/',
+                                         {'movement_type': 'IN', 'search': 'MAT-00'}))
+        self.assertEqual(sorted(r[2] for r in rows[1:]), ['MAT-001', 'MAT-003', 'MAT-005',
+                                                          'MAT-007', 'MAT-009'])
+        self.assertEqual(rows[1][5], '본창고')
+
+    def test_exp_02_xlsx(self):
+        """XLSX 는 헤더 + 필터 결과 행을 담은 워크북을 돌려준다."""
+        resp = self.client.get('/api/wm/movements/export/',
+                               {'export_format': 'xlsx', 'movement_type': 'OUT'})
+        self.assertEqual(resp.status_code, 200)
+        workbook = load_workbook(io.BytesIO(b''.join(resp.streaming_content)), read_only=True)
+        rows = list(workbook.active.iter_rows(values_only=True))
+        self.assertEqual(rows[0][2], '자재코드')
+        self.assertEqual(len(rows) - 1, 125)
+        self.assertIsInstance(rows[1][0], datetime.datetime)
+
+        resp = self.client.get('/api/wm/movements/export/', {'export_format': 'pdf'})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_exp_03_journal_lines(self):
+        """FI 전표 내보내기는 전표 필터를 적용한 라인 단위 분개장이다."""
+        cash = Account.objects.create(company=self.company, code='101', name='현금', account_type='ASSET')
+        sales = Account.objects.create(company=self.company, code='401', name='매출', account_type='REVENUE')
+        for i, state in enumerate(['POSTED', 'DRAFT']):
+            move = AccountMove.objects.create(company=self.company, move_number=f'JE-EXP-{i}',
+                                              move_type='SALE', posting_date=datetime.date(2026, 1, 1),
+                                              state=state)
+            AccountMoveLine.objects.create(move=move, account=cash, debit=Decimal('10'))
+            AccountMoveLine.objects.create(move=move, account=sales, credit=Decimal('10'))
+
+        rows = self._csv(self.client.get('/api/fi/moves/export/', {'state': 'POSTED'}))
+        self.assertEqual(rows[0][:2], ['전표번호', '전기일'])
+        self.assertEqual([(r[0], r[4]) for r in rows[1:]], [('JE-EXP-0', '101'), ('JE-EXP-0', '401')])
@@ -0,0 +1,126 @@
+"""
+FI 계정별 월 잔액 테스트 — 전표 확정·취소·라인 변경 증감 / 재무제표 / 재검증 명령
+
+커버리지:
+  BAL   (2)  확정 시 +, 확정 후 라인 수정·전기일 변경 반영, 취소 시 −, 기간 마감 시 재계산·고정
+  STMT  (1)  재무제표 API = 전표 라인 전수 집계, 월 잔액 테이블만 조회
+  CMD   (1)  reconcile_account_balances 가 변조를 검출하고 --fix 로 복구
+"""
+import datetime
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_fi.balances import materialized, reconcile
+from scm_fi.models import Account, AccountingPeriod, AccountMonthlyBalance, AccountMove, AccountMoveLine
+
+
+class AccountBalanceTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='BAL', company_name='잔액')
+        self.user = User.objects.create_user(
+            username='baluser', email='bal@test.com', password='testpass123',
+            name='잔액', company=self.company,
+        )
+        self.client = APIClient()
+        resp = self.client.post('/api/auth/login/', {'email': 'bal@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {resp.data["access"]}')
+
+        self.cash = Account.objects.create(company=self.company, code='101', name='현금', account_type='ASSET')
+        self.sales = Account.objects.create(company=self.company, code='401', name='매출', account_type='REVENUE')
+        self.cost = Account.objects.create(company=self.company, code='501', name='원가', account_type='EXPENSE')
+
+    def _move(self, number, day, amount, debit_account=None, credit_account=None):
+        move = AccountMove.objects.create(company=self.company, move_number=number, move_type='SALE',
+                                          posting_date=day)
+        AccountMoveLine.objects.create(move=move, account=debit_account or self.cash, debit=amount)
+        AccountMoveLine.objects.create(move=move, account=credit_account or self.sales, credit=amount)
+        return move
+
+    def _post(self, move):
+        resp = self.client.post(f'/api/fi/moves/{move.pk}/post/')
+        self.assertEqual(resp.status_code, 200, resp.data)
+
+    def test_bal_01_post_edit_cancel(self):
+        """확정 +, 확정 후 라인 수정·전기일 변경, 취소 − 가 월 잔액에 반영된다."""
+        move = self._move('JE-BAL-1', datetime.date(2026, 3, 5), Decimal('100'))
+        self.assertEqual(materialized(self.company), {})   # DRAFT 는 반영하지 않음
+
+        self._post(move)
+        self.assertEqual(materialized(self.company), {
+            (self.cash.pk, 2026, 3): (Decimal('100'), Decimal('0')),
+            (self.sales.pk, 2026, 3): (Decimal('0'), Decimal('100')),
+        })
+
+        line = move.lines.get(account=self.cash)
+        line.debit = Decimal('120')
+        line.save()
+        AccountMoveLine.objects.create(move=move, account=self.sales, credit=Decimal('20'))
+        move.refresh_from_db()
+        move.posting_date = datetime.date(2026, 4, 1)
+        move.save()
+        self.assertEqual(materialized(self.company), {
+            (self.cash.pk, 2026, 4): (Decimal('120'), Decimal('0')),
+            (self.sales.pk, 2026, 4): (Decimal('0'), Decimal('120')),
+        })
+        self.assertEqual(reconcile(self.company), [])
+
+        resp = self.client.post(f'/api/fi/moves/{move.pk}/cancel/')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(materialized(self.company), {})
+
+    def test_bal_02_period_close_rebuilds_and_locks(self):
+        """기간 마감 시 해당 월을 전수 집계로 재작성하고 is_closed 를 설정, 재개 시 해제."""
+        self._post(self._move('JE-BAL-2', datetime.date(2026, 5, 10), Decimal('50')))
+        AccountMonthlyBalance.objects.filter(company=self.company).update(debit=Decimal('999'))
+
+        period = AccountingPeriod.objects.create(company=self.company, year=2026, month=5)
+        resp = self.client.post(f'/api/fi/periods/{period.pk}/close/')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(reconcile(self.company, 2026, 5), [])
+        rows = AccountMonthlyBalance.objects.filter(company=self.company, year=2026, month=5)
+        self.assertTrue(all(r.is_closed for r in rows))
+
+        self.client.post(f'/api/fi/periods/{period.pk}/reopen/')
+        self.assertFalse(rows.filter(is_closed=True).exists())
+
+    def test_stmt_01_statement_matches_full_scan(self):
+        """손익계산서 값 = 전표 라인 전수 집계, 전표 라인 테이블은 조회하지 않는다."""
+        for i, (day, amount) in enumerate([(5, '100'), (17, '40.50'), (28, '9.25')]):
+            self._post(self._move(f'JE-ST-{i}', datetime.date(2026, 6, day), Decimal(amount)))
+        self._post(self._move('JE-ST-C', datetime.date(2026, 6, 9), Decimal('30'),
+                              debit_account=self.cost, credit_account=self.cash))
+        self._move('JE-ST-D', datetime.date(2026, 6, 9), Decimal('1000'))   # DRAFT 제외
+
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get('/api/fi/statements/', {'year': 2026, 'month': 6, 'type': 'income'})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data['total_revenue'], 149.75)
+        self.assertEqual(resp.data['total_expense'], 30.0)
+        self.assertEqual(resp.data['net_income'], 119.75)
+        sql = ' '.join(q['sql'] for q in ctx.captured_queries)
+        self.assertIn('scm_fi_accountmonthlybalance', sql)
+        self.assertNotIn('scm_fi_accountmoveline', sql)
+
+        resp = self.client.get('/api/fi/statements/', {'year': 2026, 'type': 'balance'})
+        self.assertEqual(resp.data['total_assets'], 119.75)
+
+    def test_cmd_01_reconcile_detects_and_fixes(self):
+        """월 잔액 변조를 검출(CommandError)하고 --fix 로 복구한다."""
+        self._post(self._move('JE-CMD-1', datetime.date(2026, 7, 1), Decimal('10')))
+        call_command('reconcile_account_balances', company='BAL', stdout=StringIO())
+
+        AccountMonthlyBalance.objects.filter(account=self.cash).update(debit=Decimal('11'))
+        with self.assertRaises(CommandError):
+            call_command('reconcile_account_balances', company='BAL', year=2026, stdout=StringIO())
+
+        out = StringIO()
+        call_command('reconcile_account_balances', company='BAL', fix=True, stdout=out)
+        self.assertIn('재작성', out.getvalue())
+        self.assertEqual(reconcile(self.company), [])
@@ -0,0 +1,80 @@
+"""
+키셋 페이지네이션 테스트 — scm_core.pagination.KeysetPagination (?pagination=cursor)
+
+커버리지:
+  KEY (3)  next 로 끝까지 / previous 로 처음까지 순회 시 누락·중복 없음 (created_at 동률 포함),
+           COUNT·OFFSET 없는 쿼리, 기본 페이지 번호 응답 유지, 잘못된 cursor 404
+"""
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_wm.models import StockMovement
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='KEY', company_name='키셋')
+        self.user = User.objects.create_user(
+            username='keyuser', email='key@test.com', password='testpass123',
+            name='키셋', company=self.company,
+        )
+        self.client = APIClient()
+        resp = self.client.post('/api/auth/login/', {'email': 'key@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {resp.data["access"]}')
+
+        for i in range(45):
+            StockMovement.objects.create(company=self.company, movement_type='IN',
+                                         material_code=f'K-{i:02d}', quantity=Decimal('1'))
+        # 절반은 같은 created_at — id 가 순서를 결정해야 함
+        StockMovement.objects.filter(material_code__lt='K-20').update(created_at=timezone.now())
+        self.expected = list(StockMovement.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def _get(self, url, params=None):
+        resp = self.client.get(url, params)
+        self.assertEqual(resp.status_code, 200)
+        return resp.data
+
+    def test_key_01_walk_forward_and_back(self):
+        """next 링크로 끝까지, previous 링크로 처음까지 누락·중복 없이 순회한다."""
+        data = self._get('/api/wm/movements/', {'pagination': 'cursor', 'page_size': 10})
+        self.assertEqual(set(data), {'estimated_count', 'next', 'previous', 'results'})
+        self.assertIsNone(data['previous'])
+
+        pages = [[r['id'] for r in data['results']]]
+        while data['next']:
+            data = self._get(data['next'])
+            pages.append([r['id'] for r in data['results']])
+        self.assertEqual([i for page in pages for i in page], self.expected)
+        self.assertEqual([len(p) for p in pages], [10, 10, 10, 10, 5])
+
+        back = [[r['id'] for r in data['results']]]
+        while data['previous']:
+            data = self._get(data['previous'])
+            back.insert(0, [r['id'] for r in data['results']])
+        self.assertEqual(back, pages)
+
+    def test_key_02_no_count_or_offset(self):
+        """깊은 페이지도 COUNT(*)·OFFSET 없이 키 조건 + LIMIT 으로 조회한다."""
+        data = self._get('/api/wm/movements/', {'pagination': 'cursor', 'page_size': 10})
+        data = self._get(data['next'])
+        with CaptureQueriesContext(connection) as ctx:
+            self._get(data['next'])
+        sql = [q['sql'].upper() for q in ctx.captured_queries if 'STOCKMOVEMENT' in q['sql'].upper()]
+        self.assertEqual(len(sql), 1)
+        self.assertNotIn('COUNT(', sql[0])
+        self.assertNotIn('OFFSET', sql[0])
+
+    def test_key_03_default_and_invalid_cursor(self):
+        """파라미터가 없으면 기존 페이지 번호 응답, 잘못된 cursor 는 404."""
+        data = self._get('/api/wm/movements/')
+        self.assertEqual(data['count'], 45)
+        self.assertEqual(data['total_pages'], 3)
+
+        resp = self.client.get('/api/wm/movements/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(resp.status_code, 404)
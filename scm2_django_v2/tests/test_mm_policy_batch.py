@@ -0,0 +1,138 @@
+"""
+MM 일괄 재고정책 계산 테스트 — calc_policy_batch / /api/mm/calculator/policy-batch/
+
+커버리지:
+  CALC (1)  벡터 일괄 계산 = 단건 calc_eoq / calc_safety_stock / calc_reorder_point / classify_abc
+  API  (3)  열 배열 입력 계산·일괄 저장(upsert), 자재 마스터 + 출고 실적 기반 계산,
+            음수·비유한 입력과 중복 자재 코드 → 400 (저장 없음)
+"""
+import random
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_mm.models import Material, MaterialInventoryPolicy
+from scm_mm.utils import calc_eoq, calc_policy_batch, calc_reorder_point, calc_safety_stock, classify_abc
+from scm_wm.models import Inventory, StockMovement
+
+
+class PolicyBatchCalcTests(SimpleTestCase):
+    def test_calc_01_matches_scalar_functions_to_the_cent(self):
+        """무작위 2천 자재: 일괄 계산 결과가 단건 함수 결과와 전 항목 일치한다."""
+        rng = random.Random(7)
+        n = 2000
+        codes = [f'M{i:04d}' for i in range(n)]
+        value = [0 if rng.random() < 0.1 else round(rng.uniform(0, 1e6), 2) for _ in codes]
+        demand = [rng.choice([0, round(rng.uniform(1, 1e5), 2)]) for _ in codes]
+        avg = [round(rng.uniform(0, 500), 3) for _ in codes]
+        std = [round(rng.uniform(0, 50), 3) for _ in codes]
+        lead = [rng.choice([0, 0.5, 1, 2, 3, 7, 14]) for _ in codes]
+        order_cost = [round(rng.uniform(0, 1000), 2) for _ in codes]
+        holding = [rng.choice([0, round(rng.uniform(0.01, 100), 2)]) for _ in codes]
+        level = [rng.choice([0.5, 0.9, 0.95, 0.96, 0.975, 0.99, 1.0]) for _ in codes]
+
+        batch = calc_policy_batch(codes, value, demand, avg, std, lead, order_cost, holding, level)
+        abc = {
+            r['material_code']: r
+            for r in classify_abc([{'material_code': c, 'annual_value': v} for c, v in zip(codes, value)])
+        }
+        for i, code in enumerate(codes):
+            eoq = calc_eoq(demand[i], order_cost[i], holding[i])
+            ss = calc_safety_stock(std[i], lead[i], level[i])
+            rop = calc_reorder_point(avg[i], lead[i], ss['safety_stock'])
+            self.assertEqual(batch['abc_class'][i], abc[code]['abc_class'], code)
+            self.assertEqual(batch['cumulative_pct'][i], abc[code]['cumulative_pct'], code)
+            self.assertEqual(batch['eoq'][i], eoq.get('eoq'), code)
+            self.assertEqual(batch['annual_orders'][i], eoq.get('annual_orders'), code)
+            self.assertEqual(batch['cycle_days'][i], eoq.get('cycle_days'), code)
+            self.assertEqual(batch['z'][i], ss['z'], code)
+            self.assertEqual(batch['safety_stock'][i], ss['safety_stock'], code)
+            self.assertEqual(batch['rop'][i], rop['rop'], code)
+            self.assertEqual(batch['lead_time_demand'][i], rop['lead_time_demand'], code)
+
+
+class PolicyBatchApiTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='POLB', company_name='정책일괄')
+        self.user = User.objects.create_user(
+            username='poluser', email='pol@test.com', password='testpass123',
+            name='정책', company=self.company,
+        )
+        self.client = APIClient()
+        resp = self.client.post('/api/auth/login/', {'email': 'pol@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {resp.data["access"]}')
+        for code in ('PB-1', 'PB-2', 'PB-3'):
+            Material.objects.create(company=self.company, material_code=code, material_name=code,
+                                    lead_time_days=30)
+
+    def test_api_01_columns_calculated_and_upserted(self):
+        """열 배열 입력: 결과 반환 + 자재별 정책 저장, 재실행 시 갱신(중복 없음)."""
+        payload = {
+            'columns': {
+                'material_code': ['PB-1', 'PB-2', 'PB-3', 'UNKNOWN'],
+                'annual_value':  [900, 80, 20, 0],
+                'annual_demand': [1200, 600, 100, 0],
+                'avg_demand':    [100, 50, 8, 0],
+                'demand_std':    [20, 5, 1, 0],
+                'lead_time':     [1, 2, 0.5, 1],
+            },
+            'order_cost': 50000, 'holding_cost': 2000, 'service_level': 0.95,
+        }
+        resp = self.client.post('/api/mm/calculator/policy-batch/', payload, format='json')
+        self.assertEqual(resp.status_code, 200, resp.data)
+        self.assertEqual(resp.data['count'], 4)
+        self.assertEqual(resp.data['persisted'], 3)
+        first = resp.data['results'][0]
+        self.assertEqual(first['abc_class'], 'B')  # 900 / 1000 = 90%
+        self.assertEqual(first['eoq'], calc_eoq(1200, 50000, 2000)['eoq'])
+        self.assertEqual(first['rop'], 132.9)      # 100×1 + 1.645×20×1
+
+        payload['service_level'] = 0.99
+        self.client.post('/api/mm/calculator/policy-batch/', payload, format='json')
+        self.assertEqual(MaterialInventoryPolicy.objects.filter(company=self.company).count(), 3)
+        policy = MaterialInventoryPolicy.objects.get(material__material_code='PB-1')
+        self.assertEqual(policy.safety_stock, Decimal('46.52'))
+        self.assertEqual(policy.service_level, Decimal('0.990'))
+
+    def test_api_02_material_master_mode_uses_out_movements(self):
+        """columns 생략: 자재 마스터 전체를 출고 실적·재고단가로 계산한다."""
+        Inventory.objects.create(company=self.company, item_code='PB-1', item_name='PB-1',
+                                 stock_qty=10, unit_price=Decimal('1000'))
+        StockMovement.objects.create(company=self.company, movement_type='OUT',
+                                     material_code='PB-1', quantity=Decimal('120'))
+
+        resp = self.client.post('/api/mm/calculator/policy-batch/',
+                                {'order_cost': 10000, 'history_months': 12}, format='json')
+        self.assertEqual(resp.status_code, 200, resp.data)
+        rows = {r['material_code']: r for r in resp.data['results']}
+        self.assertEqual(set(rows), {'PB-1', 'PB-2', 'PB-3'})
+        self.assertEqual(rows['PB-1']['cumulative_pct'], 100.0)   # 출고 실적 있는 유일 자재
+        self.assertEqual(rows['PB-1']['lead_time_demand'], 10.0)   # 월평균 10 × 리드타임 1개월
+        self.assertIsNone(rows['PB-2']['eoq'])                      # 단가 없음 → 보관비 0
+        self.assertEqual(resp.data['persisted'], 3)
+
+        resp = self.client.post('/api/mm/calculator/policy-batch/', {}, format='json')
+        self.assertEqual(resp.status_code, 400)
+
+    def test_api_03_rejects_invalid_and_duplicate_columns(self):
+        """음수 리드타임·표준편차, nan, 중복 자재 코드는 계산·저장 전에 400."""
+        def payload(**overrides):
+            columns = {
+                'material_code': ['PB-1', 'PB-2'],
+                'annual_value':  [900, 80],
+                'annual_demand': [1200, 600],
+                'avg_demand':    [100, 50],
+                'demand_std':    [20, 5],
+                'lead_time':     [1, 2],
+            }
+            columns.update(overrides)
+            return {'columns': columns, 'order_cost': 50000, 'holding_cost': 2000}
+
+        for overrides in ({'lead_time': [1, -2]}, {'demand_std': [-1, 5]},
+                          {'annual_demand': [1200, 'nan']}, {'material_code': ['PB-1', 'PB-1']}):
+            resp = self.client.post('/api/mm/calculator/policy-batch/', payload(**overrides), format='json')
+            self.assertEqual(resp.status_code, 400, overrides)
+            self.assertIn(next(iter(overrides)), resp.data['error'])
+        self.assertFalse(MaterialInventoryPolicy.objects.filter(company=self.company).exists())
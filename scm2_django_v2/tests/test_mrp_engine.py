@@ -0,0 +1,428 @@
+"""
+MRP 엔진 테스트 — 집합 기반 BOM 전개 / MRP 실행
+
+커버리지:
+  BOM  (4)  다단계 전개 결과 = explode_bom, 공용부품 합산·LLC, 순환참조, 고정 쿼리 수
+  MRP  (4)  기간별 run_mrp, 재고·입고예정 차감, 오더 수 무관 쿼리 수, 진행률 WebSocket
+  NC   (4)  변경 자재 표시 signal, 일괄 재고 이동(apply_movements) 표시, 순변경 재계획·이관, 기준 실행 없을 때 전체 실행
+  NET  (2)  순소요량 일괄 계산 = 단건 계산, 자재 수 무관 쿼리 수
+  CACHE(5)  BOM 그래프 캐시 재사용·signal 무효화, 생산오더 저장은 그래프 미적재, 생산완료 최하위 자재 소비,
+            LLC·단위당 누적 계수 사전 계산, 비활성 BOM 소비도 캐시 사용
+"""
+import datetime
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_mm.models import Material, PurchaseOrder, PurchaseOrderLine
+from scm_pp.models import (BillOfMaterial, BomLine, MrpChangedMaterial, MrpPlannedOrder, MrpRun,
+                           ProductionOrder)
+from scm_pp.utils.mrp import (calculate_net_requirements, calculate_net_requirements_bulk, explode_bom,
+                              explode_bom_by_level, execute_mrp_run, get_bom_graph, invalidate_bom_graph,
+                              load_bom_graph)
+from scm_wm.models import Inventory, StockMovement
+
+
+def _bom(company, code, lines):
+    bom = BillOfMaterial.objects.create(company=company, bom_code=code, product_name=code)
+    for material_code, qty, scrap in lines:
+        BomLine.objects.create(
+            bom=bom, material_code=material_code, material_name=material_code,
+            quantity=Decimal(qty), scrap_rate=Decimal(scrap),
+        )
+    return bom
+
+
+class BomExplosionTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='MRPT', company_name='MRP테스트')
+
+    def test_bom_01_matches_recursive_explosion(self):
+        """트리형 BOM: 레벨별 전개 합계 = 기존 재귀 전개 (스크랩율 포함)."""
+        root = _bom(self.company, 'FG-1', [('SA-1', '2', '0'), ('RM-1', '1.5', '3')])
+        _bom(self.company, 'SA-1', [('SA-2', '3', '1.5'), ('RM-2', '0.25', '0')])
+        _bom(self.company, 'SA-2', [('RM-3', '7', '10')])
+
+        legacy = {}
+        for row in explode_bom(root.id, Decimal('13'), self.company.id):
+            legacy[row['material_code']] = legacy.get(row['material_code'], 0) + row['required_qty']
+
+        rows = explode_bom_by_level({root.id: Decimal('13')}, self.company.id)
+        self.assertEqual({r['material_code']: r['required_qty'] for r in rows}, legacy)
+        levels = {r['material_code']: r['level'] for r in rows}
+        self.assertEqual(levels, {'SA-1': 0, 'RM-1': 0, 'SA-2': 1, 'RM-2': 1, 'RM-3': 2})
+
+    def test_bom_02_shared_component_aggregated_at_low_level_code(self):
+        """공용 반제품은 합산 후 한 번만 전개되고, 가장 깊은 레벨을 LLC로 가진다."""
+        root = _bom(self.company, 'FG-2', [('SA-X', '1', '0'), ('SA-Y', '1', '0')])
+        _bom(self.company, 'SA-X', [('SA-Y', '2', '0')])
+        _bom(self.company, 'SA-Y', [('RM-Z', '4', '0')])
+
+        rows = {r['material_code']: r for r in explode_bom_by_level({root.id: 10}, self.company.id)}
+        self.assertEqual(rows['SA-Y']['required_qty'], Decimal('30.000'))
+        self.assertEqual(rows['SA-Y']['level'], 1)
+        self.assertEqual(rows['RM-Z']['required_qty'], Decimal('120.000'))
+        self.assertEqual(rows['RM-Z']['level'], 2)
+
+    def test_bom_03_cycle_is_not_reexploded(self):
+        """순환 BOM: 순환 라인은 소요량에만 포함되고 재전개되지 않는다."""
+        root = _bom(self.company, 'CY-A', [('CY-B', '1', '0')])
+        _bom(self.company, 'CY-B', [('CY-A', '2', '0'), ('RM-C', '1', '0')])
+
+        rows = {r['material_code']: r for r in explode_bom_by_level({root.id: 1}, self.company.id)}
+        self.assertEqual(rows['CY-A']['required_qty'], Decimal('2.000'))
+        self.assertFalse(rows['CY-A']['has_bom'])
+        self.assertEqual(rows['RM-C']['required_qty'], Decimal('1.000'))
+
+    def test_bom_04_constant_query_count(self):
+        """그래프 적재는 BOM 깊이와 무관하게 2회 쿼리, 전개는 0회 쿼리."""
+        root = _bom(self.company, 'DP-0', [('DP-1', '1', '0')])
+        for depth in range(1, 6):
+            _bom(self.company, f'DP-{depth}', [(f'DP-{depth + 1}', '2', '0'), ('RM', '1', '0')])
+
+        with self.assertNumQueries(2):
+            graph = load_bom_graph(self.company.id)
+        with self.assertNumQueries(0):
+            rows = explode_bom_by_level({root.id: 1}, self.company.id, graph)
+        self.assertEqual(next(r for r in rows if r['material_code'] == 'DP-6')['level'], 5)
+
+
+class MrpRunTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='MRPR', company_name='MRP실행')
+        self.user = User.objects.create_user(
+            username='mrpuser', email='mrp@test.com', password='testpass123',
+            name='MRP', company=self.company,
+        )
+        self.client = APIClient()
+        resp = self.client.post('/api/auth/login/', {'email': 'mrp@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {resp.data["access"]}')
+
+    def _order(self, number, bom, qty, start=None):
+        return ProductionOrder.objects.create(
+            company=self.company, order_number=number, bom=bom,
+            product_name=bom.product_name, planned_qty=qty, planned_start=start,
+        )
+
+    def test_mrp_01_run_mrp_explodes_pending_orders(self):
+        """run_mrp: 계획 상태 생산오더의 BOM 을 레벨별로 전개해 계획오더를 만든다."""
+        bom = _bom(self.company, 'FG-RUN', [('SA-RUN', '2', '0')])
+        _bom(self.company, 'SA-RUN', [('RM-RUN', '5', '0')])
+        self._order('PO-RUN-1', bom, 3)
+
+        resp = self.client.post('/api/pp/mrp-plans/run_mrp/')
+        self.assertEqual(resp.status_code, 202, resp.data)
+        self.assertEqual(resp.data['status'], '완료')
+        planned = {
+            p.material_code: (p.order_type, p.planned_qty)
+            for p in MrpPlannedOrder.objects.filter(mrp_run_id=resp.data['id'])
+        }
+        self.assertEqual(planned, {
+            'SA-RUN': ('생산', Decimal('6.000')),
+            'RM-RUN': ('구매', Decimal('30.000')),
+        })
+
+    def test_mrp_02_nets_inventory_and_scheduled_receipts_per_period(self):
+        """재고·미입고 발주를 기간별로 차감하고, 반제품 재고는 하위 소요를 줄인다."""
+        today = datetime.date.today()
+        bom = _bom(self.company, 'FG-NET', [('SA-NET', '1', '0'), ('RM-A', '2', '0')])
+        _bom(self.company, 'SA-NET', [('RM-B', '3', '0')])
+        Inventory.objects.create(company=self.company, item_code='SA-NET', item_name='SA', stock_qty=4)
+        mat = Material.objects.create(
+            company=self.company, material_code='RM-A', material_name='RM-A', lead_time_days=7,
+        )
+        po = PurchaseOrder.objects.create(
+            company=self.company, po_number='PO-NET-1', item_name='RM-A', quantity=5,
+            unit_price=Decimal('1'), delivery_date=today + datetime.timedelta(days=7),
+        )
+        PurchaseOrderLine.objects.create(po=po, material=mat, item_name='RM-A', quantity=5)
+        self._order('PO-NET-1', bom, 10)
+        self._order('PO-NET-2', bom, 10, start=today + datetime.timedelta(days=7))
+
+        resp = self.client.post('/api/pp/mrp-plans/run_mrp/', {'periods': 4})
+        self.assertEqual(resp.status_code, 202, resp.data)
+        plan = {
+            (p.material_code, p.period): p.planned_qty
+            for p in MrpPlannedOrder.objects.filter(mrp_run_id=resp.data['id'])
+        }
+        # SA-NET: 1기간 10 - 재고 4 = 6, 2기간 10
+        self.assertEqual(plan[('SA-NET', 1)], Decimal('6.000'))
+        self.assertEqual(plan[('SA-NET', 2)], Decimal('10.000'))
+        # RM-B: 반제품 계획오더(6, 10) × 3 — 리드타임 1기간이므로 둘 다 1기간 착수
+        self.assertEqual(plan[('RM-B', 1)], Decimal('48.000'))
+        # RM-A: 1기간 20, 2기간 20 - 입고예정 5
+        self.assertEqual(plan[('RM-A', 1)], Decimal('20.000'))
+        self.assertEqual(plan[('RM-A', 2)], Decimal('15.000'))
+
+    def test_mrp_03_query_count_independent_of_order_count(self):
+        """생산오더 수가 늘어도 MRP 실행 쿼리 수는 동일하다."""
+        bom = _bom(self.company, 'FG-Q', [('SA-Q', '1', '0')])
+        _bom(self.company, 'SA-Q', [('RM-Q', '2', '0')])
+        run = MrpRun.objects.create(company=self.company, run_number='MRP-Q1')
+        get_bom_graph(self.company.id)  # BOM 그래프 캐시 적재 후 비교
+
+        self._order('PO-Q-0', bom, 1)
+        with CaptureQueriesContext(connection) as small:
+            execute_mrp_run(run)
+        for i in range(1, 30):
+            self._order(f'PO-Q-{i}', bom, i)
+        with CaptureQueriesContext(connection) as large:
+            execute_mrp_run(run)
+        self.assertEqual(len(small), len(large))
+        self.assertEqual(run.total_items, 2)
+
+    def test_mrp_04_progress_streamed_to_user_channel(self):
+        """run_mrp: 진행률·완료 메시지가 notifications_user_{id} 그룹으로 전송된다."""
+        layer = get_channel_layer()
+        channel = async_to_sync(layer.new_channel)()
+        async_to_sync(layer.group_add)(f'notifications_user_{self.user.pk}', channel)
+
+        bom = _bom(self.company, 'FG-WS', [('SA-WS', '1', '0')])
+        _bom(self.company, 'SA-WS', [('RM-WS', '1', '0')])
+        self._order('PO-WS-1', bom, 5)
+        resp = self.client.post('/api/pp/mrp-plans/run_mrp/')
+        self.assertEqual(resp.status_code, 202, resp.data)
+
+        events = []
+        while True:
+            data = async_to_sync(layer.receive)(channel)['data']
+            events.append(data)
+            if data['type'] != 'mrp_progress':
+                break
+        self.assertEqual(events[-1]['type'], 'mrp_completed')
+        self.assertEqual(events[-1]['run_id'], resp.data['id'])
+        progress = [e for e in events if e['type'] == 'mrp_progress']
+        self.assertIn('netting', {e['stage'] for e in progress})
+        self.assertEqual(progress[-1]['percent'], 100)
+        self.assertIn('elapsed_sec', progress[-1])
+
+
+class NetChangeMrpTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='MRPN', company_name='순변경')
+        self.bom = _bom(self.company, 'FG-NC', [('SA-NC', '1', '0'), ('RM-A', '2', '0')])
+        _bom(self.company, 'SA-NC', [('RM-B', '3', '0')])
+        ProductionOrder.objects.create(
+            company=self.company, order_number='PO-NC-1', bom=self.bom,
+            product_name='FG-NC', planned_qty=10,
+        )
+
+    def _changed(self):
+        return set(MrpChangedMaterial.objects.filter(company=self.company)
+                   .values_list('material_code', flat=True))
+
+    def _receive(self, code, qty):
+        Inventory.objects.create(company=self.company, item_code=code, item_name=code, stock_qty=qty)
+        StockMovement.objects.create(
+            company=self.company, movement_type='IN', material_code=code, quantity=qty,
+        )
+
+    def _plan(self, run):
+        return {p.material_code: p.planned_qty for p in run.plan_lines.all()}
+
+    def test_nc_01_signals_mark_changed_materials(self):
+        """BOM·생산오더·재고이동 변경 시 해당 자재가 순변경 대상으로 표시된다."""
+        self.assertEqual(self._changed(), {'FG-NC', 'SA-NC', 'RM-A', 'RM-B'})
+        MrpChangedMaterial.objects.all().delete()
+
+        self._receive('RM-X', 1)
+        line = BomLine.objects.get(bom=self.bom, material_code='RM-A')
+        line.quantity = Decimal('4')
+        line.save()
+        self.assertEqual(self._changed(), {'RM-X', 'FG-NC', 'RM-A'})
+
+    def test_nc_02_replans_only_changed_materials_and_descendants(self):
+        """순변경 실행: 변경 자재와 하위 자재만 재계획하고 나머지 계획오더는 이관한다."""
+        full = MrpRun.objects.create(company=self.company, run_number='MRP-NC-0')
+        execute_mrp_run(full)
+        self.assertEqual(self._plan(full), {
+            'SA-NC': Decimal('10.000'), 'RM-A': Decimal('20.000'), 'RM-B': Decimal('30.000'),
+        })
+        self.assertEqual(self._changed(), set())
+
+        self._receive('RM-A', 5)
+        nc1 = MrpRun.objects.create(company=self.company, run_number='MRP-NC-1')
+        result = execute_mrp_run(nc1, net_change=True)
+        self.assertEqual(nc1.run_mode, '순변경')
+        self.assertEqual(result['total_items'], 1)
+        self.assertEqual(self._plan(nc1), {
+            'SA-NC': Decimal('10.000'), 'RM-A': Decimal('15.000'), 'RM-B': Decimal('30.000'),
+        })
+
+        # 반제품 재고 변동 → 반제품 + 하위 자재 재계획, RM-A 는 이관
+        self._receive('SA-NC', 4)
+        nc2 = MrpRun.objects.create(company=self.company, run_number='MRP-NC-2')
+        execute_mrp_run(nc2, net_change=True)
+        self.assertEqual(self._plan(nc2), {
+            'SA-NC': Decimal('6.000'), 'RM-A': Decimal('15.000'), 'RM-B': Decimal('18.000'),
+        })
+        self.assertEqual(self._changed(), set())
+
+    def test_nc_03_falls_back_to_full_run_without_base(self):
+        """직전 완료 실행이 없으면 전체 재생성으로 실행된다."""
+        run = MrpRun.objects.create(company=self.company, run_number='MRP-NC-F')
+        execute_mrp_run(run, net_change=True)
+        self.assertEqual(run.run_mode, '전체')
+        self.assertEqual(run.total_items, 3)
+
+    def test_nc_04_bulk_stock_movements_mark_changed(self):
+        """_adjust_inventory(bulk_create 경로) 재고 이동도 순변경 대상으로 표시된다."""
+        from scm_wm.signals import _adjust_inventory
+        MrpChangedMaterial.objects.all().delete()
+
+        _adjust_inventory(self.company, 'RM-A', 'RM-A', 5, 'IN', reference_type='GR', reference_document='GR-1')
+        self.assertEqual(self._changed(), {'RM-A'})
+
+
+class NetRequirementsBulkTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='NETB', company_name='순소요테스트')
+        self.today = datetime.date.today()
+
+    def _material(self, code, lead_time, stock, receipts):
+        mat = Material.objects.create(
+            company=self.company, material_code=code, material_name=code, lead_time_days=lead_time,
+        )
+        for qty in stock:
+            Inventory.objects.create(company=self.company, item_code=code, item_name=code, stock_qty=qty)
+        for i, (days, qty, status) in enumerate(receipts):
+            po = PurchaseOrder.objects.create(
+                company=self.company, po_number=f'PO-{code}-{i}', item_name=code, quantity=qty,
+                unit_price=Decimal('1'), status=status,
+                delivery_date=self.today + datetime.timedelta(days=days),
+            )
+            PurchaseOrderLine.objects.create(po=po, material=mat, item_name=code, quantity=qty)
+        return mat
+
+    def test_net_01_bulk_matches_single_calculation(self):
+        """일괄 계산 결과가 자재별 단건 계산과 동일하다 (창고 합계·납기·발주 상태 반영)."""
+        a = self._material('NB-A', 3, [10, 5], [(2, 20, '발주확정'), (10, 30, '납품중'), (1, 99, '취소')])
+        b = self._material('NB-B', 0, [], [(5, 8, '발주확정')])
+        c = self._material('NB-C', 30, [100], [])
+        requests = [
+            (a.id, Decimal('50'), self.today + datetime.timedelta(days=5)),
+            (a.id, Decimal('50'), self.today + datetime.timedelta(days=14)),
+            (b.id, Decimal('4.5'), self.today + datetime.timedelta(days=4)),
+            (b.id, Decimal('20'), self.today + datetime.timedelta(days=5)),
+            (c.id, Decimal('40'), self.today + datetime.timedelta(days=7)),
+            (999999, Decimal('1'), self.today),
+        ]
+        bulk = calculate_net_requirements_bulk(requests, self.company.id)
+        single = [
+            calculate_net_requirements(mid, gross, self.company.id, day)
+            for mid, gross, day in requests
+        ]
+        self.assertEqual(bulk, single)
+        self.assertEqual(bulk[0]['available'], Decimal('15.000'))
+        self.assertEqual(bulk[0]['incoming'], Decimal('20.000'))
+        self.assertEqual(bulk[0]['net'], Decimal('15.000'))
+        self.assertEqual(bulk[1]['net'], Decimal('0.000'))
+        self.assertTrue(bulk[4]['is_urgent'])
+
+    def test_net_02_constant_query_count(self):
+        """자재 수와 무관하게 3회 쿼리로 계산한다."""
+        mats = [self._material(f'NQ-{i}', i, [i], [(i, i + 1, '발주확정')]) for i in range(20)]
+        requests = [(m.id, Decimal('10'), self.today + datetime.timedelta(days=7)) for m in mats]
+        with self.assertNumQueries(3):
+            rows = calculate_net_requirements_bulk(requests, self.company.id)
+        self.assertEqual(len(rows), 20)
+        self.assertEqual(calculate_net_requirements_bulk([], self.company.id), [])
+
+
+class BomGraphCacheTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='BGC', company_name='BOM캐시')
+        self.root = _bom(self.company, 'FG-C', [('SA-C', '2', '0'), ('RM-1', '1', '3')])
+        _bom(self.company, 'SA-C', [('RM-1', '3', '0'), ('RM-2', '0.5', '0')])
+
+    def test_cache_01_reused_until_bom_changes(self):
+        """두 번째 조회는 쿼리 없이 캐시를 쓰고, BomLine 저장·삭제 시 재적재된다."""
+        graph = get_bom_graph(self.company.id)
+        with self.assertNumQueries(0):
+            self.assertIs(get_bom_graph(self.company.id), graph)
+
+        line = BomLine.objects.create(
+            bom=self.root, material_code='RM-3', material_name='RM-3', quantity=Decimal('1'),
+        )
+        with self.assertNumQueries(2):
+            graph = get_bom_graph(self.company.id)
+        self.assertIn('RM-3', {l['material_code'] for l in graph['lines'][self.root.id]})
+
+        line.delete()
+        self.assertNotIn(
+            'RM-3', {l['material_code'] for l in get_bom_graph(self.company.id)['lines'][self.root.id]},
+        )
+
+    def test_cache_02_production_order_save_does_not_load_graph(self):
+        """생산오더 저장 signal 은 BOM 코드만 조회하고 회사 BOM 그래프를 적재하지 않는다."""
+        invalidate_bom_graph(self.company.id)
+        with CaptureQueriesContext(connection) as ctx:
+            ProductionOrder.objects.create(
+                company=self.company, order_number='PO-CACHE-0', bom_id=self.root.id,
+                product_name='FG-C', planned_qty=1,
+            )
+        self.assertFalse([q['sql'] for q in ctx.captured_queries if 'scm_pp_bomline' in q['sql']])
+        self.assertIn('FG-C', set(MrpChangedMaterial.objects.filter(company=self.company)
+                                  .values_list('material_code', flat=True)))
+
+    def test_cache_03_production_completion_consumes_without_bom_queries(self):
+        """생산완료 시 캐시된 최하위 구성품 계수로 출고하며 BOM 테이블을 조회하지 않는다."""
+        for code in ('SA-C', 'RM-1', 'RM-2'):
+            Inventory.objects.create(company=self.company, item_code=code, item_name=code, stock_qty=100)
+        order = ProductionOrder.objects.create(
+            company=self.company, order_number='PO-CACHE-1', bom=self.root,
+            product_name='FG-C', planned_qty=10, status='확정',
+        )
+        get_bom_graph(self.company.id)
+
+        order.status = '완료'
+        with CaptureQueriesContext(connection) as ctx:
+            order.save()
+        bom_queries = [q['sql'] for q in ctx.captured_queries
+                       if 'scm_pp_bomline' in q['sql'] or 'scm_pp_billofmaterial' in q['sql']]
+        self.assertEqual(bom_queries, [])
+        stock = dict(Inventory.objects.filter(company=self.company).values_list('item_code', 'stock_qty'))
+        self.assertEqual(stock['SA-C'], 100)  # 반제품은 하위 구성품으로 전개되어 출고되지 않음
+        self.assertEqual(stock['RM-1'], 30)   # 10 × (2×3 + 1/0.97) = 70.3 → 정수 재고 단위로 절사
+        self.assertEqual(stock['RM-2'], 90)   # 10 × 2 × 0.5
+
+    def test_cache_04_low_level_codes_and_unit_requirements_precomputed(self):
+        """LLC·단위당 누적 계수는 적재 시 계산되고, 조회 시 추가 계산 없이 캐시를 재사용한다."""
+        graph = get_bom_graph(self.company.id)
+        self.assertEqual(graph['llc'], {'SA-C': 0, 'RM-1': 1, 'RM-2': 1})
+        unit = graph['unit_requirements'][self.root.id]
+        self.assertEqual(unit['SA-C'], Decimal('2'))
+        self.assertEqual(unit['RM-2'], Decimal('1'))
+        self.assertAlmostEqual(float(unit['RM-1']), 6 + 1 / 0.97, places=9)
+        self.assertNotIn('SA-C', graph['unit_consumption'][self.root.id])
+
+        rows = {r['material_code']: r for r in explode_bom_by_level({self.root.id: 10}, self.company.id)}
+        self.assertEqual({code: row['level'] for code, row in rows.items()}, graph['llc'])
+        self.assertIs(get_bom_graph(self.company.id)['unit_requirements'], graph['unit_requirements'])
+
+    def test_cache_05_inactive_bom_consumption_uses_cache(self):
+        """비활성 BOM 으로 발행된 생산오더도 캐시에서 소비 계수를 읽고 BOM 테이블을 조회하지 않는다."""
+        old_root = _bom(self.company, 'FG-OLD', [('SA-C', '1', '0')])
+        old_root.is_active = False
+        old_root.save()
+        Inventory.objects.create(company=self.company, item_code='RM-1', item_name='RM-1', stock_qty=100)
+        order = ProductionOrder.objects.create(
+            company=self.company, order_number='PO-CACHE-2', bom=old_root,
+            product_name='FG-OLD', planned_qty=10, status='확정',
+        )
+        graph = get_bom_graph(self.company.id)
+        self.assertNotIn(old_root.id, graph['boms'])
+
+        order.status = '완료'
+        with CaptureQueriesContext(connection) as ctx:
+            order.save()
+        self.assertFalse([q['sql'] for q in ctx.captured_queries
+                          if 'scm_pp_bomline' in q['sql'] or 'scm_pp_billofmaterial' in q['sql']])
+        stock = dict(Inventory.objects.filter(company=self.company).values_list('item_code', 'stock_qty'))
+        self.assertEqual(stock['RM-1'], 70)  # 10 × 1 × 3
@@ -0,0 +1,164 @@
+"""
+SPC 관리도 데이터 API 테스트 — GET /api/qm/spc-monitor/chart/
+
+커버리지:
+  RAW   (2)  점 수 ≤ max_points 면 전체, 넘으면 minmax·lttb 다운샘플 + 이상점 항상 포함,
+             관리한계 = imr_limits, 응답 크기 제한
+  BKT   (3)  RAW_LIMIT 초과: DB 구간 집계(개수·최소·최대) + 규칙 1 은 관리한계 밖 점만 조회,
+             런 규칙 청크 판정 = 전체 판정 (청크 경계 포함) + 위반점 구간 합산, RULE_LIMIT 초과 시 400
+  PARAM (1)  기간 필터·회사 범위·잘못된 파라미터 400
+"""
+import json
+import random
+from datetime import timedelta
+
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_core.analytics import spc
+from scm_qm.models import InspectionResult, SPCData
+
+URL = '/api/qm/spc-monitor/chart/'
+
+
+class SPCChartTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='CHT', company_name='관리도')
+        User.objects.create_user(username='chartuser', email='chart@test.com', password='testpass123',
+                                 name='관리도', company=self.company)
+        self.result = InspectionResult.objects.create(company=self.company, result_number='QR-CHT-1',
+                                                      item_name='샤프트')
+        self.client = APIClient()
+        res = self.client.post('/api/auth/login/', {'email': 'chart@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {res.data["access"]}')
+
+    def _load(self, n, spikes=(), name='외경', company=None, seed=1):
+        rng = random.Random(seed)
+        values = [round(10 + rng.gauss(0, 0.5), 4) for _ in range(n)]
+        for i in spikes:
+            values[i] = 20.0
+        company = company or self.company
+        result = self.result if company == self.company else InspectionResult.objects.create(
+            company=company, result_number=f'QR-{company.company_code}', item_name='타사')
+        rows = SPCData.objects.bulk_create(
+            [SPCData(company=company, inspection_result=result, measurement_name=name,
+                     measured_value=v, usl=12, lsl=8) for v in values],
+            batch_size=2000,
+        )
+        return values, rows
+
+    def _get(self, **params):
+        return self.client.get(URL, {'measurement_name': '외경', **params})
+
+    def test_raw_01_full_and_small(self):
+        values, rows = self._load(300, spikes=[150])
+        res = self._get()
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual(res.data['mode'], 'raw')
+        self.assertEqual(res.data['points']['id'], [r.pk for r in rows])
+        self.assertEqual(res.data['spec'], {'usl': 12.0, 'lsl': 8.0, 'target': None})
+        self.assertAlmostEqual(res.data['control_limits']['ucl_x'], round(spc.imr_limits(values)['ucl'], 6))
+        self.assertIn(rows[150].pk, res.data['violations']['id'])
+        k = res.data['violations']['id'].index(rows[150].pk)
+        self.assertIn(1, res.data['violations']['rules'][k])
+        self.assertIsNotNone(res.data['violations']['measured_at'][k])
+
+    def test_raw_02_downsample_keeps_violations(self):
+        spikes = [1234, 20000, 49990]
+        values, rows = self._load(50000, spikes=spikes)
+        for method in ('minmax', 'lttb'):
+            res = self._get(max_points=1000, method=method, rules='1,2,3,4,5,6,7,8')
+            self.assertEqual(res.status_code, 200, res.data)
+            self.assertEqual(res.data['mode'], method)
+            self.assertEqual(res.data['n'], 50000)
+            self.assertEqual(res.data['rules'], list(range(1, 9)))
+            violation_ids = res.data['violations']['id']
+            point_ids = res.data['points']['id']
+            self.assertLessEqual(len(point_ids), 1000 + 2 + len(violation_ids))
+            self.assertEqual(point_ids, sorted(point_ids))
+            self.assertTrue(set(violation_ids) <= set(point_ids))
+            self.assertTrue({rows[i].pk for i in spikes} <= set(violation_ids), method)
+            self.assertIn(rows[0].pk, point_ids)
+            self.assertIn(rows[-1].pk, point_ids)
+            size = len(json.dumps(res.data, default=str))
+            self.assertLess(size, 300_000, f'{method}: {size} bytes')
+
+    @override_settings(QM_SPC_CHART_RAW_LIMIT=1000)
+    def test_bkt_01_database_buckets(self):
+        values, rows = self._load(5000, spikes=[10, 4000])
+        res = self._get(max_points=100, rules='1')
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual(res.data['mode'], 'bucket')
+        self.assertEqual(res.data['rules'], [1])
+        buckets = res.data['buckets']
+        self.assertLessEqual(len(buckets['count']), 50)
+        self.assertEqual(sum(buckets['count']), 5000)
+        self.assertEqual(max(buckets['max']), 20.0)
+        self.assertEqual(min(buckets['min']), min(values))
+
+        limits = spc.imr_limits(values)
+        self.assertAlmostEqual(res.data['control_limits']['x_bar'], round(limits['center'], 6), places=4)
+        self.assertAlmostEqual(res.data['control_limits']['mr_bar'], round(limits['r_bar'], 6), places=4)
+        expected = spc.run_rule_ends(values, limits['ucl'], limits['lcl'], limits['center'])[1].tolist()
+        self.assertEqual(res.data['violations']['id'], [rows[i].pk for i in expected])
+        self.assertEqual(sum(buckets['violations']), len(expected))
+
+    @override_settings(QM_SPC_CHART_RAW_LIMIT=1000, QM_SPC_CHART_MAX_VIOLATIONS=20)
+    def test_bkt_02_run_rules_chunked_match_full_evaluation(self):
+        values, rows = self._load(5000, spikes=[10, 4000])
+        for i in range(2000, 2030):   # 청크 경계(700 배수)에 걸친 한쪽 쏠림 → 규칙 2·5·6
+            values[i] += 1.2
+        SPCData.objects.bulk_update([SPCData(pk=rows[i].pk, measured_value=values[i])
+                                     for i in range(2000, 2030)], ['measured_value'])
+        with mock.patch('scm_qm.spc_chart._RULE_CHUNK', 700):
+            res = self._get(max_points=100, rules='1,2,3,4,5,6,7,8')
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual(res.data['rules'], list(range(1, 9)))
+
+        limits = res.data['control_limits']
+        ends = spc.nelson_rule_ends(values, limits['ucl_x'], limits['x_bar'] - 3 * limits['sigma'],
+                                    limits['x_bar'])
+        expected = {}
+        for rule, rule_ends in ends.items():
+            for index in rule_ends.tolist():
+                expected.setdefault(rows[index].pk, []).append(rule)
+        self.assertIn(2, {rule for point in expected.values() for rule in point})
+
+        buckets = res.data['buckets']
+        self.assertEqual(sum(buckets['violations']), len(expected))
+        self.assertTrue(res.data['violations_truncated'])
+        listed = res.data['violations']
+        self.assertEqual(listed['id'], sorted(expected)[-20:])
+        self.assertEqual(listed['rules'], [expected[pk] for pk in listed['id']])
+        self.assertTrue(all(listed['measured_at']))
+
+    @override_settings(QM_SPC_CHART_RAW_LIMIT=100, QM_SPC_CHART_RULE_LIMIT=200)
+    def test_bkt_03_run_rules_rejected_above_limit(self):
+        self._load(300)
+        res = self._get(rules='1,2')
+        self.assertEqual(res.status_code, 400)
+        self.assertIn('error', res.data)
+        self.assertEqual(self._get(rules='1').status_code, 200)
+
+    def test_param_01_filters_and_validation(self):
+        _, rows = self._load(100)
+        other = Company.objects.create(company_code='OTC', company_name='타사')
+        self._load(50, company=other)
+        now = timezone.now()
+        SPCData.objects.filter(pk__in=[r.pk for r in rows[:40]]).update(measured_at=now - timedelta(days=3))
+
+        self.assertEqual(self._get().data['n'], 100)   # 타사 측정값 제외
+        since = (now - timedelta(days=1)).isoformat()
+        self.assertEqual(self._get(start=since).data['n'], 60)
+        self.assertEqual(self._get(end=(now - timedelta(days=2)).date().isoformat()).data['n'], 40)
+
+        self.assertEqual(self.client.get(URL).status_code, 400)
+        self.assertEqual(self._get(start='어제').status_code, 400)
+        self.assertEqual(self._get(method='random').status_code, 400)
+        self.assertEqual(self._get(rules='1,9').status_code, 400)
+        empty = self._get(measurement_name='없음')
+        self.assertEqual((empty.status_code, empty.data['n'], empty.data['points']['id']), (200, 0, []))
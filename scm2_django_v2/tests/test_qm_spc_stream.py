@@ -0,0 +1,163 @@
+"""
+SPC 스트리밍 상태 테스트 — scm_qm.spc_stream / GET·POST /api/qm/spc-monitor/
+
+커버리지:
+  CALC  (2)  stream_* 누적 결과 = 전체 재계산(imr_limits·capability), 규칙 3·4 = run_rule_ends
+  SIG   (2)  SPCData 저장마다 상태 갱신 (이력 길이와 무관한 쿼리 수),
+             진행 중인 위반은 규칙이 성립하는 동안 열려 있고 끊기면 닫힘, rebuild = 누적 상태
+  API   (2)  일괄 기록 → Cp/Cpk·위반 응답, 다른 회사 상태는 보이지 않음,
+             상태 갱신 실패 시 측정값도 저장하지 않음
+"""
+import random
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_core.analytics import spc
+from scm_qm import spc_stream
+from scm_qm.models import InspectionResult, SPCData, SPCStreamState
+
+
+def _series(n, seed=7):
+    rng = random.Random(seed)
+    return [round(10 + rng.gauss(0, 0.5), 4) for _ in range(n)]
+
+
+class StreamCalcTests(TestCase):
+    def test_calc_01_matches_batch(self):
+        values = _series(500)
+        state = spc.stream_init()
+        for x in values:
+            spc.stream_update(state, x)
+
+        batch = spc.imr_limits(values)
+        limits = spc.stream_limits(state)
+        for key in ('center', 'ucl', 'lcl', 'sigma', 'r_bar', 'ucl_r'):
+            self.assertAlmostEqual(limits[key], batch[key], places=9)
+        cap = spc.capability(values, usl=12, lsl=8, target=10)
+        stream_cap = spc.stream_capability(state, usl=12, lsl=8, target=10)
+        for key in ('std', 'cp', 'cpk', 'cpm'):
+            self.assertAlmostEqual(stream_cap[key], cap[key], places=9)
+
+    def test_calc_02_trend_rules_match_batch(self):
+        values = _series(300, seed=3)
+        values[50:60] = [9 + 0.1 * i for i in range(10)]             # 단조 증가
+        values[100:120] = [9 if i % 2 else 11 for i in range(20)]   # 교대 증감
+        state = spc.stream_init()
+        fired = {3: [], 4: []}
+        for i, x in enumerate(values):
+            for rule in spc.stream_update(state, x):
+                if rule in fired:
+                    fired[rule].append(i)
+        ends = spc.run_rule_ends(values, ucl=0, lcl=0, cl=0)
+        self.assertEqual(fired[3], ends[3].tolist())
+        self.assertEqual(fired[4], ends[4].tolist())
+        self.assertIn(55, fired[3])
+        self.assertIn(113, fired[4])
+
+
+class StreamSignalTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='SPC', company_name='공정')
+        self.result = InspectionResult.objects.create(company=self.company, result_number='QR-SPC-1',
+                                                      item_name='샤프트')
+
+    def _add(self, value, name='외경', **spec):
+        return SPCData.objects.create(company=self.company, inspection_result=self.result,
+                                      measurement_name=name, measured_value=value, **spec)
+
+    def test_sig_01_updates_per_insert_with_constant_queries(self):
+        values = _series(60)
+        for x in values[:10]:
+            self._add(x, usl=12, lsl=8)
+        with CaptureQueriesContext(connection) as early:
+            self._add(values[10])
+        for x in values[11:59]:
+            self._add(x)
+        with CaptureQueriesContext(connection) as late:
+            self._add(values[59])
+        self.assertEqual(len(late.captured_queries), len(early.captured_queries))
+
+        state = SPCStreamState.objects.get(company=self.company, measurement_name='외경')
+        self.assertEqual(state.n, 60)
+        self.assertEqual((state.usl, state.lsl), (12, 8))
+        snap = spc_stream.snapshot(state)
+        cap = spc.capability(values, usl=12, lsl=8)
+        self.assertAlmostEqual(snap['capability']['cpk'], round(cap['cpk'], 4))
+        self.assertAlmostEqual(snap['control_limits']['ucl_x'], round(spc.imr_limits(values)['ucl'], 6))
+
+    def test_sig_02_open_violations_and_rebuild(self):
+        for x in [10, 10.2, 9.8, 10.1, 9.9, 10.0, 10.1, 9.9]:
+            self._add(x)
+        rising = [self._add(9.0 + 0.05 * i) for i in range(7)]
+        state = SPCStreamState.objects.get(company=self.company, measurement_name='외경')
+        trend = {v['rule']: v for v in state.open_violations}[3]
+        self.assertEqual(trend['points'], 2)   # 6번째·7번째 상승 점
+        self.assertEqual(trend['first_data_id'], rising[5].pk)
+        self.assertEqual(trend['last_data_id'], rising[6].pk)
+
+        self._add(9.0)   # 하락 → 추세 위반 종료
+        state.refresh_from_db()
+        self.assertNotIn(3, [v['rule'] for v in state.open_violations])
+
+        incremental = {f: getattr(state, f) for f in spc.STREAM_FIELDS}
+        violations = state.open_violations
+        call_command('rebuild_spc_state', company='SPC', stdout=open('/dev/null', 'w'))
+        rebuilt = SPCStreamState.objects.get(company=self.company, measurement_name='외경')
+        for field, value in incremental.items():
+            self.assertAlmostEqual(getattr(rebuilt, field), value, places=9, msg=field)
+        self.assertEqual(rebuilt.open_violations, violations)
+
+
+class SPCMonitorApiTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='MON', company_name='모니터')
+        other = Company.objects.create(company_code='OTH', company_name='타사')
+        User.objects.create_user(username='qmuser', email='qm@test.com', password='testpass123',
+                                 name='품질', company=self.company)
+        self.result = InspectionResult.objects.create(company=self.company, result_number='QR-MON-1',
+                                                      item_name='샤프트')
+        other_result = InspectionResult.objects.create(company=other, result_number='QR-OTH-1', item_name='타사품')
+        SPCData.objects.create(company=other, inspection_result=other_result,
+                               measurement_name='외경', measured_value=1)
+        self.client = APIClient()
+        res = self.client.post('/api/auth/login/', {'email': 'qm@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {res.data["access"]}')
+
+    def test_api_01_record_and_monitor(self):
+        values = _series(200) + [20.0]   # 마지막 점은 관리한계 밖
+        res = self.client.post('/api/qm/spc-monitor/record/', {
+            'inspection_result': self.result.pk, 'measurement_name': '외경',
+            'values': values, 'usl': 12, 'lsl': 8,
+        }, format='json')
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(res.data['n'], 201)
+        self.assertEqual(SPCData.objects.filter(company=self.company).count(), 201)
+        self.assertEqual([v['rule'] for v in res.data['open_violations']], [1])
+
+        res = self.client.get('/api/qm/spc-monitor/', {'measurement_name': '외경'})
+        self.assertEqual(res.status_code, 200)
+        rows = res.data['results'] if isinstance(res.data, dict) else res.data
+        self.assertEqual(len(rows), 1)   # 타사 상태 제외
+        cap = spc.capability(values, usl=12, lsl=8)
+        self.assertAlmostEqual(rows[0]['capability']['cp'], round(cap['cp'], 4))
+        self.assertAlmostEqual(rows[0]['capability']['cpk'], round(cap['cpk'], 4))
+
+        res = self.client.post('/api/qm/spc-monitor/record/', {
+            'inspection_result': InspectionResult.objects.get(result_number='QR-OTH-1').pk,
+            'measurement_name': '외경', 'values': [1],
+        }, format='json')
+        self.assertEqual(res.status_code, 400)
+
+    def test_api_02_record_rolls_back_when_state_update_fails(self):
+        with mock.patch('scm_qm.spc_stream.ingest', side_effect=RuntimeError('state')):
+            with self.assertRaises(RuntimeError):
+                self.client.post('/api/qm/spc-monitor/record/', {
+                    'inspection_result': self.result.pk, 'measurement_name': '외경', 'values': [1, 2, 3],
+                }, format='json')
+        self.assertFalse(SPCData.objects.filter(company=self.company).exists())
@@ -0,0 +1,84 @@
+"""
+쿼리 예산 계측 테스트 — QueryBudgetMiddleware / QueryBudgetMixin / QueryBudgetTestMixin
+
+커버리지:
+  HDR    (1)  Server-Timing 헤더의 쿼리 수 = 실제 실행 쿼리 수, ser 항목 기록
+  LOG    (1)  settings.QUERY_BUDGETS 초과 시 scm_core.perf WARNING
+  BUDGET (1)  재고 대시보드·자재 소요계획·결재 대기함 action 별 예산 (행 수와 무관)
+"""
+import re
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_core.testing import QueryBudgetTestMixin
+from scm_mm.models import Material
+from scm_wm.models import Inventory, Warehouse
+from scm_workflow.models import ApprovalRequest, ApprovalStep, ApprovalTemplate
+
+
+class QueryBudgetTests(QueryBudgetTestMixin, TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='QBGT', company_name='예산')
+        self.user = User.objects.create_user(
+            username='qbuser', email='qb@test.com', password='testpass123',
+            name='예산', company=self.company, department='구매',
+        )
+        self.client = APIClient()
+        resp = self.client.post('/api/auth/login/', {'email': 'qb@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {resp.data["access"]}')
+
+        warehouse = Warehouse.objects.create(company=self.company, warehouse_code='WH-QB',
+                                             warehouse_name='예산창고')
+        for i in range(15):
+            Inventory.objects.create(company=self.company, warehouse=warehouse, item_code=f'QB-{i}',
+                                     item_name=f'QB-{i}', stock_qty=i, min_stock=5,
+                                     unit_price=Decimal('100'))
+        self.material = Material.objects.create(company=self.company, material_code='QB-1',
+                                                material_name='QB-1')
+
+        template = ApprovalTemplate.objects.create(company=self.company, name='구매결재',
+                                                   module='mm', doc_type='purchase_order')
+        ApprovalStep.objects.create(template=template, step_no=1, step_name='팀장', approver_role='구매')
+        for i in range(10):
+            ApprovalRequest.objects.create(
+                company=self.company, template=template, requester=self.user,
+                content_type=ContentType.objects.get_for_model(Material),
+                object_id=self.material.pk, title=f'결재 {i}',
+            )
+
+    def test_hdr_01_server_timing_reports_query_count(self):
+        """Server-Timing 의 db desc 쿼리 수가 실제 실행 쿼리 수와 같다."""
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get('/api/wm/inventory/')
+        self.assertEqual(resp.status_code, 200)
+        header = resp['Server-Timing']
+        match = re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', header)
+        self.assertIsNotNone(match, header)
+        self.assertEqual(int(match.group(1)), len(ctx.captured_queries))
+        self.assertRegex(header, r'ser;dur=[\d.]+')
+        self.assertRegex(header, r'app;dur=[\d.]+')
+
+    @override_settings(QUERY_BUDGETS={'InventoryViewSet.dashboard': 1})
+    def test_log_01_budget_exceeded_is_logged(self):
+        """예산 초과 요청은 뷰·action·쿼리 수와 함께 WARNING 으로 기록된다."""
+        with self.assertLogs('scm_core.perf', level='WARNING') as logs:
+            self.client.get('/api/wm/inventory/dashboard/')
+        self.assertIn('view=InventoryViewSet.dashboard', logs.output[0])
+        self.assertIn('budget=1', logs.output[0])
+
+    def test_budget_01_hot_path_actions_within_budget(self):
+        """대시보드·소요계획·결재 대기함·목록이 선언된 action 별 예산 이내."""
+        self.assertQueryBudgets([
+            ('get', '/api/wm/inventory/'),
+            ('get', '/api/wm/inventory/dashboard/'),
+            ('get', f'/api/mm/materials/{self.material.pk}/requirements/'),
+            ('get', '/api/workflow/requests/'),
+            ('get', '/api/workflow/requests/my/'),
+            ('get', '/api/workflow/requests/pending/'),
+        ])
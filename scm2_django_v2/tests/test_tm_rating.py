@@ -0,0 +1,168 @@
+"""
+TM 운임 일괄 산정 테스트 — scm_tm.rating / POST /api/tm/orders/rerate/
+
+커버리지:
+  RATE  (2)  중량 구간·최신 valid_from 선택, 최저 운임, 유효기간 밖 요율 제외,
+             일괄 산정 = 건별 quote, 가장 싼·빠른 운송사 (비활성 운송사 제외)
+  SIG   (2)  완료 전환 운임 자동계산에 중량 구간 적용, 구간 조회도 quote 와 같은 정규화(공백·대소문자)
+  API   (1)  기간 오더 재산정 (오더 수와 무관한 쿼리 수), 합계·차액, 회사 범위, 잘못된 기간 400
+"""
+import datetime
+import random
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_tm.models import Carrier, FreightRate, TransportOrder
+from scm_tm.rating import RateTable
+
+D = datetime.date
+
+
+class RatingFixture(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='RATE', company_name='운임')
+        self.fast = Carrier.objects.create(company=self.company, carrier_code='FAST', carrier_name='빠른운송')
+        self.cheap = Carrier.objects.create(company=self.company, carrier_code='CHEAP', carrier_name='싼운송')
+        self.idle = Carrier.objects.create(company=self.company, carrier_code='IDLE', carrier_name='휴면',
+                                           is_active=False)
+        self._rate(self.fast, 0, '20', transit_days=1, min_charge='30000')
+        self._rate(self.fast, 1000, '15', transit_days=1)
+        self._rate(self.cheap, 0, '12', transit_days=3, min_charge='50000')
+        self._rate(self.cheap, 0, '11', transit_days=3, min_charge='50000', valid_from=D(2025, 6, 1))
+        self._rate(self.cheap, 500, '9', transit_days=2, valid_from=D(2024, 1, 1))   # 이전 요율표 — 대체됨
+        self._rate(self.idle, 0, '1', transit_days=1)
+        self._rate(self.fast, 0, '99', valid_from=D(2020, 1, 1), valid_to=D(2023, 12, 31))   # 만료
+
+    def _rate(self, carrier, break_kg, per_kg, valid_from=D(2025, 1, 1), valid_to=None,
+              origin='서울', destination='부산', min_charge='0', **extra):
+        return FreightRate.objects.create(
+            company=self.company, carrier=carrier, origin=origin, destination=destination,
+            rate_per_kg=Decimal(per_kg), min_charge=Decimal(min_charge), min_weight_kg=Decimal(break_kg),
+            valid_from=valid_from, valid_to=valid_to, **extra)
+
+
+class RateTableTests(RatingFixture):
+    def test_rate_01_weight_break_and_validity(self):
+        table = RateTable.load(self.company, D(2025, 3, 1), D(2025, 7, 1))
+        self.assertEqual(len(table), 6)   # 만료 요율 제외
+        on = D(2025, 7, 1)
+        self.assertEqual(table.quote(self.fast.pk, '서울', '부산', 100, 0, on=on), 30000.0)   # 최저 운임
+        self.assertEqual(table.quote(self.fast.pk, '서울', '부산', 2000, 0, on=on), 30000.0)
+        self.assertEqual(table.quote(self.fast.pk, ' 서울', '부산 ', 2500, 0, on=on), 37500.0)   # 1000kg 구간
+        self.assertEqual(table.quote(self.cheap.pk, '서울', '부산', 6000, 0, on=D(2025, 3, 1)), 72000.0)
+        # 2025-06-01 요율표가 이전 구간(500kg·9원)까지 대체
+        self.assertEqual(table.quote(self.cheap.pk, '서울', '부산', 6000, 0, on=on), 66000.0)
+        self.assertIsNone(table.quote(self.cheap.pk, '서울', '대구', 6000, 0, on=on))
+        self.assertIsNone(RateTable.load(self.company, D(2023, 1, 1)).quote(self.cheap.pk, '서울', '부산', 1, 0))
+
+    def test_rate_02_batch_matches_quote_and_picks_carriers(self):
+        rng = random.Random(5)
+        n = 400
+        weights = [rng.choice([50, 800, 1500, 4000, 9000]) for _ in range(n)]
+        lanes = [rng.choice([('서울', '부산'), ('서울', '대구')]) for _ in range(n)]
+        dates = [rng.choice([D(2025, 3, 1), D(2025, 7, 1)]) for _ in range(n)]
+        carriers = [rng.choice([self.fast.pk, self.cheap.pk]) for _ in range(n)]
+        table = RateTable.load(self.company, D(2025, 3, 1), D(2025, 7, 1))
+        result = table.rate([o for o, _ in lanes], [d for _, d in lanes], weights, [0] * n,
+                            dates=dates, carrier_ids=carriers)
+
+        for i in range(0, n, 7):
+            expected = table.quote(carriers[i], *lanes[i], weights[i], 0, on=dates[i])
+            got = result['assigned_cost'][i]
+            self.assertEqual(None if got != got else got, expected)
+            if lanes[i][1] == '대구':
+                self.assertEqual((result['cheapest'][i], result['fastest'][i]), (None, None))
+                continue
+            fast = table.quote(self.fast.pk, *lanes[i], weights[i], 0, on=dates[i])
+            cheap = table.quote(self.cheap.pk, *lanes[i], weights[i], 0, on=dates[i])
+            self.assertEqual(result['cheapest_cost'][i], min(fast, cheap))
+            self.assertEqual(result['cheapest'][i], self.fast.pk if fast < cheap else self.cheap.pk)
+            self.assertEqual((result['fastest'][i], result['fastest_days'][i]), (self.fast.pk, 1))   # 휴면 제외
+        self.assertEqual([c['id'] for c in result['carriers']], sorted([self.fast.pk, self.cheap.pk, self.idle.pk]))
+        self.assertEqual(result['cost'].shape, (n, 3))
+
+
+class RatingSignalTests(RatingFixture):
+    def test_sig_01_completion_uses_weight_break(self):
+        today = datetime.date.today()
+        FreightRate.objects.filter(company=self.company).update(valid_from=today - datetime.timedelta(days=1),
+                                                               valid_to=None)
+        order = TransportOrder.objects.create(company=self.company, transport_number='TO-RATE-1', carrier=self.fast,
+                                              origin='서울', destination='부산', weight_kg=Decimal('3000'),
+                                              status='운송중')
+        order.status = '완료'
+        order.save()
+        order.refresh_from_db()
+        self.assertEqual(float(order.freight_cost), 45000.0)
+
+
+    def test_sig_02_lane_filter_normalized_like_quote(self):
+        """요율·오더의 출발지/도착지 앞뒤 공백·대소문자가 달라도 같은 구간으로 조회·산정한다."""
+        today = datetime.date.today()
+        FreightRate.objects.filter(company=self.company).delete()
+        self._rate(self.fast, 0, '10', valid_from=today, origin=' Seoul ', destination='BUSAN')
+        table = RateTable.load(self.company, carrier_ids=[self.fast.pk], lanes=[('seoul', ' Busan  ')])
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.quote(self.fast.pk, 'SEOUL', 'busan', 100, 0), 1000.0)
+
+        order = TransportOrder.objects.create(company=self.company, transport_number='TO-RATE-2', carrier=self.fast,
+                                              origin='seoul ', destination=' busan', weight_kg=Decimal('200'),
+                                              status='운송중')
+        order.status = '완료'
+        order.save()
+        order.refresh_from_db()
+        self.assertEqual(float(order.freight_cost), 2000.0)
+
+
+class RerateApiTests(RatingFixture):
+    URL = '/api/tm/orders/rerate/'
+
+    def setUp(self):
+        super().setUp()
+        User.objects.create_user(username='rater', email='rater@test.com', password='testpass123',
+                                 name='운임', company=self.company)
+        other = Company.objects.create(company_code='RATE2', company_name='타사')
+        TransportOrder.objects.create(company=other, transport_number='TO-OTHER', origin='서울',
+                                      destination='부산', planned_date=D(2025, 7, 10))
+        self.client = APIClient()
+        res = self.client.post('/api/auth/login/', {'email': 'rater@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {res.data["access"]}')
+
+    def _orders(self, n, start):
+        TransportOrder.objects.bulk_create([
+            TransportOrder(company=self.company, transport_number=f'TO-R-{start + i}',
+                           carrier=self.fast if i % 2 else self.cheap, origin='서울', destination='부산',
+                           weight_kg=Decimal(2000), freight_cost=Decimal(30000), planned_date=D(2025, 7, 1 + i % 28))
+            for i in range(n)
+        ])
+
+    def test_api_01_rerate_period(self):
+        self._orders(20, 0)
+        with CaptureQueriesContext(connection) as small:
+            res = self.client.post(self.URL, {'date_from': '2025-07-01', 'date_to': '2025-07-31'}, format='json')
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual(res.data['count'], 20)   # 타사 오더 제외
+        row = next(r for r in res.data['orders'] if r['carrier'] == self.cheap.pk)
+        self.assertEqual((row['rated_cost'], row['cheapest_carrier'], row['cheapest_cost']),
+                         (50000.0, self.fast.pk, 30000.0))
+        self.assertEqual((row['fastest_carrier'], row['fastest_days'], row['saving']), (self.fast.pk, 1, 20000.0))
+        summary = res.data['summary']
+        self.assertEqual(summary['rated_cost'], 10 * 30000 + 10 * 50000)
+        self.assertEqual((summary['saving'], summary['mismatched'], summary['unrated']), (200000.0, 10, 0))
+
+        self._orders(500, 20)
+        with CaptureQueriesContext(connection) as large:
+            res = self.client.post(self.URL, {'date_from': '2025-07-01', 'date_to': '2025-07-31',
+                                              'carrier': self.fast.pk}, format='json')
+        self.assertEqual(res.data['count'], 260)
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+
+        self.assertEqual(self.client.post(self.URL, {'date_from': '2025-08-01', 'date_to': '2025-07-01'},
+                                          format='json').status_code, 400)
+        self.assertEqual(self.client.post(self.URL, {'date_from': '2024-01-01', 'date_to': '2025-07-01'},
+                                          format='json').status_code, 400)
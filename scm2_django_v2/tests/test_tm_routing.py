@@ -0,0 +1,149 @@
+"""
+TM 배송 경로 최적화 테스트 — scm_tm.utils.routing / POST /api/tm/orders/optimize_route/
+
+커버리지:
+  ROUTE (3)  거리 행렬 = calculate_distance_km (좌표 집합별 캐시), 200개 배송지 1초 이내·
+             최근접 이웃보다 짧은 경로, 모든 배송지 1회 방문, 캐시는 총 바이트 한도 이내로 축출
+  VRP   (2)  다중 차량: 적재량 이내, 모든 배송지 배정 또는 미배정 목록, 차량보다 무거운 배송지 미배정,
+             최선 차량 간 이동이 적재 초과면 적재량 안의 차선 이동 적용
+  API   (1)  운송 오더 중량으로 적재량 판단, 다른 회사 오더 400
+"""
+import random
+import time
+from decimal import Decimal
+from unittest import mock
+
+import numpy as np
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User
+from scm_tm.models import TransportOrder
+from scm_tm.utils import routing
+from scm_tm.utils.routing import calculate_distance_km, distance_matrix, optimize_delivery_route
+
+DEPOT = (37.5665, 126.9780)
+
+
+def _stops(n, seed=4):
+    rng = random.Random(seed)
+    return [{'id': i, 'name': f'배송지{i}', 'lat': DEPOT[0] + rng.uniform(-0.4, 0.4),
+             'lon': DEPOT[1] + rng.uniform(-0.5, 0.5), 'weight_kg': rng.uniform(10, 200)}
+            for i in range(n)]
+
+
+class RoutingTests(SimpleTestCase):
+    def test_route_01_matrix_matches_scalar_and_is_cached(self):
+        coords = [DEPOT] + [(s['lat'], s['lon']) for s in _stops(30)]
+        matrix = distance_matrix(coords)
+        for i in (0, 5, 17):
+            for j in (0, 3, 29):
+                self.assertAlmostEqual(matrix[i, j], calculate_distance_km(*coords[i], *coords[j]), places=3)
+        self.assertIs(distance_matrix(list(coords)), matrix)
+        self.assertFalse(matrix.flags.writeable)
+        with self.assertRaises(ValueError):
+            distance_matrix([(91.0, 0.0)])
+
+    def test_route_02_local_search_shortens_200_stops(self):
+        stops = _stops(200)
+        started = time.perf_counter()
+        result = optimize_delivery_route(DEPOT, stops, time_budget=0.8)
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(sorted(r['id'] for r in result['route']), list(range(200)))
+        self.assertEqual([r['order'] for r in result['route']], list(range(1, 201)))
+        self.assertLess(result['total_distance_km'], result['initial_distance_km'] * 0.95)
+        legs = sum(r['distance_from_prev_km'] for r in result['route']) + result['return_distance_km']
+        self.assertAlmostEqual(legs, result['total_distance_km'], delta=0.5)
+
+    def test_route_03_cache_bounded_by_bytes(self):
+        sets = [[DEPOT] + [(s['lat'], s['lon']) for s in _stops(99, seed=100 + k)] for k in range(4)]
+        one = 100 * 100 * 8
+        with mock.patch.object(routing, '_MATRIX_CACHE_MAX_BYTES', one * 2), \
+                mock.patch.object(routing, '_matrix_cache', routing.OrderedDict()), \
+                mock.patch.object(routing, '_matrix_cache_bytes', 0):
+            first = distance_matrix(sets[0])
+            for coords in sets[1:]:
+                distance_matrix(coords)
+            self.assertEqual(len(routing._matrix_cache), 2)
+            self.assertLessEqual(routing._matrix_cache_bytes, one * 2)
+            self.assertIsNot(distance_matrix(sets[0]), first)   # 가장 오래된 행렬은 축출됨
+            self.assertIs(distance_matrix(sets[0]), distance_matrix(sets[0]))
+
+            big = [DEPOT] + [(s['lat'], s['lon']) for s in _stops(199, seed=7)]
+            distance_matrix(big)                                # 한도보다 큰 행렬은 캐시 안 함
+            self.assertNotIn(tuple(big), routing._matrix_cache)
+
+
+class VehicleRoutingTests(SimpleTestCase):
+    def test_vrp_01_capacity_and_assignment(self):
+        stops = _stops(120, seed=8)
+        stops.append({'id': 'heavy', 'lat': DEPOT[0], 'lon': DEPOT[1] + 0.1, 'weight_kg': 5000})
+        capacity = sum(s['weight_kg'] for s in stops[:-1]) / 3.5
+        result = optimize_delivery_route(DEPOT, stops, vehicles=4, capacity_kg=capacity)
+
+        self.assertLessEqual(len(result['routes']), 4)
+        for route in result['routes']:
+            self.assertLessEqual(route['load_kg'], capacity + 1e-6)
+        assigned = [r['id'] for route in result['routes'] for r in route['route']]
+        self.assertEqual(sorted(map(str, assigned + result['unassigned'])), sorted(str(s['id']) for s in stops))
+        self.assertIn('heavy', result['unassigned'])
+        self.assertLessEqual(result['total_distance_km'], result['initial_distance_km'])
+        self.assertAlmostEqual(sum(r['distance_km'] for r in result['routes']), result['total_distance_km'], places=2)
+
+    def test_vrp_02_falls_back_to_best_feasible_move(self):
+        # 0 depot, 1 서쪽, 2·3 동쪽(2 는 무거움), 4 동쪽(두 번째 차량)
+        matrix = distance_matrix([(0, 0), (0, -1), (0.3, 1.0), (-0.3, 1.0), (0, 1.0)])
+        weights = np.array([0, 10, 100, 10, 10.])
+        tours = [np.array([0, 1, 2, 3, 0]), np.array([0, 4, 0])]
+        before = sum(routing._tour_length(matrix, t) for t in tours)
+
+        tours = routing._local_search(matrix, tours, weights, 120.0, time.perf_counter() + 1.0)
+
+        for tour in tours:
+            self.assertLessEqual(weights[tour].sum(), 120.0)
+        self.assertEqual(sorted(int(i) for t in tours for i in t[1:-1]), [1, 2, 3, 4])
+        self.assertLess(sum(routing._tour_length(matrix, t) for t in tours), before * 0.8)
+
+
+class RouteApiTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='RT', company_name='경로')
+        other = Company.objects.create(company_code='RT2', company_name='타사')
+        User.objects.create_user(username='router', email='router@test.com', password='testpass123',
+                                 name='배차', company=self.company)
+        self.orders = [
+            TransportOrder.objects.create(company=self.company, transport_number=f'TO-RT-{i}', origin='서울',
+                                          destination=f'지점{i}', weight_kg=Decimal(w))
+            for i, w in enumerate(('600', '500', '300'))
+        ]
+        self.foreign = TransportOrder.objects.create(company=other, transport_number='TO-OTHER', origin='부산',
+                                                     destination='대구', weight_kg=Decimal('1'))
+        self.client = APIClient()
+        res = self.client.post('/api/auth/login/', {'email': 'router@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {res.data["access"]}')
+
+    def test_api_01_optimize_with_order_weights(self):
+        stops = [{'transport_order': o.pk, 'lat': DEPOT[0] + 0.05 * (i + 1), 'lon': DEPOT[1]}
+                 for i, o in enumerate(self.orders)]
+        res = self.client.post('/api/tm/orders/optimize_route/', {
+            'depot_lat': DEPOT[0], 'depot_lon': DEPOT[1], 'stops': stops,
+            'vehicles': 2, 'capacity_kg': 900,
+        }, format='json')
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual(res.data['unassigned'], [])
+        self.assertEqual(sorted(r['load_kg'] for r in res.data['routes']), [600.0, 800.0])   # 600 단독 + 500·300 이 최단
+        names = {r['name'] for route in res.data['routes'] for r in route['route']}
+        self.assertEqual(names, {'TO-RT-0', 'TO-RT-1', 'TO-RT-2'})
+
+        res = self.client.post('/api/tm/orders/optimize_route/', {
+            'depot_lat': DEPOT[0], 'depot_lon': DEPOT[1],
+            'stops': [{'transport_order': self.foreign.pk, 'lat': 37.0, 'lon': 127.0}],
+        }, format='json')
+        self.assertEqual(res.status_code, 400)
+        res = self.client.post('/api/tm/orders/optimize_route/', {
+            'depot_lat': DEPOT[0], 'depot_lon': DEPOT[1], 'stops': [{'lat': 95, 'lon': 127.0}],
+        }, format='json')
+        self.assertEqual(res.status_code, 400)
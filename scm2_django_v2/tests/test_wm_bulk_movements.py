@@ -0,0 +1,147 @@
+"""
+WM 일괄 재고 이동 API 테스트 — POST /api/wm/movements/bulk/
+
+커버리지:
+  BULK  (2)  품목별 재고 합산 반영, 참조 문서당 자동전표 1건(금액 합산),
+             쿼리 수는 이동 건수가 아닌 품목·문서 수에 비례
+  VALID (2)  행 단위 검증 오류·입고/출고 금액 혼합 문서 → 400, 아무것도 기록하지 않음,
+             소수 수량 → 400 (정수 재고와 이동 이력 불일치 방지)
+  ALERT (1)  같은 품목 출고가 여러 건이어도 부족재고 알림·자동발주는 품목당 1회
+"""
+import time
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from scm_accounts.models import Company, User, UserPermission
+from scm_fi.models import AccountMove
+from scm_mm.models import PurchaseOrder
+from scm_notifications.models import Notification
+from scm_wm.models import Inventory, StockMovement
+
+URL = '/api/wm/movements/bulk/'
+
+
+class BulkMovementTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='BULK', company_name='일괄')
+        for i in range(2):
+            User.objects.create_user(username=f'bulk{i}', email=f'bulk{i}@test.com', password='testpass123',
+                                     name=f'일괄{i}', company=self.company)
+        UserPermission.objects.create(user=User.objects.get(username='bulk0'), module='mm', can_read=True)
+        self.client = APIClient()
+        res = self.client.post('/api/auth/login/', {'email': 'bulk0@test.com', 'password': 'testpass123'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {res.data["access"]}')
+
+    def _post(self, movements):
+        return self.client.post(URL, {'movements': movements}, format='json')
+
+    def test_bulk_01_stock_and_one_journal_per_document(self):
+        """5,000건: 품목별 재고 = 입고 − 출고, 문서별 전표 1건에 금액 합산."""
+        movements = []
+        for i in range(5000):
+            movements.append({
+                'item_code': f'BK-{i % 50:02d}', 'item_name': f'품목{i % 50}',
+                'quantity': '2', 'movement_type': 'IN',
+                'reference_type': 'GR', 'reference_document': f'GR-{i % 5}', 'amount': '10.00',
+            })
+        movements += [
+            {'item_code': 'BK-00', 'quantity': '3', 'movement_type': 'OUT',
+             'reference_type': 'DN', 'reference_document': 'DN-1', 'amount': '50', 'cost_amount': '20'},
+            {'item_code': 'BK-01', 'quantity': '1', 'movement_type': 'OUT',
+             'reference_type': 'DN', 'reference_document': 'DN-1', 'amount': '25', 'cost_amount': '10'},
+        ]
+
+        started = time.perf_counter()
+        res = self._post(movements)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(res.data['created'], 5002)
+        self.assertEqual(res.data['items'], 50)
+        self.assertEqual(sorted(res.data['journal_entries']),
+                         ['AUTO-DN-DN-1'] + [f'AUTO-GR-GR-{k}' for k in range(5)])
+        self.assertEqual(StockMovement.objects.filter(company=self.company).count(), 5002)
+        stock = dict(Inventory.objects.filter(company=self.company).values_list('item_code', 'stock_qty'))
+        self.assertEqual(stock['BK-00'], 200 - 3)
+        self.assertEqual(stock['BK-01'], 200 - 1)
+        self.assertEqual(stock['BK-49'], 200)
+
+        gr = AccountMove.objects.get(company=self.company, move_number='AUTO-GR-GR-0')
+        self.assertEqual(gr.total_debit, Decimal('10000.00'))   # 1,000건 × 10
+        dn = AccountMove.objects.get(company=self.company, move_number='AUTO-DN-DN-1')
+        self.assertEqual(dn.total_debit, Decimal('105.00'))     # 매출 75 + 원가 30
+        self.assertEqual(dn.move_type, 'SALE')
+        self.assertLess(elapsed, 30, f'{len(movements) / elapsed:.0f} movements/s')
+
+    def test_bulk_02_queries_scale_with_items_not_movements(self):
+        """같은 품목·문서 구성이면 이동 10건과 1,000건의 쿼리 수(이동 INSERT 제외)가 같다."""
+        def payload(n, doc):
+            return [{'item_code': f'Q-{i % 5}', 'quantity': '1', 'movement_type': 'IN',
+                     'reference_type': 'GR', 'reference_document': doc, 'amount': '1'} for i in range(n)]
+
+        self._post(payload(5, 'WARM'))   # 품목·계정과목 생성
+        with CaptureQueriesContext(connection) as small:
+            self.assertEqual(self._post(payload(10, 'S')).status_code, 201)
+        with CaptureQueriesContext(connection) as large:
+            self.assertEqual(self._post(payload(1000, 'L')).status_code, 201)
+
+        def others(ctx):   # StockMovement INSERT 는 DB 변수 한도에 따라 배치로 나뉘므로 제외
+            return [q['sql'] for q in ctx.captured_queries
+                    if not q['sql'].startswith('INSERT INTO "scm_wm_stockmovement"')]
+        self.assertEqual(len(others(large)), len(others(small)))
+
+    def test_valid_01_rejects_whole_batch(self):
+        """한 건이라도 잘못되면 400 이고 재고·이동·전표는 그대로다."""
+        res = self._post([
+            {'item_code': 'V-1', 'quantity': '1', 'movement_type': 'IN'},
+            {'item_code': 'V-1', 'quantity': '0', 'movement_type': 'IN'},
+            {'item_code': 'V-2', 'quantity': '1', 'movement_type': 'MOVE'},
+        ])
+        self.assertEqual(res.status_code, 400)
+        errors = res.data['movements']
+        self.assertEqual(sorted(errors), [1, 2])   # 오류 행 index → 필드 오류
+        self.assertIn('quantity', errors[1])
+        self.assertIn('movement_type', errors[2])
+
+        res = self._post([
+            {'item_code': 'V-1', 'quantity': '1', 'movement_type': 'IN',
+             'reference_type': 'X', 'reference_document': 'X-1', 'amount': '5'},
+            {'item_code': 'V-2', 'quantity': '1', 'movement_type': 'OUT',
+             'reference_type': 'X', 'reference_document': 'X-1', 'amount': '5'},
+        ])
+        self.assertEqual(res.status_code, 400)
+        self.assertIn('X-X-1', str(res.data['movements']))
+
+        self.assertEqual(self._post([]).status_code, 400)
+        self.assertFalse(StockMovement.objects.filter(company=self.company).exists())
+        self.assertFalse(Inventory.objects.filter(company=self.company).exists())
+        self.assertFalse(AccountMove.objects.filter(company=self.company).exists())
+
+    def test_valid_02_rejects_fractional_quantity(self):
+        """소수 수량은 400 — 재고는 정수이므로 이동 이력과 어긋나지 않게 한다."""
+        res = self._post([
+            {'item_code': 'F-1', 'quantity': '0.5', 'movement_type': 'IN'},
+            {'item_code': 'F-2', 'quantity': '2.9', 'movement_type': 'IN'},
+        ])
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(sorted(res.data['movements']), [0, 1])
+        self.assertFalse(StockMovement.objects.filter(company=self.company).exists())
+
+        res = self._post([{'item_code': 'F-1', 'quantity': '3.000', 'movement_type': 'IN'}])
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(Inventory.objects.get(company=self.company, item_code='F-1').stock_qty, 3)
+
+    def test_alert_01_once_per_item(self):
+        """출고 20건으로 최소재고 아래가 돼도 알림은 권한 사용자당 1건, 자동발주 1건."""
+        Inventory.objects.create(company=self.company, item_code='AL-1', item_name='알림품목',
+                                 stock_qty=30, min_stock=25)
+        res = self._post([{'item_code': 'AL-1', 'quantity': '1', 'movement_type': 'OUT'}] * 20)
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(Inventory.objects.get(company=self.company, item_code='AL-1').stock_qty, 10)
+        self.assertEqual(Notification.objects.filter(company=self.company, title='재고 부족 경고').count(), 1)
+        self.assertEqual(PurchaseOrder.objects.filter(company=self.company,
+                                                      po_number__startswith='AUTO-PO-AL-1-').count(), 1)
@@ -0,0 +1,113 @@
+"""
+부족재고 알림·자동발주 테스트 — scm_wm.alerts (모아서 평가)
+
+커버리지:
+  BUF   (1)  buffered: 커밋된 저장만 버퍼에 모였다가 flush 1회로 평가, 쿼리 수는 품목 수와 무관,
+             WM·MM 권한 사용자·관리자에게만 통합 알림 1건, 자동발주 bulk_create + 대시보드 증감 1회
+  DEDUP (2)  오늘 자동발주가 있는 품목은 다시 발주하지 않지만 부족하면 계속 알림, 재고 회복 품목은 제외,
+             자동발주 생성이 실패해도 부족 품목 알림은 발송
+  SYNC  (1)  sync: deferred() 블록 안의 여러 저장은 블록 끝에서 1회 평가
+"""
+from unittest import mock
+
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from scm_accounts.models import Company, User, UserPermission
+from scm_mm.models import PurchaseOrder
+from scm_notifications.models import Notification
+from scm_wm import alerts
+from scm_wm.alerts import LowStockCollector, auto_po_number
+from scm_wm.models import Inventory
+
+
+class LowStockAlertTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='LOW', company_name='부족')
+        self.admin = User.objects.create_user(username='lowadmin', email='lowadmin@test.com', password='testpass123',
+                                              name='관리자', company=self.company, is_admin=True)
+        self.keeper = User.objects.create_user(username='keeper', email='keeper@test.com', password='testpass123',
+                                               name='창고', company=self.company)
+        UserPermission.objects.create(user=self.keeper, module='wm', can_read=True)
+        self.sales = User.objects.create_user(username='lowsales', email='lowsales@test.com', password='testpass123',
+                                              name='영업', company=self.company)
+        UserPermission.objects.create(user=self.sales, module='sd', can_read=True)
+        UserPermission.objects.create(user=self.sales, module='mm', can_read=False)
+
+    def _items(self, n, prefix='LS'):
+        return [Inventory.objects.create(company=self.company, item_code=f'{prefix}-{i:03d}',
+                                         item_name=f'{prefix}{i}', stock_qty=50, min_stock=10)
+                for i in range(n)]
+
+    def _drop(self, items, qty=2):
+        for inv in items:
+            inv.stock_qty = qty
+            inv.save()
+
+    @override_settings(WM_LOW_STOCK_ALERT_MODE='buffered')
+    def test_buf_01_collects_then_evaluates_once(self):
+        items = self._items(30)
+        collector = LowStockCollector(window=None)
+        with mock.patch.object(alerts, '_collector', collector), \
+                mock.patch('scm_dashboard.push.push_kpi_delta') as push:
+            with self.captureOnCommitCallbacks(execute=True):
+                self._drop(items)
+                try:
+                    with transaction.atomic():
+                        self._drop(self._items(1, prefix='RB'))
+                        raise ValueError('rollback')
+                except ValueError:
+                    pass
+            self.assertEqual(len(collector), 30)   # 롤백된 저장은 제외
+            self.assertFalse(Notification.objects.exists())
+
+            with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as ctx:
+                self.assertEqual(collector.flush(), 1)
+        self.assertLessEqual(len(ctx.captured_queries), 10)
+
+        self.assertEqual(PurchaseOrder.objects.filter(company=self.company, po_number__startswith='AUTO-PO-').count(), 30)
+        po = PurchaseOrder.objects.get(po_number=auto_po_number('LS-000', timezone.localdate()))
+        self.assertEqual(po.quantity, 18)   # 최소재고 2배까지
+        notes = Notification.objects.filter(company=self.company, notification_type='low_stock')
+        self.assertEqual(sorted(notes.values_list('recipient__username', flat=True)), ['keeper', 'lowadmin'])
+        self.assertEqual(notes.first().title, '재고 부족 경고 (30개 품목)')
+        self.assertIn('외 10개 품목', notes.first().message)
+        order_pushes = [c.args[1] for c in push.call_args_list if 'pending_orders' in c.args[1].get('mm', {})]
+        self.assertEqual(order_pushes, [{'mm': {'pending_orders': 30}}])
+
+    def test_dedup_01_once_per_item_per_day(self):
+        items = self._items(2)
+        self._drop(items[:1])   # sync: 저장 즉시 평가 → 발주 1건·알림 2건
+        self.assertEqual(Notification.objects.filter(company=self.company).count(), 2)
+
+        self._drop(items[:1], qty=0)   # 같은 날 다시 부족 → 발주는 그대로, 알림은 다시
+        self.assertEqual(Notification.objects.filter(company=self.company).count(), 4)
+        self.assertEqual(alerts.evaluate(self.company.pk, [inv.pk for inv in items]), [])   # items[1] 은 정상 재고
+        notes = Notification.objects.filter(company=self.company).order_by('-pk')
+        self.assertEqual(notes.count(), 6)
+        self.assertEqual((notes[0].title, notes[0].ref_id), ('재고 부족 경고', items[0].pk))
+        self.assertEqual(PurchaseOrder.objects.filter(company=self.company).count(), 1)
+
+    def test_dedup_02_notifies_when_order_creation_fails(self):
+        items = self._items(3)
+        with mock.patch.object(alerts, '_create_orders', side_effect=RuntimeError('db')), \
+                self.assertLogs('scm_wm.alerts', 'WARNING'):
+            with alerts.deferred():
+                self._drop(items)
+        self.assertFalse(PurchaseOrder.objects.filter(company=self.company).exists())
+        notes = Notification.objects.filter(company=self.company, notification_type='low_stock')
+        self.assertEqual(notes.count(), 2)
+        self.assertEqual(notes.first().title, '재고 부족 경고 (3개 품목)')
+
+    def test_sync_01_deferred_block_evaluates_once(self):
+        items = self._items(5)
+        with mock.patch.object(alerts, 'evaluate', wraps=alerts.evaluate) as evaluate:
+            with alerts.deferred():
+                self._drop(items)
+                self.assertEqual(evaluate.call_count, 0)
+        self.assertEqual(evaluate.call_count, 1)
+        self.assertEqual(set(evaluate.call_args.args[1]), {inv.pk for inv in items})
+        self.assertEqual(Notification.objects.filter(company=self.company).count(), 2)
+        self.assertEqual(PurchaseOrder.objects.filter(company=self.company).count(), 5)
@@ -0,0 +1,96 @@
+"""
+WM 재고 반영 테스트 — scm_wm.stock.apply_movements (행 잠금 + 일괄 기록)
+
+커버리지:
+  BATCH (2)  여러 이동을 순서대로 반영(0 미만 방지), StockMovement INSERT 1회,
+             item_code 순서 잠금, 부족재고 signal 유지, 대시보드 증감 1회 합산 전송
+  CONC  (1)  여러 스레드가 같은 품목에 동시 입·출고 → 최종 재고 = 입고 합계 − 출고 합계
+             (SELECT FOR UPDATE 필요 — SQLite 에서는 건너뜀, CI 는 config.test_settings_pg 로 실행:
+              python manage.py test --settings=config.test_settings_pg tests.test_wm_stock)
+"""
+import threading
+from unittest import mock
+
+from django.db import close_old_connections, connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+
+from scm_accounts.models import Company, User, UserPermission
+from scm_notifications.models import Notification
+from scm_wm.models import Inventory, StockMovement
+from scm_wm.stock import apply_movements
+
+
+class ApplyMovementsTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_code='STK', company_name='재고')
+        user = User.objects.create_user(username='stkuser', email='stk@test.com', password='testpass123',
+                                        name='재고', company=self.company)
+        UserPermission.objects.create(user=user, module='wm', can_read=True)
+        Inventory.objects.create(company=self.company, item_code='B-1', item_name='B-1',
+                                 stock_qty=10, min_stock=5)
+
+    def test_batch_01_sequential_single_insert(self):
+        """이동 순서대로 반영하고 StockMovement 는 bulk_create 한 번으로 기록한다."""
+        movements = [
+            {'item_code': 'B-1', 'quantity': 8, 'movement_type': 'OUT', 'reference_document': 'R-1'},
+            {'item_code': 'A-1', 'quantity': 3, 'movement_type': 'OUT'},   # 신규 품목: 0 미만 방지
+            {'item_code': 'A-1', 'quantity': 5, 'movement_type': 'IN'},
+            {'item_code': 'B-1', 'quantity': 1, 'movement_type': 'IN'},
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            created = apply_movements(self.company, movements)
+
+        self.assertEqual(len(created), 4)
+        stock = dict(Inventory.objects.filter(company=self.company).values_list('item_code', 'stock_qty'))
+        self.assertEqual(stock, {'A-1': 5, 'B-1': 3})
+        inserts = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('INSERT INTO "scm_wm_stockmovement"')]
+        self.assertEqual(len(inserts), 1)
+        locks = [q['sql'] for q in ctx.captured_queries
+                 if q['sql'].startswith('SELECT') and 'ORDER BY "scm_wm_inventory"."item_code"' in q['sql']]
+        self.assertEqual(len(locks), 1)
+        # B-1 이 최소재고(5) 아래로 내려감 → 재고 post_save signal 로 부족 알림
+        self.assertTrue(Notification.objects.filter(company=self.company, title='재고 부족 경고').exists())
+
+    def test_batch_02_dashboard_delta_pushed_once(self):
+        """일괄 생성된 재고이동은 커밋 후 합산된 kpi_delta 로 한 번 전송된다."""
+        with mock.patch('scm_dashboard.push.push_kpi_delta') as push, \
+                self.captureOnCommitCallbacks(execute=True):
+            apply_movements(self.company, [
+                {'item_code': f'D-{i}', 'quantity': 1, 'movement_type': 'IN'} for i in range(5)
+            ])
+        movement_pushes = [c.args[1] for c in push.call_args_list if 'movements_today' in c.args[1].get('wm', {})]
+        self.assertEqual(movement_pushes, [{'wm': {'movements_today': 5}}])
+
+
+class ConcurrentAdjustmentTests(TransactionTestCase):
+    @skipUnlessDBFeature('has_select_for_update')
+    def test_conc_01_parallel_threads_one_sku(self):
+        """8 스레드 × 25회 입·출고를 동시에 반영해도 재고 유실이 없다."""
+        company = Company.objects.create(company_code='CONC', company_name='동시성')
+        Inventory.objects.create(company=company, item_code='HOT-1', item_name='HOT-1', stock_qty=1000)
+        errors = []
+
+        def worker(index):
+            try:
+                for i in range(25):
+                    movement_type = 'IN' if (index + i) % 2 else 'OUT'
+                    apply_movements(company, [{'item_code': 'HOT-1', 'quantity': 3,
+                                               'movement_type': movement_type}])
+            except Exception as exc:   # pragma: no cover - 실패 시 원인 보고
+                errors.append(exc)
+            finally:
+                close_old_connections()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        ins = StockMovement.objects.filter(company=company, movement_type='IN').count()
+        outs = StockMovement.objects.filter(company=company, movement_type='OUT').count()
+        self.assertEqual(ins + outs, 200)
+        self.assertEqual(Inventory.objects.get(company=company, item_code='HOT-1').stock_qty,
+                         1000 + 3 * ins - 3 * outs)